@@ -9,7 +9,8 @@ import logging
 import os
 import stat
 import xml
-from .lang.c import preprocess, c_to_ir, COptions
+from .lang.c import preprocess, c_to_ir, COptions, CContext
+from .lang.c import preprocess_to_tokens, tokens_to_text
 from .lang.c3 import c3_to_ir
 from .lang.bf import bf_to_ir
 from .lang.fortran import fortran_to_ir
@@ -22,15 +23,19 @@ from .irutils import verify_module
 from .utils.reporting import DummyReportGenerator, HtmlReportGenerator
 from .opt.transform import DeleteUnusedInstructionsPass
 from .opt.transform import RemoveAddZeroPass
-from .opt import CommonSubexpressionEliminationPass
+from .opt import GlobalValueNumberingPass
+from .opt import SparseConditionalConstantPropagationPass
+from .opt import InlinePass
 from .opt import ConstantFolder
 from .opt import LoadAfterStorePass
+from .opt import LoopInvariantCodeMotionPass, StrengthReductionPass
 from .opt import CleanPass
 from .opt.mem2reg import Mem2RegPromotor
-from .opt.cjmp import CJumpPass
 from .opt.tailcall import TailCallOptimization
+from .opt.passmanager import PassManager
 from .codegen import CodeGenerator
 from .binutils.linker import link
+from .binutils.archive import create_archive
 from .binutils.outstream import BinaryOutputStream, TextOutputStream
 from .binutils.outstream import MasterOutputStream, FunctionOutputStream
 from .binutils.objectfile import ObjectFile, get_object
@@ -42,13 +47,14 @@ from .format.exefile import ExeWriter
 from .format import uboot_image
 from .build.tasks import TaskError, TaskRunner
 from .build.recipe import RecipeLoader
+from .build.state import BuildState
 from .common import CompilerError, DiagnosticsManager, get_file
 from .arch import get_arch, get_current_arch
 
 # When using 'from ppci.api import *' include the following:
 __all__ = [
-    'asm', 'c3c', 'cc', 'link', 'objcopy', 'bfcompile', 'construct',
-    'optimize', 'preprocess',
+    'asm', 'c3c', 'cc', 'link', 'archive', 'objcopy', 'bfcompile',
+    'construct', 'optimize', 'preprocess',
     'get_arch', 'get_current_arch', 'is_platform_supported',
     'ir_to_object', 'ir_to_python',
     'bf_to_ir', 'ws_to_ir']
@@ -75,10 +81,21 @@ def is_platform_supported():
     return get_current_arch() is not None
 
 
-def construct(buildfile, targets=()):
+def construct(buildfile, targets=(), cache=None, jobs=1, incremental=True):
     """ Construct the given buildfile.
 
     Raise task error if something goes wrong.
+
+    Args:
+        buildfile: the build.xml file to construct.
+        targets: the targets to build, when empty the default target is
+            built.
+        cache: an optional :class:`ppci.build.cache.ObjectCache` which is
+            used by the compile tasks.
+        jobs: the amount of processes to use. Independent targets are
+            run in parallel.
+        incremental: when True, tasks which are up to date since the
+            last build are skipped.
     """
     # Ensure file:
     buildfile = get_file(buildfile)
@@ -95,7 +112,8 @@ def construct(buildfile, targets=()):
     if not project:
         raise TaskError('No project loaded')
 
-    runner = TaskRunner()
+    state = BuildState.for_project(project) if incremental else None
+    runner = TaskRunner(cache=cache, jobs=jobs, state=state)
     runner.run(project, list(targets))
 
 
@@ -168,6 +186,52 @@ def disasm(data, march):
 OPT_LEVELS = ('0', '1', '2', 's')
 
 
+def get_opt_passes(level):
+    """ Get the optimization passes of an optimization level.
+
+    Level 1 promotes memory to registers, propagates constants and cleans
+    up. Level 2 adds the other passes. Level s leaves out the passes which
+    can make the code bigger, such as inlining.
+    """
+    level = str(level)
+    if level == '0':
+        return []
+    elif level == '1':
+        return [
+            Mem2RegPromotor(),
+            SparseConditionalConstantPropagationPass(),
+            ConstantFolder(),
+            DeleteUnusedInstructionsPass(),
+            CleanPass()]
+    elif level == '2':
+        return [
+            Mem2RegPromotor(),
+            SparseConditionalConstantPropagationPass(),
+            InlinePass(),
+            RemoveAddZeroPass(),
+            ConstantFolder(),
+            GlobalValueNumberingPass(),
+            LoopInvariantCodeMotionPass(),
+            StrengthReductionPass(),
+            TailCallOptimization(),
+            LoadAfterStorePass(),
+            DeleteUnusedInstructionsPass(),
+            CleanPass()]
+    elif level == 's':
+        # Tail call optimization adds a block and a phi per argument:
+        return [
+            Mem2RegPromotor(),
+            SparseConditionalConstantPropagationPass(),
+            RemoveAddZeroPass(),
+            ConstantFolder(),
+            GlobalValueNumberingPass(),
+            LoadAfterStorePass(),
+            DeleteUnusedInstructionsPass(),
+            CleanPass()]
+    else:  # pragma: no cover
+        raise ValueError('Invalid optimization level {}'.format(level))
+
+
 def optimize(ir_module, level=0, reporter=None):
     """ Run a bag of tricks against the :doc:`ir-code<ir>`.
 
@@ -196,27 +260,10 @@ def optimize(ir_module, level=0, reporter=None):
     if level == '0':
         return
 
-    # TODO: differentiate between optimization levels!
-
-    # Optimization passes (bag of tricks) run them three times:
-    opt_passes = [Mem2RegPromotor(),
-                  RemoveAddZeroPass(),
-                  ConstantFolder(),
-                  CommonSubexpressionEliminationPass(),
-                  TailCallOptimization(),
-                  LoadAfterStorePass(),
-                  DeleteUnusedInstructionsPass(),
-                  CleanPass()] * 3
-
-    if level == '3':
-        opt_passes.append(CJumpPass())
-
-    # Run the passes over the module:
+    # Run the passes over the module until nothing changes:
     verify_module(ir_module)
-    for opt_pass in opt_passes:
-        opt_pass.run(ir_module)
-        # reporter.message('{} after {}:'.format(ir_module, opt_pass))
-        # reporter.dump_ir(ir_module)
+    pass_manager = PassManager(get_opt_passes(level), reporter=reporter)
+    pass_manager.run(ir_module)
 
     if reporter:
         # Dump report:
@@ -229,8 +276,12 @@ def optimize(ir_module, level=0, reporter=None):
 
 def ir_to_stream(
         ir_module, march, output_stream, reporter=None,
-        debug=False, opt='speed'):
+        debug=False, opt='speed', jobs=1, function_sections=False):
     """ Translate IR module to output stream.
+
+    When jobs is larger than 1, functions are compiled in parallel using
+    the given amount of processes. When function_sections is true, each
+    function is placed in a section of its own.
     """
     march = get_arch(march)
 
@@ -242,12 +293,13 @@ def ir_to_stream(
 
     # Code generation:
     code_generator.generate(
-        ir_module, output_stream, reporter=reporter, debug=debug)
+        ir_module, output_stream, reporter=reporter, debug=debug, jobs=jobs,
+        function_sections=function_sections)
 
 
 def ir_to_object(
         ir_modules, march, reporter=None, debug=False,
-        opt='speed', outstream=None):
+        opt='speed', outstream=None, jobs=1, function_sections=False):
     """ Translate IR-modules into code for the given architecture.
 
     Args:
@@ -258,6 +310,10 @@ def ir_to_object(
         debug (bool): include debugging information
         opt (str): optimization goal. Can be 'speed', 'size' or 'co2'.
         outstream: instruction stream to write instructions to
+        jobs (int): amount of processes to use for code generation. The
+            output does not depend on this value.
+        function_sections (bool): place each function in a section of its
+            own, so that the linker can remove unused functions.
 
     Returns:
         ObjectFile: An object file
@@ -287,7 +343,8 @@ def ir_to_object(
     for ir_module in ir_modules:
         ir_to_stream(
             ir_module, march, output_stream,
-            reporter=reporter, debug=debug, opt=opt)
+            reporter=reporter, debug=debug, opt=opt, jobs=jobs,
+            function_sections=function_sections)
 
     # TODO: refactor polishing?
     obj.polish()
@@ -297,7 +354,7 @@ def ir_to_object(
 
 
 def cc(source: io.TextIOBase, march, coptions=None, opt_level=0,
-       debug=False, reporter=None):
+       debug=False, reporter=None, cache=None, function_sections=False):
     """ C compiler. compiles a single source file into an object file.
 
     Args:
@@ -305,6 +362,10 @@ def cc(source: io.TextIOBase, march, coptions=None, opt_level=0,
         march: The architecture for which to compile
         coptions: options for the C frontend
         debug: Create debug info when set to True
+        function_sections: place each function in a section of its own
+        cache: an optional :class:`ppci.build.cache.ObjectCache`. When
+            the pre-processed source was compiled before with the same
+            settings, the cached object is returned.
 
     Returns:
         an object file
@@ -325,11 +386,32 @@ def cc(source: io.TextIOBase, march, coptions=None, opt_level=0,
     if not coptions:
         coptions = COptions()
 
+    if cache:
+        march = get_arch(march)
+        source = preprocess_to_tokens(source, coptions)
+        pch = coptions.precompiled_header
+        if pch:
+            pch.check(CContext(coptions, march.info))
+        key = cache.make_key(
+            'cc', march.make_id_str(), opt_level, debug, function_sections,
+            sorted(coptions.settings.items()),
+            pch.digest if pch else None,
+            tokens_to_text(source, locations=debug))
+        obj = cache.load(key)
+        if obj:
+            reporter.message('Using cached object {}'.format(key))
+            return obj
+
     ir_module = c_to_ir(source, march, coptions=coptions, reporter=reporter)
     reporter.message('{} {}'.format(ir_module, ir_module.stats()))
     reporter.dump_ir(ir_module)
     optimize(ir_module, level=opt_level, reporter=reporter)
-    return ir_to_object([ir_module], march, debug=debug, reporter=reporter)
+    obj = ir_to_object(
+        [ir_module], march, debug=debug, reporter=reporter,
+        function_sections=function_sections)
+    if cache:
+        cache.store(key, obj)
+    return obj
 
 
 def wasmcompile(source: io.TextIOBase, march, opt_level=2, reporter=None):
@@ -358,7 +440,7 @@ def llc(source, march):
 
 
 def c3c(sources, includes, march, opt_level=0, reporter=None, debug=False,
-        outstream=None):
+        outstream=None, cache=None, jobs=1):
     """ Compile a set of sources into binary format for the given target.
 
     Args:
@@ -368,6 +450,9 @@ def c3c(sources, includes, march, opt_level=0, reporter=None, debug=False,
         march: the architecture for which to compile.
         reporter: reporter to write compilation report to
         debug: include debugging information
+        cache: an optional :class:`ppci.build.cache.ObjectCache` to
+            lookup and store the compiled object in.
+        jobs: amount of processes to use for code generation.
 
     Returns:
         An object file
@@ -383,15 +468,48 @@ def c3c(sources, includes, march, opt_level=0, reporter=None, debug=False,
     """
     reporter = get_reporter(reporter)
     march = get_arch(march)
+
+    # An output stream needs the instructions, so do not use the cache:
+    if cache and not outstream:
+        sources = _read_sources(sources)
+        includes = _read_sources(includes)
+        key = cache.make_key(
+            'c3c', march.make_id_str(), opt_level, debug,
+            [(getattr(f, 'name', ''), f.getvalue()) for f in sources],
+            [(getattr(f, 'name', ''), f.getvalue()) for f in includes])
+        obj = cache.load(key)
+        if obj:
+            reporter.message('Using cached object {}'.format(key))
+            return obj
+    else:
+        cache = None
+
     ir_module = \
         c3_to_ir(sources, includes, march, reporter=reporter)
 
     optimize(ir_module, level=opt_level, reporter=reporter)
 
     opt_cg = 'size' if opt_level == 's' else 'speed'
-    return ir_to_object(
+    obj = ir_to_object(
         [ir_module], march, debug=debug, reporter=reporter,
-        opt=opt_cg, outstream=outstream)
+        opt=opt_cg, outstream=outstream, jobs=jobs)
+    if cache:
+        cache.store(key, obj)
+    return obj
+
+
+def _read_sources(sources):
+    """ Read the given sources into in-memory files, keeping the names """
+    files = []
+    for source in sources:
+        f = get_file(source)
+        text = io.StringIO(f.read())
+        if hasattr(f, 'name'):
+            text.name = f.name
+        if f is not source:
+            f.close()
+        files.append(text)
+    return files
 
 
 def pascal(sources, march, opt_level=0, reporter=None):
@@ -508,6 +626,29 @@ def objcopy(obj: ObjectFile, image_name: str, fmt: str, output_filename):
         raise NotImplementedError("output format not implemented")
 
 
+def archive(objects):
+    """ Create an archive (library) of the given object files.
+
+    When the archive is passed as a library to :func:`link`, only the
+    members which define a symbol that is needed are linked in.
+
+    .. doctest::
+
+        >>> import io
+        >>> from ppci.api import archive, c3c, link
+        >>> lib_source = io.StringIO(
+        ...     "module lib; function int f() { return 2; }")
+        >>> lib = archive([c3c([lib_source], [], 'arm')])
+        >>> print(lib)
+        Archive of 1 members
+        >>> c3_source = io.StringIO("module main; var int a;")
+        >>> obj = link([c3c([c3_source], [], 'arm')], libraries=[lib])
+        >>> print(obj)
+        CodeObject of 4 bytes
+    """
+    return create_archive(objects)
+
+
 def write_ldb(obj, output_file):
     """ Export debug info from object to ldb format.
 
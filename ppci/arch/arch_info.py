@@ -6,6 +6,7 @@ The information present:
 - endianness
 - type sizes and alignment
 - int size for the machine
+- instruction latencies and issue width for the scheduler
 
 """
 import enum
@@ -25,15 +26,63 @@ class TypeInfo:
         self.alignment = alignment
 
 
+class SchedulingInfo:
+    """ Target specific instruction scheduling information.
+
+    Only the instruction classes listed here are moved by the instruction
+    scheduler, all other instructions stay in place.
+
+    Args:
+        instructions: instructions which only access registers
+        memory: instructions which load or store memory. These are kept
+            in program order, since volatile accesses cannot be told
+            apart anymore after instruction selection.
+        prefixes: instructions which must directly precede the
+            next instruction, like an immediate prefix
+        latencies: a map from instruction class to the amount of
+            cycles before its result can be used. Defaults to 1.
+        issue_width: the amount of instructions issued per cycle
+    """
+    def __init__(
+            self, instructions=(), memory=(), prefixes=(),
+            latencies=None, issue_width=1):
+        self.instructions = frozenset(instructions)
+        self.memory = frozenset(memory)
+        self.prefixes = frozenset(prefixes)
+        self.latencies = latencies if latencies else {}
+        assert issue_width >= 1
+        self.issue_width = issue_width
+
+    def can_schedule(self, instruction):
+        """ Test if the given instruction may be moved """
+        cls = type(instruction)
+        return (
+            cls in self.instructions or cls in self.memory or
+            cls in self.prefixes)
+
+    def accesses_memory(self, instruction):
+        """ Test if the given instruction loads or stores memory """
+        return type(instruction) in self.memory
+
+    def is_prefix(self, instruction):
+        """ Test if the given instruction is glued to the next one """
+        return type(instruction) in self.prefixes
+
+    def get_latency(self, instruction):
+        """ Get the result latency of the given instruction """
+        return self.latencies.get(type(instruction), 1)
+
+
 class ArchInfo:
     """ A collection of information for language frontends """
     def __init__(
             self, type_infos=None, endianness=Endianness.LITTLE,
-            register_classes=()):
+            register_classes=(), scheduling=None):
         self.type_infos = type_infos
         assert isinstance(endianness, Endianness)
         self.endianness = endianness
         self.register_classes = register_classes
+        self.scheduling = scheduling
 
         mapping = {}
         for register_class in self.register_classes:
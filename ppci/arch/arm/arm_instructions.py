@@ -5,7 +5,7 @@
 from .isa import arm_isa, ArmToken, ArmImmToken, Isa
 from ..encoding import Instruction, Constructor, Syntax, Operand, Transform
 from ..generic_instructions import RegisterUseDef
-from ...utils.bitfun import encode_imm32
+from ...utils.bitfun import encode_imm32, decode_imm32
 from ...utils.tree import Tree
 from .registers import ArmRegister, Coreg, Coproc, RegisterSet, R11
 from .registers import R0, R1, R2
@@ -91,6 +91,9 @@ class ArmExpand(Transform):
     def forwards(self, value):
         return encode_imm32(value)
 
+    def backwards(self, value):
+        return decode_imm32(value)
+
 
 class Mov1(ArmInstruction):
     """ Mov Rd, imm16 """
@@ -300,15 +303,7 @@ class Asr(ShiftBase):
 
 class OpRegRegImm(ArmInstruction):
     """ add rd, rn, imm12 """
-    def encode(self):
-        tokens = self.get_tokens()
-        tokens[0][0:12] = encode_imm32(self.imm)
-        tokens[0].rd = self.rd.num
-        tokens[0].rn = self.rn.num
-        tokens[0].S = 0  # Set flags
-        tokens[0][21:28] = self.opcode
-        tokens[0].cond = AL
-        return tokens[0].encode()
+    tokens = [ArmImmToken]
 
 
 def make_regregimm(mnemonic, opcode):
@@ -316,8 +311,12 @@ def make_regregimm(mnemonic, opcode):
     rn = Operand('rn', ArmRegister, read=True)
     imm = Operand('imm', int)
     syntax = Syntax([mnemonic, ' ', rd, ',', ' ', rn, ',', ' ', imm])
+    patterns = {
+        'cond': AL, 'opcode': opcode, 's': 0, 'rn': rn, 'rd': rd,
+        'imm12': ArmExpand(imm)}
     members = {
-        'syntax': syntax, 'rd': rd, 'rn': rn, 'imm': imm, 'opcode': opcode}
+        'syntax': syntax, 'patterns': patterns,
+        'rd': rd, 'rn': rn, 'imm': imm, 'opcode': opcode}
     return type(mnemonic + '_ins', (OpRegRegImm,), members)
 
 
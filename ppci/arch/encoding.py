@@ -2,6 +2,8 @@
 
 
 import abc
+import copyreg
+import importlib
 from .registers import Register
 from .token import TokenSequence
 
@@ -90,6 +92,10 @@ class Operand(property):
 
 class Transform(metaclass=abc.ABCMeta):
     """ Wrapper to transform the numeric value of a property """
+    # The values the property can take, if these are few. This allows
+    # decoding of the property when there is no backwards transform.
+    values = None
+
     def __init__(self, wrapped):
         self._wrapped = wrapped
 
@@ -213,11 +219,12 @@ class Constructor:
 
                 for sub_con in options:
                     try:
-                        c = sub_con.from_tokens(tokens)
-                        print(c)
-                        prop_map[farg] = c
-                    except ValueError as e:
-                        print(e)
+                        prop_map[farg] = sub_con.from_tokens(tokens)
+                        break
+                    except ValueError:
+                        pass
+                else:
+                    raise ValueError('Cannot decode {}'.format(cls))
 
         # Instantiate:
         init_args = [prop_map[a] for a in fargs]
@@ -265,6 +272,11 @@ class Constructor:
 
 class InsMeta(type):
     """ Meta class to register an instruction within an isa class. """
+    # All instruction classes by module and name. Many instruction classes
+    # are created by factory functions, so they cannot be pickled by their
+    # name. Use this registry instead.
+    registry = {}
+
     def __init__(cls, name, bases, attrs):
         super(InsMeta, cls).__init__(name, bases, attrs)
 
@@ -272,6 +284,14 @@ class InsMeta(type):
         if hasattr(cls, 'isa'):
             cls.isa.add_instruction(cls)
 
+        # Classes with the same name in a module are numbered in order
+        # of creation:
+        number = 0
+        while (cls.__module__, cls.__qualname__, number) in InsMeta.registry:
+            number += 1
+        cls._registry_key = (cls.__module__, cls.__qualname__, number)
+        InsMeta.registry[cls._registry_key] = cls
+
     def __add__(cls, other):
         assert isinstance(other, InsMeta)
         tokens = cls.tokens + other.tokens
@@ -294,6 +314,19 @@ class InsMeta(type):
         return InsMeta(name, (Instruction,), members)
 
 
+def _lookup_instruction_class(module, qualname, number):
+    """ Retrieve a registered instruction class """
+    importlib.import_module(module)
+    return InsMeta.registry[(module, qualname, number)]
+
+
+def _reduce_instruction_class(cls):
+    return _lookup_instruction_class, cls._registry_key
+
+
+copyreg.pickle(InsMeta, _reduce_instruction_class)
+
+
 class Instruction(Constructor, metaclass=InsMeta):
     """ Base instruction class.
 
@@ -434,7 +467,7 @@ class Instruction(Constructor, metaclass=InsMeta):
     def sizes(cls):
         """ Get possible encoding sizes in bytes """
         if hasattr(cls, 'tokens'):
-            return [sum(t.size for t in cls.tokens) // 8]
+            return [sum(t.Info.size for t in cls.tokens) // 8]
         else:
             return []
 
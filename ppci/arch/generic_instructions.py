@@ -128,7 +128,7 @@ class Alignment(PseudoInstruction):
         if self.rep:
             return self.rep
         else:
-            return 'ALIGN({})'.format(self.align)
+            return 'align {}'.format(self.align)
 
 
 class SectionInstruction(PseudoInstruction):
@@ -2,7 +2,7 @@
 
 from ... import ir
 from ..arch import Architecture
-from ..arch_info import ArchInfo, TypeInfo, Endianness
+from ..arch_info import ArchInfo, TypeInfo, Endianness, SchedulingInfo
 from ..generic_instructions import Label, RegisterUseDef, Alignment
 from ..data_instructions import Db
 from ..stack import StackLocation, FramePointerLocation
@@ -11,6 +11,30 @@ from . import instructions
 from . import registers
 
 
+# Only instructions which keep the carry flag are moved. The imm
+# instruction provides the upper half of the immediate of the next
+# instruction, so it must stay in front of it.
+scheduling_info = SchedulingInfo(
+    instructions=(
+        instructions.Addk, instructions.Rsubk, instructions.Addik,
+        instructions.Rsubik, instructions.Cmp, instructions.Cmpu,
+        instructions.Mul, instructions.Muli, instructions.Bsra,
+        instructions.Bsll, instructions.Or, instructions.And,
+        instructions.Xor, instructions.Andn, instructions.Ori,
+        instructions.Andi, instructions.Xori, instructions.Andni,
+        instructions.Sext8, instructions.Sext16),
+    memory=(
+        instructions.Lbu, instructions.Lhu, instructions.Lw,
+        instructions.Lbui, instructions.Lhui, instructions.Lwi,
+        instructions.Sb, instructions.Sh, instructions.Sw,
+        instructions.Sbi, instructions.Shi, instructions.Swi),
+    prefixes=(instructions.Imm,),
+    latencies={
+        instructions.Lbu: 2, instructions.Lhu: 2, instructions.Lw: 2,
+        instructions.Lbui: 2, instructions.Lhui: 2, instructions.Lwi: 2,
+        instructions.Mul: 3, instructions.Muli: 3})
+
+
 class MicroBlazeArch(Architecture):
     """ Microblaze architecture """
     name = 'microblaze'
@@ -26,7 +50,8 @@ class MicroBlazeArch(Architecture):
                 'int': ir.i32, 'ptr': ir.u32, ir.ptr: ir.u32,
             },
             endianness=Endianness.BIG,
-            register_classes=registers.register_classes)
+            register_classes=registers.register_classes,
+            scheduling=scheduling_info)
         self.fp_location = FramePointerLocation.BOTTOM
         self.isa = instructions.isa
         self.assembler = BaseAssembler()
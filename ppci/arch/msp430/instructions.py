@@ -143,6 +143,7 @@ class ConstLabelSrc(Src):
 
 class AsConstTransform(Transform):
     as_cn_map = {-1: 3, 0: 0, 1: 1, 2: 2, 4: 2, 8: 3}
+    values = tuple(as_cn_map)
 
     def forwards(self, value):
         return self.as_cn_map[value]
@@ -2,11 +2,12 @@
 
 import io
 from ..arch import Architecture
-from ..arch_info import ArchInfo, TypeInfo
+from ..arch_info import ArchInfo, TypeInfo, SchedulingInfo
 from ..generic_instructions import Label, RegisterUseDef
 from ..data_instructions import DByte, DZero
 from .asm_printer import RiscvAsmPrinter
 from .instructions import isa, Align, Section
+from . import instructions
 from .rvc_instructions import rvcisa
 from .rvf_instructions import rvfisa, movf
 from .registers import RiscvRegister, RiscvFRegister, gdb_registers, Register
@@ -62,6 +63,28 @@ class RiscvAssembler(BaseAssembler):
         return label_name
 
 
+# In order pipelines stall one cycle when a load result is used by the
+# next instruction:
+scheduling_info = SchedulingInfo(
+    instructions=(
+        instructions.Movr, instructions.Li, instructions.Lui,
+        instructions.Addr, instructions.Subr, instructions.Sll,
+        instructions.Slt, instructions.Sltu, instructions.Xorr,
+        instructions.Srl, instructions.Sra, instructions.Orr,
+        instructions.Andr, instructions.Slli, instructions.Srli,
+        instructions.Srai, instructions.Addi, instructions.Slti,
+        instructions.Sltiu, instructions.Xori, instructions.Ori,
+        instructions.Andi, instructions.Mul, instructions.Div,
+        instructions.Divu, instructions.Rem, instructions.Remu),
+    memory=(
+        instructions.Lb, instructions.Lh, instructions.Lw,
+        instructions.Lbu, instructions.Lhu, instructions.Sb,
+        instructions.Sh, instructions.Sw),
+    latencies={
+        instructions.Lb: 2, instructions.Lh: 2, instructions.Lw: 2,
+        instructions.Lbu: 2, instructions.Lhu: 2})
+
+
 class RiscvArch(Architecture):
     name = 'riscv'
     option_names = ('rvc','rvf')
@@ -101,7 +124,8 @@ class RiscvArch(Architecture):
                 ir.i32: TypeInfo(4, 4), ir.u32: TypeInfo(4, 4),
                 ir.f32: TypeInfo(4, 4), ir.f64: TypeInfo(4, 4),
                 'int': ir.i32, 'ptr': ir.u32, ir.ptr: ir.u32,
-            }, register_classes=self.regclass)
+            }, register_classes=self.regclass,
+            scheduling=scheduling_info)
 
         self.fp = FP
         self.callee_save = (
@@ -15,7 +15,7 @@ from .relocations import BImm12Relocation, BImm20Relocation
 from .relocations import Abs32Imm20Relocation
 from .relocations import Abs32Imm12Relocation, RelImm20Relocation
 from .relocations import RelImm12Relocation
-from .tokens import RiscvToken, RiscvIToken
+from .tokens import RiscvToken, RiscvIToken, RiscvSToken
 import struct
 
 isa = Isa()
@@ -141,15 +141,7 @@ Srai = make_si('srai', 0b0100000, 0b101)
 
 
 class IBase(RiscvInstruction):
-    def encode(self):
-        tokens = self.get_tokens()
-        tokens[0][0:7] = 0b0010011
-        tokens[0][7:12] = self.rd.num
-        tokens[0][12:15] = self.func
-        tokens[0][15:20] = self.rs1.num
-        self.imm = self.imm & 0xfff
-        tokens[0][20:32] = self.imm
-        return tokens[0].encode()
+    tokens = [RiscvIToken]
 
 
 def make_i(mnemonic, func):
@@ -158,8 +150,11 @@ def make_i(mnemonic, func):
     rs1 = Operand('rs1', RiscvRegister, read=True)
     imm = Operand('imm', int)
     syntax = Syntax([mnemonic, ' ', rd, ',', ' ', rs1, ',', ' ', imm])
+    patterns = {
+        'opcode': 0b0010011, 'rd': rd, 'funct3': func,
+        'rs1': rs1, 'imm': imm}
     members = {
-        'syntax': syntax, 'func': func,
+        'syntax': syntax, 'func': func, 'patterns': patterns,
         'rd': rd, 'rs1': rs1, 'imm': imm}
     return type(mnemonic + '_ins', (IBase,), members)
 
@@ -461,17 +456,7 @@ def reg_list_to_mask(reg_list):
 
 
 class StrBase(RiscvInstruction):
-    def encode(self):
-        imml5 = self.offset & 0x1f
-        immh7 = (self.offset >> 5) & 0x7f
-        tokens = self.get_tokens()
-        tokens[0][0:7] = 0b0100011
-        tokens[0][7:12] = imml5
-        tokens[0][12:15] = self.func
-        tokens[0][15:20] = self.rs1.num
-        tokens[0][20:25] = self.rs2.num
-        tokens[0][25:32] = immh7
-        return tokens[0].encode()
+    tokens = [RiscvSToken]
 
 
 def make_str(mnemonic, func):
@@ -479,8 +464,11 @@ def make_str(mnemonic, func):
     offset = Operand('offset', int)
     rs1 = Operand('rs1', RiscvRegister, read=True)
     syntax = Syntax([mnemonic, ' ', rs2, ',', ' ', offset, '(', rs1, ')'])
+    patterns = {
+        'opcode': 0b0100011, 'funct3': func, 'rs1': rs1, 'rs2': rs2,
+        'imm': offset}
     members = {
-        'syntax': syntax,
+        'syntax': syntax, 'patterns': patterns,
         'func': func,
         'offset': offset, 'rs1': rs1, 'rs2': rs2}
     return type(mnemonic.title(), (StrBase,), members)
@@ -120,7 +120,14 @@ class Frame:
 
     def live_ranges(self, vreg):
         """ Determine the live range of some register """
-        return self.cfg._live_ranges[vreg]
+        bit = 1 << self.cfg.number(vreg)
+        ranges = []
+        for node in self.cfg:
+            instructions = node.instructions
+            for ins1, ins2 in zip(instructions, instructions[1:]):
+                if ins1.live_out & bit:
+                    ranges.append((ins1, ins2))
+        return ranges
 
     def new_reg(self, cls, twain=""):
         """ Retrieve a new virtual register """
@@ -1,4 +1,5 @@
 import struct
+from ..utils.bitfun import to_signed
 from .arch_info import Endianness
 
 
@@ -43,7 +44,10 @@ class _p2(property):
 def bit_range(b, e, signed=False):
     """ Create a property which sets a bit range """
     def getter(s):
-        return s[b:e]
+        value = s[b:e]
+        if signed:
+            value = to_signed(value, e - b)
+        return value
 
     def setter(s, v):
         s[b:e] = v
@@ -63,6 +67,8 @@ def bit_concat(*partials):
         for at in partials:
             v = v << at._bitsize
             v = v | (at.__get__(s) & at._mask)
+        if signed:
+            v = to_signed(v, bitsize)
         return v
 
     def setter(s, v):
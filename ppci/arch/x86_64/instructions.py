@@ -27,6 +27,7 @@ class Imm8Token(Token):
         size = 8
 
     disp8 = bit_range(0, 8, signed=True)
+    imm8 = bit_range(0, 8)
 
 
 class PrefixToken(Token):
@@ -262,7 +263,7 @@ class Int(X86Instruction):
     nr = Operand('nr', int)
     syntax = Syntax(['int', ' ', nr])
     tokens = [OpcodeToken, Imm8Token]
-    patterns = {'opcode': 0xcd, 'disp8': nr}
+    patterns = {'opcode': 0xcd, 'imm8': nr}
 
 
 class CallReg(X86Instruction):
@@ -646,7 +647,7 @@ class rmregbase16(X86Instruction):
 
         # sib byte and ...
         if rm.mod == 0 and rm.rm == 4:
-            if tokens[3].base == 5:
+            if sib.base == 5:
                 r += tokens[6].encode()
         return r
 
@@ -3,7 +3,7 @@
 from ... import ir
 from ...binutils.assembler import BaseAssembler
 from ..arch import Architecture
-from ..arch_info import ArchInfo, TypeInfo
+from ..arch_info import ArchInfo, TypeInfo, SchedulingInfo
 from ..generic_instructions import Label, Alignment, RegisterUseDef
 from ..data_instructions import Db, Dd, Dcd2, data_isa
 from ..runtime import get_runtime_files
@@ -12,6 +12,25 @@ from . import registers
 from . import instructions
 
 
+# The shifts using the shift amount register are left in place. Loads
+# have a latency of two cycles on the five stage pipeline.
+scheduling_info = SchedulingInfo(
+    instructions=(
+        instructions.Abs, instructions.Add, instructions.Addi,
+        instructions.Addmi, instructions.Addx2, instructions.Addx4,
+        instructions.Addx8, instructions.And, instructions.Movi,
+        instructions.Neg, instructions.Or, instructions.Srli,
+        instructions.Sub, instructions.Subx2, instructions.Subx4,
+        instructions.Subx8, instructions.Xor),
+    memory=(
+        instructions.L8ui, instructions.L16si, instructions.L16ui,
+        instructions.L32i, instructions.L32r, instructions.S8i,
+        instructions.S16i, instructions.S32i),
+    latencies={
+        instructions.L8ui: 2, instructions.L16si: 2, instructions.L16ui: 2,
+        instructions.L32i: 2, instructions.L32r: 2})
+
+
 class XtensaArch(Architecture):
     """ Xtensa architecture implementation. """
     name = 'xtensa'
@@ -30,7 +49,8 @@ class XtensaArch(Architecture):
                 ir.i32: TypeInfo(4, 4), ir.u32: TypeInfo(4, 4),
                 ir.f32: TypeInfo(4, 4), ir.f64: TypeInfo(8, 8),
                 'int': ir.i32, 'ptr': ir.u32
-            }, register_classes=register_classes)
+            }, register_classes=register_classes,
+            scheduling=scheduling_info)
 
         # TODO: a15 is also callee save
         self.callee_save = registers.callee_save
@@ -0,0 +1,237 @@
+""" Archives of object files.
+
+An archive bundles several object files, called members, into a single
+library file. The archive contains an index of the symbols defined by
+each member. The linker uses this index to extract only the members which
+define symbols that are referred to, but not yet defined, instead of
+linking the whole library.
+
+The file starts with a fixed header, followed by the member records, the
+symbol records, a string table and the members themselves. Each member is
+stored in the :mod:`binary object format<ppci.binutils.binaryobject>`.
+All numbers are stored little endian.
+
+When an archive is loaded, the members are only decoded when they are
+extracted.
+"""
+
+import io
+import mmap
+import struct
+from .binaryobject import StringTable, align, read_object, write_object
+from .objectfile import get_object
+
+
+MAGIC = b'PPCIARC\x00'
+VERSION = 1
+
+# magic, version, flags, string count, member count, symbol count,
+# string table offset, string table size:
+header_struct = struct.Struct('<8sHHIIIQQ')
+
+# name, data offset, data size:
+member_struct = struct.Struct('<IQQ')
+
+# name, member index:
+symbol_struct = struct.Struct('<II')
+
+
+def is_archive(data):
+    """ Check if the given data starts as an archive """
+    return bytes(data[:len(MAGIC)]) == MAGIC
+
+
+class ArchiveMember:
+    """ An object file in an archive.
+
+    The object file is created on first use by calling the loader.
+    """
+    def __init__(self, name, symbols, obj=None, loader=None):
+        assert obj or loader
+        self.name = name
+        self.symbols = symbols
+        self._obj = obj
+        self._loader = loader
+
+    def __repr__(self):
+        return 'ArchiveMember({})'.format(self.name)
+
+    def get_object(self):
+        """ Get the object file of this member """
+        if self._obj is None:
+            self._obj = self._loader()
+        return self._obj
+
+
+class Archive:
+    """ A collection of object files with an index of their symbols """
+    def __init__(self):
+        self.members = []
+        self.symbol_map = {}
+
+    def __repr__(self):
+        return 'Archive of {} members'.format(len(self.members))
+
+    def add_object(self, name, obj):
+        """ Add an object file as a new member """
+        symbols = [symbol.name for symbol in obj.symbols]
+        self.add_member(ArchiveMember(name, symbols, obj=obj))
+
+    def add_member(self, member):
+        """ Add a member and index its symbols.
+
+        When several members define the same symbol, the first one is
+        used.
+        """
+        self.members.append(member)
+        for name in member.symbols:
+            self.symbol_map.setdefault(name, member)
+
+    def find_member(self, name):
+        """ Find the member defining the given symbol, or None """
+        return self.symbol_map.get(name, None)
+
+    def save(self, output_file):
+        """ Save the archive to a binary file """
+        write_archive(self, output_file)
+
+
+def create_archive(objects):
+    """ Create an archive from the given objects.
+
+    Members loaded from a file are named after the file.
+    """
+    archive = Archive()
+    for index, obj in enumerate(objects):
+        if isinstance(obj, str):
+            name = obj
+        else:
+            name = getattr(obj, 'name', 'member{}'.format(index))
+        archive.add_object(name, get_object(obj))
+    return archive
+
+
+def write_archive(archive, output_file):
+    """ Write an archive to a binary file """
+    strings = StringTable()
+    member_names = [strings[member.name] for member in archive.members]
+    member_numbers = {
+        member: number for number, member in enumerate(archive.members)}
+    symbol_records = [
+        (strings[name], member_numbers[member])
+        for name, member in sorted(archive.symbol_map.items())]
+    string_data = strings.encode()
+
+    member_data = []
+    for member in archive.members:
+        f = io.BytesIO()
+        write_object(member.get_object(), f)
+        member_data.append(f.getvalue())
+
+    # Determine the position of all parts:
+    offset = header_struct.size
+    offset += member_struct.size * len(archive.members)
+    offset += symbol_struct.size * len(symbol_records)
+    string_offset = offset
+    offset += len(string_data)
+
+    member_records = []
+    for name, data in zip(member_names, member_data):
+        offset = align(offset)
+        member_records.append((name, offset, len(data)))
+        offset += len(data)
+
+    parts = [header_struct.pack(
+        MAGIC, VERSION, 0, len(strings.strings), len(member_records),
+        len(symbol_records), string_offset, len(string_data))]
+    for record in member_records:
+        parts.append(member_struct.pack(*record))
+    for record in symbol_records:
+        parts.append(symbol_struct.pack(*record))
+    parts.append(string_data)
+    offset = string_offset + len(string_data)
+    for record, data in zip(member_records, member_data):
+        padding = record[1] - offset
+        parts.append(bytes(padding))
+        parts.append(data)
+        offset += padding + len(data)
+
+    for part in parts:
+        output_file.write(part)
+
+
+def read_archive(data):
+    """ Create an archive from a buffer with an archive.
+
+    The members refer into the buffer and are read when they are used.
+    """
+    view = memoryview(data)
+    try:
+        return _read_archive(view)
+    except (struct.error, IndexError) as ex:
+        raise ValueError('Corrupt archive: {}'.format(ex))
+
+
+def _read_archive(view):
+    header = header_struct.unpack_from(view)
+    magic, version = header[:2]
+    if magic != MAGIC:
+        raise ValueError('Not an archive')
+    if version != VERSION:
+        raise ValueError('Unsupported archive version {}'.format(version))
+    string_count, member_count, symbol_count = header[3:6]
+    string_offset, string_size = header[6:]
+
+    strings = bytes(
+        view[string_offset:string_offset+string_size]).decode('utf8')
+    strings = strings.split('\x00')
+    if len(strings) != string_count:
+        raise ValueError('Corrupt string table')
+
+    offset = header_struct.size
+    size = member_struct.size * member_count
+    member_records = list(member_struct.iter_unpack(
+        view[offset:offset+size]))
+    offset += size
+    size = symbol_struct.size * symbol_count
+    symbol_records = symbol_struct.iter_unpack(view[offset:offset+size])
+
+    symbols = [[] for _ in member_records]
+    for name, number in symbol_records:
+        symbols[number].append(strings[name])
+
+    archive = Archive()
+    for (name, data_offset, data_size), names in zip(
+            member_records, symbols):
+        if data_offset + data_size > len(view):
+            raise ValueError('Member data beyond end of file')
+        data = view[data_offset:data_offset+data_size]
+        loader = _make_loader(data)
+        archive.add_member(ArchiveMember(strings[name], names, loader=loader))
+    return archive
+
+
+def _make_loader(data):
+    return lambda: read_object(data)
+
+
+def load_archive(filename):
+    """ Load an archive by memory mapping it """
+    with open(filename, 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return read_archive(buffer)
+
+
+def get_archive(archive):
+    """ Load an archive, unless it already is one """
+    if isinstance(archive, Archive):
+        return archive
+    if isinstance(archive, str):
+        return load_archive(archive)
+    return read_archive(archive.read())
+
+
+def save_archive(archive, filename):
+    """ Save an archive under the given filename """
+    with open(filename, 'wb') as f:
+        archive.save(f)
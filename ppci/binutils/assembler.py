@@ -53,8 +53,193 @@ class AsmLexer(BaseLexer):
         return typ, val
 
 
+class DerivationParser(EarleyParser):
+    """ Earley parser which returns the derivation of the parse.
+
+    A derivation is a tuple of a production and its children. A child
+    is the index of a token, or the derivation of a non-terminal.
+    """
+    def walk(self, columns, end, nt):
+        items = columns[end]
+        items = filter(lambda i: i.rule.name == nt and i.is_reduce, items)
+        items = sorted(items, key=lambda i: i.rule.priority)
+        if not items:
+            raise RuntimeError("Unable build tree")  # pragma: no cover
+
+        item = items[0]
+        children = []
+        for x in reversed(item.rule.symbols):
+            if self.grammar.is_nonterminal(x):
+                x, end = self.walk(columns, end, x)
+                children.insert(0, x)
+            else:
+                children.insert(0, end - 1)
+                end -= 1
+        return (item.rule, tuple(children)), end
+
+
+class TokenList:
+    """ Feed a list of tokens to a parser """
+    def __init__(self, tokens, eof):
+        self.tokens = iter(tokens)
+        self.eof = eof
+
+    def next_token(self):
+        return next(self.tokens, self.eof)
+
+
+class LeftRecursion(Exception):
+    """ Raised when the shape matcher runs into a left recursive rule """
+    pass
+
+
+class ShapeMatcher:
+    """ Top down matcher of a sequence of token types.
+
+    The productions of each non-terminal are indexed by the terminals
+    they can start with, so for an instruction only the productions
+    starting with its mnemonic are tried. All derivations of the
+    token types are determined, and the match only succeeds when there is
+    exactly one. Left recursive rules are not supported.
+    """
+    def __init__(self, grammar):
+        self.grammar = grammar
+        self.nonterminals = set(grammar.nonterminals)
+        first, nullable = self.calculate_first_sets()
+
+        productions = {nt: [] for nt in self.nonterminals}
+        for production in grammar.productions:
+            productions[production.name].append(production)
+
+        # Determine for each non-terminal the productions to try per
+        # terminal. Productions which can be empty are always tried:
+        self.index = {}
+        self.nullable_productions = {}
+        for nt, nt_productions in productions.items():
+            starts = {}
+            for production in nt_productions:
+                starts[production] = self.sequence_first(
+                    production.symbols, first, nullable)
+            empty = [p for p in nt_productions if starts[p][1]]
+            terminals = set()
+            for production_first, _ in starts.values():
+                terminals |= production_first
+            self.index[nt] = {
+                terminal: [
+                    p for p in nt_productions
+                    if terminal in starts[p][0] or starts[p][1]]
+                for terminal in terminals}
+            self.nullable_productions[nt] = empty
+
+    def calculate_first_sets(self):
+        """ Determine the first terminals and nullability of symbols """
+        first = {nt: set() for nt in self.nonterminals}
+        nullable = set()
+        changed = True
+        while changed:
+            changed = False
+            for production in self.grammar.productions:
+                name = production.name
+                symbols_first, empty = self.sequence_first(
+                    production.symbols, first, nullable)
+                if symbols_first - first[name]:
+                    first[name] |= symbols_first
+                    changed = True
+                if empty and name not in nullable:
+                    nullable.add(name)
+                    changed = True
+        return first, nullable
+
+    def sequence_first(self, symbols, first, nullable):
+        """ Get the first terminals of a sequence, and if it can be empty """
+        result = set()
+        for symbol in symbols:
+            if symbol in self.nonterminals:
+                result |= first[symbol]
+                if symbol not in nullable:
+                    return result, False
+            else:
+                result.add(symbol)
+                return result, False
+        return result, True
+
+    def match(self, shape):
+        """ Get the derivation of the token types, or None """
+        self.shape = shape
+        self.memo = {}
+        self.active = set()
+        try:
+            derivations = [
+                derivation for end, derivation in self.match_nonterminal(
+                    self.grammar.start_symbol, 0)
+                if end == len(shape)]
+        except LeftRecursion:
+            return
+        if len(derivations) == 1:
+            return derivations[0]
+
+    def match_nonterminal(self, nt, pos):
+        """ Get all end positions and derivations of nt starting at pos """
+        key = (nt, pos)
+        if key in self.memo:
+            return self.memo[key]
+        if key in self.active:
+            raise LeftRecursion()
+        self.active.add(key)
+
+        shape = self.shape
+        if pos < len(shape):
+            productions = self.index[nt].get(
+                shape[pos], self.nullable_productions[nt])
+        else:
+            productions = self.nullable_productions[nt]
+
+        results = []
+        for production in productions:
+            partial = [(pos, ())]
+            for symbol in production.symbols:
+                extended = []
+                for start, children in partial:
+                    if symbol in self.nonterminals:
+                        for end, derivation in self.match_nonterminal(
+                                symbol, start):
+                            extended.append((end, children + (derivation,)))
+                    elif start < len(shape) and shape[start] == symbol:
+                        extended.append((start + 1, children + (start,)))
+                partial = extended
+                if not partial:
+                    break
+            for end, children in partial:
+                results.append((end, (production, children)))
+
+        self.active.remove(key)
+        self.memo[key] = results
+        return results
+
+
+def apply_derivation(derivation, tokens):
+    """ Apply the semantic actions of a derivation to the tokens """
+    production, children = derivation
+    args = [
+        tokens[child] if isinstance(child, int)
+        else apply_derivation(child, tokens) for child in children]
+    if production.f:
+        return production.f(*args)
+
+
 class AsmParser:
-    """ Base parser for assembler language """
+    """ Base parser for assembler language.
+
+    A line is parsed in two steps. First the types of its tokens are
+    matched against the grammar, resulting in a derivation. Then the
+    semantic actions of the derivation are applied to the tokens.
+
+    The derivation only depends on the token types, so it is cached by the
+    sequence of token types. New sequences are matched by the shape
+    matcher, and only when this fails by the earley parser.
+    """
+    fast_path = True
+
     def __init__(self):
         # Construct a parser given a grammar:
         terminals = ['ID', 'NUMBER', EPS, 'COMMENT', EOF] + Syntax.GLYPHS
@@ -72,6 +257,7 @@ class AsmParser:
         self.g.add_production('asmline2', ['directive'])
         self.g.add_production('asmline2', [])
         self.g.start_symbol = 'asmline'
+        self.grammar_size = None
 
     def handle_ins(self, i):
         # if i:
@@ -87,9 +273,44 @@ class AsmParser:
 
     def parse(self, lexer):
         """ Entry function to parser """
-        if not hasattr(self, 'p'):
-            self.p = EarleyParser(self.g)
-        self.p.parse(lexer)
+        if not self.fast_path:
+            if not hasattr(self, 'p'):
+                self.p = EarleyParser(self.g)
+            self.p.parse(lexer)
+            return
+
+        # Rules can be added at any time, check if the grammar changed:
+        grammar_size = (len(self.g.terminals), len(self.g.productions))
+        if grammar_size != self.grammar_size:
+            self.grammar_size = grammar_size
+            self.derivations = {}
+            self.matcher = None
+            self.derivation_parser = None
+
+        tokens = []
+        token = lexer.next_token()
+        while token.typ != EOF:
+            tokens.append(token)
+            token = lexer.next_token()
+
+        shape = tuple(token.typ for token in tokens)
+        if shape in self.derivations:
+            derivation = self.derivations[shape]
+        else:
+            derivation = self.derive(shape, tokens, token)
+            self.derivations[shape] = derivation
+        apply_derivation(derivation, tokens)
+
+    def derive(self, shape, tokens, eof):
+        """ Determine the derivation of a new sequence of token types """
+        if self.matcher is None:
+            self.matcher = ShapeMatcher(self.g)
+        derivation = self.matcher.match(shape)
+        if derivation is None:
+            if self.derivation_parser is None:
+                self.derivation_parser = DerivationParser(self.g)
+            derivation = self.derivation_parser.parse(TokenList(tokens, eof))
+        return derivation
 
 
 class BaseAssembler:
@@ -204,7 +425,9 @@ class BaseAssembler:
 
         if isinstance(arg_cls, tuple):
             assert len(arg_cls) > 0
-            nt = 'w00t{}'.format(id(arg_cls))
+            # Number the non terminal, so that the grammar does not
+            # depend on memory addresses:
+            nt = 'w00t{}'.format(len(self.typ2nt))
             assert nt not in self.typ2nt.values()
             self.typ2nt[arg_cls] = nt
             for con in arg_cls:
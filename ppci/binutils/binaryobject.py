@@ -0,0 +1,239 @@
+""" Compact binary format for object files.
+
+The json based object format is easy to inspect, but parsing the json and
+decoding the hexadecimal section data is slow when many object files are
+linked together. This binary format contains the same information, but can
+be loaded quickly.
+
+The file starts with a fixed header, followed by tables of packed records,
+a string table, optional debug information and the raw section data. All
+numbers are stored little endian. Names are stored once in the string
+table, and records refer to them by index.
+
+Loading copies the section data out of the buffer in one piece per
+section, so that the loaded sections can be changed like any other.
+"""
+
+import json
+import struct
+from . import debuginfo
+from .objectfile import ObjectFile, Section, Image
+
+
+MAGIC = b'PPCIOBJ\x00'
+VERSION = 1
+
+# magic, version, flags, arch, string count, section count, symbol count,
+# relocation count, image count, image section count, string table offset,
+# string table size, debug offset, debug size:
+header_struct = struct.Struct('<8sHHIIIIIIIQQQQ')
+
+# name, address, alignment, data offset, data size:
+section_struct = struct.Struct('<IQIQQ')
+
+# name, value, section:
+symbol_struct = struct.Struct('<IqI')
+
+# symbol, type, section, offset, addend:
+relocation_struct = struct.Struct('<IIIqq')
+
+# name, address, first image section, image section count:
+image_struct = struct.Struct('<IQII')
+
+# section index:
+image_section_struct = struct.Struct('<I')
+
+
+def is_binary_object(data):
+    """ Check if the given data starts as a binary object file """
+    return bytes(data[:len(MAGIC)]) == MAGIC
+
+
+class StringTable:
+    """ Collects unique strings and numbers them """
+    def __init__(self):
+        self.strings = []
+        self.string_map = {}
+
+    def __getitem__(self, string):
+        if string not in self.string_map:
+            self.string_map[string] = len(self.strings)
+            self.strings.append(string)
+        return self.string_map[string]
+
+    def encode(self):
+        """ Encode all strings, separated by zero bytes """
+        return '\x00'.join(self.strings).encode('utf8')
+
+
+def align(offset, alignment=8):
+    """ Round offset up to a multiple of alignment """
+    return offset + (-offset % alignment)
+
+
+def write_object(obj, output_file):
+    """ Write an object file in binary format to a binary file """
+    obj.polish()
+    strings = StringTable()
+    arch = strings[obj.arch.make_id_str()]
+
+    section_numbers = {}
+    for number, section in enumerate(obj.sections):
+        section_numbers[section.name] = number
+
+    image_records = []
+    image_sections = []
+    for image in obj.images:
+        image_records.append((
+            strings[image.name], image.address, len(image_sections),
+            len(image.sections)))
+        image_sections.extend(
+            section_numbers[section.name] for section in image.sections)
+
+    symbol_records = [
+        (strings[s.name], s.value, strings[s.section]) for s in obj.symbols]
+
+    relocation_records = [
+        (strings[r.symbol_name], strings[r.name], strings[r.section],
+         r.offset, r.addend) for r in obj.relocations]
+
+    # Reserve names of the sections in the table:
+    section_names = [strings[section.name] for section in obj.sections]
+
+    if obj.debug_info:
+        debug_data = json.dumps(
+            debuginfo.serialize(obj.debug_info),
+            sort_keys=True).encode('utf8')
+    else:
+        debug_data = bytes()
+    string_data = strings.encode()
+
+    # Determine the position of all parts:
+    offset = header_struct.size
+    offset += section_struct.size * len(obj.sections)
+    offset += symbol_struct.size * len(symbol_records)
+    offset += relocation_struct.size * len(relocation_records)
+    offset += image_struct.size * len(image_records)
+    offset += image_section_struct.size * len(image_sections)
+    string_offset = offset
+    offset += len(string_data)
+    debug_offset = offset
+    offset += len(debug_data)
+
+    section_records = []
+    for name, section in zip(section_names, obj.sections):
+        offset = align(offset)
+        section_records.append((
+            name, section.address, section.alignment, offset,
+            section.size))
+        offset += section.size
+
+    parts = [header_struct.pack(
+        MAGIC, VERSION, 0, arch, len(strings.strings), len(section_records),
+        len(symbol_records), len(relocation_records), len(image_records),
+        len(image_sections), string_offset, len(string_data),
+        debug_offset, len(debug_data))]
+    for records, record_struct in [
+            (section_records, section_struct),
+            (symbol_records, symbol_struct),
+            (relocation_records, relocation_struct),
+            (image_records, image_struct),
+            ([(n,) for n in image_sections], image_section_struct)]:
+        for record in records:
+            parts.append(record_struct.pack(*record))
+    parts.append(string_data)
+    parts.append(debug_data)
+    offset = debug_offset + len(debug_data)
+    for record, section in zip(section_records, obj.sections):
+        padding = record[3] - offset
+        parts.append(bytes(padding))
+        parts.append(section.data)
+        offset += padding + section.size
+
+    for part in parts:
+        output_file.write(part)
+
+
+def read_object(data):
+    """ Create an object file from a buffer with a binary object """
+    view = memoryview(data)
+    try:
+        return _read_object(view)
+    except (struct.error, IndexError) as ex:
+        raise ValueError('Corrupt binary object file: {}'.format(ex))
+
+
+def _read_object(view):
+    from ..api import get_arch
+    header = header_struct.unpack_from(view)
+    magic, version = header[:2]
+    if magic != MAGIC:
+        raise ValueError('Not a binary object file')
+    if version != VERSION:
+        raise ValueError(
+            'Unsupported binary object file version {}'.format(version))
+    arch, string_count = header[3:5]
+    section_count, symbol_count, relocation_count = header[5:8]
+    image_count, image_section_count = header[8:10]
+    string_offset, string_size, debug_offset, debug_size = header[10:]
+
+    strings = bytes(
+        view[string_offset:string_offset+string_size]).decode('utf8')
+    strings = strings.split('\x00')
+    if len(strings) != string_count:
+        raise ValueError('Corrupt string table')
+
+    def records(record_struct, count):
+        nonlocal offset
+        size = record_struct.size * count
+        part = view[offset:offset+size]
+        offset += size
+        return record_struct.iter_unpack(part)
+
+    offset = header_struct.size
+    section_records = records(section_struct, section_count)
+    symbol_records = records(symbol_struct, symbol_count)
+    relocation_records = records(relocation_struct, relocation_count)
+    image_records = records(image_struct, image_count)
+    image_sections = records(image_section_struct, image_section_count)
+
+    arch = get_arch(strings[arch])
+    obj = ObjectFile(arch)
+    for name, address, alignment, data_offset, size in section_records:
+        if data_offset + size > len(view):
+            raise ValueError('Section data beyond end of file')
+        section = Section(strings[name])
+        section.address = address
+        section.alignment = alignment
+        section.data = bytearray(view[data_offset:data_offset+size])
+        obj.add_section(section)
+
+    for name, value, section in symbol_records:
+        obj.add_symbol(strings[name], value, strings[section])
+
+    relocation_map = arch.isa.relocation_map
+    for symbol, typ, section, reloc_offset, addend in relocation_records:
+        reloc_cls = relocation_map[strings[typ]]
+        obj.add_relocation(reloc_cls(
+            strings[symbol], offset=reloc_offset, section=strings[section],
+            addend=addend))
+
+    image_sections = [n for n, in image_sections]
+    for name, address, first, count in image_records:
+        image = Image(strings[name], address)
+        for number in image_sections[first:first+count]:
+            image.add_section(obj.sections[number])
+        obj.add_image(image)
+
+    if debug_size:
+        debug_data = bytes(view[debug_offset:debug_offset+debug_size])
+        obj.debug_info = debuginfo.deserialize(
+            json.loads(debug_data.decode('utf8')))
+    return obj
+
+
+def load_object(filename):
+    """ Load a binary object file """
+    with open(filename, 'rb') as f:
+        data = f.read()
+    return read_object(data)
@@ -358,14 +358,39 @@ class DebugInfoReplicator:
 
 class SectionAdjustingReplicator(DebugInfoReplicator):
     """ Replicate debug information, but shift offsets in sections by
-        the amount given in the offsets dictionary """
-    def __init__(self, offsets):
+        the amount given in the offsets dictionary.
+
+        Sections can be renamed with the names dictionary. Information
+        about sections which are not in the offsets dictionary is left out.
+    """
+    def __init__(self, offsets, names=None):
         self.offsets = offsets
+        self.names = names or {}
+
+    def replicate(self, debug_info_in, debug_info_out):
+        for location in debug_info_in.locations:
+            if self.is_kept(location.address):
+                debug_info_out.add(self.do_location(location))
+        for function in debug_info_in.functions:
+            if self.is_kept(function.begin):
+                debug_info_out.add(self.do_function(function))
+        for typ in debug_info_in.types:
+            debug_info_out.add(self.do_type(typ))
+        for variable in debug_info_in.variables:
+            if self.is_kept(variable.address):
+                debug_info_out.add(self.do_variable(variable))
+
+    def is_kept(self, address):
+        """ Check if the address is in one of the replicated sections """
+        if isinstance(address, DebugAddress):
+            return address.section in self.offsets
+        return True
 
     def do_address(self, address):
         if isinstance(address, DebugAddress):
             offset = address.offset + self.offsets[address.section]
-            return DebugAddress(address.section, offset)
+            section = self.names.get(address.section, address.section)
+            return DebugAddress(section, offset)
         else:
             return super().do_address(address)
 
@@ -1,40 +1,485 @@
+""" Contains disassembler stuff.
 
-""" Contains disassembler stuff. """
+The disassembler is table driven. When created for an architecture, a
+decode entry is made for each instruction of the isa, and for each choice
+of the sub constructors of its operands (such as the addressing modes of
+msp430 and x86_64). An operand is decoded in one of two ways:
 
+- From its bit field, when the instruction is encoded by its patterns
+  only and the operand maps onto a field (see
+  :class:`ppci.arch.encoding.VariablePattern`).
+- By lookup, when the operand can take only a few values, for example
+  a register. Each value is encoded once, and the changed bits are used
+  to look up the value when decoding. This also works for instructions
+  with a custom encode function.
+
+The bits which do not belong to any operand are fixed. These mask / value
+pairs are arranged into a decision tree, where each node selects a set of
+bits and looks up the matching subtree in a dictionary. This way, decoding
+an instruction costs a few table lookups, independent of the amount of
+instructions in the isa. A decoded instruction is encoded again to verify
+that it results in the same bytes. The tables are made once for each isa.
+
+Instructions which refer to labels, such as branches, and operands with
+many values which are not mapped onto a single field, such as x86_64
+memory displacements, are not decoded. Those are emitted as bytes.
+"""
+
+import itertools
+import logging
+from collections import defaultdict
+from functools import lru_cache
 from ..arch.data_instructions import DByte
+from ..arch.encoding import Instruction, Constructor, Operand, Transform
+from ..arch.encoding import VariablePattern
+from ..arch.generic_instructions import VirtualInstruction
+from ..arch.registers import Register
+from ..arch.token import TokenSequence
+
+
+class DecodeEntry:
+    """ A single instruction form in the decoding table.
+
+    The form consists of the instruction and the sub constructor chosen
+    for each of its constructor operands. The operands of these are
+    decoded from the fields or via the lookup tables.
+    """
+    __slots__ = (
+        'mask', 'value', 'size', 'instruction', 'options', 'tokens',
+        'fields', 'lookups', 'specificity')
+
+    def __init__(
+            self, mask, value, size, instruction, options, tokens, fields,
+            lookups):
+        self.mask = mask
+        self.value = value
+        self.size = size
+        self.instruction = instruction
+        self.options = options
+        self.tokens = tokens
+        self.fields = fields
+        self.lookups = lookups
+        self.specificity = bin(mask).count('1') + sum(
+            bin(lookup_mask).count('1') for _, _, lookup_mask, _ in lookups)
+
+    def __repr__(self):
+        return 'DecodeEntry({}, mask={:x}, value={:x})'.format(
+            self.instruction.__name__, self.mask, self.value)
+
+    def matches(self, word):
+        """ Test if the given word matches this entry """
+        return word & self.mask == self.value
+
+    def decode(self, data):
+        """ Decode data into an instruction of this form """
+        values = [{} for _ in range(len(self.options) + 1)]
+        if self.fields:
+            tokens = TokenSequence([t() for t in self.tokens])
+            tokens.fill(data)
+            for index, operand, pattern in self.fields:
+                value = tokens.get_field(pattern.field)
+                values[index][operand] = pattern.prop.from_value(value)
+
+        word = int.from_bytes(data, 'little')
+        for index, operand, mask, table in self.lookups:
+            values[index][operand] = table[word & mask]
+
+        instruction = build_instruction(
+            self.instruction, self.options, values)
+        if instruction.encode() != data:
+            raise ValueError('Cannot decode {}'.format(self.instruction))
+        return instruction
+
+
+def build_instruction(instruction, options, values):
+    """ Instantiate an instruction and its sub constructors.
+
+    The values contain the operand values of the instruction, followed
+    by those of each option.
+    """
+    sub_constructors = {}
+    for index, (farg, option) in enumerate(options, 1):
+        args = [
+            values[index][a] for a in option.syntax.get_formal_arguments()]
+        sub_constructors[farg] = option(*args)
+
+    args = []
+    for farg in instruction.syntax.get_formal_arguments():
+        if farg in sub_constructors:
+            args.append(sub_constructors[farg])
+        else:
+            args.append(values[0][farg])
+    return instruction(*args)
+
+
+class DecisionNode:
+    """ Decision tree node.
+
+    The node selects the bits in mask, and uses the selected value
+    to lookup the next node. Entries which do not have all bits in mask
+    fixed, are kept in the default node.
+    """
+    __slots__ = ('mask', 'children', 'default')
+
+    def __init__(self, mask, children, default):
+        self.mask = mask
+        self.children = children
+        self.default = default
+
+    def lookup(self, word):
+        """ Walk the tree and return the candidate entries """
+        node = self
+        while isinstance(node, DecisionNode):
+            node = node.children.get(word & node.mask, node.default)
+        return node
+
+
+def build_decision_tree(entries, used_mask=0):
+    """ Arrange the given decode entries into a decision tree.
+
+    Returns either a DecisionNode or a list of entries in the order in
+    which they must be tried.
+    """
+    if len(entries) < 2:
+        return entries
+
+    # Select the bits which are fixed in all entries:
+    common = ~used_mask
+    for entry in entries:
+        common &= entry.mask
+
+    if common:
+        fixed, wild = entries, []
+    else:
+        # Pick the bit fixed in most entries, and partition on the
+        # bits shared by all entries which have this bit fixed.
+        counts = defaultdict(int)
+        for entry in entries:
+            mask = entry.mask & ~used_mask
+            while mask:
+                low_bit = mask & -mask
+                counts[low_bit] += 1
+                mask ^= low_bit
+
+        if not counts:
+            return sort_candidates(entries)
+
+        top_bit = max(counts, key=lambda b: (counts[b], b))
+        if counts[top_bit] < 2:
+            return sort_candidates(entries)
+
+        fixed = [e for e in entries if e.mask & top_bit]
+        wild = [e for e in entries if not e.mask & top_bit]
+        common = ~used_mask
+        for entry in fixed:
+            common &= entry.mask
+
+    buckets = defaultdict(list)
+    for entry in fixed:
+        buckets[entry.value & common].append(entry)
+
+    used_mask |= common
+    children = {
+        key: build_decision_tree(bucket + wild, used_mask)
+        for key, bucket in buckets.items()}
+    default = build_decision_tree(wild, used_mask)
+    return DecisionNode(common, children, default)
+
+
+def sort_candidates(entries):
+    """ Sort entries such that the most specific entry is tried first """
+    return sorted(entries, key=lambda e: e.specificity, reverse=True)
+
+
+def field_pattern(operand, patterns):
+    """ Find a pattern from which the operand can be decoded """
+    for pattern in patterns:
+        if not isinstance(pattern, VariablePattern):
+            continue
+        if pattern.prop.source is not operand:
+            continue
+        prop = pattern.prop
+        if isinstance(prop, Operand) or \
+                type(prop).backwards is not Transform.backwards:
+            return pattern
+
+
+def operand_domain(operand, patterns):
+    """ Get the few values an operand can take, or None if unknown """
+    cls = operand._cls
+    if isinstance(cls, type) and issubclass(cls, Register):
+        try:
+            return list(cls.all_registers())
+        except NotImplementedError:
+            return
+    for pattern in patterns:
+        if isinstance(pattern, VariablePattern) and \
+                isinstance(pattern.prop, Transform) and \
+                pattern.prop.source is operand and pattern.prop.values:
+            return list(pattern.prop.values)
+
+
+# Errors raised when encoding forms which are not valid:
+ENCODE_ERRORS = (ValueError, KeyError)
+
+
+def is_decodable(instruction):
+    """ Determine if an instruction can be decoded at all """
+    if not isinstance(instruction, type):
+        return False
+    if not issubclass(instruction, Instruction):
+        return False
+    if issubclass(instruction, VirtualInstruction):
+        return False
+    return bool(instruction.syntax)
+
+
+def make_entries(instruction):
+    """ Create the decode table entries for the given instruction.
+
+    An entry is created for each combination of the sub constructors
+    of the operands.
+    """
+    if not is_decodable(instruction):
+        return
+
+    choices = []
+    for farg in instruction.syntax.get_formal_arguments():
+        if farg.is_constructor:
+            options = farg._cls
+            if not isinstance(options, tuple):
+                options = (options,)
+            choices.append([(farg, option) for option in options])
+
+    for options in itertools.product(*choices):
+        yield from make_form_entries(instruction, options)
+
+
+def make_form_entries(instruction, options):
+    """ Create the decode table entries for one form of an instruction.
+
+    Some operand values result in encodings of another size, for example
+    registers which require a prefix. An entry is created for each size.
+    """
+    owners = [instruction]
+    for _, option in options:
+        if not isinstance(option, type) or \
+                not issubclass(option, Constructor) or not option.syntax:
+            return
+        owners.append(option)
+
+    # Fields can only be decoded when the patterns are the whole story:
+    by_patterns = instruction.encode is Instruction.encode and all(
+        owner.set_user_patterns is Constructor.set_user_patterns
+        for owner in owners)
+
+    fields = []
+    domains = []
+    values = []
+    for index, owner in enumerate(owners):
+        patterns = Constructor.dict_to_patterns(owner.patterns)
+        owner_values = {}
+        for farg in owner.syntax.get_formal_arguments():
+            if farg.is_constructor:
+                if index == 0:
+                    continue
+                # Sub constructors of sub constructors are not supported.
+                return
+
+            pattern = field_pattern(farg, patterns) if by_patterns else None
+            if pattern:
+                fields.append((index, farg, pattern))
+                if isinstance(farg._cls, type) and \
+                        issubclass(farg._cls, Register):
+                    owner_values[farg] = farg._cls.all_registers()[0]
+                elif farg._cls is int:
+                    owner_values[farg] = 0
+                else:
+                    return
+            else:
+                domain = operand_domain(farg, patterns)
+                if not domain:
+                    return
+                domains.append((index, farg, domain))
+                owner_values[farg] = domain[0]
+        values.append(owner_values)
+
+    # Group the values of each operand by the size of the encoding:
+    groups = []
+    for index, operand, domain in domains:
+        sizes = defaultdict(list)
+        for value, data in encode_values(
+                instruction, options, values, index, operand, domain):
+            sizes[len(data)].append((value, data))
+        groups.append(list(sizes.values()))
+
+    for encodings in itertools.product(*groups):
+        # The encodings of an operand were made with the other operands
+        # set to their first value, so these only apply if the others
+        # use their first group.
+        lookups = []
+        for position, (index, operand, _) in enumerate(domains):
+            valid = all(
+                group is groups[other][0]
+                for other, group in enumerate(encodings) if other != position)
+            lookups.append((
+                index, operand, [value for value, _ in encodings[position]],
+                encodings[position] if valid else None))
+            values[index][operand] = encodings[position][0][0]
+        entry = make_entry(instruction, options, fields, lookups, values)
+        if entry:
+            yield entry
+
+
+def encode_values(instruction, options, values, index, operand, domain):
+    """ Encode the instruction for each value of an operand """
+    encodings = []
+    original = values[index][operand]
+    for value in domain:
+        values[index][operand] = value
+        try:
+            data = build_instruction(instruction, options, values).encode()
+        except ENCODE_ERRORS:
+            continue
+        encodings.append((value, data))
+    values[index][operand] = original
+    return encodings
+
+
+def make_entry(instruction, options, fields, domains, values):
+    """ Create a decode table entry for one form of an instruction.
+
+    The fields are decoded from the tokens. The domains list the values
+    to look up for the other operands, and optionally their encodings.
+    The values contain the initial value of each operand.
+    """
+    try:
+        ins = build_instruction(instruction, options, values)
+        data = ins.encode()
+    except ENCODE_ERRORS:
+        return
+
+    size = len(data)
+    word = int.from_bytes(data, 'little')
+
+    # Mark the bits of the fields as not fixed:
+    operand_mask = 0
+    tokens = ()
+    if fields:
+        mask_tokens = ins.get_tokens()
+        tokens = [type(t) for t in mask_tokens.tokens]
+        if sum(t.Info.size for t in tokens) != size * 8:
+            return
+        for _, _, pattern in fields:
+            # Setting a field to -1 sets all bits of the field:
+            mask_tokens.set_field(pattern.field, -1)
+        operand_mask = int.from_bytes(mask_tokens.encode(), 'little')
+
+    # Record the bits which change with the value of the other operands:
+    lookups = []
+    for index, operand, domain, encodings in domains:
+        if encodings is None:
+            encodings = encode_values(
+                instruction, options, values, index, operand, domain)
+        encodings = [
+            (value, int.from_bytes(value_data, 'little'))
+            for value, value_data in encodings if len(value_data) == size]
+
+        mask = 0
+        for _, value_word in encodings:
+            mask |= value_word ^ word
+        table = {}
+        for value, value_word in encodings:
+            table.setdefault(value_word & mask, value)
+        lookups.append((index, operand, mask, table))
+        operand_mask |= mask
+
+    mask = ((1 << (size * 8)) - 1) & ~operand_mask
+    # Instructions without fixed bits, such as data directives,
+    # would match anything, so leave them out:
+    if not mask:
+        return
+
+    return DecodeEntry(
+        mask, word & mask, size, instruction, options, tokens, fields,
+        lookups)
+
+
+@lru_cache(maxsize=30)
+def make_decode_trees(isa):
+    """ Create a decision tree for each instruction size of an isa """
+    entries = defaultdict(list)
+    for instruction in isa.instructions:
+        for entry in make_entries(instruction):
+            entries[entry.size].append(entry)
+
+    return {
+        size: build_decision_tree(size_entries)
+        for size, size_entries in entries.items()}
 
 
 class Disassembler:
     """ Base disassembler for some architecture """
+    logger = logging.getLogger('disassembler')
+
     def __init__(self, arch):
         self.arch = arch
-        for instruction in arch.isa.instructions:
-            # print(instruction, instruction.patterns)
-            # for nl in instruction.non_leaves:
-            #    print('  ', nl.patterns)
-            pass
+        self.trees = make_decode_trees(arch.isa)
+
+        # Try bigger instructions first, they are usually more specific:
+        self.sizes = sorted(self.trees, reverse=True)
+        if self.sizes:
+            self.unit_size = min(self.sizes)
+        else:
+            self.unit_size = 1
+        self.logger.debug('Using decode tables for %s', arch)
+
+    def take_one(self, data, offset):
+        """ Decode a single instruction at the given offset.
+
+        Returns a tuple of the decode entry and the instruction, or None
+        when no instruction matches.
+        """
+        best = None
+        for size in self.sizes:
+            part = data[offset:offset + size]
+            if len(part) != size:
+                continue
+            word = int.from_bytes(part, 'little')
+            tree = self.trees[size]
+            if isinstance(tree, DecisionNode):
+                candidates = tree.lookup(word)
+            else:
+                candidates = tree
+            for entry in candidates:
+                if best and best[0].specificity >= entry.specificity:
+                    break
+                if entry.matches(word):
+                    try:
+                        ins = entry.decode(part)
+                    except (ValueError, KeyError):
+                        continue
+                    best = entry, ins
+                    break
+        return best
 
     def disasm(self, data, outs, address=0):
         """ Disassemble data into an instruction stream """
-        # TODO: implement this!
-
-        # The trial and error method, will be slow as a snail:
-        # for instruction in self.arch.isa.instructions:
-        #    for size in instruction.sizes():
-        #        part = data[:size]
-        #        try:
-        #            print(instruction, part, size)
-        #            i = instruction.decode(part)
-        #            print(i)
-        #        except ValueError:
-        #            pass
-
-        # For now, all is bytes!
-        for byte in data:
-            ins = DByte(byte)
-            ins.address = address
-            outs.emit(ins)
-            address += len(ins.encode())
-
-    def take_one(self):
-        pass
+        offset = 0
+        while offset < len(data):
+            decoded = self.take_one(data, offset)
+            if decoded is None:
+                # Emit a unit of undecodable data as bytes:
+                for byte in data[offset:offset + self.unit_size]:
+                    ins = DByte(byte)
+                    ins.address = address
+                    outs.emit(ins)
+                    address += 1
+                    offset += 1
+            else:
+                entry, ins = decoded
+                size = entry.size
+                ins.address = address
+                outs.emit(ins)
+                address += size
+                offset += size
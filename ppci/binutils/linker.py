@@ -1,16 +1,50 @@
-""" Linker utility. """
+""" Linker utility.
+
+Besides object files, the linker accepts archives of object files. Only
+the archive members defining symbols which are referred to, but not yet
+defined, are linked in.
+
+The code generator can put each function in a section of its own, with
+a name like 'code.main'. When producing a final image, these function
+sections are merged into the output section named by the part in front
+of the dot, in this case 'code'. A partial link keeps the names, so that
+the function sections can still be told apart by a later link. When
+garbage collection of sections is requested, these sections are removed
+when no symbol defined in them is reachable from the entry symbols or
+from the other sections. Without explicit entry symbols, 'main' and
+'_start' are used.
+"""
 
 import logging
 from .objectfile import ObjectFile, Image, get_object
+from .archive import get_archive
 from ..common import CompilerError
 from .layout import Layout, Section, SectionData, SymbolDefinition, Align
 from .layout import get_layout
 from .debuginfo import SectionAdjustingReplicator, DebugInfo
 
 
+FUNCTION_SECTION_BASES = ('code', 'data')
+DEFAULT_ENTRY_SYMBOLS = ('main', '_start')
+
+
+def is_function_section(name):
+    """ Test if a section holds a single function or variable """
+    base, _, rest = name.partition('.')
+    return base in FUNCTION_SECTION_BASES and bool(rest)
+
+
+def get_output_section_name(name):
+    """ Get the name of the output section for the given input section """
+    if is_function_section(name):
+        return name.partition('.')[0]
+    return name
+
+
 def link(
         objects, layout=None, use_runtime=False, partial_link=False,
-        reporter=None, debug=False, extra_symbols=None):
+        reporter=None, debug=False, extra_symbols=None, libraries=None,
+        gc_sections=False, entry=None):
     """ Links the iterable of objects into one using the given layout.
 
     Args:
@@ -23,6 +57,13 @@ def link(
             this debug information from the result.
         extra_symbols: a dict of extra symbols which can be used during
             linking.
+        libraries: a collection of archives. Members of these archives
+            are linked in when they define a symbol that is referred to
+            but not defined by the objects.
+        gc_sections (bool): when true, remove sections of functions which
+            are not referred to.
+        entry: a collection of symbol names which are kept when removing
+            unused sections. Defaults to 'main' and '_start'.
 
     Returns:
         The linked object file
@@ -52,10 +93,14 @@ def link(
     if use_runtime:
         objects.append(march.runtime)
 
+    if libraries:
+        libraries = [get_archive(library) for library in libraries]
+
     linker = Linker(march, reporter)
     output_obj = linker.link(
         objects, layout=layout, partial_link=partial_link,
-        debug=debug, extra_symbols=extra_symbols)
+        debug=debug, extra_symbols=extra_symbols, libraries=libraries,
+        gc_sections=gc_sections, entry=entry)
     return output_obj
 
 
@@ -69,7 +114,8 @@ class Linker:
         self.reporter = reporter
 
     def link(self, input_objects, layout=None, partial_link=False,
-             debug=False, extra_symbols=None):
+             debug=False, extra_symbols=None, libraries=None,
+             gc_sections=False, entry=None):
         """ Link together the given object files using the layout """
         assert isinstance(input_objects, (list, tuple))
 
@@ -81,17 +127,30 @@ class Linker:
         else:
             self.extra_symbols = {}
 
+        # Extract the required archive members:
+        if libraries:
+            input_objects = self.extract_members(input_objects, libraries)
+
         # Check all incoming objects for same architecture:
         for input_object in input_objects:
             assert input_object.arch == self.arch
 
+        # Determine which sections are not used:
+        if gc_sections:
+            removed_sections = self.collect_garbage(
+                input_objects, entry or DEFAULT_ENTRY_SYMBOLS)
+        else:
+            removed_sections = set()
+
         # Create new object file to store output:
         dst = ObjectFile(self.arch)
         if debug:
             dst.debug_info = DebugInfo()
 
         # First merge all sections into output sections:
-        self.merge_objects(input_objects, dst, debug)
+        self.merge_objects(
+            input_objects, dst, debug, removed_sections,
+            partial_link=partial_link)
 
         # Apply layout rules:
         if layout:
@@ -123,16 +182,115 @@ class Linker:
             self.reporter.message('Linking complete')
         return dst
 
-    def merge_objects(self, input_objects, dst, debug):
-        """ Merge object files into a single object file """
-        for input_object in input_objects:
+    def extract_members(self, input_objects, libraries):
+        """ Add the archive members which define undefined symbols.
+
+        Members are extracted until no more undefined symbols can be
+        resolved, so members may refer to members of other archives.
+        """
+        objects = list(input_objects)
+        defined = set(self.extra_symbols)
+        referred = set()
+
+        def add_object(obj):
+            defined.update(symbol.name for symbol in obj.symbols)
+            referred.update(reloc.symbol_name for reloc in obj.relocations)
+
+        for obj in objects:
+            add_object(obj)
+
+        extracted = set()
+        changed = True
+        while changed:
+            changed = False
+            for library in libraries:
+                for name in sorted(referred - defined):
+                    member = library.find_member(name)
+                    if member is None or member in extracted:
+                        continue
+                    self.logger.debug(
+                        'Extracting %s for symbol %s', member.name, name)
+                    extracted.add(member)
+                    obj = member.get_object()
+                    objects.append(obj)
+                    add_object(obj)
+                    changed = True
+        return objects
+
+    def collect_garbage(self, input_objects, entry):
+        """ Determine the function sections which are not used.
+
+        Sections with a name like 'code.main' are removed, unless a symbol
+        defined in them is referred to from a used section, or is one of
+        the entry symbols. All other sections are used.
+
+        Returns a set of tuples with the index of the object and the name
+        of the section to remove.
+        """
+        definitions = {}
+        for index, input_object in enumerate(input_objects):
+            for symbol in input_object.symbols:
+                definitions.setdefault(
+                    symbol.name, (index, symbol.section))
+
+        references = {}
+        for index, input_object in enumerate(input_objects):
+            for reloc in input_object.relocations:
+                if reloc.symbol_name in definitions:
+                    references.setdefault((index, reloc.section), set()).add(
+                        definitions[reloc.symbol_name])
+
+        sections = [
+            (index, section.name)
+            for index, input_object in enumerate(input_objects)
+            for section in input_object.sections]
+        worklist = [
+            section for section in sections
+            if not is_function_section(section[1])]
+        roots = [definitions[name] for name in entry if name in definitions]
+        if not roots:
+            self.logger.warning(
+                'None of the entry symbols %s is defined', ', '.join(entry))
+        worklist.extend(roots)
+        used = set(worklist)
+        while worklist:
+            section = worklist.pop()
+            for target in references.get(section, ()):
+                if target not in used:
+                    used.add(target)
+                    worklist.append(target)
+
+        removed = set(sections) - used
+        for index, name in sorted(removed):
+            self.logger.debug(
+                'Removing unused section %s of %s', name, input_objects[index])
+        return removed
+
+    def merge_objects(
+            self, input_objects, dst, debug, removed_sections=(),
+            partial_link=False):
+        """ Merge object files into a single object file.
+
+        The sections given in removed_sections are left out. Function
+        sections are only merged into their output section when
+        partial_link is false.
+        """
+        for index, input_object in enumerate(input_objects):
             self.logger.debug('Merging %s', input_object)
             offsets = {}
+            names = {}
             # Merge sections:
             for input_section in input_object.sections:
+                if (index, input_section.name) in removed_sections:
+                    continue
+
                 # Get or create the output section:
-                output_section = dst.get_section(
-                    input_section.name, create=True)
+                if partial_link:
+                    name = input_section.name
+                else:
+                    name = get_output_section_name(input_section.name)
+                names[input_section.name] = name
+                output_section = dst.get_section(name, create=True)
 
                 # Align section:
                 while output_section.size % input_section.alignment != 0:
@@ -154,20 +312,24 @@ class Linker:
 
             # Merge symbols:
             for sym in input_object.symbols:
+                if sym.section not in offsets:
+                    continue
                 value = offsets[sym.section] + sym.value
-                dst.add_symbol(sym.name, value, sym.section)
+                dst.add_symbol(sym.name, value, names[sym.section])
 
             # Merge relocations:
             for reloc in input_object.relocations:
+                if reloc.section not in offsets:
+                    continue
                 offset = offsets[reloc.section] + reloc.offset
                 new_reloc = type(reloc)(
-                    reloc.symbol_name, section=reloc.section, offset=offset,
-                    addend=reloc.addend)
+                    reloc.symbol_name, section=names[reloc.section],
+                    offset=offset, addend=reloc.addend)
                 dst.add_relocation(new_reloc)
 
             # Merge debug info:
             if debug and input_object.debug_info:
-                replicator = SectionAdjustingReplicator(offsets)
+                replicator = SectionAdjustingReplicator(offsets, names)
                 replicator.replicate(input_object.debug_info, dst.debug_info)
 
     def layout_sections(self, dst, layout):
@@ -14,8 +14,13 @@ The hierarchy is as follows:
 - debug data have an offset into a section and contain data.
 - sections cannot overlap
 
+Object files can be stored in two formats. The default format is json, which
+can be inspected with a text editor. The binary format is compact and fast
+to load, and is used for files with the '.ojb' extension.
+
 """
 
+import io
 import json
 import binascii
 from ..common import CompilerError, make_num, get_file
@@ -23,15 +28,56 @@ from ..arch.encoding import Relocation
 from . import debuginfo
 
 
+BINARY_EXTENSION = '.ojb'
+
+
 def get_object(obj):
     """ Try hard to load an object """
     if not isinstance(obj, ObjectFile):
-        f = get_file(obj)
-        obj = ObjectFile.load(f)
-        f.close()
+        if isinstance(obj, str):
+            obj = load_object(obj)
+        else:
+            f = get_file(obj)
+            obj = ObjectFile.load(f)
+            f.close()
     return obj
 
 
+def load_object(filename):
+    """ Load an object file in either format from the given filename """
+    from . import binaryobject
+    with open(filename, 'rb') as f:
+        binary = binaryobject.is_binary_object(f.read(8))
+    if binary:
+        return binaryobject.load_object(filename)
+    with open(filename, 'r') as f:
+        return ObjectFile.load(f)
+
+
+def save_object(obj, filename, binary=None):
+    """ Save an object file under the given filename.
+
+    When binary is not given, the binary format is used when the filename
+    has the '.ojb' extension.
+    """
+    from ..build.cache import write_atomic
+    if binary is None:
+        binary = filename.endswith(BINARY_EXTENSION)
+
+    def write(f):
+        if binary:
+            obj.save(f, binary=True)
+        else:
+            text_file = io.TextIOWrapper(f, encoding='utf8')
+            obj.save(text_file)
+            text_file.flush()
+            text_file.detach()
+
+    # Write a new file which replaces the old one, so that no other process
+    # reads a half written object file.
+    write_atomic(filename, write)
+
+
 class Symbol:
     """ A symbol definition in an object file """
     def __init__(self, name, value, section):
@@ -58,6 +104,9 @@ class Section:
 
     def add_data(self, data):
         """ Append data to the end of this section """
+        if not isinstance(self.data, bytearray):
+            # Copy data loaded as a read-only view before changing it:
+            self.data = bytearray(self.data)
         self.data += data
 
     @property
@@ -246,16 +295,31 @@ class ObjectFile:
             (self.relocations == other.relocations) and \
             (self.images == other.images)
 
-    def save(self, output_file):
-        """ Save object file to a file like object """
-        self.polish()
-        json.dump(serialize(self), output_file, indent=2, sort_keys=True)
-        print(file=output_file)
+    def save(self, output_file, binary=False):
+        """ Save object file to a file like object.
+
+        When binary is true, the binary format is written into
+        the file, which must be opened in binary mode.
+        """
+        if binary:
+            from .binaryobject import write_object
+            write_object(self, output_file)
+        else:
+            self.polish()
+            json.dump(
+                serialize(self), output_file, indent=2, sort_keys=True)
+            print(file=output_file)
 
     @staticmethod
     def load(input_file):
-        """ Load object file from file """
-        return deserialize(json.load(input_file))
+        """ Load object file from file. Both formats are recognized. """
+        data = input_file.read()
+        if isinstance(data, bytes):
+            from . import binaryobject
+            if binaryobject.is_binary_object(data):
+                return binaryobject.read_object(data)
+            data = data.decode('utf8')
+        return deserialize(json.loads(data))
 
     def polish(self):
         """ Cleanup an object file """
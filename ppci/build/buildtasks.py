@@ -6,11 +6,16 @@ These task are wrappers around the functions provided in the buildfunctions
 module
 """
 
+import os
 from .tasks import Task, TaskError, register_task
 from ..utils.reporting import HtmlReportGenerator, DummyReportGenerator
 from .. import api
+from ..lang.c.api import get_included_files
 from ..lang.tools.common import ParserException
 from ..common import CompilerError
+from ..binutils.objectfile import save_object
+from .parallel import compile_c_sources
+from .state import file_stamp
 
 
 @register_task
@@ -42,7 +47,9 @@ class BuildTask(Task):
     """ Builds another build description file (build.xml) """
     def run(self):
         project = self.relpath(self.get_argument('file'))
-        api.construct(project)
+        api.construct(
+            project, cache=self.cache, jobs=self.jobs,
+            incremental=self.incremental)
 
 
 class OutputtingTask(Task):
@@ -52,14 +59,15 @@ class OutputtingTask(Task):
         """ Store the object in the specified file """
         output_filename = self.relpath(self.get_argument('output'))
         self.ensure_path(output_filename)
-        with open(output_filename, 'wt', encoding='utf8') as output_file:
-            obj.save(output_file)
+        save_object(obj, output_filename)
 
 
 @register_task
 class AssembleTask(OutputtingTask):
     """ Task that can runs the assembler over the source and enters the
         output into an object file """
+    input_arguments = ('source',)
+    output_arguments = ('output',)
 
     def run(self):
         arch = self.get_argument('arch')
@@ -85,6 +93,9 @@ class AssembleTask(OutputtingTask):
 @register_task
 class C3CompileTask(OutputtingTask):
     """ Task that compiles C3 source for some target into an object file """
+    input_arguments = ('sources', 'includes')
+    output_arguments = ('output', 'report')
+
     def run(self):
         arch = self.get_argument('arch')
         sources = self.open_file_set(self.arguments['sources'])
@@ -105,7 +116,8 @@ class C3CompileTask(OutputtingTask):
         with reporter:
             obj = api.c3c(
                 sources, includes, arch, opt_level=opt,
-                reporter=reporter, debug=debug)
+                reporter=reporter, debug=debug, cache=self.cache,
+                jobs=self.jobs)
 
         self.store_object(obj)
 
@@ -113,13 +125,54 @@ class C3CompileTask(OutputtingTask):
 @register_task
 class CCompileTask(OutputtingTask):
     """ Task that compiles C code for some target into an object file """
-    def run(self):
-        arch = self.get_argument('arch')
-        sources = self.open_file_set(self.arguments['sources'])
+    input_arguments = ('sources', 'includes')
+    output_arguments = ('output', 'report')
+
+    def get_coptions(self):
+        """ Get the options for the C frontend """
         if 'includes' in self.arguments:
             includes = self.open_file_set(self.arguments['includes'])
         else:
             includes = []
+        coptions = api.COptions()
+        coptions.add_include_paths(includes)
+        return coptions
+
+    def input_files(self):
+        """ Get the input files, including the headers of the sources.
+
+        The sources are pre-processed to find the headers they include,
+        for example from their own directory or from the standard library.
+        The headers of each source are recorded in the dependencies, and
+        a source is only pre-processed again when it or one of its
+        headers changed.
+        """
+        filenames = super().input_files()
+        coptions = self.get_coptions()
+        dependencies = {}
+        for source in self.open_file_set(self.get_argument('sources')):
+            stamp = file_stamp(source)
+            previous = self.dependencies.get(source)
+            if previous and previous['stamp'] == stamp and all(
+                    file_stamp(header) == header_stamp
+                    for header, header_stamp in previous['headers'].items()):
+                headers = previous['headers']
+            else:
+                try:
+                    with open(source, 'r') as f:
+                        headers = get_included_files(f, coptions=coptions)
+                except (OSError, CompilerError) as err:
+                    raise TaskError('Error:' + str(err))
+                headers = {
+                    os.path.normpath(h): file_stamp(h) for h in headers}
+            dependencies[source] = {'stamp': stamp, 'headers': headers}
+            filenames.extend(headers)
+        self.dependencies = dependencies
+        return sorted(set(filenames))
+
+    def run(self):
+        arch = self.get_argument('arch')
+        sources = self.open_file_set(self.arguments['sources'])
 
         if 'report' in self.arguments:
             report_file = self.relpath(self.arguments['report'])
@@ -130,17 +183,22 @@ class CCompileTask(OutputtingTask):
         debug = bool(self.get_argument('debug', default=False))
         opt = int(self.get_argument('optimize', default='0'))
 
-        coptions = api.COptions()
-        coptions.add_include_paths(includes)
+        coptions = self.get_coptions()
 
         with reporter:
-            objs = []
-            for source in sources:
-                with open(source, 'r') as f:
-                    obj = api.cc(
-                        f, arch, coptions=coptions, opt_level=opt,
-                        reporter=reporter, debug=debug)
-                objs.append(obj)
+            if self.jobs > 1:
+                # The worker processes do not write to the report:
+                objs = compile_c_sources(
+                    sources, arch, coptions=coptions, opt_level=opt,
+                    debug=debug, jobs=self.jobs, cache=self.cache)
+            else:
+                objs = []
+                for source in sources:
+                    with open(source, 'r') as f:
+                        obj = api.cc(
+                            f, arch, coptions=coptions, opt_level=opt,
+                            reporter=reporter, debug=debug, cache=self.cache)
+                    objs.append(obj)
             obj = api.link(
                 objs, partial_link=True, reporter=reporter, debug=debug)
 
@@ -150,6 +208,9 @@ class CCompileTask(OutputtingTask):
 @register_task
 class WasmCompileTask(OutputtingTask):
     """ Task that compiles a wasm module into an object file """
+    input_arguments = ('source',)
+    output_arguments = ('output', 'report')
+
     def run(self):
         arch = self.get_argument('arch')
         source = self.open_file_set(self.arguments['source'])
@@ -172,6 +233,9 @@ class WasmCompileTask(OutputtingTask):
 @register_task
 class LinkTask(OutputtingTask):
     """ Link together a collection of object files """
+    input_arguments = ('objects', 'layout')
+    output_arguments = ('output',)
+
     def run(self):
         if 'layout' in self.arguments:
             layout = self.relpath(self.get_argument('layout'))
@@ -194,6 +258,9 @@ class LinkTask(OutputtingTask):
 @register_task
 class ObjCopyTask(Task):
     """ Binary move parts of object code. """
+    input_arguments = ('objectfile',)
+    output_arguments = ('output',)
+
     def run(self):
         image_name = self.get_argument('imagename')
         output_filename = self.relpath(self.get_argument('output'))
@@ -0,0 +1,220 @@
+""" Persistent cache for compiled object files.
+
+Compilation results are stored on disk, keyed by a hash over everything
+which influences the output: the preprocessed source, the target
+architecture, the optimization level and the compiler version. When the
+same key is requested again, the stored object file is returned and
+compilation can be skipped.
+
+Entries are stored in the binary object format, which is fast to load.
+
+The cache is bounded in size. When it grows beyond its maximum size, the
+least recently used entries are removed.
+
+The cache directory can be set with the ``PPCI_CACHE_DIR`` environment
+variable. Caching can be disabled by setting ``PPCI_NO_CACHE``.
+
+The cached objects are linked into programs as they are, so everyone who
+can write to the cache directory controls the code of the programs built
+with it. Only use a cache directory which is writable by trusted users.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from .. import __version__
+from ..binutils.binaryobject import load_object
+
+
+class DiskCache:
+    """ Base class of caches which store one file per entry.
+
+    The cache is bounded in size. When it grows beyond its maximum size,
+    the least recently used entries are removed. Loading an entry marks it
+    as recently used.
+    """
+    logger = logging.getLogger('cache')
+    extension = ''
+
+    def __init__(self, directory, max_size):
+        self.directory = directory
+        self.max_size = max_size
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__.__name__, self.directory)
+
+    @staticmethod
+    def make_key(*parts):
+        """ Create a key from the given parts.
+
+        The parts can be strings, bytes or other objects which have a
+        stable string representation. The compiler version is always part
+        of the key.
+        """
+        return make_key(*parts)
+
+    def _filename(self, key):
+        return os.path.join(self.directory, key[:2], key + self.extension)
+
+    def touch(self, filename):
+        """ Mark an entry as recently used """
+        try:
+            os.utime(filename)
+        except OSError:  # pragma: no cover
+            pass
+
+    def write(self, key, write):
+        """ Store an entry by calling write with a binary file object """
+        try:
+            write_atomic(self._filename(key), write)
+        except OSError as ex:
+            self.logger.warning('Could not store %s in cache: %s', key, ex)
+            return
+        self.logger.debug('Stored %s in cache', key)
+        self.evict()
+
+    def entries(self):
+        """ Get a list of (mtime, size, filename) tuples of all entries """
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for sub_directory in os.listdir(self.directory):
+            path = os.path.join(self.directory, sub_directory)
+            if not os.path.isdir(path):
+                continue
+            for name in os.listdir(path):
+                if not name.endswith(self.extension):
+                    continue
+                filename = os.path.join(path, name)
+                try:
+                    stat = os.stat(filename)
+                except OSError:  # pragma: no cover
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, filename))
+        return entries
+
+    @property
+    def size(self):
+        """ The total size in bytes of the cache """
+        return sum(e[1] for e in self.entries())
+
+    def evict(self):
+        """ Remove least recently used entries until the cache fits """
+        entries = self.entries()
+        total_size = sum(e[1] for e in entries)
+        if total_size <= self.max_size:
+            return
+
+        for _, size, filename in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            self.logger.debug('Evicting %s from cache', filename)
+            try:
+                os.remove(filename)
+            except OSError:  # pragma: no cover
+                continue
+            total_size -= size
+
+    def clear(self):
+        """ Remove all entries from the cache """
+        for _, _, filename in self.entries():
+            os.remove(filename)
+
+
+class ObjectCache(DiskCache):
+    """ Content addressed on-disk cache of object files.
+
+    Args:
+        directory: the directory to store the cache in. When not given,
+            the default cache directory is used.
+        max_size: the maximum size in bytes of the cache.
+    """
+    extension = '.ojb'
+
+    def __init__(self, directory=None, max_size=256 * 1024 * 1024):
+        if directory is None:
+            directory = default_cache_directory()
+        super().__init__(directory, max_size)
+
+    def load(self, key):
+        """ Load the object stored under the given key.
+
+        Returns None when the key is not present in the cache.
+        """
+        filename = self._filename(key)
+        try:
+            obj = load_object(filename)
+        except (OSError, ValueError, KeyError):
+            self.logger.debug('Cache miss for %s', key)
+            return
+
+        self.touch(filename)
+        self.logger.info('Cache hit for %s', key)
+        return obj
+
+    def store(self, key, obj):
+        """ Store an object in the cache under the given key """
+        self.write(key, lambda f: obj.save(f, binary=True))
+
+
+def make_key(*parts):
+    """ Create a hash of the given parts and the ppci version """
+    digest = hashlib.sha256()
+    for part in ('ppci', __version__) + parts:
+        if not isinstance(part, bytes):
+            part = str(part).encode('utf8')
+        digest.update(str(len(part)).encode('ascii'))
+        digest.update(b':')
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def _file_mode():
+    """ Determine the permissions of newly created files.
+
+    The umask can only be read by changing it, which affects all threads.
+    So this is done once, when this module is imported.
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+_FILE_MODE = _file_mode()
+
+
+def write_atomic(filename, write):
+    """ Write a file by calling write with a binary file object.
+
+    The data is written to a temporary file first, which then replaces the
+    file, so that other processes never see half written files.
+    """
+    directory = os.path.dirname(filename) or os.curdir
+    os.makedirs(directory, exist_ok=True)
+    handle, tmp_filename = tempfile.mkstemp(suffix='.tmp', dir=directory)
+    try:
+        with open(handle, 'wb') as f:
+            write(f)
+        # Give the file the permissions of a newly created file:
+        os.chmod(tmp_filename, _FILE_MODE)
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        os.remove(tmp_filename)
+        raise
+
+
+def default_cache_directory():
+    """ Determine the default directory of the object cache """
+    if 'PPCI_CACHE_DIR' in os.environ:
+        return os.environ['PPCI_CACHE_DIR']
+    cache_home = os.environ.get(
+        'XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(cache_home, 'ppci', 'objects')
+
+
+def get_default_cache():
+    """ Get the default object cache, or None when caching is disabled """
+    if os.environ.get('PPCI_NO_CACHE'):
+        return
+    return ObjectCache()
@@ -0,0 +1,97 @@
+""" Compile independent translation units in parallel processes.
+
+Each C source is a translation unit of its own, which can be compiled into
+an object file without looking at the other sources. A pool of worker
+processes compiles the sources, from preprocessing up to the object file.
+
+The workers send the object files back in the binary object format. The
+objects are returned in the order of the sources, so the result does not
+depend on which worker finished first.
+"""
+
+import io
+import logging
+import multiprocessing
+from ..binutils.binaryobject import read_object, write_object
+
+
+logger = logging.getLogger('parallel')
+
+
+def compile_c_sources(
+        sources, march, coptions=None, opt_level=0, debug=False,
+        function_sections=False, jobs=1, cache=None):
+    """ Compile each C source into an object file.
+
+    Args:
+        sources: a list of sources. A source can be a filename, a file
+            like object or a list of pre-processed tokens.
+        march: the architecture for which to compile.
+        coptions: options for the C frontend.
+        jobs: the amount of processes to use.
+        cache: an optional :class:`ppci.build.cache.ObjectCache` in which
+            the objects of the sources are looked up and stored.
+
+    Returns:
+        A list with an object file for each source.
+    """
+    from ..api import get_arch, COptions
+    if coptions is None:
+        coptions = COptions()
+    march = get_arch(march).make_id_str()
+    work = [
+        (_prepare_source(source), march, coptions, opt_level, debug,
+         function_sections, cache)
+        for source in sources]
+    return [read_object(data) for data in run_jobs(_compile_c, work, jobs)]
+
+
+def run_jobs(function, work, jobs):
+    """ Call function on each item of work, using a pool of processes.
+
+    The results are returned in the order of the work items.
+    """
+    if jobs <= 1 or len(work) <= 1:
+        return [function(item) for item in work]
+
+    jobs = min(jobs, len(work))
+    logger.info('Running %s jobs using %s processes', len(work), jobs)
+    if 'fork' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('fork')
+    else:  # pragma: no cover
+        context = multiprocessing.get_context()
+    with context.Pool(jobs) as pool:
+        return pool.map(function, work, chunksize=1)
+
+
+def _prepare_source(source):
+    """ Turn open files into text, which can be sent to a worker """
+    if hasattr(source, 'read'):
+        return (source.read(), getattr(source, 'name', None))
+    return source
+
+
+def _compile_c(item):
+    """ Compile a single C source and return the binary object data """
+    from .. import api
+    source, march, coptions, opt_level, debug, function_sections, cache = \
+        item
+    if isinstance(source, str):
+        with open(source, 'r') as f:
+            source = (f.read(), source)
+
+    if isinstance(source, tuple):
+        text, name = source
+        source = io.StringIO(text)
+        if name is not None:
+            source.name = name
+    else:
+        # Pre-processed tokens cannot be looked up in the cache:
+        cache = None
+
+    obj = api.cc(
+        source, march, coptions=coptions, opt_level=opt_level, debug=debug,
+        function_sections=function_sections, cache=cache)
+    f = io.BytesIO()
+    write_object(obj, f)
+    return f.getvalue()
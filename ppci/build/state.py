@@ -0,0 +1,104 @@
+""" Build state of a project.
+
+The build state records, for each task which ran successfully, a signature
+of its arguments and input files, and the size and modification time of
+its output files. When a task is about to run again with the same
+signature, and its outputs are unchanged, the task is skipped.
+
+A task can record extra information about its inputs as well, such as the
+headers included by C sources, so that it does not need to find them
+again on the next build.
+
+The state of a project is stored in a json file next to the build file.
+"""
+
+import json
+import logging
+import os
+from .cache import write_atomic
+
+
+STATE_FILENAME = '.ppci-build-state.json'
+
+
+def file_stamp(filename):
+    """ Get the size and modification time of a file, or None """
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class BuildState:
+    """ Signatures of the tasks which ran successfully.
+
+    Args:
+        filename: the file to load the state from and save it to. When
+            None, the state is not persisted.
+    """
+    logger = logging.getLogger('buildstate')
+
+    def __init__(self, filename=None):
+        self.filename = filename
+        self.entries = {}
+        self.changes = {}
+        if filename and os.path.exists(filename):
+            try:
+                with open(filename, 'r') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as ex:
+                self.logger.warning(
+                    'Ignoring build state %s: %s', filename, ex)
+
+    @classmethod
+    def for_project(cls, project):
+        """ Create the build state stored next to the build file.
+
+        Returns None when the project was not loaded from a file.
+        """
+        if 'basedir' not in project.properties:
+            return
+        return cls(os.path.join(
+            project.get_property('basedir'), STATE_FILENAME))
+
+    def is_up_to_date(self, key, signature, outputs):
+        """ Test if a task ran before with the same signature, and if its
+        output files are unchanged since then """
+        entry = self.entries.get(key)
+        if not entry or entry['signature'] != signature:
+            return False
+        if sorted(outputs) != sorted(entry['outputs']):
+            return False
+        return all(
+            file_stamp(filename) == stamp
+            for filename, stamp in entry['outputs'].items())
+
+    def get_dependencies(self, key):
+        """ Get the information a task recorded about its inputs """
+        entry = self.entries.get(key)
+        if not entry:
+            return {}
+        return entry.get('dependencies', {})
+
+    def update(self, key, signature, outputs, dependencies=None):
+        """ Record that a task ran successfully """
+        stamps = {filename: file_stamp(filename) for filename in outputs}
+        entry = {'signature': signature, 'outputs': stamps}
+        if dependencies:
+            entry['dependencies'] = dependencies
+        self.add_entries({key: entry})
+
+    def add_entries(self, entries):
+        """ Add entries, for example the changes of another process """
+        self.entries.update(entries)
+        self.changes.update(entries)
+
+    def save(self):
+        """ Write the state to file, when there are changes """
+        if not self.filename or not self.changes:
+            return
+        data = json.dumps(self.entries, sort_keys=True, indent=1)
+        write_atomic(
+            self.filename, lambda f: f.write(data.encode('utf8')))
+        self.changes = {}
@@ -1,12 +1,20 @@
 """
     This module defines tasks and a runner for these tasks. Tasks can
     have dependencies and it can be determined if they need to be run.
+
+Targets which do not depend on each other can be run in parallel
+processes. A task is skipped when its arguments, its input files and its
+output files are unchanged since it last ran successfully.
 """
 
+import hashlib
 import logging
+import multiprocessing
+import multiprocessing.connection
 import re
 import os
 import glob
+from .. import __version__
 
 
 task_map = {}
@@ -26,6 +34,7 @@ def register_task(cls):
 class TaskError(Exception):
     """ When a task fails, this exception is raised """
     def __init__(self, msg):
+        super().__init__(msg)
         self.msg = msg
 
 
@@ -116,11 +125,21 @@ class Target:
 
 class Task:
     """ Task that can run, and depend on other tasks """
+    # Names of the arguments with the input and output files of the task.
+    # Tasks without output files always run.
+    input_arguments = ()
+    output_arguments = ()
+
     def __init__(self, target, kwargs, sub_elements=[]):
         self.logger = logging.getLogger('task')
         self.target = target
         self.name = self.__class__.__name__
         self.arguments = kwargs
+        self.cache = None  # Object cache, set by the task runner
+        self.jobs = 1  # Amount of processes, set by the task runner
+        self.incremental = False  # Set by the task runner
+        # Information about the inputs, kept in the build state:
+        self.dependencies = {}
 
     def get_argument(self, name, default=None):
         if name not in self.arguments:
@@ -159,6 +178,50 @@ class Task:
                 file_names.append(os.path.normpath(filename))
         return file_names
 
+    def input_files(self):
+        """ Get the input files of this task.
+
+        The files in an input directory are inputs as well.
+        """
+        filenames = []
+        for name in self.input_arguments:
+            if name in self.arguments:
+                for filename in self.open_file_set(self.arguments[name]):
+                    if os.path.isdir(filename):
+                        for path, _, files in os.walk(filename):
+                            filenames.extend(
+                                os.path.join(path, f) for f in files)
+                    else:
+                        filenames.append(filename)
+        return sorted(set(filenames))
+
+    def output_files(self):
+        """ Get the output files of this task """
+        return [
+            os.path.normpath(self.relpath(self.arguments[name]))
+            for name in self.output_arguments if name in self.arguments]
+
+    def get_signature(self):
+        """ Create a hash over the arguments and input files.
+
+        Returns None if the task must always run.
+        """
+        if not self.output_files():
+            return None
+        try:
+            inputs = self.input_files()
+        except TaskError:
+            return None
+        stamps = []
+        for filename in inputs:
+            stat = os.stat(filename)
+            stamps.append((filename, stat.st_mtime_ns, stat.st_size))
+        digest = hashlib.sha256()
+        digest.update(repr((
+            'ppci', __version__, self.name, sorted(self.arguments.items()),
+            self.get_property('basedir'), stamps)).encode('utf8'))
+        return digest.hexdigest()
+
     def run(self):  # pragma: no cover
         """ Implement this method when creating a custom task """
         raise NotImplementedError("Implement this abstract method!")
@@ -168,9 +231,20 @@ class Task:
 
 
 class TaskRunner:
-    """ Basic task runner that can run some tasks in sequence """
-    def __init__(self):
+    """ Task runner that runs the tasks of targets.
+
+    Args:
+        cache: an optional object cache, used by the compile tasks.
+        jobs: the amount of processes to use. Targets which do not
+            depend on each other are run in parallel.
+        state: an optional :class:`ppci.build.state.BuildState`. Tasks
+            which are up to date according to this state are skipped.
+    """
+    def __init__(self, cache=None, jobs=1, state=None):
         self.logger = logging.getLogger('taskrunner')
+        self.cache = cache
+        self.jobs = jobs
+        self.state = state
 
     def get_task(self, name):
         """ Tries to load the task type """
@@ -199,26 +273,129 @@ class TaskRunner:
             project.check_target(target)
 
         # Calculate all dependencies:
-        # TODO: make this understandable:
-        target_list = set.union(
-            *[project.dependencies(t) for t in target_list])\
-            .union(set(target_list))
-
-        # Lookup actual targets:
-        target_list = [project.get_target(target_name)
-                       for target_name in target_list]
-        target_list.sort()
-
-        self.logger.info('Target sequence: {}'.format(target_list))
-
-        # Run tasks:
+        target_names = set(target_list)
         for target in target_list:
-            self.logger.info('Target {} Started'.format(target.name))
-            for tname, props in target.tasks:
-                for arg in props:
-                    props[arg] = project.expand_macros(props[arg])
-                task = self.get_task(tname)(target, props)
-                self.logger.info('Running {}'.format(task))
-                task.run()
-            self.logger.info('Target {} Ready'.format(target.name))
+            target_names |= project.dependencies(target)
+        target_list = [project.get_target(n) for n in target_names]
+
+        try:
+            if self.jobs > 1 and len(target_list) > 1 and \
+                    'fork' in multiprocessing.get_all_start_methods():
+                self.run_parallel(project, target_list)
+            else:
+                target_list = order_targets(target_list)
+                self.logger.info('Target sequence: {}'.format(target_list))
+                for target in target_list:
+                    self.run_target(project, target, self.jobs)
+        finally:
+            if self.state:
+                self.state.save()
         self.logger.info('All targets done!')
+
+    def run_target(self, project, target, jobs):
+        """ Run the tasks of a single target """
+        self.logger.info('Target {} Started'.format(target.name))
+        for index, (tname, props) in enumerate(target.tasks):
+            for arg in props:
+                props[arg] = project.expand_macros(props[arg])
+            task = self.get_task(tname)(target, props)
+            task.cache = self.cache
+            task.jobs = jobs
+            task.incremental = self.state is not None
+            key = '{}:{}:{}'.format(target.name, index, tname)
+            if self.state:
+                task.dependencies = self.state.get_dependencies(key)
+            signature = task.get_signature() if self.state else None
+            if signature and self.state.is_up_to_date(
+                    key, signature, task.output_files()):
+                self.logger.info('Skipping {}, up to date'.format(task))
+                continue
+            self.logger.info('Running {}'.format(task))
+            task.run()
+            if signature:
+                self.state.update(
+                    key, signature, task.output_files(), task.dependencies)
+        self.logger.info('Target {} Ready'.format(target.name))
+
+    def run_parallel(self, project, target_list):
+        """ Run targets in parallel processes.
+
+        A target is started when all its dependencies are done. Each
+        target runs in a forked process, which reports back the project
+        properties and the build state of its tasks.
+        """
+        context = multiprocessing.get_context('fork')
+        self.logger.info(
+            'Running {} targets using {} processes'.format(
+                len(target_list), self.jobs))
+        pending = sorted(target_list, key=lambda t: t.name)
+        done = set()
+        running = {}
+        try:
+            while pending or running:
+                for target in list(pending):
+                    if len(running) >= self.jobs:
+                        break
+                    if target.dependencies <= done:
+                        pending.remove(target)
+                        reader, writer = context.Pipe(duplex=False)
+                        process = context.Process(
+                            target=self._target_worker,
+                            args=(project, target, writer))
+                        process.start()
+                        writer.close()
+                        running[reader] = process, target
+
+                ready = multiprocessing.connection.wait(list(running))
+                for reader in ready:
+                    process, target = running.pop(reader)
+                    try:
+                        status, result = reader.recv()
+                    except EOFError:
+                        status, result = 'error', TaskError(
+                            'Target {} failed'.format(target.name))
+                    reader.close()
+                    process.join()
+                    if status == 'error':
+                        raise result
+                    properties, changes = result
+                    project.properties.update(properties)
+                    if self.state:
+                        self.state.add_entries(changes)
+                    done.add(target.name)
+        finally:
+            for process, _ in running.values():
+                process.terminate()
+                process.join()
+
+    def _target_worker(self, project, target, writer):
+        """ Run a target in a worker process and report back """
+        try:
+            # Leave the other processors to the other targets:
+            self.run_target(project, target, 1)
+            changes = self.state.changes if self.state else {}
+            writer.send(('ok', (project.properties, changes)))
+        except Exception as ex:
+            try:
+                writer.send(('error', ex))
+            except Exception:
+                writer.send(('error', TaskError(str(ex))))
+        finally:
+            writer.close()
+
+
+def order_targets(targets):
+    """ Order targets such that each target comes after its dependencies """
+    ordered = []
+    done = set()
+    pending = sorted(targets, key=lambda t: t.name)
+    while pending:
+        for target in pending:
+            if target.dependencies <= done:
+                pending.remove(target)
+                ordered.append(target)
+                done.add(target.name)
+                break
+        else:  # pragma: no cover
+            raise TaskError('Dependency loop detected')
+    return ordered
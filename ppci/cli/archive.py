@@ -0,0 +1,33 @@
+""" Archiver.
+
+Use the archiver to combine several object files into a library. When
+linking against this library, only the object files which are needed
+are linked in.
+"""
+
+import argparse
+from .base import base_parser, LogSetup
+from .. import api
+from ..binutils.archive import save_archive
+
+
+parser = argparse.ArgumentParser(
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+    description=__doc__,
+    parents=[base_parser])
+parser.add_argument(
+    'output', help='the archive to create', metavar='archive-file')
+parser.add_argument(
+    'obj', nargs='+', help='the object to add to the archive')
+
+
+def archive(args=None):
+    """ Run archiver from command line """
+    args = parser.parse_args(args)
+    with LogSetup(args):
+        library = api.archive(args.obj)
+        save_archive(library, args.output)
+
+
+if __name__ == '__main__':
+    archive()
@@ -3,6 +3,7 @@
 
 import argparse
 from .base import base_parser, march_parser, out_parser, LogSetup
+from .base import object_format_parser, save_object_from_args
 from .base import get_arch_from_args
 from .. import api
 
@@ -10,7 +11,7 @@ from .. import api
 parser = argparse.ArgumentParser(
     description=__doc__,
     formatter_class=argparse.RawDescriptionHelpFormatter,
-    parents=[base_parser, march_parser, out_parser])
+    parents=[base_parser, march_parser, out_parser, object_format_parser])
 parser.add_argument(
     '-g', '--debug', help='create debug information',
     action='store_true', default=False)
@@ -28,8 +29,7 @@ def asm(args=None):
         obj = api.asm(args.sourcefile, march, debug=args.debug)
 
         # Write object file to disk:
-        with open(args.output, 'w') as output:
-            obj.save(output)
+        save_object_from_args(obj, args)
 
 
 if __name__ == '__main__':
@@ -9,7 +9,9 @@ import sys
 from .. import __version__
 from ..arch.target_list import target_names, create_arch
 from ..build.tasks import TaskError
+from ..build.cache import ObjectCache, get_default_cache
 from ..common import logformat, CompilerError
+from ..binutils.objectfile import save_object
 from ..utils.reporting import HtmlReportGenerator, DummyReportGenerator
 from ..utils.reporting import TextReportGenerator
 
@@ -78,12 +80,46 @@ def get_arch_from_args(args):
     return create_arch(machine, options=options)
 
 
+cache_parser = argparse.ArgumentParser(add_help=False)
+cache_parser.add_argument(
+    '--no-cache', action='store_true', default=False,
+    help='Do not use the cache of compiled object files')
+cache_parser.add_argument(
+    '--cache-dir', metavar='directory',
+    help='Directory to store the cache of compiled object files in')
+
+
+def get_cache_from_args(args):
+    """ Create the object cache, or None when caching is disabled """
+    if args.no_cache:
+        return
+    if args.cache_dir:
+        return ObjectCache(args.cache_dir)
+    return get_default_cache()
+
+
 out_parser = argparse.ArgumentParser(add_help=False)
 out_parser.add_argument(
     '--output', '-o', help='output file', metavar='output-file',
     default='f.out')
 
 
+object_format_parser = argparse.ArgumentParser(add_help=False)
+object_format_parser.add_argument(
+    '--object-format', choices=('json', 'binary'), default=None,
+    help='format of the object file. By default the binary format is '
+    'used when the output file has the .ojb extension')
+
+
+def save_object_from_args(obj, args):
+    """ Write an object file to the output in the chosen format """
+    if args.object_format:
+        binary = args.object_format == 'binary'
+    else:
+        binary = None
+    save_object(obj, args.output, binary=binary)
+
+
 class ColoredFormatter(logging.Formatter):
     """ Custom formatter that makes vt100 coloring to log messages """
     BLACK, RED, GREEN, YELLOW, BLUE, MAGENTA, CYAN, WHITE = range(8)
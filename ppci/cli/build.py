@@ -5,16 +5,23 @@ Use this to execute build files.
 
 
 import argparse
-from .base import base_parser, LogSetup
+from .base import base_parser, cache_parser, LogSetup, get_cache_from_args
 from .. import api
 
 
 parser = argparse.ArgumentParser(
-    description=__doc__, parents=[base_parser])
+    description=__doc__, parents=[base_parser, cache_parser])
 parser.add_argument(
     '-f', '--buildfile', metavar='build-file',
     help='use buildfile, otherwise build.xml is the default',
     default='build.xml')
+parser.add_argument(
+    '-j', '--jobs', metavar='N', type=int, default=1,
+    help='amount of processes to use. Independent targets are run in '
+    'parallel')
+parser.add_argument(
+    '-B', '--always-make', action='store_true', default=False,
+    help='run all tasks, also the ones which are up to date')
 parser.add_argument('targets', metavar='target', nargs='*')
 
 
@@ -22,7 +29,10 @@ def build(args=None):
     """ Run the build command from command line. Used by ppci-build.py """
     args = parser.parse_args(args)
     with LogSetup(args):
-        api.construct(args.buildfile, args.targets)
+        cache = get_cache_from_args(args)
+        api.construct(
+            args.buildfile, args.targets, cache=cache, jobs=args.jobs,
+            incremental=not args.always_make)
 
 
 if __name__ == '__main__':
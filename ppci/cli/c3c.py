@@ -9,7 +9,8 @@ result in any code.
 import argparse
 from .base import base_parser, march_parser
 from .compile_base import compile_parser, do_compile
-from .base import LogSetup, get_arch_from_args
+from .compile_base import is_object_output, load_cached_object
+from .base import LogSetup, get_arch_from_args, get_cache_from_args
 from .. import api
 
 
@@ -31,11 +32,30 @@ def c3c(args=None):
         # Compile sources:
         march = get_arch_from_args(args)
 
+        cache = get_cache_from_args(args)
+        key = None
+        if cache and is_object_output(args):
+            key = cache.make_key(
+                'c3c', march.make_id_str(), args.O, args.g,
+                args.function_sections,
+                [(f, read_text(f)) for f in args.sources],
+                [(f, read_text(f)) for f in args.include])
+            if load_cached_object(cache, key, args):
+                return
+
         ir_module = api.c3_to_ir(
             args.sources, args.include, march,
             reporter=log_setup.reporter)
 
-        do_compile([ir_module], march, log_setup.reporter, log_setup.args)
+        do_compile(
+            [ir_module], march, log_setup.reporter, log_setup.args,
+            cache=cache, key=key)
+
+
+def read_text(filename):
+    """ Read the contents of a source file """
+    with open(filename, 'r') as f:
+        return f.read()
 
 
 if __name__ == '__main__':
@@ -8,10 +8,15 @@ computer architectures.
 import argparse
 from .base import base_parser, march_parser
 from .compile_base import compile_parser, do_compile
-from .base import LogSetup, get_arch_from_args
+from .compile_base import is_object_output, load_cached_object
+from .base import LogSetup, get_arch_from_args, get_cache_from_args
+from .base import save_object_from_args
 from .. import api
-from ..lang.c import create_ast, CAstPrinter
+from ..build.parallel import compile_c_sources
+from ..lang.c import create_ast, CAstPrinter, CContext
+from ..lang.c import preprocess_to_tokens, tokens_to_text
 from ..lang.c.options import COptions, coptions_parser
+from ..lang.c.pch import create_pch, save_pch
 
 
 parser = argparse.ArgumentParser(
@@ -28,6 +33,9 @@ parser.add_argument(
 parser.add_argument(
     '--ast', action='store_true', default=False,
     help="Stop parsing and output the C abstract syntax tree (ast)")
+parser.add_argument(
+    '--emit-pch', action='store_true', default=False,
+    help="Save the given header as a precompiled header")
 parser.add_argument(
     '-c', action="store_true", default=False,
     help="Compile, but do not link")
@@ -53,6 +61,11 @@ def cc(args=None):
             dependencies = []
             for filename in dependencies:
                 print(filename)
+        elif args.emit_pch:
+            if len(args.sources) != 1:
+                parser.error('--emit-pch requires a single header')
+            pch = create_pch(args.sources[0], march.info, coptions)
+            save_pch(pch, args.output)
         elif args.ast:
             with open(args.output, 'w') as output:
                 printer = CAstPrinter(file=output)
@@ -63,14 +76,53 @@ def cc(args=None):
                         src, march.info, filename=filename, coptions=coptions)
                     printer.print(ast)
         else:
+            sources = args.sources
+            cache = get_cache_from_args(args)
+            key = None
+            if cache and is_object_output(args):
+                # Lookup the pre-processed sources in the object cache:
+                sources = [
+                    preprocess_to_tokens(src, coptions) for src in sources]
+                pch = coptions.precompiled_header
+                if pch:
+                    # The key only covers the precompiled header itself,
+                    # so reject it when a header it was made from changed:
+                    pch.check(CContext(coptions, march.info))
+                key = cache.make_key(
+                    'cc', march.make_id_str(), args.O, args.g,
+                    args.function_sections,
+                    sorted(coptions.settings.items()),
+                    pch.digest if pch else None,
+                    *[tokens_to_text(s, locations=args.g) for s in sources])
+                if load_cached_object(cache, key, args):
+                    return
+
+            if args.jobs > 1 and len(sources) > 1 and \
+                    is_object_output(args):
+                # Compile the translation units in parallel, and merge
+                # them in the order of the sources:
+                objs = compile_c_sources(
+                    sources, march, coptions=coptions, opt_level=args.O,
+                    debug=args.g, function_sections=args.function_sections,
+                    jobs=args.jobs)
+                obj = api.link(
+                    objs, partial_link=True, reporter=log_setup.reporter,
+                    debug=args.g)
+                save_object_from_args(obj, args)
+                if cache and key:
+                    cache.store(key, obj)
+                return
+
             ir_modules = []
-            for src in args.sources:
+            for src in sources:
                 # Compile and optimize in any case:
                 ir_module = api.c_to_ir(
                     src, march, coptions=coptions, reporter=log_setup.reporter)
                 ir_modules.append(ir_module)
 
-            do_compile(ir_modules, march, log_setup.reporter, log_setup.args)
+            do_compile(
+                ir_modules, march, log_setup.reporter, log_setup.args,
+                cache=cache, key=key)
 
 
 if __name__ == '__main__':
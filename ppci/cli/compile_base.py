@@ -6,11 +6,14 @@ import argparse
 import logging
 from .. import api, irutils
 from ..binutils.outstream import TextOutputStream
-from .base import out_parser
+from .base import out_parser, cache_parser, object_format_parser
+from .base import save_object_from_args
 from ..wasm import ir_to_wasm
 
 
-compile_parser = argparse.ArgumentParser(add_help=False, parents=[out_parser])
+compile_parser = argparse.ArgumentParser(
+    add_help=False,
+    parents=[out_parser, object_format_parser, cache_parser])
 compile_parser.add_argument(
     '-g', help='create debug information', action='store_true', default=False)
 compile_parser.add_argument(
@@ -27,10 +30,38 @@ compile_parser.add_argument(
     action='store_true', default=False)
 compile_parser.add_argument(
     '-O', help='optimize code', default='0', choices=api.OPT_LEVELS)
+compile_parser.add_argument(
+    '-j', '--jobs', metavar='N', type=int, default=1,
+    help='amount of processes to use for compilation')
+compile_parser.add_argument(
+    '--function-sections', action='store_true', default=False,
+    help='place each function in a section of its own, so that the linker '
+    'can remove unused functions')
+
+
+def is_object_output(args):
+    """ Check if the compile arguments request an object file """
+    return not (args.ir or args.S or args.wasm or args.pycode)
+
 
+def load_cached_object(cache, key, args):
+    """ Try to write the object stored under key to the output.
 
-def do_compile(ir_modules, march, reporter, args):
-    """ Handle the proper output action """
+    Returns True when the object was found in the cache.
+    """
+    obj = cache.load(key)
+    if obj is None:
+        return False
+    save_object_from_args(obj, args)
+    return True
+
+
+def do_compile(ir_modules, march, reporter, args, cache=None, key=None):
+    """ Handle the proper output action.
+
+    When a cache and key are given, the produced object file is stored
+    in the cache.
+    """
 
     # Optimize:
     for ir_module in ir_modules:
@@ -49,7 +80,8 @@ def do_compile(ir_modules, march, reporter, args):
                 printer=march.asm_printer, f=output)
             for ir_module in ir_modules:
                 api.ir_to_stream(
-                    ir_module, march, stream, reporter=reporter)
+                    ir_module, march, stream, reporter=reporter,
+                    jobs=args.jobs)
     elif args.wasm:  # Output web-assembly code
         assert len(ir_modules) == 1
         ir_module = ir_modules[0]
@@ -61,9 +93,12 @@ def do_compile(ir_modules, march, reporter, args):
             api.ir_to_python(ir_modules, output, reporter=reporter)
     else:  # Full object output
         obj = api.ir_to_object(
-            ir_modules, march, reporter=reporter, debug=args.g)
-        with open(args.output, 'w') as output:
-            obj.save(output)
+            ir_modules, march, reporter=reporter, debug=args.g,
+            jobs=args.jobs, function_sections=args.function_sections)
+        save_object_from_args(obj, args)
+
+        if cache and key:
+            cache.store(key, obj)
 
         # TODO: link objects together?
         logging.warning('TODO: Linking with stdlibs')
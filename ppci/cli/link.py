@@ -6,29 +6,42 @@ to produce another resulting object file with images.
 
 import argparse
 from .base import base_parser, out_parser, LogSetup
+from .base import object_format_parser, save_object_from_args
 from .. import api
 
 
 parser = argparse.ArgumentParser(
     formatter_class=argparse.RawDescriptionHelpFormatter,
-    description=__doc__, parents=[base_parser, out_parser])
+    description=__doc__,
+    parents=[base_parser, out_parser, object_format_parser])
 parser.add_argument(
-    'obj', type=argparse.FileType('r'), nargs='+',
-    help='the object to link')
+    'obj', nargs='+', help='the object to link')
 parser.add_argument(
     '--layout', '-L', help='memory layout', default=None,
     type=argparse.FileType('r'), metavar='layout-file')
 parser.add_argument(
     '-g', help='retain debug information', action='store_true', default=False)
+parser.add_argument(
+    '--library', '-l', help='archive to take the required objects from',
+    action='append', default=[], metavar='archive-file')
+parser.add_argument(
+    '--gc-sections', action='store_true', default=False,
+    help='remove the sections of functions which are not used')
+parser.add_argument(
+    '--entry', '-e', action='append', default=[], metavar='symbol',
+    help='symbol to keep when removing unused sections '
+    '(default: main and _start)')
 
 
 def link(args=None):
     """ Run asm from command line """
     args = parser.parse_args(args)
     with LogSetup(args):
-        obj = api.link(args.obj, layout=args.layout, debug=args.g)
-        with open(args.output, 'w') as output:
-            obj.save(output)
+        obj = api.link(
+            args.obj, layout=args.layout, debug=args.g,
+            libraries=args.library, gc_sections=args.gc_sections,
+            entry=args.entry)
+        save_object_from_args(obj, args)
 
 
 if __name__ == '__main__':
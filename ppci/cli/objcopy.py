@@ -10,7 +10,7 @@ from ..binutils.objectfile import ObjectFile
 parser = argparse.ArgumentParser(
     description=__doc__, parents=[base_parser])
 parser.add_argument(
-    'input', help='input file', type=argparse.FileType('r'))
+    'input', help='input file', type=argparse.FileType('rb'))
 parser.add_argument(
     '--segment', '-S', help='segment to copy', required=True)
 parser.add_argument(
@@ -4,6 +4,7 @@ The architecture is provided when the generator is created.
 """
 
 import logging
+import multiprocessing
 from .. import ir
 from ..irutils import Verifier, split_block
 from ..arch.arch import Architecture
@@ -44,13 +45,25 @@ class CodeGenerator:
         self.instruction_selector = InstructionSelector1(
             arch, self.sgraph_builder,
             weights=selection_weights)
-        self.instruction_scheduler = InstructionScheduler()
+        self.instruction_scheduler = InstructionScheduler(arch)
+        self.schedule = optimize_for == 'speed'
         self.register_allocator = GraphColoringRegisterAllocator(
             arch, self.instruction_selector)
 
     def generate(
-            self, ircode: ir.Module, output_stream, reporter, debug=False):
-        """ Generate machine code from ir-code into output stream """
+            self, ircode: ir.Module, output_stream, reporter, debug=False,
+            jobs=1, function_sections=False):
+        """ Generate machine code from ir-code into output stream.
+
+        When jobs is larger than 1, the functions are compiled in a pool
+        of worker processes. The resulting instructions are emitted in
+        the order of the functions in the module, so the output is the
+        same as a serial build. Debug information requires a serial build.
+
+        When function_sections is true, each function is placed in a
+        section of its own, named 'code.' followed by the function name.
+        This allows the linker to remove unused functions.
+        """
         assert isinstance(ircode, ir.Module)
         if ircode.debug_db:
             self.debug_db = ircode.debug_db
@@ -69,9 +82,15 @@ class CodeGenerator:
         # Munch program into a bunch of frames. One frame per function.
         # Each frame has a flat list of abstract instructions.
         output_stream.select_section('code')
-        for function in ircode.functions:
-            self.generate_function(
-                function, output_stream, reporter, debug=debug)
+        if jobs > 1 and not debug and len(ircode.functions) > 1:
+            self.generate_functions_parallel(
+                ircode, output_stream, reporter, jobs, function_sections)
+        else:
+            for function in ircode.functions:
+                if function_sections:
+                    self.select_function_section(function, output_stream)
+                self.generate_function(
+                    function, output_stream, reporter, debug=debug)
 
         # Output debug type data:
         if debug:
@@ -80,6 +99,50 @@ class CodeGenerator:
                     # TODO: prevent this from being emitted twice in some way?
                     output_stream.emit(DebugData(di))
 
+    def generate_functions_parallel(
+            self, ircode, output_stream, reporter, jobs,
+            function_sections=False):
+        """ Generate code for all functions using a pool of processes.
+
+        Each worker generates code for a single function into a list of
+        instructions. These lists are emitted in order into the output
+        stream.
+        """
+        self.logger.info(
+            'Generating code for %s functions using %s processes',
+            len(ircode.functions), jobs)
+        global _worker_state
+        if 'fork' in multiprocessing.get_all_start_methods():
+            # Forked workers inherit the module, no need to pickle it:
+            context = multiprocessing.get_context('fork')
+            _worker_state = (self, ircode)
+            initargs = (None, None)
+        else:  # pragma: no cover
+            context = multiprocessing.get_context()
+            initargs = (self, ircode)
+
+        try:
+            with context.Pool(
+                    jobs, initializer=_init_worker,
+                    initargs=initargs) as pool:
+                results = pool.map(
+                    _generate_function_worker,
+                    range(len(ircode.functions)))
+        finally:
+            _worker_state = None
+
+        for function, instructions in zip(ircode.functions, results):
+            reporter.heading(3, 'Log for {}'.format(function))
+            if function_sections:
+                self.select_function_section(function, output_stream)
+            output_stream.emit_all(instructions)
+            reporter.dump_instructions(instructions, self.arch)
+
+    @staticmethod
+    def select_function_section(function, output_stream):
+        """ Switch to the section of its own for the given function """
+        output_stream.select_section('code.{}'.format(function.name))
+
     def generate_global(self, var, output_stream, debug):
         """ Generate code for a global variable """
         alignment = Alignment(var.alignment)
@@ -197,8 +260,9 @@ class CodeGenerator:
             # reporter.message('Selection graph')
             # reporter.dump_sgraph(sgraph)
 
-            # Schedule instructions:
-            # self.instruction_scheduler.schedule(sgraph, frame)
+        if self.schedule:
+            self.logger.debug('Scheduling instructions')
+            self.instruction_scheduler.schedule(frame)
 
     def emit_frame_to_stream(self, frame, output_stream, debug=False):
         """
@@ -258,3 +322,29 @@ class CodeGenerator:
                 # print(tmp, di)
                 # frame.live_ranges(tmp)
                 # print('live ranges:', lr)
+
+
+# State of a code generation worker process:
+_worker_state = None
+
+
+def _init_worker(code_generator, ir_module):
+    """ Initialize a worker process for parallel code generation """
+    global _worker_state
+    if code_generator is not None:
+        _worker_state = (code_generator, ir_module)
+
+
+def _generate_function_worker(index):
+    """ Generate code for the function with the given index.
+
+    Returns the list of emitted instructions.
+    """
+    from ..utils.reporting import DummyReportGenerator
+    code_generator, ir_module = _worker_state
+    function = ir_module.functions[index]
+    instructions = []
+    output_stream = FunctionOutputStream(instructions.append)
+    code_generator.generate_function(
+        function, output_stream, DummyReportGenerator())
+    return instructions
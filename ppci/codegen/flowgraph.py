@@ -1,17 +1,21 @@
 import logging
-from collections import defaultdict
+from collections import deque
 from ..graph.digraph import DiGraph, DiNode
 
 
 class FlowGraphNode(DiNode):
     """ A node in the flow graph. A node can contain more than one
-        instruction. """
+        instruction.
+
+    The gen, kill and liveness sets are stored as bitsets, use
+    :meth:`FlowGraph.registers` to get the registers in such a set.
+    """
     def __init__(self, g, ins):
         super().__init__(g)
-        self.gen = set()
-        self.kill = set()
-        self.live_in = set()
-        self.live_out = set()
+        self.gen = 0
+        self.kill = 0
+        self.live_in = 0
+        self.live_out = 0
         self.instructions = []
 
         # Start with the instruction itself..
@@ -19,13 +23,13 @@ class FlowGraphNode(DiNode):
 
     def add_instruction(self, ins):
         """ Bundle the instruction into the current node. """
-        ins.gen = set(ins.used_registers)
-        ins.kill = set(ins.defined_registers)
+        ins.gen = self.graph.mask(ins.used_registers)
+        ins.kill = self.graph.mask(ins.defined_registers)
         self.instructions.append(ins)
 
         # Combine gen and kill effects of the node and the new instruction:
-        self.gen = self.gen | (ins.gen - self.kill)
-        self.kill = self.kill | ins.kill
+        self.gen |= ins.gen & ~self.kill
+        self.kill |= ins.kill
 
     def __repr__(self):
         r = 'CFG-node({})'.format(len(self.instructions))
@@ -34,32 +38,48 @@ class FlowGraphNode(DiNode):
     @property
     def longrepr(self):
         r = str(self)
+        registers = self.graph.registers
         if self.gen:
-            r += ' gen:' + ', '.join(str(u) for u in self.gen)
+            r += ' gen:' + ', '.join(str(u) for u in registers(self.gen))
         if self.kill:
-            r += ' kill:' + ', '.join(str(d) for d in self.kill)
-        r += ' live_out={}, live_in={}'.format(self.live_out, self.live_in)
+            r += ' kill:' + ', '.join(str(d) for d in registers(self.kill))
+        r += ' live_out={}, live_in={}'.format(
+            registers(self.live_out), registers(self.live_in))
         r += ', Succ={}, Pred={}'.format(self.successors, self.predecessors)
         return r
 
 
 class FlowGraph(DiGraph):
-    """ A directed graph containing nodes with linear lists of instructions """
+    """ A directed graph containing nodes with linear lists of instructions
+
+    Registers are numbered densely in order of appearance, such that
+    sets of registers can be represented by integers in which bit n
+    is set when register n is in the set.
+    """
     def __init__(self, instrs):
         """ Create a flowgraph from a linear list of abstract instructions """
         super().__init__()
         self.logger = logging.getLogger('flowgraph')
         self._map = {}
-        self._live_ranges = defaultdict(list)
+        self._numbers = {}
+        self._registers = []
+
+        # Number the registers in order of appearance:
+        for ins in instrs:
+            self.mask(ins.used_registers)
+            self.mask(ins.defined_registers)
 
         # TODO: make this very tricky part of code better readable!!!
 
         # Create leaders:
+        self.entry = None
         node = None
         for ins in instrs:
             if node is None:
                 # Get the first node:
                 node = self.get_node(ins)
+                if self.entry is None:
+                    self.entry = node
             if ins.jumps:
                 # Do not create edges yet, as this would not
                 # result in correct flow graph:
@@ -100,7 +120,54 @@ class FlowGraph(DiGraph):
             self.add_node(node)
         return self._map[ins]
 
-    # def live_range(
+    def number(self, register):
+        """ Get the bit number of a register, numbering it if required """
+        if register not in self._numbers:
+            self._numbers[register] = len(self._registers)
+            self._registers.append(register)
+        return self._numbers[register]
+
+    def mask(self, registers):
+        """ Get the bitset of the given registers """
+        mask = 0
+        for register in registers:
+            mask |= 1 << self.number(register)
+        return mask
+
+    def registers(self, mask):
+        """ Get the registers in the bitset, in order of numbering """
+        registers = []
+        while mask:
+            lowest = mask & -mask
+            registers.append(self._registers[lowest.bit_length() - 1])
+            mask ^= lowest
+        return registers
+
+    def reverse_postorder(self):
+        """ Get the nodes of the flowgraph in reverse postorder.
+
+        Nodes not reachable from the entry are placed at the end.
+        """
+        visited = set()
+        postorder = []
+        for root in [self.entry] + list(self.nodes):
+            if root is None or root in visited:
+                continue
+            visited.add(root)
+            stack = [(root, iter(root.successors))]
+            while stack:
+                node, successors = stack[-1]
+                for successor in successors:
+                    if successor not in visited:
+                        visited.add(successor)
+                        stack.append(
+                            (successor, iter(successor.successors)))
+                        break
+                else:
+                    stack.pop()
+                    postorder.append(node)
+        return list(reversed(postorder))
+
     def calculate_liveness(self):
         """ Calculate liveness in CFG: """
         ###
@@ -109,49 +176,41 @@ class FlowGraph(DiGraph):
         #  out[n] = for s in n.succ in union in[s]
         ###
         for node in self:
-            node.live_in = set()
-            node.live_out = set()
+            node.live_in = 0
+            node.live_out = 0
 
-        # Sort flowgraph nodes backwards:
-        cfg_nodes = list(self.nodes)
+        # Liveness flows backwards, so visit successors before
+        # predecessors, which is postorder:
+        worklist = deque(reversed(self.reverse_postorder()))
+        pending = set(worklist)
 
         # Dataflow fixed point iteration over the nodes in the CFG:
         n_iterations = 0
-        change = True
-        while change:
-            change = False
-            for node in cfg_nodes:
-                _in = node.live_in
-                _out = node.live_out
-                node.live_in = node.gen | (node.live_out - node.kill)
-                if node.successors:
-                    node.live_out = set.union(
-                        *(s.live_in for s in node.successors))
-                else:
-                    node.live_out = set()
-
-                # Record for change:
-                change = change or (_in != node.live_in) or \
-                    (_out != node.live_out)
+        while worklist:
+            node = worklist.popleft()
+            pending.remove(node)
             n_iterations += 1
 
+            live_out = 0
+            for successor in node.successors:
+                live_out |= successor.live_in
+            node.live_out = live_out
+            live_in = node.gen | (live_out & ~node.kill)
+            if live_in != node.live_in:
+                node.live_in = live_in
+                for predecessor in node.predecessors:
+                    if predecessor not in pending:
+                        pending.add(predecessor)
+                        worklist.append(predecessor)
+
         # In one pass fix all instructions:
         for node in self:
             assert len(node.instructions) > 0
-            ins2 = node.instructions[-1]
-            ins2.live_out = node.live_out  # Propagate into last instruction
-            ins2.live_in = ins2.gen | (ins2.live_out - ins2.kill)
-            if len(node.instructions) > 1:
-                for ins in reversed(node.instructions[:-1]):
-                    ins1 = ins
-
-                    ins1.live_out = ins2.live_in
-                    ins1.live_in = ins1.gen | (ins1.live_out - ins1.kill)
-
-                    for vreg in (ins2.live_in & ins1.live_out):
-                        self._live_ranges[vreg].append((ins1, ins2))
-
-                    ins2 = ins1
+            live = node.live_out
+            for ins in reversed(node.instructions):
+                ins.live_out = live
+                live = ins.gen | (live & ~ins.kill)
+                ins.live_in = live
 
         self.logger.debug(
             'Iterations: %s,  nodes: %s', n_iterations, len(self))
@@ -1,12 +1,171 @@
-
 """
     This algorithm takes the selected instructions and schedules them in
     a linear form.
+
+The scheduler is a list scheduler. The instructions of a frame are split
+into regions of instructions which the target allows to be moved. Labels,
+jumps, calls and all instructions without scheduling information split
+the frame into these regions and stay in place.
+
+Within a region a dependency graph is constructed from the registers
+which are defined and used, and from the order of memory accesses. Then
+the instructions are issued cycle by cycle, taking the instruction with
+the longest path to the end of the region first. This fills the cycles
+after a load with independent work instead of stalling on its result.
+
+The latencies and issue width are taken from the
+:class:`ppci.arch.arch_info.SchedulingInfo` of the target.
 """
 
+import itertools
+import logging
+
+
+class ScheduleNode:
+    """ A group of instructions which is scheduled as a single unit """
+    def __init__(self, index, instructions, latency):
+        self.index = index
+        self.instructions = instructions
+        self.latency = latency
+        self.successors = {}
+        self.predecessor_count = 0
+        self.height = latency
+        self.earliest = 0
+
+    def __repr__(self):
+        return 'ScheduleNode({})'.format(self.instructions)
+
+    def add_successor(self, node, latency):
+        """ Mark that node may only be issued latency cycles after this """
+        if node in self.successors:
+            latency = max(latency, self.successors[node])
+        else:
+            node.predecessor_count += 1
+        self.successors[node] = latency
+
 
 class InstructionScheduler:
-    def schedule(self, graph, frame):
-        # TODO: schedule traces in better order.
-        # This is optional!
-        pass
+    """ List scheduler for the selected instructions of a frame """
+    logger = logging.getLogger('scheduler')
+
+    def __init__(self, arch):
+        self.arch = arch
+
+    @property
+    def info(self):
+        return self.arch.info.scheduling
+
+    def schedule(self, frame):
+        """ Reorder the instructions of the frame to avoid stalls """
+        if self.info is None:
+            return
+
+        instructions = []
+        groups = self.make_groups(frame.instructions)
+        for movable, region in itertools.groupby(groups, self.is_movable):
+            region = list(region)
+            if movable and len(region) > 1:
+                region = self.schedule_region(region)
+            for group in region:
+                instructions.extend(group)
+        assert len(instructions) == len(frame.instructions)
+        frame.instructions = instructions
+
+    def make_groups(self, instructions):
+        """ Split instructions in groups which are moved together.
+
+        A prefix instruction is glued to the instruction after it.
+        """
+        group = []
+        for instruction in instructions:
+            group.append(instruction)
+            if not self.info.is_prefix(instruction):
+                yield group
+                group = []
+        if group:
+            yield group
+
+    def is_movable(self, group):
+        """ Test if a group of instructions can be moved """
+        return all(
+            self.info.can_schedule(i) and not i.jumps and not i.clobbers
+            for i in group)
+
+    def schedule_region(self, groups):
+        """ Schedule a list of movable instruction groups """
+        nodes = self.make_dag(groups)
+
+        # Determine the length of the path to the end of the region:
+        for node in reversed(nodes):
+            for successor, latency in node.successors.items():
+                node.height = max(node.height, latency + successor.height)
+
+        width = self.info.issue_width
+        ready = [node for node in nodes if not node.predecessor_count]
+        schedule = []
+        cycle = 0
+        stalls = 0
+        while ready:
+            issued = 0
+            while issued < width:
+                candidates = [n for n in ready if n.earliest <= cycle]
+                if not candidates:
+                    break
+                node = max(candidates, key=lambda n: (n.height, -n.index))
+                ready.remove(node)
+                schedule.append(node)
+                issued += 1
+                for successor, latency in node.successors.items():
+                    successor.earliest = max(
+                        successor.earliest, cycle + latency)
+                    successor.predecessor_count -= 1
+                    if not successor.predecessor_count:
+                        ready.append(successor)
+            if not issued:
+                stalls += 1
+            cycle += 1
+
+        assert len(schedule) == len(nodes)
+        self.logger.debug(
+            'Scheduled %s instructions in %s cycles with %s stalls',
+            len(nodes), cycle, stalls)
+        return [node.instructions for node in schedule]
+
+    def make_dag(self, groups):
+        """ Create the dependency graph of the given instruction groups """
+        nodes = []
+        last_def = {}
+        last_uses = {}
+        last_memory = None
+        for index, group in enumerate(groups):
+            latency = max(self.info.get_latency(i) for i in group)
+            node = ScheduleNode(index, group, latency)
+            nodes.append(node)
+            uses = [r for i in group for r in i.used_registers]
+            defs = [r for i in group for r in i.defined_registers]
+
+            # Read after write:
+            for reg in uses:
+                if reg in last_def:
+                    definer = last_def[reg]
+                    definer.add_successor(node, definer.latency)
+
+            # Write after write and write after read:
+            for reg in defs:
+                if reg in last_def:
+                    last_def[reg].add_successor(node, 1)
+                for user in last_uses.pop(reg, ()):
+                    if user is not node:
+                        user.add_successor(node, 0)
+
+            for reg in uses:
+                last_uses.setdefault(reg, []).append(node)
+            for reg in defs:
+                last_def[reg] = node
+
+            # Keep memory accesses in order:
+            if any(self.info.accesses_memory(i) for i in group):
+                if last_memory:
+                    last_memory.add_successor(node, 0)
+                last_memory = node
+        return nodes
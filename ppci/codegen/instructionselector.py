@@ -56,11 +56,12 @@ Memory move operations:
 
 import abc
 import logging
+from collections import defaultdict
 from ..utils.tree import Tree
 from .treematcher import State
 from .. import ir
 from ..arch.encoding import Instruction
-from .burg import BurgSystem
+from .burg import BurgSystem, BurgError
 from .irdag import FunctionInfo, prepare_function_info
 from .dagsplit import DagSplitter
 from ..arch.generic_instructions import RegisterUseDef
@@ -132,13 +133,17 @@ class TreeSelector:
     def gen(self, context, tree):
         """ Generate code for a given tree. The tree will be tiled with
             patterns and the corresponding code will be emitted """
-        self.sys.check_tree_defined(tree)
+        self.check_tree(tree)
         self.burm_label(tree)
 
         if not tree.state.has_goal("stm"):  # pragma: no cover
             raise RuntimeError("Tree {} not covered".format(tree))
         return self.apply_rules(context, tree, "stm")
 
+    def check_tree(self, tree):
+        """ Check if all names in the tree are known """
+        self.sys.check_tree_defined(tree)
+
     def burm_label(self, tree):
         """ Label all nodes in the tree bottom up """
         for child_tree in tree.children:
@@ -200,6 +205,121 @@ class TreeSelector:
         return self.sys.get_nts(template_tree)
 
 
+class MemoizedTreeSelector(TreeSelector):
+    """ Tree matcher which labels trees using lazily built state tables.
+
+    The rules are split into single level rules, by introducing a new
+    non terminal for each nested operator in a pattern. The label of a
+    node then only depends on the operator of the node and the labels
+    of its children. Costs in a label are stored relative to the
+    cheapest goal, so the same label is found for many nodes. This
+    allows to memoize the labeling in a table indexed by the operator
+    and the labels of the children.
+
+    Rules with an acceptance function cannot be decided up front. For
+    these rules, the outcome of the acceptance function is made part of
+    the table index.
+    """
+    def __init__(self, sys):
+        super().__init__(sys)
+        self.operator_rules = defaultdict(list)
+        self.acceptance_rules = defaultdict(list)
+        for rule in sys.rules:
+            if rule.tree.name in sys.terminals:
+                self.split_rule(rule)
+
+        # Unique labels, and labels by operator and child labels:
+        self.states = {}
+        self.table = {}
+
+    def split_rule(self, rule):
+        """ Split a rule into single level rules """
+        goals = tuple(
+            self.split_tree(child, '{}.{}'.format(rule.nr, index))
+            for index, child in enumerate(rule.tree.children))
+        single_rule = (
+            rule.non_term, rule.cost, rule.nr, goals, rule.acceptance)
+        self.operator_rules[rule.tree.name].append(single_rule)
+        if rule.acceptance:
+            self.acceptance_rules[rule.tree.name].append(single_rule)
+
+    def split_tree(self, tree, name):
+        """ Get the goal to which a part of a pattern must be reduced """
+        if tree.name in self.sys.non_terminals:
+            return tree.name
+
+        goals = tuple(
+            self.split_tree(child, '{}.{}'.format(name, index))
+            for index, child in enumerate(tree.children))
+        goal = '@' + name
+        self.operator_rules[tree.name].append((goal, 0, None, goals, None))
+        return goal
+
+    def check_tree(self, tree):
+        """ Names are checked when a new table entry is created """
+        pass
+
+    def burm_label(self, tree):
+        """ Label all nodes in the tree bottom up """
+        for child_tree in tree.children:
+            self.burm_label(child_tree)
+
+        kids = tuple(child_tree.state for child_tree in tree.children)
+        accepted = tuple(
+            self.accepts(tree, kids, rule)
+            for rule in self.acceptance_rules[tree.name])
+        key = (tree.name, kids, accepted)
+        if key in self.table:
+            tree.state = self.table[key]
+        else:
+            tree.state = self.table[key] = self.create_state(
+                tree.name, kids, accepted)
+
+    @staticmethod
+    def accepts(tree, kids, rule):
+        """ Check if a rule with an acceptance function matches """
+        goals, acceptance = rule[3], rule[4]
+        return all(x.has_goal(y) for x, y in zip(kids, goals)) and \
+            bool(acceptance(tree))
+
+    def create_state(self, name, kids, accepted):
+        """ Determine the label for an operator with the given kids """
+        if name not in self.sys.symbols:
+            raise BurgError("{} not defined".format(name))
+
+        state = State()
+        accepted = iter(accepted)
+        for goal, cost, nr, goals, acceptance in self.operator_rules[name]:
+            if acceptance:
+                accept = next(accepted)
+            else:
+                accept = all(x.has_goal(y) for x, y in zip(kids, goals))
+
+            if accept:
+                cost += sum(x.get_cost(y) for x, y in zip(kids, goals))
+                self.mark_state(state, goal, cost, nr, set())
+
+        # Make costs relative and get the unique state:
+        if state.labels:
+            base = min(cost for cost, _ in state.labels.values())
+            state.labels = {
+                goal: (cost - base, nr)
+                for goal, (cost, nr) in state.labels.items()}
+        key = frozenset(state.labels.items())
+        return self.states.setdefault(key, state)
+
+    def mark_state(self, state, goal, cost, nr, marked_rules):
+        """ Set the cost of a goal, and of goals reachable by chain rules """
+        state.set_cost(goal, cost, nr)
+        if goal in self.sys.non_terminals:
+            for cr in self.sys.chain_rules_for_nt(goal):
+                if cr not in marked_rules:
+                    marked_rules.add(cr)
+                    self.mark_state(
+                        state, cr.non_term, cost + cr.cost, cr.nr,
+                        marked_rules)
+
+
 class InstructionSelector1:
     """ Instruction selector which takes in a DAG and puts instructions
         into a frame.
@@ -208,6 +328,10 @@ class InstructionSelector1:
     """
     verbose = False
 
+    # Label trees with memoized state tables instead of matching all rules
+    # against every node:
+    memoize = True
+
     def __init__(self, arch, sgraph_builder, weights=(1, 1, 1)):
         """ Create a new instruction selector.
 
@@ -242,7 +366,10 @@ class InstructionSelector1:
                 pattern.condition, pattern.method)
 
         self.sys.check()
-        self.tree_selector = TreeSelector(self.sys)
+        if self.memoize:
+            self.tree_selector = MemoizedTreeSelector(self.sys)
+        else:
+            self.tree_selector = TreeSelector(self.sys)
 
     def call_function(self, context, tree):
         label, args, rv = tree.value
@@ -10,14 +10,15 @@ from collections import defaultdict
 from ..graph.graph import Node
 from ..graph.maskable_graph import MaskableGraph
 from ..arch.registers import Register
+from ..utils.collections import OrderedSet
 
 
 class InterferenceGraphNode(Node):
     """ Node in an interference graph. Represents a single register """
     def __init__(self, graph, vreg):
         super().__init__(graph)
-        self.temps = {vreg}
-        self.moves = set()
+        self.temps = OrderedSet([vreg])
+        self.moves = OrderedSet()
         self.reg = vreg if vreg.is_colored else None
         self.reg_class = type(vreg)
 
@@ -40,6 +41,22 @@ class InterferenceGraph(MaskableGraph):
         self._def_map = defaultdict(list)
         self._use_map = defaultdict(list)
 
+        # The flowgraph which numbers the temporaries:
+        self.flowgraph = None
+
+        # Bitset of the temporaries with a node in this graph:
+        self._temps = 0
+
+        # Bitset of the temporaries which were removed from the program.
+        # Their bits can still be present in the live sets:
+        self._removed = 0
+
+        # Interference between temporaries, as a bitset per temporary
+        # number. This information is kept unchanged when combining
+        # or masking nodes, and is used to update the graph after a
+        # program change.
+        self._interferences = defaultdict(int)
+
     def defs(self, tmp):
         return self._def_map[tmp]
 
@@ -48,32 +65,145 @@ class InterferenceGraph(MaskableGraph):
 
     def calculate_interference(self, flowgraph):
         """ Construct interference graph """
-        for n in flowgraph:
-            for ins in n.instructions:
-                # ins.live_out |= ins.
-                for tmp in ins.live_in:
-                    self.get_node(tmp)
-
-                # Live out and zero length defined variables:
-                live_and_def = ins.live_out | ins.kill
-
-                # Add interfering edges:
-                for tmp in live_and_def:
-                    n1 = self.get_node(tmp)
-                    for tmp2 in (live_and_def - {tmp}):
-                        n2 = self.get_node(tmp2)
-                        self.add_edge(n1, n2)
-
-                    # Add clobbered interfering edges:
-                    for tmp2 in ins.clobbers:
-                        n2 = self.get_node(tmp2)
-                        self.add_edge(n1, n2)
-
-                # Generate usage info:
-                for reg in ins.defined_registers:
-                    self._def_map[reg].append(ins)
-                for reg in ins.used_registers:
-                    self._use_map[reg].append(ins)
+        self.flowgraph = flowgraph
+        instructions = [ins for n in flowgraph for ins in n.instructions]
+
+        # Create nodes in order of appearance. Liveness sets are ordered
+        # by this order as well, such that the graph, and thus the
+        # register allocation, is the same on each run.
+        for ins in instructions:
+            self._add_temps(ins.gen | ins.kill)
+
+        for ins in instructions:
+            self._add_interferences(ins)
+            self._add_usage(ins)
+
+    def update(self, changed, removed, usage=()):
+        """ Create a new interference graph after a program change.
+
+        Instead of calculating all interferences again, the interference
+        bitsets and the usage information are taken over from this graph,
+        which must not be used afterwards. Only the neighbours of removed
+        temporaries and the changed instructions are visited. The liveness
+        information of the instructions must already be up to date, apart
+        from the removed temporaries, which are ignored.
+
+        Args:
+            changed: the instructions which live sets changed
+            removed: bitset of the temporaries which are no longer used
+            usage: pairs of an instruction and the registers for which the
+                instruction must be recorded as a definition or use
+        """
+        graph = InterferenceGraph()
+        graph.flowgraph = flowgraph = self.flowgraph
+        graph._removed = removed
+        graph._def_map = self._def_map
+        graph._use_map = self._use_map
+        graph._interferences = interferences = self._interferences
+
+        # Forget the temporaries which are gone:
+        for tmp in flowgraph.registers(self._temps & removed):
+            number = flowgraph.number(tmp)
+            bit = 1 << number
+            for other in flowgraph.registers(interferences.pop(number, 0)):
+                interferences[flowgraph.number(other)] &= ~bit
+            self._def_map.pop(tmp, None)
+            self._use_map.pop(tmp, None)
+
+        temps = self._temps & ~removed
+        for ins in changed:
+            temps |= graph._record_interferences(ins)
+
+        for ins, registers in usage:
+            graph._add_usage(ins, registers)
+
+        graph._add_temps(temps)
+        graph._add_edges(temps)
+        return graph
+
+    def _record_interferences(self, ins):
+        """ Record the interferences at an instruction in the bitsets only.
+
+        Returns the bitset of the temporaries at the instruction.
+        """
+        live_and_def = (ins.live_out | ins.kill) & ~self._removed
+        temps = live_and_def | (ins.gen & ~self._removed)
+        if not live_and_def:
+            return temps
+
+        clobbers = self.flowgraph.mask(ins.clobbers)
+        interferences = live_and_def | clobbers
+        number = self.flowgraph.number
+        for tmp in self.flowgraph.registers(live_and_def):
+            tmp_number = number(tmp)
+            self._interferences[tmp_number] |= \
+                interferences & ~(1 << tmp_number)
+        for tmp in self.flowgraph.registers(clobbers & ~live_and_def):
+            self._interferences[number(tmp)] |= live_and_def
+        return temps | interferences
+
+    def _add_edges(self, temps):
+        """ Create the edges between the given temporaries from the
+        interference bitsets """
+        number = self.flowgraph.number
+        registers = self.flowgraph.registers
+        temp_map = self.temp_map
+        for tmp in registers(temps):
+            interferences = self._interferences[number(tmp)] & temps
+            if interferences:
+                self.adj_map[temp_map[tmp]] |= (
+                    temp_map[tmp2] for tmp2 in registers(interferences))
+
+    def _add_temps(self, temps):
+        """ Create nodes for the temporaries in the given bitset """
+        new = temps & ~self._temps
+        if new:
+            self._temps |= new
+            for tmp in self.flowgraph.registers(new):
+                self.get_node(tmp)
+
+    def _add_interferences(self, ins):
+        """ Add the interfering edges at a single instruction """
+        # Live out and zero length defined variables:
+        live_and_def = ins.live_out | ins.kill
+        if not live_and_def:
+            return
+
+        # Clobbered registers interfere as well:
+        clobbers = self.flowgraph.mask(ins.clobbers)
+        interferences = live_and_def | clobbers
+        self._add_temps(interferences)
+
+        # Add interfering edges:
+        for tmp in self.flowgraph.registers(live_and_def):
+            self.add_interferences(tmp, interferences)
+
+    def _add_usage(self, ins, registers=None):
+        """ Generate usage info, optionally only for the given registers """
+        for reg in ins.defined_registers:
+            if registers is None or reg in registers:
+                self._def_map[reg].append(ins)
+        for reg in ins.used_registers:
+            if registers is None or reg in registers:
+                self._use_map[reg].append(ins)
+
+    def add_interferences(self, tmp, temps):
+        """ Mark tmp as interfering with the temporaries in a bitset """
+        number = self.flowgraph.number
+        tmp_number = number(tmp)
+        bit = 1 << tmp_number
+        interferences = self._interferences
+
+        # Only add edges which are not there yet:
+        new = temps & ~(interferences[tmp_number] | bit)
+        if not new:
+            return
+        interferences[tmp_number] |= new
+
+        node = self.get_node(tmp)
+        for tmp2 in self.flowgraph.registers(new):
+            interferences[number(tmp2)] |= bit
+            self.add_edge(node, self.get_node(tmp2))
 
     def has_node(self, tmp):
         """ Check if there exists a node for this temp register """
@@ -105,7 +235,7 @@ class InterferenceGraph(MaskableGraph):
         """ Combine n and m into n and return n """
         # Copy associated moves and temporaries into n:
         n.temps |= m.temps
-        n.moves.update(m.moves)
+        n.moves |= m.moves
 
         # Update local temp map:
         for tmp in m.temps:
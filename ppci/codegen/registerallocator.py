@@ -200,6 +200,18 @@ class GraphColoringRegisterAllocator:
     logger = logging.getLogger('regalloc')
     verbose = False  # Set verbose to True to get more logging info
 
+    # Update liveness and interference after spilling, instead of
+    # calculating them again for the whole frame:
+    incremental = True
+
+    # A register is gone from the program once it is spilled, and
+    # registers introduced by spilling are only spilled when nothing
+    # else is left, so the amount of spill rounds is bounded by the
+    # amount of registers. Big functions on register poor targets need
+    # more than 50 rounds, but a lot more rounds means that spilling
+    # does not help anymore.
+    max_spill_rounds = 200
+
     def __init__(self, arch: Architecture, instruction_selector):
         assert isinstance(arch, Architecture), arch
         self.arch = arch
@@ -233,6 +245,7 @@ class GraphColoringRegisterAllocator:
             frame: The frame to perform register allocation on.
         """
         self.spill_rounds = 0
+        self.spill_temps = set()
         self.init_data(frame)
         self.logger.debug('Starting iterative coloring')
         while True:
@@ -246,9 +259,9 @@ class GraphColoringRegisterAllocator:
             elif self.freeze_worklist:
                 self.freeze()
             elif self.spill_worklist:
-                self.spill()
+                spilled, rewrites = self.spill()
                 self.logger.debug('Starting over')
-                self.init_data(frame)
+                self.update_data(spilled, rewrites)
             else:
                 break   # Done!
         self.logger.debug('Now assinging colors')
@@ -281,13 +294,140 @@ class GraphColoringRegisterAllocator:
             len(cfg.nodes))
 
         cfg.calculate_liveness()
+        self.cfg = cfg
+        self.node_map = {
+            instruction: node
+            for node in cfg for instruction in node.instructions}
+        self.spilled_mask = 0  # Temporaries which are no longer used
+        self.moves = [i for i in self.frame.instructions if i.ismove]
+        self.frame.cfg = cfg
         self.frame.ig = InterferenceGraph()
         self.frame.ig.calculate_interference(cfg)
         self.logger.debug(
             'Constructed interferencegraph with %s nodes',
             len(self.frame.ig.nodes))
+        self.init_worklists()
 
-        self.moves = [i for i in self.frame.instructions if i.ismove]
+    def update_data(self, spilled, rewrites):
+        """ Update data structures after spilling.
+
+        Spill code only touches the instructions around the spilled
+        registers, so liveness and interference are only calculated
+        for the changed instructions. When this is not possible, the
+        data structures are constructed from scratch.
+
+        This removes the rebuild of the flowgraph, liveness and
+        interference graph from each spill round. The worklists are still
+        filled from the whole graph, and coalescing starts over on all
+        moves, so a spill round still takes time in proportion to the
+        frame.
+        """
+        changed = self.update_liveness(spilled, rewrites)
+        if changed is None:
+            self.logger.debug('Cannot update liveness, rebuilding')
+            self.init_data(self.frame)
+            return
+
+        # Record the spill code, and the new registers of the rewritten
+        # instructions, as definitions and uses:
+        usage = []
+        for instruction, loads, stores in rewrites:
+            new_registers = {
+                reg for reg in self.cfg.registers(
+                    instruction.gen | instruction.kill)
+                if not self.frame.ig.has_node(reg)}
+            usage.append((instruction, new_registers))
+            usage.extend((ins, None) for ins in loads + stores)
+            self.moves.extend(ins for ins in loads + stores if ins.ismove)
+
+        self.frame.ig = self.frame.ig.update(
+            changed, self.spilled_mask, usage)
+        self.logger.debug(
+            'Updated interferencegraph with %s nodes',
+            len(self.frame.ig.nodes))
+        self.init_worklists()
+
+    def update_liveness(self, spilled, rewrites):
+        """ Update the liveness information after rewriting the program.
+
+        The liveness of each rewritten instruction and the spill code
+        around it is calculated. Registers which become live at the start
+        of such a piece of code, for example the stack pointer used by the
+        spill code, are propagated backwards through the flowgraph.
+
+        The spilled registers are not removed from the live sets of the
+        other instructions, since that would visit the whole frame. They
+        are recorded in spilled_mask instead, and are ignored where the
+        live sets are used.
+
+        Returns the list of new and changed instructions, or None when
+        the liveness cannot be updated locally.
+        """
+        if not self.incremental:
+            return
+
+        self.spilled_mask |= self.cfg.mask(spilled)
+        keep = ~self.spilled_mask
+
+        changed = OrderedSet()
+        for instruction, loads, stores in rewrites:
+            # Place the spill code into the flowgraph node:
+            node = self.node_map[instruction]
+            region = loads + [instruction] + stores
+            index = node.instructions.index(instruction)
+            node.instructions[index:index + 1] = region
+            for ins in region:
+                self.node_map[ins] = node
+
+            live = instruction.live_out & keep
+            old_live_in = instruction.live_in & keep
+            for ins in reversed(region):
+                ins.gen = self.cfg.mask(ins.used_registers)
+                ins.kill = self.cfg.mask(ins.defined_registers)
+                ins.live_out = live
+                ins.live_in = ins.gen | (live & ~ins.kill)
+                live = ins.live_in
+            changed |= OrderedSet(region)
+
+            if old_live_in & ~live:
+                # Spill code defines a live register, give up.
+                return
+
+            if live & ~old_live_in:
+                changed |= self.propagate_liveness(
+                    node, index, live & ~old_live_in)
+        return list(changed)
+
+    @staticmethod
+    def propagate_liveness(node, index, registers):
+        """ Mark registers live before the instruction at index in node.
+
+        The registers are given as a bitset. Returns the instructions
+        which live sets were changed.
+        """
+        changed = OrderedSet()
+        worklist = [(node, index, registers)]
+        while worklist:
+            node, index, registers = worklist.pop()
+            for ins in reversed(node.instructions[:index]):
+                registers &= ~ins.live_out
+                if not registers:
+                    break
+                ins.live_out |= registers
+                ins.live_in = ins.gen | (ins.live_out & ~ins.kill)
+                changed.add(ins)
+                registers &= ~ins.kill
+                if not registers:
+                    break
+            else:
+                for predecessor in node.predecessors:
+                    worklist.append((
+                        predecessor, len(predecessor.instructions),
+                        registers))
+        return changed
+
+    def init_worklists(self):
+        """ Initialize the move and node work lists """
         for mv in self.moves:
             self.link_move(mv)
 
@@ -382,8 +522,13 @@ class GraphColoringRegisterAllocator:
             return True
 
         B = node.reg_class
-        num_blocked = sum(self.q(B, j.reg_class) for j in node.adjecent)
-        return num_blocked < self.K[B]
+        K = self.K[B]
+        num_blocked = 0
+        for j in node.adjecent:
+            num_blocked += self.q(B, j.reg_class)
+            if num_blocked >= K:
+                return False
+        return True
 
     def NodeMoves(self, n):
         return n.moves
@@ -575,14 +720,22 @@ class GraphColoringRegisterAllocator:
         """ Do spilling """
         self.logger.debug('Spilling round %s', self.spill_rounds)
         self.spill_rounds += 1
-        if self.spill_rounds > 30:
-            raise RuntimeError('Give up: more than 10 spill rounds done!')
-        # TODO: select a node which is certainly not a node that was
-        # introduced during spilling?
-        # Select to be spilled variable:
+        if self.spill_rounds > self.max_spill_rounds:
+            raise RuntimeError(
+                'Give up: more than {} spill rounds done!'.format(
+                    self.max_spill_rounds))
+        # Select to be spilled variable. Registers introduced during
+        # spilling have tiny live ranges, spilling them again does
+        # not help, so avoid those if possible.
+        candidates = [
+            n for n in self.spill_worklist
+            if not n.temps <= self.spill_temps]
+        if not candidates:
+            candidates = self.spill_worklist
+
         # Select node with the lowest priority:
         p = []
-        for n in self.spill_worklist:
+        for n in candidates:
             assert not n.is_colored
             d = sum(len(self.frame.ig.defs(t)) for t in n.temps)
             u = sum(len(self.frame.ig.uses(t)) for t in n.temps)
@@ -591,10 +744,15 @@ class GraphColoringRegisterAllocator:
             p.append((n, priority))
         node = min(p, key=lambda x: x[1])[0]
         # TODO: mark now, rewrite later?
-        self.rewrite_program(node)
+        rewrites = self.rewrite_program(node)
+        return set(node.temps), rewrites
 
     def rewrite_program(self, node):
-        """ Rewrite program by creating a load and a store for each use """
+        """ Rewrite program by creating a load and a store for each use.
+
+        Returns a list of tuples with each rewritten instruction and the
+        load and store code placed before and after it.
+        """
         # Generate spill code:
         self.logger.debug('Placing %s on stack', node)
 
@@ -603,19 +761,28 @@ class GraphColoringRegisterAllocator:
         slot = self.frame.alloc(size, alignment)
         self.logger.debug('Allocating stack slot %s', slot)
         # TODO: maybe break-up coalesced node before doing this?
+        rewrites = OrderedDict()
         for tmp in node.temps:
             instructions = OrderedSet(
                 self.frame.ig.uses(tmp) + self.frame.ig.defs(tmp))
             for instruction in instructions:
+                # An instruction can use more temporaries of the node:
+                if instruction not in rewrites:
+                    rewrites[instruction] = ([], [])
+                loads, stores = rewrites[instruction]
                 vreg2 = self.frame.new_reg(type(tmp))
+                self.spill_temps.add(vreg2)
                 self.logger.debug('tmp: %s, new: %s', tmp, vreg2)
                 instruction.replace_register(tmp, vreg2)
                 if instruction.reads_register(vreg2):
                     code = self.spill_gen.gen_load(self.frame, vreg2, slot)
                     self.frame.insert_code_before(instruction, code)
+                    loads.extend(code)
                 if instruction.writes_register(vreg2):
                     code = self.spill_gen.gen_store(self.frame, vreg2, slot)
                     self.frame.insert_code_after(instruction, code)
+                    stores[:0] = code
+        return [(i, l, s) for i, (l, s) in rewrites.items()]
 
     def assign_colors(self):
         """ Add nodes back to the graph to color it. """
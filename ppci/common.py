@@ -55,6 +55,10 @@ class CompilerError(Exception):
     def __repr__(self):
         return '"{}"'.format(self.msg)
 
+    def __reduce__(self):
+        # Allow errors to be passed from worker processes:
+        return (self.__class__, (self.msg, self.loc, self.hints))
+
     def render(self, lines):
         """ Render this error in some lines of context """
         self.loc.print_message('Error: {0}'.format(self.msg), lines=lines)
@@ -1,4 +1,3 @@
-
 """ A callgraph is a graph of functions which call eachother.
 
 """
@@ -8,29 +7,47 @@ from .. import ir
 
 
 class CallGraph(DiGraph):
-    pass
+    def __init__(self):
+        super().__init__()
+        self.node_map = {}
+
+    def get_node(self, routine):
+        """ Get the node of a function or external function """
+        return self.node_map[routine]
+
+
+class CallGraphNode(DiNode):
+    """ A function in the call graph """
+    def __init__(self, graph, routine):
+        super().__init__(graph)
+        self.routine = routine
+        graph.node_map[routine] = self
+
+    def __repr__(self):
+        return 'CallGraphNode({})'.format(self.routine.name)
 
 
 def mod_to_call_graph(ir_module) -> CallGraph:
-    """ Create a call graph for an ir-module """
+    """ Create a call graph for an ir-module.
+
+    Calls through function pointers are not part of the graph.
+    """
     cg = CallGraph()
 
     # Create call graph nodes:
-    node_map = {}
     for routine in ir_module.functions:
-        node_map[routine] = DiNode(cg)
+        CallGraphNode(cg, routine)
     for routine in ir_module.externals:
         if isinstance(routine, ir.ExternalSubRoutine):
-            node_map[routine] = DiNode(cg)
+            CallGraphNode(cg, routine)
 
     # Add call graph edges:
     for routine in ir_module.functions:
-        n1 = node_map[routine]
+        n1 = cg.get_node(routine)
         for instruction in routine.get_instructions():
             if isinstance(instruction, (ir.FunctionCall, ir.ProcedureCall)):
                 routine2 = instruction.callee
-                n2 = node_map[routine2]
-                cg.add_edge(n1, n2)
+                if routine2 in cg.node_map:
+                    cg.add_edge(n1, cg.get_node(routine2))
 
     return cg
-
@@ -229,23 +229,35 @@ class ControlFlowGraph(DiGraph):
                     self._reach[node] = new_reach
 
     def calculate_loops(self):
-        """ Calculate loops by use of the dominator info """
-        if self._reach is None:
-            self.calculate_reach()
+        """ Calculate loops by use of the dominator info.
+
+        An edge to a node which dominates its source is a back edge. The
+        loop of a back edge consists of the nodes from which the source
+        can be reached without passing the header. The loops of all back
+        edges to the same header are merged into a single loop.
+        """
+        if self._dom is None:
+            self._calculate_dominator_info()
 
-        loops = []
+        bodies = {}
         for node in self.nodes:
             for header in self.successors(node):
                 if header.dominates(node):
                     # Back edge!
-                    # Determine the other nodes in the loop:
-                    loop_nodes = [
-                        ln for ln in self._reach[header]
-                        if (header.dominates(ln)
-                            and ln.can_reach(header) and ln is not header)]
-                    loop = Loop(header=header, rest=loop_nodes)
-                    loops.append(loop)
-        return loops
+                    # Walk backwards from its source up to the header:
+                    body = bodies.setdefault(header, {})
+                    worklist = [node]
+                    while worklist:
+                        loop_node = worklist.pop()
+                        if loop_node is header or loop_node in body:
+                            continue
+                        body[loop_node] = None
+                        worklist.extend(
+                            p for p in self.predecessors(loop_node)
+                            if header.dominates(p))
+        return [
+            Loop(header=header, rest=list(body))
+            for header, body in bodies.items()]
 
     def calculate_dominance_frontier(self):
         """ Calculate the dominance frontier.
@@ -10,6 +10,7 @@ class CfgInfo:
         self.function = function
         self.cfg, self._block_map = ir_function_to_graph(function)
         self._node_map = {n: b for b, n in self._block_map.items()}
+        self._loops = None
 
         self._calculate_df()
 
@@ -25,6 +26,13 @@ class CfgInfo:
     def has_block(self, node):
         return node in self._node_map
 
+    @property
+    def loops(self):
+        """ The loops in the control flow graph, calculated on first use """
+        if self._loops is None:
+            self._loops = self.cfg.calculate_loops()
+        return self._loops
+
     def _calculate_df(self):
         self.cfg.calculate_dominance_frontier()
         self.df = {
@@ -616,11 +616,12 @@ def value_use(name):
             raise TypeError(
                 'Expecting a Value instance, but got {}'.format(value))
         # If value was already set, remove usage
-        if name in self._var_map:
-            self.del_use(self._var_map[name])
+        old = self._var_map.get(name)
 
         # Place the value in the var map:
         self._var_map[name] = value
+        if old is not None and old not in self._var_map.values():
+            self.del_use(old)
 
         # Add usage:
         self.add_use(value)
@@ -669,11 +670,12 @@ class Instruction:
         """
         # TODO: update reference
         # assert old in self._var_map.values()
-        for name in self._var_map:
-            if self._var_map[name] is old:
-                self.del_use(old)
-                self._var_map[name] = new
-                self.add_use(new)
+        names = [n for n, v in self._var_map.items() if v is old]
+        for name in names:
+            self._var_map[name] = new
+        if names:
+            self.del_use(old)
+            self.add_use(new)
 
     def remove_from_block(self):
         for use in list(self.uses):
@@ -806,9 +808,11 @@ class FunctionCall(LocalValue):
     def replace_use(self, old, new):
         super().replace_use(old, new)
         if old in self.arguments:
-            idx = self.arguments.index(old)
-            self.del_use(old)
-            self.arguments[idx] = new
+            self.arguments = [
+                new if argument is old else argument
+                for argument in self.arguments]
+            if old in self.uses:
+                self.del_use(old)
             self.add_use(new)
 
     def __str__(self):
@@ -839,9 +843,11 @@ class ProcedureCall(Instruction):
     def replace_use(self, old, new):
         super().replace_use(old, new)
         if old in self.arguments:
-            idx = self.arguments.index(old)
-            self.del_use(old)
-            self.arguments[idx] = new
+            self.arguments = [
+                new if argument is old else argument
+                for argument in self.arguments]
+            if old in self.uses:
+                self.del_use(old)
             self.add_use(new)
 
     def __str__(self):
@@ -928,9 +934,9 @@ class Phi(LocalValue):
         assert old in self.inputs.values()
         for inp in self.inputs:
             if self.inputs[inp] == old:
-                self.del_use(old)
                 self.inputs[inp] = new
-                self.add_use(new)
+        self.del_use(old)
+        self.add_use(new)
 
     def set_incoming(self, block, value):
         """ Set the value for the phi node when entering through block """
@@ -938,9 +944,10 @@ class Phi(LocalValue):
             raise ValueError(
                 'Type mismatch {} where {} was expected'.format(
                     value.ty, self.ty))
-        if block in self.inputs:
-            self.del_use(self.inputs[block])
+        old = self.inputs.get(block)
         self.inputs[block] = value
+        if old is not None and old not in self.inputs.values():
+            self.del_use(old)
         self.add_use(value)
 
     def get_value(self, block):
@@ -950,7 +957,8 @@ class Phi(LocalValue):
     def del_incoming(self, block):
         """ Remove incoming branch from this phi node and delete the usage """
         value = self.inputs.pop(block)
-        self.del_use(value)
+        if value not in self.inputs.values():
+            self.del_use(value)
 
 
 class Alloc(LocalValue):
@@ -1143,8 +1151,9 @@ class JumpBase(FinalInstruction):
     def delete(self):
         """ Clear references """
         while self._block_map:
+            # A block can be the target more than once:
             _, block = self._block_map.popitem()
-            block.references.remove(self)
+            block.references.discard(self)
 
     @property
     def targets(self):
@@ -11,11 +11,12 @@ from .utils import CAstPrinter, print_ast
 from .printer import CPrinter, render_ast
 from .options import COptions
 from .token import CTokenPrinter
-from .api import preprocess, c_to_ir
+from .api import preprocess, preprocess_to_tokens, tokens_to_text, c_to_ir
 
 
 __all__ = [
-    'create_ast', 'preprocess', 'c_to_ir', 'print_ast', 'parse_text',
+    'create_ast', 'preprocess', 'preprocess_to_tokens', 'tokens_to_text',
+    'c_to_ir', 'print_ast', 'parse_text',
     'render_ast', 'parse_type',
     'CBuilder', 'CContext', 'CLexer', 'COptions', 'CPreProcessor', 'CParser',
     'CAstPrinter', 'CSemantics', 'CSynthesizer', 'CPrinter', 'CTokenPrinter',
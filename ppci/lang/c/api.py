@@ -16,12 +16,49 @@ def preprocess(f, output_file, coptions=None):
     CTokenPrinter().dump(tokens, file=output_file)
 
 
+def preprocess_to_tokens(f, coptions=None):
+    """ Pre-process a file into a list of tokens """
+    if coptions is None:
+        coptions = COptions()
+    preprocessor = CPreProcessor(coptions)
+    filename = f.name if hasattr(f, 'name') else None
+    return list(preprocessor.process_file(f, filename=filename))
+
+
+def get_included_files(f, coptions=None):
+    """ Pre-process a file and get the names of the files it includes """
+    if coptions is None:
+        coptions = COptions()
+    preprocessor = CPreProcessor(coptions)
+    filename = f.name if hasattr(f, 'name') else None
+    for _ in preprocessor.process_file(f, filename=filename):
+        pass
+    return preprocessor.included_files
+
+
+def tokens_to_text(tokens, locations=False):
+    """ Render pre-processed tokens into text.
+
+    When locations is True, the source location of each token is
+    included as well. This text can be used as a cache key.
+    """
+    output_file = io.StringIO()
+    CTokenPrinter().dump(tokens, file=output_file)
+    if locations:
+        for token in tokens:
+            loc = getattr(token, 'loc', None)
+            if loc:
+                print(loc.filename, loc.row, loc.col, file=output_file)
+    return output_file.getvalue()
+
+
 def c_to_ir(
         source: io.TextIOBase, march, coptions=None, reporter=None):
     """ C to ir translation.
 
     Args:
-        source (file-like object): The C source to compile.
+        source (file-like object): The C source to compile. This can also
+            be a list of pre-processed tokens.
         march (str): The targetted architecture.
         coptions: C specific compilation options.
 
@@ -38,6 +75,10 @@ def c_to_ir(
     from ...api import get_arch
     march = get_arch(march)
     cbuilder = CBuilder(march.info, coptions)
+    if isinstance(source, list):
+        filename = getattr(source[0], 'filename', None) if source else None
+        return cbuilder.build_tokens(source, filename, reporter=reporter)
+
     assert isinstance(source, io.TextIOBase)
     if hasattr(source, 'name'):
         filename = getattr(source, 'name')
@@ -2,6 +2,9 @@
 
 import logging
 import io
+import os
+import re
+from collections import OrderedDict
 
 from ..common import SourceLocation
 from .token import CToken
@@ -77,6 +80,71 @@ def continued_lines_filter(characters):
                 yield char
 
 
+# The tokens of the fast lexer. The alternatives follow the hand written
+# lexer, including its quirks. Comments, strings and character constants
+# which are not properly terminated are matched as errors, and are left to
+# the hand written lexer to report.
+token_pattern = re.compile(r"""
+    (?P<WS>[ \t]+)
+  | (?P<ID>(?!L')[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<BOL>\n)
+  | (?P<NUMBER>
+        (?:0[xX][0-9a-fA-F]*|0[bB][01]*|0[0-7]*|[1-9][0-9]*)
+        (?:\.[0-9]*(?:[eEpP][+-]?[0-9]*)?|[LlUu]{0,3})
+      | \.[0-9]+(?:[eEpP][+-]?[0-9]*)?)
+  | (?P<COMMENT>/\*[\s\S]*?\*/|//[^\n]*)
+  | (?P<STRING>"[^"\\]*(?:\\['"?\\abfntrv0-7xuU][^"\\]*)*")
+  | (?P<CHAR>L?'(?:
+        \\(?:['"?\\abfnrtv]|[0-7]{1,3}|x[0-9a-fA-F]{0,2}|[uU][0-9a-fA-F]{0,4})
+      | [^\\])')
+  | (?P<ERROR>/\*|L?'|")
+  | (?P<PUNCT>
+        \.\.\.|<<=|>>=|<=|<<|>=|>>|==|!=|\|\||\|=|&&|&=|\#\#|\+\+|\+=
+      | --|-=|->|\*=|%=|\^=|~=|/=|[-<>=!|&\#+*%^~/.;{}()\[\],?:\\])
+  | (?P<FF>\f)
+    """, re.VERBOSE)
+
+# A line continuation. Backslashes pair up from the start of the run:
+continuation_pattern = re.compile(r'\\+(?:[\r\n]|\Z)')
+
+
+class TokenCache:
+    """ Cache of the tokens of lexed files.
+
+    The same headers are included many times, by each source file of a
+    compiler run. The tokens of a file are kept, keyed by the path and
+    modification time of the file and the options which influence the
+    lexer. Only the most recently used files are kept.
+    """
+    logger = logging.getLogger('clexer')
+
+    def __init__(self, max_files=1000):
+        self.max_files = max_files
+        self.files = OrderedDict()
+
+    def lex_file(self, filename, coptions):
+        """ Get a tuple with the tokens of the given file """
+        stat = os.stat(filename)
+        key = (
+            filename, stat.st_mtime_ns, stat.st_size,
+            coptions['trigraphs'], coptions['std'])
+        if key in self.files:
+            self.files.move_to_end(key)
+            return self.files[key]
+
+        with open(filename, 'r') as f:
+            lexer = CLexer(coptions)
+            tokens = tuple(lexer.lex(f, SourceFile(filename)))
+        self.files[key] = tokens
+        if len(self.files) > self.max_files:
+            self.files.popitem(last=False)
+        return tokens
+
+    def clear(self):
+        """ Forget all lexed files """
+        self.files.clear()
+
+
 def lex_text(text, coptions):
     """ Lex a piece of text """
     lexer = CLexer(coptions)
@@ -93,6 +161,9 @@ class CLexer(HandLexerBase):
     numbers = octal_numbers + '89'
     hex_numbers = numbers + 'abcdefABCDEF'
 
+    # Lex whole texts with regular expressions when possible:
+    fast = True
+
     def __init__(self, coptions):
         super().__init__()
         self.coptions = coptions
@@ -101,15 +172,16 @@ class CLexer(HandLexerBase):
         """ Read a source and generate a series of tokens """
         self.logger.debug('Lexing %s', source_file.filename)
 
+        if self.fast:
+            src = list(src)
+            tokens = self.lex_lines(src, source_file)
+            if tokens is not None:
+                return tokens
+
         characters = create_characters(src, source_file)
         if self.coptions['trigraphs']:
             characters = trigraph_filter(characters)
         characters = continued_lines_filter(characters)
-        # print('=== lex ')
-        # print(s)
-        # print('=== end lex ')
-
-        # s = '\n'.join(r)
         return self.tokenize(characters)
 
     def lex_text(self, txt):
@@ -117,9 +189,136 @@ class CLexer(HandLexerBase):
         f = io.StringIO(txt)
         filename = None
         source_file = SourceFile(filename)
-        characters = characters = create_characters(f, source_file)
+        if self.fast:
+            tokens = self.lex_lines(f, source_file, continuations=False)
+            if tokens is not None:
+                return tokens
+            f.seek(0)
+        characters = create_characters(f, source_file)
         return self.tokenize(characters)
 
+    def lex_lines(self, lines, source_file, continuations=True):
+        """ Create tokens from lines of text at once.
+
+        This matches the tokens with a single regular expression on the
+        whole text, instead of creating an object for each character. The
+        location of each token is calculated from its offset in the text.
+
+        None is returned when the text contains trigraphs or lexical
+        errors. These are left to the character based lexer.
+        """
+        lines = [line.expandtabs() for line in lines]
+        line_starts = [0]
+        for line in lines:
+            line_starts.append(line_starts[-1] + len(line))
+        text = ''.join(lines)
+        if self.coptions['trigraphs'] and '??' in text:
+            return
+
+        # Glue continued lines, and remember the offsets where text was
+        # removed:
+        splice_offsets = []
+        splice_sizes = []
+        if continuations and '\\' in text:
+            parts = []
+            offset = removed = 0
+            for match in continuation_pattern.finditer(text):
+                start, end = match.span()
+                backslashes = end - start
+                if text[end - 1:end] in ('\r', '\n'):
+                    backslashes -= 1
+                if backslashes % 2:
+                    # Remove the last backslash and the newline:
+                    splice = start + backslashes - 1
+                    parts.append(text[offset:splice])
+                    offset = end
+                    splice_offsets.append(splice - removed)
+                    removed += end - splice
+                    splice_sizes.append(removed)
+            parts.append(text[offset:])
+            text = ''.join(parts)
+
+        # Match all tokens first, to find errors before any token is
+        # used:
+        splice_offsets.append(len(text) + 1)
+        splice_index = 0
+        shift = 0
+        std = self.coptions['std']
+        kinds = []
+        values = []
+        offsets = []
+        pos = 0
+        for match in token_pattern.finditer(text):
+            start = match.start()
+            if start != pos:
+                return
+            pos = match.end()
+            kind = match.lastgroup
+            if kind == 'COMMENT':
+                if std == 'c89' and match.group().startswith('//'):
+                    return
+                continue
+            elif kind == 'FF':
+                continue
+            elif kind == 'ERROR':
+                return
+            val = match.group()
+            if kind == 'PUNCT':
+                kind = '<<' if val == '<<=' else val
+            while splice_offsets[splice_index] <= start:
+                shift = splice_sizes[splice_index]
+                splice_index += 1
+            kinds.append(kind)
+            values.append(val)
+            offsets.append(start + shift)
+        if pos != len(text):
+            return
+        return self.create_tokens(
+            zip(kinds, values, offsets), line_starts, source_file)
+
+    def create_tokens(self, matches, line_starts, source_file):
+        """ Generate tokens from matched text and offsets into the lines.
+
+        The locations are determined when the tokens are taken, since
+        the preprocessor can change the row and filename of the source
+        file in between, with a line directive.
+        """
+        line = 1
+        line_start = 0
+        next_line_start = line_starts[1] if len(line_starts) > 1 else 0
+        space = ''
+        first = True
+        row = None
+        for kind, val, offset in matches:
+            while next_line_start <= offset:
+                source_file.row += 1
+                line += 1
+                line_start = next_line_start
+                next_line_start = line_starts[line]
+            col = offset - line_start + 1
+            row = source_file.row
+            if kind == 'WS':
+                space += val
+                continue
+
+            loc = SourceLocation(source_file.filename, row, col, 1)
+            if kind == 'BOL':
+                if first:
+                    # Yield an extra start of line
+                    yield CToken('BOL', '', '', first, loc)
+                first = True
+                space = ''
+            else:
+                yield CToken(kind, val, space, first, loc)
+                space = ''
+                first = False
+
+        # Emit last newline:
+        if first and row is not None:
+            loc = SourceLocation(source_file.filename, row, col, 1)
+            yield CToken('BOL', '', '', first, loc)
+        source_file.row += len(line_starts) - line
+
     def tokenize(self, characters):
         """ Generate tokens from characters """
         space = ''
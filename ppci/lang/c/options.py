@@ -7,6 +7,7 @@ class COptions:
         self.settings = {}
         self.include_directories = []
         self.macros = []
+        self.precompiled_header = None
 
         # Initialize defaults:
         self.disable('trigraphs')
@@ -51,6 +52,9 @@ class COptions:
         for macro in args.define:
             self.add_define(macro)
         self.set('verbose', args.super_verbose)
+        if args.include_pch:
+            from .pch import load_pch
+            self.precompiled_header = load_pch(args.include_pch)
 
     @classmethod
     def from_args(cls, args):
@@ -75,6 +79,9 @@ coptions_parser.add_argument(
     '--include', action='append',
     default=[], metavar='file',
     help="Include a file before all other sources")
+coptions_parser.add_argument(
+    '-include-pch', '--include-pch', metavar='file',
+    help="Load a precompiled header before all other sources")
 coptions_parser.add_argument(
     '--trigraphs', action="store_true", default=False,
     help="Enable trigraph processing")
@@ -125,6 +125,8 @@ class CParser(RecursiveDescentParser):
     def parse_translation_unit(self):
         """ Top level start of parsing """
         self.semantics.begin()
+        if self.coptions.precompiled_header:
+            self.coptions.precompiled_header.load_declarations(self)
         while not self.at_end:
             for declaration in self.parse_declarations():
                 # print('decl', declaration)
@@ -0,0 +1,192 @@
+""" Precompiled headers.
+
+A precompiled header holds the state of the C front end after processing
+a header file: the defined macros, and the declarations, typedefs, struct
+layouts and enum values found by the parser. Loading a precompiled header
+before a source file has the same effect as including the header at the
+top of the source file, without preprocessing and parsing it again.
+
+The state depends on the target and the C options, so a precompiled
+header can only be used with the same target and options. It also depends
+on the header and the files it includes. A hash of each of these files is
+stored, and the precompiled header is rejected when one of them changed.
+
+The file starts with a magic marker, followed by a pickle of the
+header. The macros and the parser state are pickled separately, so that
+each translation unit can load a fresh copy of them.
+"""
+
+import hashlib
+import os
+import pickle
+from ... import __version__
+from ...common import CompilerError
+from .context import CContext
+from .macro import Macro
+from .parser import CParser
+from .preprocessor import CPreProcessor, prepare_for_parsing
+from .preprocessor import find_include_guard
+from .semantics import CSemantics
+
+
+MAGIC = b'PPCIPCH\x00'
+
+
+class PrecompiledHeader:
+    """ The front end state after processing a header """
+    def __init__(self, filename, target, options, include_guards,
+                 macro_data, parse_data, dependencies=()):
+        self.filename = filename
+        self.target = target
+        self.options = options
+        self.include_guards = include_guards
+        self.macro_data = macro_data
+        self.parse_data = parse_data
+        self.dependencies = dependencies  # (filename, hash) per file
+
+    def __repr__(self):
+        return 'PrecompiledHeader({})'.format(self.filename)
+
+    @property
+    def digest(self):
+        """ A hash over the contents of the precompiled header """
+        digest = hashlib.sha256()
+        digest.update(self.macro_data)
+        digest.update(self.parse_data)
+        return digest.hexdigest()
+
+    def check(self, context):
+        """ Check that the header can be used in the given context """
+        if self.target != get_target_signature(context):
+            raise CompilerError(
+                'Precompiled header {} was made for another target'.format(
+                    self.filename))
+        if self.options != get_options_signature(context.coptions):
+            raise CompilerError(
+                'Precompiled header {} was made with other options'.format(
+                    self.filename))
+        for filename, digest in self.dependencies:
+            if file_digest(filename) != digest:
+                raise CompilerError(
+                    'Precompiled header {} is out of date, {} changed'.format(
+                        self.filename, filename))
+
+    def load_macros(self, preprocessor):
+        """ Define the macros of the header in the preprocessor """
+        for macro in pickle.loads(self.macro_data):
+            preprocessor.define(macro)
+        preprocessor.include_guards.update(self.include_guards)
+
+    def load_declarations(self, parser):
+        """ Load the declarations of the header into the parser.
+
+        The parser must have begun a translation unit.
+        """
+        semantics = parser.semantics
+        context = semantics.context
+        self.check(context)
+        typedefs, scope, declarations, field_offsets, enum_values = \
+            pickle.loads(self.parse_data)
+        parser.typedefs |= typedefs
+        semantics.scope = scope
+        semantics.declarations.extend(declarations)
+        context._field_offsets.update(field_offsets)
+        context._enum_values.update(enum_values)
+
+    def save(self, output_file):
+        """ Save the precompiled header to a binary file """
+        output_file.write(MAGIC)
+        pickle.dump(
+            (__version__, self.filename, self.target, self.options,
+             self.include_guards, self.macro_data, self.parse_data,
+             self.dependencies),
+            output_file, pickle.HIGHEST_PROTOCOL)
+
+
+def get_target_signature(context):
+    """ Describe the properties of the target which the state depends on """
+    return repr((
+        sorted(context.type_size_map.items()),
+        context.arch_info.endianness))
+
+
+def get_options_signature(coptions):
+    """ Describe the options which the state depends on """
+    return repr((coptions['std'], coptions['trigraphs']))
+
+
+def file_digest(filename):
+    """ Get a hash of the contents of a file, or None when it is missing """
+    try:
+        with open(filename, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def create_pch(f, arch_info, coptions, filename=None):
+    """ Preprocess and parse a header into a precompiled header """
+    if filename is None:
+        filename = getattr(f, 'name', None)
+    context = CContext(coptions, arch_info)
+    preprocessor = CPreProcessor(coptions)
+    semantics = CSemantics(context)
+    parser = CParser(coptions, semantics)
+    tokens = preprocessor.process_file(f, filename)
+    parser.parse(prepare_for_parsing(tokens, parser.keywords))
+
+    # The special and predefined macros are defined by each preprocessor:
+    macros = [
+        macro for macro in preprocessor.macros.values()
+        if isinstance(macro, Macro) and not macro.protected]
+    macro_data = pickle.dumps(macros, pickle.HIGHEST_PROTOCOL)
+
+    # Allow the header to be included by the sources as well:
+    include_guards = dict(preprocessor.include_guards)
+    if filename and os.path.isfile(filename):
+        guard = find_include_guard(
+            CPreProcessor.token_cache.lex_file(filename, coptions))
+        if guard:
+            include_guards[os.path.abspath(filename)] = guard
+
+    # The state is only valid as long as these files do not change:
+    filenames = list(preprocessor.included_files)
+    if filename and os.path.isfile(filename):
+        filenames.insert(0, filename)
+    dependencies = [
+        (os.path.abspath(name), file_digest(name)) for name in filenames]
+
+    parse_data = pickle.dumps(
+        (parser.typedefs, semantics.scope, semantics.declarations,
+         context._field_offsets, context._enum_values),
+        pickle.HIGHEST_PROTOCOL)
+    return PrecompiledHeader(
+        filename, get_target_signature(context),
+        get_options_signature(coptions), include_guards, macro_data,
+        parse_data, dependencies)
+
+
+def read_pch(f):
+    """ Read a precompiled header from a binary file """
+    if f.read(len(MAGIC)) != MAGIC:
+        raise CompilerError('Not a precompiled header')
+    try:
+        version, *fields = pickle.load(f)
+    except (EOFError, ValueError, pickle.UnpicklingError) as ex:
+        raise CompilerError('Corrupt precompiled header: {}'.format(ex))
+    if version != __version__:
+        raise CompilerError(
+            'Precompiled header was made by ppci {}'.format(version))
+    return PrecompiledHeader(*fields)
+
+
+def load_pch(filename):
+    """ Load a precompiled header from file """
+    with open(filename, 'rb') as f:
+        return read_pch(f)
+
+
+def save_pch(pch, filename):
+    """ Save a precompiled header to file """
+    with open(filename, 'wb') as f:
+        pch.save(f)
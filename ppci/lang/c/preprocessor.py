@@ -20,14 +20,20 @@ import operator
 import time
 
 from ...common import CompilerError
-from .lexer import CLexer, CToken, lex_text, SourceFile
+from .lexer import CLexer, CToken, lex_text, SourceFile, TokenCache
 from .utils import cnum, charval, replace_escape_codes, LineInfo
 from .macro import Macro, FunctionMacro
 
 
 class CPreProcessor:
-    """ A pre-processor for C source code """
+    """ A pre-processor for C source code.
+
+    Included files are lexed once per process, and their tokens are shared
+    by all preprocessors via the token cache. Files wrapped in an include
+    guard are not processed again when their guard macro is defined.
+    """
     logger = logging.getLogger('preprocessor')
+    token_cache = TokenCache()
 
     def __init__(self, coptions):
         self.coptions = coptions
@@ -35,8 +41,12 @@ class CPreProcessor:
         self.macros = {}  # A mapping of macros
         self.files = []  # Stack of included files.
         self.counter = 0  # For the __COUNTER__ macro
+        self.include_guards = {}  # Guard macro per included file
+        self.included_files = []  # Names of all files which were included
 
         self.predefine_builtin_macros()
+        if coptions.precompiled_header:
+            coptions.precompiled_header.load_macros(self)
 
     def predefine_builtin_macros(self):
         """ Define predefined macros """
@@ -153,12 +163,16 @@ class CPreProcessor:
 
     def process_file(self, f, filename=None):
         """ Process the given open file into tokens. """
-        self.logger.debug('Processing %s', filename)
         source_file = SourceFile(filename)
-        ex = FileExpander(source_file)
-        self.files.append(ex)
         clexer = CLexer(self.coptions)
         tokens = clexer.lex(f, source_file)
+        return self.process_source_file(tokens, source_file)
+
+    def process_source_file(self, tokens, source_file):
+        """ Process the lexed tokens of a file into tokens. """
+        self.logger.debug('Processing %s', source_file.filename)
+        ex = FileExpander(source_file)
+        self.files.append(ex)
         yield LineInfo(1, source_file.filename)
         for token in self.process_tokens(tokens):
             yield token
@@ -229,12 +243,25 @@ class CPreProcessor:
         """
         full_path = self.locate_include(
             filename, loc, use_current_dir, include_next)
-        self.logger.debug('Including %s', full_path)
         source_file = SourceFile(full_path)
         self.files[-1].dependencies.append(source_file)
-        with open(full_path, 'r') as f:
-            for token in self.process_file(f, full_path):
-                yield token
+        if full_path not in self.included_files:
+            self.included_files.append(full_path)
+        guard_key = os.path.abspath(full_path)
+        guard = self.include_guards.get(guard_key, None)
+        if guard and self.is_defined(guard):
+            self.logger.debug('Skipping %s, guarded by %s', full_path, guard)
+            return
+
+        self.logger.debug('Including %s', full_path)
+        tokens = self.token_cache.lex_file(full_path, self.coptions)
+        guard = find_include_guard(tokens)
+        if guard:
+            self.include_guards[guard_key] = guard
+
+        # The tokens are modified during processing, so use copies:
+        tokens = (token.copy() for token in tokens)
+        yield from self.process_source_file(tokens, source_file)
 
     # Token consume / peeking:
     @property
@@ -713,30 +740,37 @@ class CPreProcessor:
         """ Process the `#include` directive. """
         use_current_dir, include_filename = self.parse_included_filename()
 
-        for token in self.include(
-                include_filename, directive_token.loc,
-                use_current_dir=use_current_dir):
+        tokens = self.include(
+            include_filename, directive_token.loc,
+            use_current_dir=use_current_dir)
+        yield from self.included_tokens(tokens, directive_token)
+
+    def included_tokens(self, tokens, directive_token):
+        """ Produce the tokens of an included file.
+
+        When the file was skipped, an empty line is produced instead.
+        """
+        included = False
+        for token in tokens:
+            included = True
             yield token
 
-        yield LineInfo(
-            directive_token.loc.row + 1,
-            directive_token.loc.filename,
-            flags=[LineInfo.FLAG_RETURN_FROM_INCLUDE])
+        if included:
+            yield LineInfo(
+                directive_token.loc.row + 1,
+                directive_token.loc.filename,
+                flags=[LineInfo.FLAG_RETURN_FROM_INCLUDE])
+        else:
+            yield CToken('WS', '', '', True, directive_token.loc)
 
     def handle_include_next_directive(self, directive_token):
         """ Process the `#include_next` directive. """
         use_current_dir, include_filename = self.parse_included_filename()
 
-        for token in self.include(
-                include_filename, directive_token.loc,
-                use_current_dir=use_current_dir,
-                include_next=True):
-            yield token
-
-        yield LineInfo(
-            directive_token.loc.row + 1,
-            directive_token.loc.filename,
-            flags=[LineInfo.FLAG_RETURN_FROM_INCLUDE])
+        tokens = self.include(
+            include_filename, directive_token.loc,
+            use_current_dir=use_current_dir, include_next=True)
+        yield from self.included_tokens(tokens, directive_token)
 
     def parse_included_filename(self):
         """ Parse filename after #include/#include_next """
@@ -1190,6 +1224,59 @@ class IfState:
         return 'If-state(loc={})'.format(self.location)
 
 
+def find_include_guard(tokens):
+    """ Detect the include guard idiom in the tokens of a file.
+
+    The file must start with ``#ifndef NAME`` or ``#if !defined(NAME)``,
+    followed by ``#define NAME``, and end with the matching ``#endif``.
+    When the macro is defined, the whole file is skipped, so there is no
+    need to process the file again.
+
+    Returns the name of the guard macro, or None.
+    """
+    lines = []
+    for token in tokens:
+        if token.typ == 'BOL':
+            continue
+        if token.first or not lines:
+            lines.append([])
+        lines[-1].append(token)
+
+    if len(lines) < 3:
+        return
+
+    # Check the opening and closing lines:
+    opening = [token.val for token in lines[0]]
+    if len(opening) == 3 and opening[:2] == ['#', 'ifndef']:
+        name = opening[2]
+    elif len(opening) == 5 and opening[:4] == ['#', 'if', '!', 'defined']:
+        name = opening[4]
+    elif len(opening) == 7 and opening[:5] == \
+            ['#', 'if', '!', 'defined', '('] and opening[6] == ')':
+        name = opening[5]
+    else:
+        return
+    if [token.val for token in lines[1][:3]] != ['#', 'define', name]:
+        return
+    if [token.val for token in lines[-1]] != ['#', 'endif']:
+        return
+
+    # The opening #if must only be closed by the last line:
+    nesting = 0
+    for line in lines[:-1]:
+        if line[0].typ == '#' and len(line) > 1:
+            directive = line[1].val
+            if directive in ['if', 'ifdef', 'ifndef']:
+                nesting += 1
+            elif directive == 'endif':
+                nesting -= 1
+            elif directive in ['else', 'elif'] and nesting == 1:
+                return
+            if nesting == 0:
+                return
+    return name
+
+
 def skip_ws(tokens):
     """ Filter whitespace tokens """
     for token in tokens:
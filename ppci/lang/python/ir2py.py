@@ -40,11 +40,13 @@ class IrToPythonCompiler:
         self.stack_size = 0
         self.func_ptr_map = {}
         self._level = 0
+        self._lines = 0
 
     def print(self, level, *args):
         """ Print args to current file with level indents """
         print('    '*level, end='', file=self.output_file)
         print(*args, file=self.output_file)
+        self._lines += 1
 
     def _indent(self):
         self._level += 1
@@ -54,8 +56,15 @@ class IrToPythonCompiler:
 
     @contextlib.contextmanager
     def indented(self):
+        """ Indent the code emitted in this context.
+
+        A pass statement is emitted when no code was emitted.
+        """
         self._indent()
+        lines = self._lines
         yield
+        if self._lines == lines:
+            self.emit('pass')
         self._dedent()
 
     def emit(self, txt):
@@ -219,24 +228,22 @@ class IrToPythonCompiler:
 
     def generate_function(self, ir_function):
         """ Generate a function to python code """
-        self.stack_size = 0
+        # Allocations can be done in a loop, so free the stack by returning
+        # to the stack top at the entry of the function:
+        self.stack_size = sum(
+            ins.amount for block in ir_function for ins in block
+            if isinstance(ins, ir.Alloc))
         args = ','.join(a.name for a in ir_function.arguments)
         self.emit('def {}({}):'.format(ir_function.name, args))
         with self.indented():
-            try:
-                # TODO: remove this to enable shape style:
-                raise ValueError
-                shape, _rmap = relooper.find_structure(ir_function)
-                src = io.StringIO()
-                relooper.print_shape(shape, file=src)
-                self.reporter.dump_source(ir_function.name, src.getvalue())
-                self._rmap = _rmap
-                self._shape_style = True
+            if self.stack_size:
+                self.emit('_stack_top = len(stack)')
+            shape = self.find_shape(ir_function)
+            if shape:
                 self.generate_shape(shape)
-            except ValueError:
+            else:
                 self.logger.debug('Falling back to block-switch-style')
                 # Fall back to block switch stack!
-                self._shape_style = False
                 self.generate_function_fallback(ir_function)
 
         # Register function for function pointers:
@@ -244,27 +251,114 @@ class IrToPythonCompiler:
         self.func_ptr_map[ir_function] = len(self.func_ptr_map)
         self.emit('')
 
+    def find_shape(self, ir_function):
+        """ Find the structure of the function.
+
+        Returns None when the structure cannot be found, or when it does
+        not describe the control flow of the function exactly.
+        """
+        try:
+            shape, self._rmap = relooper.find_structure(ir_function)
+            self.check_shape(shape, None, [])
+        except (ValueError, NotImplementedError, RecursionError) as ex:
+            self.logger.debug(
+                'No structure found for %s: %s', ir_function.name, ex)
+            return
+
+        if self.reporter:
+            src = io.StringIO()
+            relooper.print_shape(shape, file=src)
+            self.reporter.dump_source(ir_function.name, src.getvalue())
+        return shape
+
+    def check_shape(self, shape, follow, loops):
+        """ Check that the shape is executed as the blocks jump.
+
+        The python code of a shape falls through to the follow block, and
+        the end of a loop body continues the loop. The loops argument is
+        a stack of (continue, break) blocks of the enclosing loops.
+
+        Returns the block which is executed first by the shape.
+        """
+        if shape is None:
+            return follow
+        elif isinstance(shape, relooper.BasicShape):
+            block = self._rmap[shape.content]
+            last = block.last_instruction
+            if isinstance(last, ir.Jump):
+                self.check_target(last.target, follow)
+            elif not isinstance(last, (ir.Return, ir.Exit)):
+                raise ValueError('{} does not end in a jump'.format(block))
+            return block
+        elif isinstance(shape, relooper.SequenceShape):
+            for sub_shape in reversed(shape.shapes):
+                follow = self.check_shape(sub_shape, follow, loops)
+            return follow
+        elif isinstance(shape, relooper.IfShape):
+            block = self._rmap[shape.content]
+            last = block.last_instruction
+            if not isinstance(last, ir.CJump):
+                raise ValueError('{} does not end in a branch'.format(block))
+            self.check_target(
+                last.lab_yes, self.check_shape(shape.yes_shape, follow, loops))
+            self.check_target(
+                last.lab_no, self.check_shape(shape.no_shape, follow, loops))
+            return block
+        elif isinstance(shape, relooper.LoopShape):
+            start = self.first_block(shape.body)
+            self.check_target(
+                start,
+                self.check_shape(shape.body, start, loops + [(start, follow)]))
+            return start
+        elif isinstance(shape, (relooper.ContinueShape, relooper.BreakShape)):
+            if shape.level != 0 or not loops:
+                raise ValueError('Cannot jump out of {}'.format(shape))
+            if isinstance(shape, relooper.ContinueShape):
+                return loops[-1][0]
+            else:
+                return loops[-1][1]
+        else:  # pragma: no cover
+            raise NotImplementedError(str(shape))
+
+    @staticmethod
+    def check_target(target, block):
+        if target is not block:
+            raise ValueError('Jump to {} arrives at {}'.format(target, block))
+
+    def first_block(self, shape):
+        """ Get the block which is executed first by a shape """
+        if isinstance(shape, (relooper.BasicShape, relooper.IfShape)):
+            return self._rmap[shape.content]
+        elif isinstance(shape, relooper.SequenceShape) and shape.shapes:
+            return self.first_block(shape.shapes[0])
+        elif isinstance(shape, relooper.LoopShape):
+            return self.first_block(shape.body)
+        else:
+            raise ValueError('No first block in {}'.format(shape))
+
     def generate_shape(self, shape):
         """ Generate python code for a shape structured program """
         if isinstance(shape, relooper.BasicShape):
-            self.generate_block(self._rmap[shape.content])
+            block = self._rmap[shape.content]
+            self.generate_block(block)
+            if isinstance(block.last_instruction, ir.Jump):
+                self.fill_phis(block, block.last_instruction.target)
         elif isinstance(shape, relooper.SequenceShape):
-            if shape.shapes:
-                for sub_shape in shape.shapes:
-                    self.generate_shape(sub_shape)
-            else:
-                self.emit('pass')
+            for sub_shape in shape.shapes:
+                self.generate_shape(sub_shape)
         elif isinstance(shape, relooper.IfShape):
-            blk = self._rmap[shape.content]
-            self.generate_block(blk)
+            block = self._rmap[shape.content]
+            self.generate_block(block)
+            cjump = block.last_instruction
+            self.emit('if {} {} {}:'.format(
+                cjump.a.name, cjump.cond, cjump.b.name))
             with self.indented():
-                if shape.yes_shape:
-                    self.generate_shape(shape.yes_shape)
-                else:
-                    self.emit('pass')
-            if shape.no_shape:
+                self.fill_phis(block, cjump.lab_yes)
+                self.generate_shape(shape.yes_shape)
+            if shape.no_shape or cjump.lab_no.phis:
                 self.emit('else:')
                 with self.indented():
+                    self.fill_phis(block, cjump.lab_no)
                     self.generate_shape(shape.no_shape)
         elif isinstance(shape, relooper.LoopShape):
             self.emit('while True:')
@@ -275,72 +369,80 @@ class IrToPythonCompiler:
         elif isinstance(shape, relooper.BreakShape):
             self.emit('break')
         elif shape is None:
-            self.emit('pass')
+            pass
         else:  # pragma: no cover
             raise NotImplementedError(str(shape))
 
     def generate_function_fallback(self, ir_function):
         """ Generate a while-true with a switch-case on current block.
 
-        This is an non-optimal, but always working strategy.
+        This is an non-optimal, but always working strategy. The blocks
+        are numbered, and the block to run is selected by comparing its
+        number in a tree of if statements.
         """
-        self.emit("prev_block = None")
-        self.emit("current_block = '{}'".format(ir_function.entry.name))
+        self._block_numbers = {
+            block: number for number, block in enumerate(
+                [ir_function.entry] +
+                [b for b in ir_function.blocks if b is not ir_function.entry])}
+        blocks = sorted(self._block_numbers, key=self._block_numbers.get)
+        self.emit('current_block = 0')
         self.emit('while True:')
         with self.indented():
-            for block in ir_function.blocks:
-                self.emit('if current_block == "{}":'.format(block.name))
-                with self.indented():
-                    self.generate_block(block)
+            self.generate_dispatch(blocks, 0)
         self.emit('')
 
+    def generate_dispatch(self, blocks, first):
+        """ Select the block to run by bisecting the block numbers """
+        if len(blocks) == 1:
+            block = blocks[0]
+            self.generate_block(block)
+            last = block.last_instruction
+            if isinstance(last, ir.Jump):
+                self.generate_goto(block, last.target)
+            elif isinstance(last, ir.CJump):
+                self.emit('if {} {} {}:'.format(
+                    last.a.name, last.cond, last.b.name))
+                with self.indented():
+                    self.generate_goto(block, last.lab_yes)
+                self.emit('else:')
+                with self.indented():
+                    self.generate_goto(block, last.lab_no)
+        else:
+            half = len(blocks) // 2
+            self.emit('if current_block < {}:'.format(first + half))
+            with self.indented():
+                self.generate_dispatch(blocks[:half], first)
+            self.emit('else:')
+            with self.indented():
+                self.generate_dispatch(blocks[half:], first + half)
+
+    def generate_goto(self, block, target):
+        """ Continue with the target block in the block switch """
+        self.fill_phis(block, target)
+        self.emit('current_block = {}'.format(self._block_numbers[target]))
+
     def generate_block(self, block):
-        """ Generate code for one block """
+        """ Generate code for one block, except for its final jump """
         for ins in block:
-            self.generate_instruction(ins, block)
-
-        if not self._shape_style:
-            self.fill_phis(block)
+            if not isinstance(ins, ir.JumpBase):
+                self.generate_instruction(ins, block)
 
-    def fill_phis(self, block):
-        # Generate eventual phi fill code:
-        phis = [p for s in block.successors for p in s.phis]
+    def fill_phis(self, block, target):
+        """ Assign the phis of the target block when jumping to it """
+        phis = target.phis
         if phis:
             phi_names = ', '.join(p.name for p in phis)
             value_names = ', '.join(p.inputs[block].name for p in phis)
             self.emit('{} = {}'.format(phi_names, value_names))
 
     def reset_stack(self):
-        self.emit('_free({})'.format(self.stack_size))
-        self.stack_size = 0
+        if self.stack_size:
+            self.emit('del stack[_stack_top:]')
 
     def generate_instruction(self, ins, block):
         """ Generate python code for this instruction """
-        if isinstance(ins, ir.CJump):
-            if self._shape_style:
-                self.fill_phis(block)
-                self.emit('if {} {} {}:'.format(
-                    ins.a.name, ins.cond, ins.b.name))
-            else:
-                self.emit('if {} {} {}:'.format(
-                    ins.a.name, ins.cond, ins.b.name))
-                with self.indented():
-                    self.emit('prev_block = current_block')
-                    self.emit('current_block = "{}"'.format(ins.lab_yes.name))
-                self.emit('else:')
-                with self.indented():
-                    self.emit('prev_block = current_block')
-                    self.emit('current_block = "{}"'.format(ins.lab_no.name))
-        elif isinstance(ins, ir.Jump):
-            if self._shape_style:
-                self.fill_phis(block)
-                self.emit('pass')
-            else:
-                self.emit('prev_block = current_block')
-                self.emit('current_block = "{}"'.format(ins.target.name))
-        elif isinstance(ins, ir.Alloc):
+        if isinstance(ins, ir.Alloc):
             self.emit('{} = _alloca({})'.format(ins.name, ins.amount))
-            self.stack_size += ins.amount
         elif isinstance(ins, ir.AddressOf):
             self.emit('{} = {}[0]'.format(ins.name, ins.src.name))
         elif isinstance(ins, ir.Const):
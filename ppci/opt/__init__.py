@@ -1,11 +1,16 @@
 from .clean import CleanPass
 from .mem2reg import Mem2RegPromotor
 from .cse import CommonSubexpressionEliminationPass
+from .gvn import GlobalValueNumberingPass
+from .inline import InlinePass
+from .sccp import SparseConditionalConstantPropagationPass
 from .constantfolding import ConstantFolder
 from .load_after_store import LoadAfterStorePass
+from .loops import LoopInvariantCodeMotionPass, StrengthReductionPass
 from .transform import RemoveAddZeroPass
 from .transform import DeleteUnusedInstructionsPass
 from .transform import ModulePass, FunctionPass, BlockPass, InstructionPass
+from .passmanager import PassManager
 
 
 __all__ = [
@@ -14,7 +19,13 @@ __all__ = [
     'CommonSubexpressionEliminationPass',
     'ConstantFolder',
     'DeleteUnusedInstructionsPass',
+    'GlobalValueNumberingPass',
+    'InlinePass',
     'LoadAfterStorePass',
+    'LoopInvariantCodeMotionPass',
     'Mem2RegPromotor',
-    'RemoveAddZeroPass'
+    'PassManager',
+    'RemoveAddZeroPass',
+    'SparseConditionalConstantPropagationPass',
+    'StrengthReductionPass',
     ]
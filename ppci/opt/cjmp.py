@@ -25,3 +25,5 @@ class CJumpPass(InstructionPass):
             block.remove_instruction(instruction)
             block.add_instruction(ir.Jump(label))
             instruction.delete()
+            return True
+        return False
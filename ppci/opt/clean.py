@@ -25,8 +25,10 @@ class CleanPass(FunctionPass):
 
     """
     def on_function(self, function):
-        self.remove_empty_blocks(function)
-        self.remove_one_preds(function)
+        removed = self.remove_empty_blocks(function)
+        simplified = self.simplify_jumps(function)
+        glued = self.remove_one_preds(function)
+        return removed > 0 or simplified > 0 or glued > 0
 
     def find_empty_blocks(self, function):
         """ Look for all blocks containing only a jump in it """
@@ -49,6 +51,12 @@ class CleanPass(FunctionPass):
             if block in predecessors:
                 continue
 
+            # A phi in the successor cannot tell apart two edges from the
+            # same predecessor:
+            if any(self.is_conflicting(phi, block, predecessors)
+                   for successor in successors for phi in successor.phis):
+                continue
+
             # Update successor incoming blocks:
             for successor in successors:
                 successor.replace_incoming(block, predecessors)
@@ -64,6 +72,32 @@ class CleanPass(FunctionPass):
             stat += 1
         if stat > 0:
             self.logger.debug('Removed %s empty blocks', stat)
+        return stat
+
+    @staticmethod
+    def is_conflicting(phi, block, predecessors):
+        """ Test whether a phi gets another value from a predecessor of
+        the block than from the block itself """
+        value = phi.get_value(block)
+        return any(
+            pred in phi.inputs and phi.get_value(pred) is not value
+            for pred in predecessors)
+
+    def simplify_jumps(self, function):
+        """ Replace conditional jumps to twice the same block by a jump """
+        count = 0
+        for block in function:
+            cjump = block.last_instruction
+            if isinstance(cjump, ir.CJump) and \
+                    cjump.lab_yes is cjump.lab_no:
+                target = cjump.lab_yes
+                block.remove_instruction(cjump)
+                cjump.delete()
+                block.add_instruction(ir.Jump(target))
+                count += 1
+        if count > 0:
+            self.logger.debug('Simplified %s conditional jumps', count)
+        return count
 
     def find_single_predecessor_block(self, function):
         """ Find a block with a single predecessor """
@@ -86,6 +120,7 @@ class CleanPass(FunctionPass):
 
     def remove_one_preds(self, function):
         """ Remove basic blocks with only one predecessor """
+        count = 0
         change = True
         while change:
             change = False
@@ -94,6 +129,8 @@ class CleanPass(FunctionPass):
                 pred, = block.predecessors  # Unpack 1 block
                 self.glue_blocks(pred, block)
                 change = True
+                count += 1
+        return count
 
     def glue_blocks(self, block1, block2):
         """ Glue two blocks together into the first block """
@@ -105,12 +142,19 @@ class CleanPass(FunctionPass):
         block1.remove_instruction(last_jump)
         last_jump.delete()
 
+        # Phis of block2 can only have block1 as incoming block:
+        for phi in block2.phis:
+            value = phi.get_value(block1)
+            block2.remove_instruction(phi)
+            phi.replace_by(value)
+            phi.delete()
+
         # Copy all instructions to block1:
         for instruction in block2:
             block1.add_instruction(instruction)
 
-        # Replace incoming info:
-        for successor in block2.successors:
+        # Replace incoming info, once for each successor:
+        for successor in set(block2.successors):
             successor.replace_incoming(block2, [block1])
 
         # Remove block from function:
@@ -23,6 +23,17 @@ def correct(value, ty):
     return value - base if signed and value.bit_length() == bits else value
 
 
+def c_div(a, b):
+    """ Divide like in C, which rounds the quotient towards zero """
+    quotient = abs(a) // abs(b)
+    return -quotient if (a < 0) != (b < 0) else quotient
+
+
+def c_mod(a, b):
+    """ Remainder like in C, which has the sign of the dividend """
+    return a - b * c_div(a, b)
+
+
 def enhance(f):
     """ Create a new enhanced method that corrects for the given type """
     return lambda ty, a, b: correct(f(a, b), ty)
@@ -30,13 +41,16 @@ def enhance(f):
 
 class ConstantFolder(BlockPass):
     """ Try to fold common constant expressions """
+    preserves_cfg = True
+
     def __init__(self):
         super().__init__()
         self.ops = {
             '+': enhance(operator.add),
             '-': enhance(operator.sub),
             '*': enhance(operator.mul),
-            '%': enhance(operator.mod),
+            '/': enhance(c_div),
+            '%': enhance(c_mod),
             '<<': enhance(operator.lshift),
             '>>': enhance(operator.rshift),
             }
@@ -48,8 +62,12 @@ class ConstantFolder(BlockPass):
         elif isinstance(value, ir.Cast):
             return self.is_const(value.src)
         elif isinstance(value, ir.Binop):
-            return value.operation in self.ops and value.ty.is_integer and \
-                self.is_const(value.a) and self.is_const(value.b)
+            if not (value.operation in self.ops and value.ty.is_integer and
+                    self.is_const(value.a) and self.is_const(value.b)):
+                return False
+            # Division by zero is left for the program to trap on:
+            return value.operation not in ('/', '%') or \
+                self.eval_const(value.b).value != 0
         else:
             return False
 
@@ -62,7 +80,8 @@ class ConstantFolder(BlockPass):
             b = self.eval_const(value.b)
             assert a.ty is b.ty
             assert a.ty is value.ty
-            res = self.ops[value.operation](value.ty, a.value, b.value)
+            res = self.ops[value.operation](
+                value.ty, correct(a.value, a.ty), correct(b.value, b.ty))
             return ir.Const(res, 'new_fold', a.ty)
         elif isinstance(value, ir.Cast):
             c_val = self.eval_const(value.src)
@@ -80,6 +99,10 @@ class ConstantFolder(BlockPass):
                 continue
 
             if self.is_const(instruction):
+                # Folded before, but not yet removed:
+                if not instruction.is_used:
+                    continue
+
                 # Now we can replace x = (4+5) with x = 9
                 cnst = self.eval_const(instruction)
                 block.insert_instruction(cnst, before_instruction=instruction)
@@ -124,3 +147,4 @@ class ConstantFolder(BlockPass):
                     count += 1
         if count > 0:
             self.logger.debug('Folded %i expressions', count)
+        return count > 0
@@ -0,0 +1,122 @@
+""" Global value numbering.
+
+The blocks of a function are visited in dominator tree order. Each value
+gets a key, which describes how the value is computed. When a value with
+the same key was computed before in a dominating block, the value is
+replaced by the earlier one.
+
+The operands of commutative operations are put in a fixed order, so that
+``a + b`` and ``b + a`` get the same key.
+"""
+
+import itertools
+from .transform import FunctionPass
+from .. import ir
+
+
+COMMUTATIVE_OPS = ('+', '*', '&', '|', '^')
+
+# Instructions which can change memory:
+MEMORY_WRITES = (ir.Store, ir.CopyBlob, ir.FunctionCall, ir.ProcedureCall)
+
+
+class GlobalValueNumberingPass(FunctionPass):
+    """ Replace values which were computed before by the earlier value.
+
+    Loads are reused as long as memory cannot have changed in between.
+    This is within a block, and into a block entered only from the
+    block which dominates it.
+
+    Constants are only reused within a block, so that the instruction
+    selector can still use them as immediate values.
+    """
+    preserves_cfg = True
+
+    def on_function(self, function):
+        cfg_info = self.get_cfg_info(function)
+        self.values = {}
+        self.undo_log = []
+        self.epochs = itertools.count()
+        count = 0
+
+        # Walk the dominator tree, and forget the values of a block when
+        # leaving it:
+        work = [('enter', cfg_info.cfg.root_tree, None)]
+        while work:
+            action, tree_node, parent = work.pop()
+            if action == 'leave':
+                self.forget(parent)
+                continue
+
+            if not cfg_info.has_block(tree_node.node):
+                continue
+            block = cfg_info.get_block(tree_node.node)
+
+            if parent and block.predecessors == [parent[0]]:
+                memory = parent[1]
+            else:
+                memory = next(self.epochs)
+
+            work.append(('leave', tree_node, len(self.undo_log)))
+            memory, replaced = self.number_block(block, memory)
+            count += replaced
+            for child in reversed(tree_node.children):
+                work.append(('enter', child, (block, memory)))
+
+        self.values = self.undo_log = None
+        if count > 0:
+            self.logger.debug('Replaced %s values', count)
+        return count > 0
+
+    def number_block(self, block, memory):
+        """ Number the values of a block.
+
+        The memory argument is the version of memory at the start of the
+        block. Returns the version of memory at the end of the block and
+        the amount of replaced values.
+        """
+        count = 0
+        for instruction in list(block):
+            if isinstance(instruction, MEMORY_WRITES):
+                memory = next(self.epochs)
+                continue
+
+            key = self.make_key(instruction, block, memory)
+            if key is None:
+                continue
+
+            if key in self.values:
+                instruction.replace_by(self.values[key])
+                instruction.remove_from_block()
+                count += 1
+            else:
+                self.values[key] = instruction
+                self.undo_log.append(key)
+        return memory, count
+
+    def forget(self, mark):
+        """ Forget the values numbered since the mark """
+        while len(self.undo_log) > mark:
+            del self.values[self.undo_log.pop()]
+
+    @staticmethod
+    def make_key(instruction, block, memory):
+        """ Get the key of a value, or None when the value is not a
+        candidate for reuse """
+        if isinstance(instruction, ir.Binop):
+            a, b = instruction.a, instruction.b
+            if instruction.operation in COMMUTATIVE_OPS and id(a) > id(b):
+                a, b = b, a
+            return ('binop', a, instruction.operation, b, instruction.ty)
+        elif isinstance(instruction, ir.Unop):
+            return (
+                'unop', instruction.operation, instruction.a, instruction.ty)
+        elif isinstance(instruction, ir.Cast):
+            return ('cast', instruction.src, instruction.ty)
+        elif isinstance(instruction, ir.AddressOf):
+            return ('addressof', instruction.src)
+        elif isinstance(instruction, ir.Const):
+            # The repr keeps apart 0.0 and -0.0:
+            return ('const', block, repr(instruction.value), instruction.ty)
+        elif isinstance(instruction, ir.Load) and not instruction.volatile:
+            return ('load', instruction.address, instruction.ty, memory)
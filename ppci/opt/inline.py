@@ -1,12 +1,246 @@
+""" Inline small functions into the functions which call them.
+
+The blocks of the called function are copied into the calling function.
+The parameters are replaced by the arguments of the call, and the returns
+become jumps to the instructions after the call. When the function
+returns from several places, the returned values are merged by a phi.
+"""
+
 from .. import ir
+from ..graph.callgraph import mod_to_call_graph
+from ..graph.cfg import pre_order
+from ..graph.digraph import dfs
+from ..graph.domtree import CfgInfo
+from .transform import ModulePass
+
+
+def inline_function(call, function: ir.SubRoutine):
+    """ Replace the call instruction with the function implementation.
+
+    Returns the block with the instructions which followed the call.
+    """
+    block = call.block
+    tail = split_block(block, call)
+
+    # Visit the blocks in dominator order, so that values are copied
+    # before they are used:
+    cfg_info = CfgInfo(function)
+    blocks = [
+        cfg_info.get_block(tree_node.node)
+        for _, tree_node in pre_order(cfg_info.cfg.root_tree)
+        if cfg_info.has_block(tree_node.node)]
+    # Block names are used as labels, which must be unique in the module:
+    caller = block.function
+    block_map = {}
+    for old_block in blocks:
+        new_block = ir.Block('{}_{}'.format(caller.name, old_block.name))
+        caller.add_block(new_block)
+        block_map[old_block] = new_block
+
+    value_map = dict(zip(function.arguments, call.arguments))
+
+    def get_value(value):
+        return value_map.get(value, value)
+
+    returns = []
+    phis = []
+    for old_block in blocks:
+        new_block = block_map[old_block]
+        for instruction in old_block:
+            if isinstance(instruction, ir.Return):
+                returns.append((new_block, get_value(instruction.result)))
+                new_block.add_instruction(ir.Jump(tail))
+            elif isinstance(instruction, ir.Exit):
+                new_block.add_instruction(ir.Jump(tail))
+            else:
+                new_instruction = copy_instruction(
+                    instruction, get_value, block_map)
+                new_block.add_instruction(new_instruction)
+                if isinstance(instruction, ir.Phi):
+                    phis.append((instruction, new_instruction))
+                if isinstance(instruction, ir.Value):
+                    value_map[instruction] = new_instruction
+
+    # The inputs of phis can be defined later on:
+    for phi, new_phi in phis:
+        for old_block, value in phi.inputs.items():
+            if old_block in block_map:
+                new_phi.set_incoming(block_map[old_block], get_value(value))
+
+    if isinstance(call, ir.FunctionCall):
+        if len(returns) == 1:
+            result = returns[0][1]
+        else:
+            result = ir.Phi('{}_result'.format(function.name), call.ty)
+            tail.insert_instruction(result)
+            for return_block, value in returns:
+                result.set_incoming(return_block, value)
+        call.replace_by(result)
+
+    block.remove_instruction(call)
+    call.delete()
+    block.add_instruction(ir.Jump(block_map[function.entry]))
+    return tail
+
+
+def split_block(block, instruction):
+    """ Move the instructions after the instruction into a new block """
+    tail = ir.Block('{}_tail'.format(block.name))
+    block.function.add_block(tail)
+    successors = set(block.successors)
+
+    pos = block.instructions.index(instruction) + 1
+    moved = block.instructions[pos:]
+    del block.instructions[pos:]
+    for moved_instruction in moved:
+        moved_instruction.block = tail
+    tail.instructions.extend(moved)
+
+    for successor in successors:
+        successor.replace_incoming(block, [tail])
+    return tail
+
+
+def copy_instruction(instruction, get_value, block_map):
+    """ Create a copy of an instruction, with other operands """
+    if isinstance(instruction, ir.Const):
+        return ir.Const(instruction.value, instruction.name, instruction.ty)
+    elif isinstance(instruction, ir.Binop):
+        return ir.Binop(
+            get_value(instruction.a), instruction.operation,
+            get_value(instruction.b), instruction.name, instruction.ty)
+    elif isinstance(instruction, ir.Unop):
+        return ir.Unop(
+            instruction.operation, get_value(instruction.a),
+            instruction.name, instruction.ty)
+    elif isinstance(instruction, ir.Cast):
+        return ir.Cast(
+            get_value(instruction.src), instruction.name, instruction.ty)
+    elif isinstance(instruction, ir.AddressOf):
+        return ir.AddressOf(get_value(instruction.src), instruction.name)
+    elif isinstance(instruction, ir.Alloc):
+        return ir.Alloc(
+            instruction.name, instruction.amount, instruction.alignment)
+    elif isinstance(instruction, ir.Undefined):
+        return ir.Undefined(instruction.name, instruction.ty)
+    elif isinstance(instruction, ir.LiteralData):
+        return ir.LiteralData(instruction.data, instruction.name)
+    elif isinstance(instruction, ir.Phi):
+        return ir.Phi(instruction.name, instruction.ty)
+    elif isinstance(instruction, ir.Load):
+        return ir.Load(
+            get_value(instruction.address), instruction.name,
+            instruction.ty, volatile=instruction.volatile)
+    elif isinstance(instruction, ir.Store):
+        return ir.Store(
+            get_value(instruction.value), get_value(instruction.address),
+            volatile=instruction.volatile)
+    elif isinstance(instruction, ir.CopyBlob):
+        return ir.CopyBlob(
+            get_value(instruction.dst), get_value(instruction.src),
+            instruction.amount)
+    elif isinstance(instruction, ir.FunctionCall):
+        return ir.FunctionCall(
+            get_value(instruction.callee),
+            [get_value(a) for a in instruction.arguments],
+            instruction.name, instruction.ty)
+    elif isinstance(instruction, ir.ProcedureCall):
+        return ir.ProcedureCall(
+            get_value(instruction.callee),
+            [get_value(a) for a in instruction.arguments])
+    elif isinstance(instruction, ir.Jump):
+        return ir.Jump(block_map[instruction.target])
+    elif isinstance(instruction, ir.CJump):
+        return ir.CJump(
+            get_value(instruction.a), instruction.cond,
+            get_value(instruction.b), block_map[instruction.lab_yes],
+            block_map[instruction.lab_no])
+    else:  # pragma: no cover
+        raise NotImplementedError(str(instruction))
+
+
+class InlinePass(ModulePass):
+    """ Inline calls to small functions.
+
+    The functions are handled bottom-up in the call graph, so that the
+    calls in a function are inlined before the function itself is
+    considered for inlining. A function is inlined when it has at most
+    max_size instructions, or at most max_single_call_size instructions
+    when there is a single call to it. Recursive functions and functions
+    which allocate stack space are not inlined.
+    """
+    max_size = 12
+    max_single_call_size = 40
+    max_caller_size = 2000
+
+    def run(self, ir_module):
+        call_graph = mod_to_call_graph(ir_module)
+        self.call_counts = {}
+        for function in ir_module.functions:
+            for call in function.get_out_calls():
+                self.call_counts[call.callee] = \
+                    self.call_counts.get(call.callee, 0) + 1
+
+        # A function is recursive when it can reach itself:
+        self.recursive = {
+            node.routine for node in call_graph
+            if any(node in n.successors for _, n in dfs(node))}
+
+        count = 0
+        for function in self.bottom_up(call_graph, ir_module):
+            for call in function.get_out_calls():
+                if self.should_inline(function, call):
+                    self.logger.debug(
+                        'Inlining %s into %s', call.callee.name,
+                        function.name)
+                    inline_function(call, call.callee)
+                    count += 1
+        self.call_counts = self.recursive = None
+
+        if count > 0:
+            self.logger.debug('Inlined %s calls', count)
+        return count > 0
+
+    @staticmethod
+    def bottom_up(call_graph, ir_module):
+        """ Order the functions such that called functions come first """
+        order = []
+        visited = set()
+        for function in ir_module.functions:
+            worklist = [(call_graph.get_node(function), False)]
+            while worklist:
+                node, done = worklist.pop()
+                if done:
+                    order.append(node.routine)
+                elif node not in visited:
+                    visited.add(node)
+                    worklist.append((node, True))
+                    for callee in reversed(list(node.successors)):
+                        worklist.append((callee, False))
+        return [f for f in order if isinstance(f, ir.SubRoutine)]
+
+    def should_inline(self, caller, call):
+        """ Decide whether a call is inlined """
+        callee = call.callee
+        if not isinstance(callee, ir.SubRoutine) or callee is caller or \
+                callee in self.recursive:
+            return False
+
+        if len(call.arguments) != len(callee.arguments) or \
+                callee.entry.predecessors:
+            return False
 
+        instructions = list(callee.get_instructions())
+        if any(isinstance(i, ir.Alloc) for i in instructions):
+            return False
 
-def inline_function(call: ir.ProcedureCall, function: ir.SubRoutine):
-    """ Replace the call instruction with the function implementation """
-    dst_function = call.function
-    for block in function:
-        block_copy = block.copy
-        dst_function.add_block(block_copy)
+        if isinstance(call, ir.FunctionCall) and \
+                not any(isinstance(i, ir.Return) for i in instructions):
+            return False
 
-    for value, parameter in zip(call.arguments, function.arguments):
-        block
+        size = len(instructions)
+        if size + caller.num_instructions() > self.max_caller_size:
+            return False
+        if self.call_counts[callee] == 1:
+            return size <= self.max_single_call_size
+        return size <= self.max_size
@@ -18,6 +18,8 @@ class LoadAfterStorePass(BlockPass):
             [x] = a
             c = a + 2
     """
+    preserves_cfg = True
+
     def find_store_backwards(
             self, i, ty,
             stop_on=(ir.FunctionCall, ir.ProcedureCall, ir.Store)):
@@ -39,14 +41,15 @@ class LoadAfterStorePass(BlockPass):
         return None
 
     def on_block(self, block):
-        self.replace_load_after_store(block)
-        self.remove_redundant_stores(block)
+        loads = self.replace_load_after_store(block)
+        stores = self.remove_redundant_stores(block)
+        return loads > 0 or stores > 0
 
     def replace_load_after_store(self, block):
         """ Replace load after store with the value of the store """
         load_instructions = [
             ins for ins in block if isinstance(ins, ir.Load) and
-            not ins.volatile]
+            not ins.volatile and ins.is_used]
 
         # Replace loads after store of same address by the stored value:
         count = 0
@@ -62,6 +65,7 @@ class LoadAfterStorePass(BlockPass):
                 # reload of instructions required?
         if count > 0:
             self.logger.debug('Replaced %s loads after store', count)
+        return count
 
     def remove_redundant_stores(self, block):
         """ From two stores to the same address remove the previous one """
@@ -77,6 +81,8 @@ class LoadAfterStorePass(BlockPass):
                 stop_on=(ir.FunctionCall, ir.ProcedureCall, ir.Store, ir.Load))
             if store_prev is not None and not store_prev.volatile:
                 store_prev.remove_from_block()
+                count += 1
 
         if count > 0:
             self.logger.debug('Replaced %s redundant stores', count)
+        return count
@@ -0,0 +1,437 @@
+""" Loop optimizations.
+
+The natural loops of a function are found with the dominator information
+of the control flow graph. The loops are handled from the innermost loop
+outwards. When values are moved out of a loop, the loop gets a preheader:
+a block which is entered from outside the loop and which only jumps to
+the loop header.
+"""
+
+from .. import ir
+from .constantfolding import correct
+from .gvn import MEMORY_WRITES
+from .transform import FunctionPass
+
+
+class Loop:
+    """ A natural loop, given by its header and the blocks in the loop """
+    def __init__(self, header, blocks):
+        self.header = header
+        self.blocks = blocks
+
+    def __repr__(self):
+        return 'Loop({}, {} blocks)'.format(self.header.name, len(self.blocks))
+
+    def contains(self, value):
+        """ Test whether a value is computed inside this loop """
+        return isinstance(value, ir.Instruction) and value.block in self.blocks
+
+    @property
+    def latches(self):
+        """ The blocks in the loop which jump back to the header """
+        return [b for b in self.header.predecessors if b in self.blocks]
+
+    @property
+    def exiting_blocks(self):
+        """ The blocks in the loop which can jump out of the loop """
+        return [
+            b for b in self.blocks
+            if any(s not in self.blocks for s in b.successors)]
+
+
+def find_loops(cfg_info):
+    """ Find the loops of a function, with the innermost loops first """
+    function = cfg_info.function
+    bodies = {}
+    for loop in cfg_info.loops:
+        if not cfg_info.has_block(loop.header):
+            continue
+        header = cfg_info.get_block(loop.header)
+        body = bodies.setdefault(header, {header})
+        body.update(
+            cfg_info.get_block(node) for node in loop.rest
+            if cfg_info.has_block(node))
+    loops = [Loop(header, body) for header, body in bodies.items()]
+    loops.sort(
+        key=lambda loop: (
+            len(loop.blocks), function.blocks.index(loop.header)))
+    return loops
+
+
+def move_instruction(instruction, block, before_instruction):
+    """ Move an instruction into another block, keeping its name """
+    instruction.block.remove_instruction(instruction)
+    instruction.block = block
+    block.instructions.insert(before_instruction.position, instruction)
+
+
+def get_constant(value):
+    """ Get the number computed from constants only, or None """
+    if isinstance(value, ir.Const):
+        return int(value.value)
+    elif isinstance(value, ir.Binop) and value.operation in ('+', '*'):
+        a, b = get_constant(value.a), get_constant(value.b)
+        if a is not None and b is not None:
+            return a + b if value.operation == '+' else a * b
+
+
+def is_valid_address(address, ty):
+    """ Test whether a value of the given type can be loaded from the
+    address, because the address is inside a variable """
+    offset = 0
+    if isinstance(address, ir.Binop) and address.operation == '+':
+        address, offset = address.a, get_constant(address.b)
+    if isinstance(address, ir.AddressOf):
+        address = address.src
+    return isinstance(address, (ir.Variable, ir.Alloc)) and \
+        isinstance(ty, ir.BasicTyp) and offset is not None and \
+        0 <= offset <= address.amount - ty.size
+
+
+class LoopPass(FunctionPass):
+    """ Base pass which calls on_loop for each loop of a function.
+
+    Inner loops are visited before the loops which contain them. The
+    control flow only changes when a preheader is inserted, so the control
+    flow information of the other functions is kept.
+    """
+    def prepare(self):
+        self.cfg_changed = set()
+
+    def changed_cfg(self, function):
+        return function in self.cfg_changed
+
+    def on_function(self, function):
+        self.cfg_info = self.get_cfg_info(function)
+        self.loops = find_loops(self.cfg_info)
+        if not self.loops:
+            self.cfg_info = self.loops = None
+            return False
+        self.new_blocks = set()
+        changed = False
+        for loop in self.loops:
+            if self.on_loop(loop):
+                changed = True
+        self.cfg_info = self.loops = self.new_blocks = None
+        return changed
+
+    def on_loop(self, loop):  # pragma: no cover
+        """ Override this virtual method """
+        raise NotImplementedError()
+
+    def get_preheader(self, loop):
+        """ Get the preheader of a loop, and create it when needed.
+
+        Returns None when the loop cannot get a preheader.
+        """
+        header = loop.header
+        function = header.function
+        outside = [b for b in header.predecessors if b not in loop.blocks]
+        if header is function.entry or not outside:
+            return
+        elif len(outside) == 1 and outside[0].successors == [header]:
+            return outside[0]
+
+        preheader = ir.Block('{}_preheader'.format(header.name))
+        function.add_block(preheader)
+        for phi in header.phis:
+            if len(outside) == 1:
+                value = phi.get_value(outside[0])
+            else:
+                value = ir.Phi(phi.name, phi.ty)
+                preheader.add_instruction(value)
+                for block in outside:
+                    value.set_incoming(block, phi.get_value(block))
+            for block in outside:
+                phi.del_incoming(block)
+            phi.set_incoming(preheader, value)
+        preheader.add_instruction(ir.Jump(header))
+        for block in outside:
+            block.change_target(header, preheader)
+        self.cfg_changed.add(function)
+
+        # The preheader is part of the loops around this loop:
+        for other in self.loops:
+            if other is not loop and header in other.blocks:
+                other.blocks.add(preheader)
+        self.new_blocks.add(preheader)
+        return preheader
+
+
+class LoopInvariantCodeMotionPass(LoopPass):
+    """ Move values which are the same in each iteration of a loop into
+    the preheader of the loop.
+
+    Arithmetic, casts and loads from loops without stores or calls are
+    moved. A load is only moved when it is executed in each iteration
+    of the loop. Constants are copied into the preheader when a moved
+    value uses them, so that the instruction selector can still use the
+    constants in the loop as immediate values.
+    """
+    def on_loop(self, loop):
+        invariants = self.find_invariants(loop)
+        if not invariants:
+            return False
+        preheader = self.get_preheader(loop)
+        if preheader is None:
+            return False
+
+        jump = preheader.last_instruction
+        constants = {}
+        for instruction in invariants:
+            for operand in list(instruction.uses):
+                if isinstance(operand, ir.Const) and loop.contains(operand):
+                    if operand not in constants:
+                        constants[operand] = ir.Const(
+                            operand.value, operand.name, operand.ty)
+                        preheader.insert_instruction(
+                            constants[operand], before_instruction=jump)
+                    instruction.replace_use(operand, constants[operand])
+            move_instruction(instruction, preheader, jump)
+        self.logger.debug(
+            'Moved %s values out of loop %s', len(invariants),
+            loop.header.name)
+        return True
+
+    def find_invariants(self, loop):
+        """ Find the values which can be moved out of the loop.
+
+        The values are in an order in which they can be computed.
+        """
+        blocks = [b for b in loop.header.function if b in loop.blocks]
+        may_write = any(
+            isinstance(i, MEMORY_WRITES) for b in blocks for i in b)
+        invariants = []
+        found = set()
+        change = True
+        while change:
+            change = False
+            for block in blocks:
+                for instruction in block:
+                    if instruction not in found and self.is_invariant(
+                            instruction, loop, found, may_write):
+                        found.add(instruction)
+                        invariants.append(instruction)
+                        change = True
+        return invariants
+
+    def is_invariant(self, instruction, loop, found, may_write):
+        """ Test whether an instruction computes the same value in each
+        iteration, and can be computed before the loop """
+        if isinstance(instruction, ir.Binop):
+            # Division by zero traps:
+            if instruction.operation in ('/', '%'):
+                return False
+        elif isinstance(instruction, ir.Load):
+            if instruction.volatile or may_write or \
+                    not self.is_safe_load(instruction, loop):
+                return False
+        elif not isinstance(instruction, (ir.Unop, ir.Cast)):
+            return False
+
+        return instruction.is_used and all(
+            isinstance(operand, ir.Const) or operand in found or
+            not loop.contains(operand) for operand in instruction.uses)
+
+    def is_safe_load(self, load, loop):
+        """ Test whether a load can be done before the loop. This is the
+        case when the load is done before the loop is left, or when the
+        load is from inside a variable. """
+        return self.is_always_executed(load.block, loop) or \
+            is_valid_address(load.address, load.ty)
+
+    def is_always_executed(self, block, loop):
+        """ Test whether a block is executed before the loop is left """
+        if block in self.new_blocks:
+            return False
+        exiting_blocks = loop.exiting_blocks
+        node = self.cfg_info.get_node(block)
+        return bool(exiting_blocks) and all(
+            node.dominates(self.cfg_info.get_node(b))
+            for b in exiting_blocks)
+
+
+class StrengthReductionPass(LoopPass):
+    """ Replace multiplications of induction variables by additions.
+
+    An induction variable is a phi in the loop header which is
+    incremented by a constant in each iteration. A multiplication of an
+    induction variable by a constant becomes a new induction variable.
+    When the product is added to a value computed before the loop, such as
+    in ``base + i * 4``, the sum becomes the new induction variable, which
+    turns array indexing into a pointer increment.
+    """
+    def on_loop(self, loop):
+        latches = loop.latches
+        if len(latches) != 1:
+            return False
+        latch = latches[0]
+        steps = {}
+        for phi in loop.header.phis:
+            step = self.get_step(phi, latch)
+            if step is not None:
+                steps[phi] = step
+
+        candidates = []
+        for block in loop.header.function:
+            if block in loop.blocks:
+                for instruction in block:
+                    candidate = self.get_candidate(instruction, steps)
+                    if candidate:
+                        candidates.append(candidate)
+        if not candidates:
+            return False
+        preheader = self.get_preheader(loop)
+        if preheader is None:
+            return False
+
+        for candidate in candidates:
+            self.reduce(loop, preheader, latch, candidate)
+        self.logger.debug(
+            'Reduced %s multiplications in loop %s', len(candidates),
+            loop.header.name)
+        return True
+
+    @staticmethod
+    def get_step(phi, latch):
+        """ Get the amount by which a phi is incremented in each iteration,
+        or None when the phi is not an induction variable """
+        if not phi.ty.is_integer or latch not in phi.inputs:
+            return
+        increment = phi.get_value(latch)
+        if not isinstance(increment, ir.Binop):
+            return
+        a, b = increment.a, increment.b
+        if increment.operation == '+' and a is phi and \
+                isinstance(b, ir.Const):
+            return int(b.value)
+        elif increment.operation == '+' and b is phi and \
+                isinstance(a, ir.Const):
+            return int(a.value)
+        elif increment.operation == '-' and a is phi and \
+                isinstance(b, ir.Const):
+            return -int(b.value)
+
+    def get_candidate(self, instruction, steps):
+        """ Check whether an instruction multiplies an induction variable
+        by a constant.
+
+        Returns the instruction, the induction variable, which can be cast,
+        the factor and the amount by which the product grows in each
+        iteration.
+        """
+        if not isinstance(instruction, ir.Binop) or \
+                not instruction.is_used or \
+                not (instruction.ty.is_integer or instruction.ty is ir.ptr):
+            return
+        a, b = instruction.a, instruction.b
+        if instruction.operation == '*':
+            if isinstance(a, ir.Const):
+                a, b = b, a
+            if not isinstance(b, ir.Const):
+                return
+            factor = int(b.value)
+        elif instruction.operation == '<<':
+            # Shifts are only done on integers of a known width:
+            if not instruction.ty.is_integer or \
+                    not isinstance(b, ir.Const) or \
+                    not 0 <= int(b.value) < instruction.ty.bits:
+                return
+            factor = 1 << int(b.value)
+        else:
+            return
+
+        if a in steps:
+            return instruction, a, factor, factor * steps[a]
+        elif isinstance(a, ir.Cast) and a.src in steps and \
+                self.is_exact_cast(a):
+            return instruction, a, factor, factor * steps[a.src]
+
+    @staticmethod
+    def is_exact_cast(cast):
+        """ Test whether the cast of an induction variable is incremented
+        by the cast of the step. This does not hold when an unsigned
+        variable wraps around and is then widened. Overflow of signed
+        variables is undefined behavior in C. """
+        if cast.ty.is_integer:
+            return cast.src.ty.is_signed or cast.ty.bits <= cast.src.ty.bits
+        return cast.ty is ir.ptr and cast.src.ty.is_signed
+
+    def reduce(self, loop, preheader, latch, candidate):
+        """ Replace a multiplication by a new induction variable """
+        multiplication, index, factor, step = candidate
+
+        # Compute the value of the first iteration in the preheader:
+        jump = preheader.last_instruction
+        ty = multiplication.ty
+        phi = index.src if isinstance(index, ir.Cast) else index
+        value = phi.get_value(preheader)
+        if isinstance(value, ir.Const) and \
+                (ty.is_integer or int(value.value) >= 0):
+            product = int(value.value) * factor
+            if ty.is_integer:
+                product = correct(product, ty)
+            initial = ir.Const(product, multiplication.name, ty)
+        else:
+            if isinstance(index, ir.Cast):
+                value = ir.Cast(value, index.name, index.ty)
+                preheader.insert_instruction(value, before_instruction=jump)
+            if multiplication.a is index:
+                other = multiplication.b
+            else:
+                other = multiplication.a
+            constant = ir.Const(other.value, other.name, other.ty)
+            preheader.insert_instruction(constant, before_instruction=jump)
+            if multiplication.a is index:
+                initial = ir.Binop(
+                    value, multiplication.operation, constant,
+                    multiplication.name, ty)
+            else:
+                initial = ir.Binop(
+                    constant, multiplication.operation, value,
+                    multiplication.name, ty)
+        preheader.insert_instruction(initial, before_instruction=jump)
+
+        # Sums with a value computed before the loop become induction
+        # variables themselves:
+        sums = [
+            u for u in multiplication.used_by
+            if isinstance(u, ir.Binop) and u.operation == '+' and
+            loop.contains(u) and u.a is not u.b and
+            not loop.contains(u.a if u.b is multiplication else u.b)]
+        other_uses = [u for u in multiplication.used_by if u not in sums]
+        for addition in sums:
+            if addition.a is multiplication:
+                start = ir.Binop(
+                    initial, '+', addition.b, addition.name, addition.ty)
+            else:
+                start = ir.Binop(
+                    addition.a, '+', initial, addition.name, addition.ty)
+            preheader.insert_instruction(start, before_instruction=jump)
+            self.add_induction_variable(
+                addition, start, step, loop, preheader, latch)
+        if other_uses:
+            self.add_induction_variable(
+                multiplication, initial, step, loop, preheader, latch)
+
+    @staticmethod
+    def add_induction_variable(value, start, step, loop, preheader, latch):
+        """ Replace a value by a phi in the loop header, which starts at
+        start and is incremented by step at the end of each iteration """
+        ty = value.ty
+        operation = '+'
+        if ty.is_integer:
+            step = correct(step, ty)
+        elif step < 0:
+            operation, step = '-', -step
+
+        phi = ir.Phi('{}_iv'.format(value.name), ty)
+        loop.header.insert_instruction(phi)
+        jump = latch.last_instruction
+        constant = ir.Const(step, 'step', ty)
+        latch.insert_instruction(constant, before_instruction=jump)
+        increment = ir.Binop(phi, operation, constant, 'next', ty)
+        latch.insert_instruction(increment, before_instruction=jump)
+        phi.set_incoming(preheader, start)
+        phi.set_incoming(latch, increment)
+        value.replace_by(phi)
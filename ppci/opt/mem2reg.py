@@ -6,7 +6,6 @@ also be stored into a register, to improve performance.
 
 from .transform import FunctionPass
 from .. import ir
-from ..graph.domtree import CfgInfo
 
 
 def is_alloc_promotable(alloc_inst: ir.Alloc):
@@ -59,6 +58,7 @@ def is_alloc_promotable(alloc_inst: ir.Alloc):
 class Mem2RegPromotor(FunctionPass):
     """ Tries to find alloc instructions only used by load and store
     instructions and replace them with values and phi nodes """
+    preserves_cfg = True
 
     def place_phi_nodes(self, stores, phi_ty, name, cfg_info):
         """
@@ -214,9 +214,12 @@ class Mem2RegPromotor(FunctionPass):
         alloc.remove_from_block()
 
     def on_function(self, function):
-        cfg_info = CfgInfo(function)
-        for block in function.blocks:
-            allocs = [i for i in block if isinstance(i, ir.Alloc)]
-            for alloc in allocs:
-                if is_alloc_promotable(alloc):
-                    self.promote(alloc, cfg_info)
+        allocs = [
+            i for block in function.blocks for i in block
+            if isinstance(i, ir.Alloc) and is_alloc_promotable(i)]
+        if not allocs:
+            return False
+        cfg_info = self.get_cfg_info(function)
+        for alloc in allocs:
+            self.promote(alloc, cfg_info)
+        return True
@@ -0,0 +1,126 @@
+""" Run a pipeline of optimization passes until nothing changes.
+
+Each pass reports which functions it changed. The pipeline is run again
+over the changed functions only, until no pass changes anything anymore.
+
+The control flow information of a function, such as the dominator tree,
+the dominance frontier and the loops, is calculated once and shared by
+the passes. It is thrown away when a pass changes a function without
+preserving its control flow.
+"""
+
+import logging
+import time
+from ..graph.domtree import CfgInfo
+from .transform import FunctionPass, has_changed
+
+
+class AnalysisCache:
+    """ Analyses of functions, kept as long as they are valid """
+    def __init__(self):
+        self._cfg_info = {}
+
+    def get_cfg_info(self, function):
+        """ Get the control flow information of a function """
+        if function not in self._cfg_info:
+            self._cfg_info[function] = CfgInfo(function)
+        return self._cfg_info[function]
+
+    def invalidate(self, function, preserves_cfg=False):
+        """ Throw away the analyses a change of a function breaks """
+        if not preserves_cfg:
+            self._cfg_info.pop(function, None)
+
+    def clear(self):
+        self._cfg_info.clear()
+
+
+class PassStatistics:
+    """ How often a pass ran, how often it changed something and the
+    time spent in the pass """
+    def __init__(self, name):
+        self.name = name
+        self.runs = 0
+        self.changes = 0
+        self.time = 0.0
+
+    def __repr__(self):
+        return '{}: {} runs, {} changes, {:.3f} s'.format(
+            self.name, self.runs, self.changes, self.time)
+
+
+class PassManager:
+    """ Run passes over a module until a fixed point is reached.
+
+    Args:
+        passes: the passes to run, in the order given.
+        max_iterations: the maximum amount of times the passes are run.
+        reporter: when given, the statistics of the passes are reported
+            to this reporter.
+    """
+    logger = logging.getLogger('passmanager')
+
+    def __init__(self, passes, max_iterations=10, reporter=None):
+        self.passes = list(passes)
+        self.max_iterations = max_iterations
+        self.reporter = reporter
+        self.analyses = AnalysisCache()
+        self.statistics = [PassStatistics(repr(p)) for p in self.passes]
+
+    def run(self, ir_module):
+        """ Run the passes over a module """
+        for opt_pass in self.passes:
+            opt_pass.analyses = self.analyses
+
+        try:
+            todo = set(ir_module.functions)
+            iteration = 0
+            while todo and iteration < self.max_iterations:
+                iteration += 1
+                self.logger.debug(
+                    'Iteration %s over %s functions', iteration, len(todo))
+                changed = set()
+                for opt_pass, stats in zip(self.passes, self.statistics):
+                    changed |= self._run_pass(
+                        opt_pass, stats, ir_module, todo | changed)
+                todo = changed
+        finally:
+            for opt_pass in self.passes:
+                opt_pass.analyses = None
+            self.analyses.clear()
+
+        if todo:
+            self.logger.debug(
+                'Stopped after %s iterations', self.max_iterations)
+
+        for stats in self.statistics:
+            self.logger.debug('%s', stats)
+        if self.reporter:
+            self.report(self.reporter)
+
+    def _run_pass(self, opt_pass, stats, ir_module, functions):
+        """ Run a single pass, and return the changed functions """
+        t1 = time.perf_counter()
+        if isinstance(opt_pass, FunctionPass):
+            functions = [f for f in ir_module.functions if f in functions]
+            changed = opt_pass.run_on_functions(ir_module, functions)
+            for function in changed:
+                self.analyses.invalidate(
+                    function,
+                    preserves_cfg=not opt_pass.changed_cfg(function))
+        elif has_changed(opt_pass.run(ir_module)):
+            # A module pass can change any function:
+            self.analyses.clear()
+            changed = ir_module.functions
+        else:
+            changed = []
+        stats.time += time.perf_counter() - t1
+        stats.runs += 1
+        stats.changes += len(changed)
+        return set(changed)
+
+    def report(self, reporter):
+        """ Report the statistics of the passes """
+        reporter.message('Optimization passes:')
+        for stats in self.statistics:
+            reporter.message(str(stats))
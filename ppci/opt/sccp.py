@@ -0,0 +1,254 @@
+""" Sparse conditional constant propagation.
+
+Each value of a function is given a lattice value. A value is either not
+known yet, a constant, or not constant. Starting at the entry block, only
+the blocks which can be executed are visited. A conditional jump with a
+constant condition makes only one of its targets executable.
+
+Afterwards, the values found to be constant are replaced by constants,
+the conditional jumps with a constant condition are replaced by jumps,
+and the blocks which can never be executed are deleted.
+
+The algorithm is described in:
+"Constant propagation with conditional branches" by Mark Wegman and
+Kenneth Zadeck.
+"""
+
+import operator
+from .transform import FunctionPass
+from .constantfolding import correct, c_div, c_mod
+from .. import ir
+
+
+class NotConstant:
+    """ The lattice value of values which are not constant """
+    def __repr__(self):
+        return 'NotConstant'
+
+
+NOT_CONSTANT = NotConstant()
+
+CONDITIONS = {
+    '==': operator.eq, '!=': operator.ne,
+    '<': operator.lt, '>': operator.gt,
+    '<=': operator.le, '>=': operator.ge,
+}
+
+
+BINOPS = {
+    '+': operator.add, '-': operator.sub, '*': operator.mul,
+    '/': c_div, '%': c_mod,
+    '&': operator.and_, '|': operator.or_, '^': operator.xor,
+    '<<': operator.lshift, '>>': operator.rshift,
+}
+
+UNOPS = {
+    '-': operator.neg, '~': operator.invert,
+}
+
+
+class SparseConditionalConstantPropagationPass(FunctionPass):
+    """ Propagate integer constants through the function, also through
+    phi nodes, and remove the blocks which are never executed. """
+    def on_function(self, function):
+        self.values = {}
+        self.executable_blocks = set()
+        self.executable_edges = set()
+        self.flow_worklist = [(None, function.entry)]
+        self.value_worklist = []
+
+        while self.flow_worklist or self.value_worklist:
+            if self.flow_worklist:
+                pred, block = self.flow_worklist.pop()
+                self.visit_edge(pred, block)
+            else:
+                instruction = self.value_worklist.pop()
+                if instruction.block in self.executable_blocks:
+                    self.visit(instruction)
+
+        changed = self.rewrite(function)
+        self.values = self.executable_blocks = None
+        self.executable_edges = None
+        return changed
+
+    def visit_edge(self, pred, block):
+        """ Handle a newly found executable edge """
+        if (pred, block) in self.executable_edges:
+            return
+        self.executable_edges.add((pred, block))
+        if block in self.executable_blocks:
+            # Only the phis see a new incoming edge:
+            for phi in block.phis:
+                self.visit(phi)
+        else:
+            self.executable_blocks.add(block)
+            for instruction in block:
+                self.visit(instruction)
+
+    def visit(self, instruction):
+        """ Evaluate an instruction """
+        if isinstance(instruction, ir.JumpBase):
+            for target in self.get_targets(instruction):
+                self.flow_worklist.append((instruction.block, target))
+        elif isinstance(instruction, ir.Value):
+            value = self.evaluate(instruction)
+            old = self.values.get(instruction)
+            if value is not None and value != old:
+                self.values[instruction] = value
+                self.value_worklist.extend(instruction.used_by)
+
+    def get_targets(self, instruction):
+        """ Get the targets of a jump, which can be executed """
+        if isinstance(instruction, ir.CJump):
+            decision = self.decide(instruction)
+            if decision is None:
+                return []
+            elif decision is NOT_CONSTANT:
+                return instruction.targets
+            else:
+                return [decision]
+        return instruction.targets
+
+    def decide(self, cjump):
+        """ Determine the target a conditional jump takes.
+
+        Returns the target when the condition is constant, None when the
+        condition is not known yet, and NOT_CONSTANT otherwise.
+        """
+        a = self.get_value(cjump.a)
+        b = self.get_value(cjump.b)
+        if a is NOT_CONSTANT or b is NOT_CONSTANT:
+            return NOT_CONSTANT
+        elif a is None or b is None:
+            return
+        elif CONDITIONS[cjump.cond](a, b):
+            return cjump.lab_yes
+        else:
+            return cjump.lab_no
+
+    def get_value(self, value):
+        """ Get the lattice value of a value """
+        if value in self.values:
+            return self.values[value]
+        elif isinstance(value, ir.Instruction) and value.block:
+            # Not visited yet:
+            return
+        else:
+            # Parameters and global values:
+            return NOT_CONSTANT
+
+    def evaluate(self, instruction):
+        """ Determine the lattice value of an instruction.
+
+        Returns None when the value is not known yet.
+        """
+        if not instruction.ty.is_integer:
+            return NOT_CONSTANT
+        ty = instruction.ty
+        if isinstance(instruction, ir.Const):
+            return correct(int(instruction.value), ty)
+        elif isinstance(instruction, ir.Phi):
+            return self.evaluate_phi(instruction)
+        elif isinstance(instruction, ir.Binop):
+            if instruction.operation not in BINOPS:
+                return NOT_CONSTANT
+            operands = (instruction.a, instruction.b)
+            function = BINOPS[instruction.operation]
+        elif isinstance(instruction, ir.Unop):
+            operands = (instruction.a,)
+            function = UNOPS[instruction.operation]
+        elif isinstance(instruction, ir.Cast):
+            if not instruction.src.ty.is_integer:
+                return NOT_CONSTANT
+            operands = (instruction.src,)
+            function = int
+        else:
+            return NOT_CONSTANT
+
+        values = [self.get_value(operand) for operand in operands]
+        if NOT_CONSTANT in values:
+            return NOT_CONSTANT
+        elif None in values:
+            return
+        elif isinstance(instruction, ir.Binop) and \
+                instruction.operation in ('<<', '>>') and \
+                not 0 <= values[1] < ty.bits:
+            return NOT_CONSTANT
+        try:
+            return correct(function(*values), ty)
+        except (ValueError, ZeroDivisionError):
+            return NOT_CONSTANT
+
+    def evaluate_phi(self, phi):
+        """ Meet the values flowing into a phi over the executable edges """
+        result = None
+        for block, value in phi.inputs.items():
+            if (block, phi.block) not in self.executable_edges:
+                continue
+            value = self.get_value(value)
+            if value is None:
+                continue
+            elif value is NOT_CONSTANT:
+                return NOT_CONSTANT
+            elif result is None:
+                result = value
+            elif result != value:
+                return NOT_CONSTANT
+        return result
+
+    def rewrite(self, function):
+        """ Replace constant values and jumps, and remove dead blocks """
+        blocks = [b for b in function if b in self.executable_blocks]
+        count = 0
+
+        # Fold the jumps first, while the conditions can still be looked up:
+        for block in blocks:
+            cjump = block.last_instruction
+            if isinstance(cjump, ir.CJump) and \
+                    isinstance(self.decide(cjump), ir.Block):
+                self.fold_cjump(cjump)
+                count += 1
+
+        for block in blocks:
+            for instruction in list(block):
+                value = self.values.get(instruction)
+                if value is None or value is NOT_CONSTANT or \
+                        isinstance(instruction, ir.Const):
+                    continue
+                elif instruction.is_used:
+                    self.replace_by_constant(instruction, value)
+                    count += 1
+
+        if len(self.executable_blocks) < len(function.blocks):
+            count += len(function.blocks) - len(self.executable_blocks)
+            function.delete_unreachable()
+
+        if count > 0:
+            self.logger.debug('Propagated %s constants', count)
+        return count > 0
+
+    def replace_by_constant(self, instruction, value):
+        """ Replace a value by a constant """
+        block = instruction.block
+        cnst = ir.Const(value, 'cnst', instruction.ty)
+        if isinstance(instruction, ir.Phi):
+            # Insert the constant after the phis:
+            first = block[len(block.phis)]
+            block.insert_instruction(cnst, before_instruction=first)
+        else:
+            block.insert_instruction(cnst, before_instruction=instruction)
+        instruction.replace_by(cnst)
+
+    def fold_cjump(self, cjump):
+        """ Replace a conditional jump by a jump to the target taken """
+        block = cjump.block
+        target = self.decide(cjump)
+        # The edge to the target taken remains, also when both targets
+        # are the same block:
+        for other in set(cjump.targets):
+            if other is not target:
+                for phi in other.phis:
+                    phi.del_incoming(block)
+        block.remove_instruction(cjump)
+        cjump.delete()
+        block.add_instruction(ir.Jump(target))
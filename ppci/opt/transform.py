@@ -3,6 +3,16 @@
 import logging
 import abc
 from .. import ir
+from ..graph.domtree import CfgInfo
+
+
+def has_changed(result):
+    """ Interpret the result of a pass.
+
+    A pass which does not report whether it changed something, is assumed
+    to have changed something.
+    """
+    return result is None or bool(result)
 
 
 class ModulePass(metaclass=abc.ABCMeta):
@@ -21,20 +31,58 @@ class ModulePass(metaclass=abc.ABCMeta):
 
     @abc.abstractmethod
     def run(self, ir_module):  # pragma: no cover
-        """ Run this pass over a module """
+        """ Run this pass over a module.
+
+        Returns True when the module was changed.
+        """
         raise NotImplementedError()
 
 
 class FunctionPass(ModulePass):
-    """ Base pass that loops over all functions in a module """
+    """ Base pass that loops over all functions in a module.
+
+    The on_function method returns True when it changed the function.
+    When a pass does not change the control flow of the functions, it
+    sets preserves_cfg, so that the pass manager can keep the control
+    flow information of the changed functions. A pass which only changes
+    the control flow of some functions overrides changed_cfg instead.
+    """
+    preserves_cfg = False
+    analyses = None
+
     def run(self, ir_module: ir.Module):
         """ Main entry point for the pass """
+        return bool(self.run_on_functions(ir_module, ir_module.functions))
+
+    def run_on_functions(self, ir_module, functions):
+        """ Run the pass over some functions of a module.
+
+        Returns the functions which were changed.
+        """
         self.prepare()
         self.debug_db = ir_module.debug_db
         assert isinstance(ir_module, ir.Module)
-        for function in ir_module.functions:
-            self.on_function(function)
+        changed = []
+        for function in functions:
+            if has_changed(self.on_function(function)):
+                changed.append(function)
         self.debug_db = None
+        return changed
+
+    def changed_cfg(self, function):
+        """ Test whether the last run could have changed the control
+        flow of a function """
+        return not self.preserves_cfg
+
+    def get_cfg_info(self, function):
+        """ Get the control flow information of a function.
+
+        The information is taken from the analyses of the pass manager,
+        when the pass is run by a pass manager.
+        """
+        if self.analyses is None:
+            return CfgInfo(function)
+        return self.analyses.get_cfg_info(function)
 
     @abc.abstractmethod
     def on_function(self, function: ir.SubRoutine):  # pragma: no cover
@@ -46,8 +94,11 @@ class BlockPass(FunctionPass):
     """ Base pass that loops over all blocks """
     def on_function(self, function):
         """ Loops over each block in the function """
+        changed = False
         for block in function.blocks:
-            self.on_block(block)
+            if has_changed(self.on_block(block)):
+                changed = True
+        return changed
 
     @abc.abstractmethod
     def on_block(self, block: ir.Block):  # pragma: no cover
@@ -59,8 +110,11 @@ class InstructionPass(BlockPass):
     """ Base pass that loops over all instructions """
     def on_block(self, block):
         """ Loops over each instruction in the block """
+        changed = False
         for instruction in block:
-            self.on_instruction(instruction)
+            if has_changed(self.on_instruction(instruction)):
+                changed = True
+        return changed
 
     @abc.abstractmethod
     def on_instruction(self, instruction):  # pragma: no cover
@@ -72,31 +126,41 @@ class RemoveAddZeroPass(InstructionPass):
     """ Replace additions with zero with the value itself.
         Replace multiplication by 1 with value itself.
     """
+    preserves_cfg = True
+
     def on_instruction(self, instruction):
-        if type(instruction) is ir.Binop:
+        if type(instruction) is ir.Binop and instruction.is_used:
             if instruction.operation == '+':
                 if type(instruction.b) is ir.Const \
                         and instruction.b.value == 0:
                     instruction.replace_by(instruction.a)
+                    return True
                 elif type(instruction.a) is ir.Const \
                         and instruction.a.value == 0:
                     instruction.replace_by(instruction.b)
+                    return True
             elif instruction.operation == '*':
                 if type(instruction.b) is ir.Const \
                         and instruction.b.value == 1:
                     instruction.replace_by(instruction.a)
+                    return True
+        return False
 
 
 class DeleteUnusedInstructionsPass(BlockPass):
     """ Remove unused variables from a block """
+    preserves_cfg = True
+
     def on_block(self, block):
-        unused_instructions = [
-            i for i in block
-            if (isinstance(i, ir.Value) and
-                (not isinstance(i, ir.FunctionCall)) and
-                (not i.is_used))]
-        count = len(unused_instructions)
-        for instruction in unused_instructions:
-            instruction.remove_from_block()
+        # Walk backwards, so that the values used only by removed
+        # instructions are removed as well:
+        count = 0
+        for instruction in reversed(block.instructions):
+            if (isinstance(instruction, ir.Value) and
+                    (not isinstance(instruction, ir.FunctionCall)) and
+                    (not instruction.is_used)):
+                instruction.remove_from_block()
+                count += 1
         if count > 0:
             self.logger.debug('Deleted %i unused instructions', count)
+        return count > 0
@@ -130,6 +130,13 @@ def encode_imm32(v):
     raise ValueError("Invalid value {}".format(v))
 
 
+def decode_imm32(x):
+    """ Expand 4 bits rotation and 8 bits value into a 32 bit value """
+    rotation = x >> 8
+    val = x & 0xFF
+    return rotr(val, rotation * 2, 32)
+
+
 def align(value, m):
     """ Increase value to a multiple of m """
     while ((value % m) != 0):
@@ -493,26 +493,28 @@ class HtmlReportGenerator(TextWritingReporter):
 
                 self.print('<td>', end='')
                 if hasattr(ins, 'gen'):
-                    self.print(str2(ins.gen), end='')
+                    self.print(str2(frame.cfg.registers(ins.gen)), end='')
                 self.print('</td>')
 
                 self.print('<td>', end='')
                 if hasattr(ins, 'kill'):
-                    self.print(str2(ins.kill), end='')
+                    self.print(str2(frame.cfg.registers(ins.kill)), end='')
                 self.print('</td>')
 
                 self.print('<td>', end='')
                 if hasattr(ins, 'live_in'):
-                    self.print(str2(ins.live_in), end='')
+                    self.print(
+                        str2(frame.cfg.registers(ins.live_in)), end='')
                 self.print('</td>')
 
                 self.print('<td>', end='')
                 if hasattr(ins, 'live_out'):
-                    self.print(str2(ins.live_out), end='')
+                    self.print(
+                        str2(frame.cfg.registers(ins.live_out)), end='')
                 self.print('</td>')
                 for ur in used_regs:
                     self.print('<td>')
-                    for r2 in ins.live_out:
+                    for r2 in frame.cfg.registers(ins.live_out):
                         if r2.color == ur.color:
                             self.print(r2.name)
                     self.print('</td>')
@@ -7,15 +7,17 @@ The wasm runtime contains the following:
 - Implement function like sqrt, floor, bit rotations etc..
 """
 
-import os
 import abc
+import hashlib
 import shelve
 import io
 import struct
 import logging
 from types import ModuleType
 
+from .. import __version__
 from ..arch.arch_info import TypeInfo
+from ..binutils.objectfile import ObjectFile
 from ..utils.codepage import load_obj, MemoryPage
 from ..utils.reporting import DummyReportGenerator
 from ..irutils import verify_module
@@ -43,7 +45,9 @@ def instantiate(module, imports, target='native', reporter=None,
                 Use 'python' to generate python code. This option is slower
                 but more reliable.
         reporter: A reporter which can record detailed compilation information.
-        cache_file: a file to use as cache
+        cache_file: a file to use as cache. When given, natively compiled
+                    code is stored in this file, and re-used when the same
+                    module is instantiated again.
 
     """
     if reporter is None:
@@ -86,31 +90,15 @@ def instantiate(module, imports, target='native', reporter=None,
 
 def native_instantiate(module, imports, reporter, cache_file):
     """ Load wasm module native """
-    from ..api import ir_to_object, get_current_arch
+    from ..api import get_current_arch
     logger.info('Instantiating wasm module as native code')
     arch = get_current_arch()
-    key = (arch, module)
-    # TODO: think of clever caching trickery:
-    cache_file = None
-    if cache_file and os.path.exists(cache_file):
-        logger.info('Using cached object from %s', cache_file)
-        with shelve.open(cache_file) as s:
-            obj = s['obj']
-            ppci_module = s['ppci_module']
+    if cache_file:
+        obj, function_names, global_names = cached_native_compile(
+            module, arch, reporter, cache_file)
     else:
-        # TODO: use cache here to short circuit re-compilation
-        # hash(key)
-        # print(hash(key))
-        # hgkfdg
-        ppci_module = wasm_to_ir(
-            module, arch.info.get_type_info('ptr'), reporter=reporter)
-        verify_module(ppci_module)
-        obj = ir_to_object([ppci_module], arch, debug=True, reporter=reporter)
-        if cache_file:
-            logger.info('Saving object to %s for later use', cache_file)
-            with shelve.open(cache_file) as s:
-                s['obj'] = obj
-                s['ppci_module'] = ppci_module
+        obj, function_names, global_names = native_compile(
+            module, arch, reporter)
     instance = NativeModuleInstance(obj, imports)
 
     instance.load_memory(module)
@@ -119,11 +107,11 @@ def native_instantiate(module, imports, reporter, cache_file):
     for definition in module:
         if isinstance(definition, Export):
             if definition.kind == 'func':
-                exported_name = ppci_module._wasm_function_names[definition.ref.index]
+                exported_name = function_names[definition.ref.index]
                 instance.exports._function_map[definition.name] = \
                     getattr(instance._code_module, exported_name)
             elif definition.kind == 'global':
-                global_name = ppci_module._wasm_globals[definition.ref.index]
+                global_name = global_names[definition.ref.index]
                 instance.exports._function_map[definition.name] = \
                     NativeWasmGlobal(global_name, instance._code_module)
                 logger.debug('global exported')
@@ -137,6 +125,56 @@ def native_instantiate(module, imports, reporter, cache_file):
     return instance
 
 
+def native_compile(module, arch, reporter):
+    """ Compile a wasm module into an object file for the given arch.
+
+    Returns a tuple with the object file, the names of the functions and
+    the names of the globals.
+    """
+    from ..api import ir_to_object
+    ppci_module = wasm_to_ir(
+        module, arch.info.get_type_info('ptr'), reporter=reporter)
+    verify_module(ppci_module)
+    obj = ir_to_object([ppci_module], arch, debug=True, reporter=reporter)
+    return obj, ppci_module._wasm_function_names, ppci_module._wasm_globals
+
+
+def cached_native_compile(module, arch, reporter, cache_file):
+    """ Compile a wasm module, using the given file as cache.
+
+    Compiled modules are stored in a shelve under a hash of the
+    wasm module bytes and the target architecture.
+    """
+    key = instantiation_key(module, arch)
+    with shelve.open(cache_file) as cache:
+        entry = cache.get(key)
+        if entry:
+            logger.info('Using cached object from %s', cache_file)
+            obj = ObjectFile.load(io.StringIO(entry['obj']))
+            return obj, entry['function_names'], entry['global_names']
+
+        obj, function_names, global_names = native_compile(
+            module, arch, reporter)
+        logger.info('Saving object to %s for later use', cache_file)
+        f = io.StringIO()
+        obj.save(f)
+        cache[key] = {
+            'obj': f.getvalue(),
+            'function_names': function_names,
+            'global_names': global_names,
+        }
+    return obj, function_names, global_names
+
+
+def instantiation_key(module, arch):
+    """ Create a stable key for the compiled form of a wasm module """
+    digest = hashlib.sha256()
+    digest.update(__version__.encode('ascii'))
+    digest.update(arch.make_id_str().encode('utf8'))
+    digest.update(module.to_bytes())
+    return digest.hexdigest()
+
+
 def python_instantiate(module, imports, reporter, cache_file):
     """ Load wasm module as a PythonModuleInstance """
     from ..api import ir_to_python
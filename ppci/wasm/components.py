@@ -31,13 +31,14 @@ Common attribute names:
 
 from io import BytesIO
 import logging
+import mmap
 import sys
 from collections import OrderedDict
 
 from .opcodes import OPERANDS, REVERZ, OPCODES, ArgType
 from .util import bytes2datastring
 from ..lang.sexpr import parse_sexpr
-from .io import FileReader, FileWriter
+from .io import FileReader, FileWriter, BufferReader
 
 
 this_is_js = lambda: False  # For PyScript
@@ -90,7 +91,8 @@ class WASMComponent:
     * its attributes (the most direct method).
     * a tuple representing an S-expression.
     * a string representing an S-expression.
-    * a bytes object representing the binary form of a component.
+    * a bytes object representing the binary form of a component. A
+      bytearray, memoryview or memory mapped file can be used as well.
     * a file object that contains the binary form of a component.
 
     """
@@ -106,7 +108,8 @@ class WASMComponent:
                 return self._from_tuple(input[0])
             elif isinstance(input[0], str) and '(' in input[0]:
                 return self._from_string(input[0])
-            elif isinstance(input[0], bytes):
+            elif isinstance(
+                    input[0], (bytes, bytearray, memoryview, mmap.mmap)):
                 return self._from_bytes(input[0])
             elif hasattr(input[0], 'read'):
                 return self._from_file(input[0])
@@ -168,7 +171,7 @@ class WASMComponent:
         raise NotImplementedError()
 
     def _from_bytes(self, b):
-        self._from_file(BytesIO(b))
+        self._from_reader(BufferReader(b))
 
     def _from_file(self, f):
         self._from_reader(FileReader(f))
@@ -363,6 +366,17 @@ class Module(WASMComponent):
                 f.write_vu32(len(payload))
             f.write(payload)
 
+    def _from_file(self, f):
+        # A module spans the whole file, so decode it from memory:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            data = f.read()
+        else:
+            if f.tell():
+                data = memoryview(data)[f.tell():]
+        self._from_bytes(data)
+
     def _from_reader(self, reader):
 
         # Check header and version
@@ -396,9 +410,8 @@ class Module(WASMComponent):
             # TODO: Validate section nbytes
             section_nbytes = reader.read_uint()
             section_name = section_id_to_name[section_id]
-            section_data = reader.read(section_nbytes)
+            reader2 = reader.sub_reader(section_nbytes)
             logger.debug('Loading %s section', section_name)
-            reader2 = FileReader(BytesIO(section_data))
 
             if section_name == 'function':
                 # Read mapping of func id to type id (both indexes)
@@ -1098,11 +1111,51 @@ class Func(Definition):
       implicit id's (note that the id is offset by the parameters).
     * instructions: a list of instructions (may be given as tuples).
 
+    A function loaded from binary only keeps the bytes of its body, and
+    decodes the locals and instructions when they are first used. A body
+    which is never decoded is written back as it was read.
+
     """
 
     # todo: force local ids to be either int or str?
 
-    __slots__ = ('id', 'ref', 'locals', 'instructions')  # ref to type
+    __slots__ = ('id', 'ref', '_locals', '_instructions', '_body')
+    _fields = ('id', 'ref', 'locals', 'instructions')
+
+    # Decode the body of functions loaded from binary on first use:
+    lazy = True
+
+    def __getitem__(self, i):
+        return getattr(self, self._fields[i])
+
+    @property
+    def locals(self):
+        if self._body is not None:
+            self._decode_body()
+        return self._locals
+
+    @locals.setter
+    def locals(self, locals):
+        if self._body is not None:
+            self._decode_body()
+        self._locals = locals
+
+    @property
+    def instructions(self):
+        if self._body is not None:
+            self._decode_body()
+        return self._instructions
+
+    @instructions.setter
+    def instructions(self, instructions):
+        if self._body is not None:
+            self._decode_body()
+        self._instructions = instructions
+
+    @property
+    def is_decoded(self):
+        """ Whether the locals and instructions are decoded """
+        return self._body is None
 
     def _from_args(self, id, ref, locals, instructions):
         if not isinstance(ref, Ref):
@@ -1110,6 +1163,7 @@ class Func(Definition):
         assert isinstance(locals, (tuple, list))
         assert isinstance(instructions, (tuple, list))
         assert all(isinstance(el, tuple) and len(el) == 2 for el in locals)
+        self._body = None
         self.id = check_id(id)
         self.ref = ref
         self.locals = tuple(locals)
@@ -1153,6 +1207,12 @@ class Func(Definition):
         # You would expect the ref to be used here, but the WASM spec has a
         # separate function section for that. Not sure why.
 
+        if self._body is not None:
+            # Copy the body which was never decoded:
+            f.write_vu32(len(self._body))
+            f.write(self._body)
+            return
+
         # Collect locals by type
         local_entries = []  # list of (count, type) tuples
         for loc_id, loc_type in self.locals:
@@ -1178,9 +1238,17 @@ class Func(Definition):
 
     def _from_reader(self, reader):
         body_size = reader.read_uint()
-        body = reader.read(body_size)
+        if self.lazy:
+            self._body = reader.read(body_size)
+        else:
+            self._body = None
+            self._read_body(reader.sub_reader(body_size))
+
+    def _decode_body(self):
+        body, self._body = self._body, None
+        self._read_body(BufferReader(body))
 
-        reader2 = FileReader(BytesIO(body))
+    def _read_body(self, reader2):
         num_local_pairs = reader2.read_uint()
         localz = []
         for _ in range(num_local_pairs):
@@ -1188,10 +1256,10 @@ class Func(Definition):
             t = reader2.read_type()
             localz.extend([(None, t)] * c)
         instructions = reader2.read_expression()
-        remaining = reader2.f.read()
+        remaining = reader2.read()
         assert remaining == bytes(), str(remaining)
-        self.locals = localz
-        self.instructions = instructions
+        self._locals = localz
+        self._instructions = instructions
 
 
 class Elem(Definition):
@@ -1,9 +1,15 @@
 """ This module assists with reading and writing wasm to binary.
+
+There are two readers. The :class:`FileReader` reads from a file like
+object. The :class:`BufferReader` decodes a buffer in memory, such as
+bytes or a memory mapped file, and is used when a whole module is loaded.
 """
 
+import io
 import struct
 from ..utils.leb128 import signed_leb128_encode, unsigned_leb128_encode
 from ..utils.leb128 import unsigned_leb128_decode, signed_leb128_decode
+from .opcodes import REVERZ, OPERANDS, ArgType
 
 
 LANG_TYPES = {
@@ -142,6 +148,10 @@ class FileReader:
     def read_u32(self) -> int:
         return struct.unpack('<I', self.read(4))[0]
 
+    def sub_reader(self, amount):
+        """ Read amount bytes, and create a reader for these bytes """
+        return FileReader(io.BytesIO(self.read(amount)))
+
     def read_bytes(self) -> bytes:
         """ Read raw bytes data """
         amount = self.read_uint()
@@ -197,3 +207,228 @@ class FileReader:
         # TODO: resolve this import hack:
         from .components import Instruction
         return Instruction(self)
+
+
+# The spaces of the operands which refer to an index:
+REF_SPACES = {
+    ArgType.LABELIDX: 'label',
+    ArgType.LOCALIDX: 'local',
+    ArgType.GLOBALIDX: 'global',
+    ArgType.FUNCIDX: 'func',
+    ArgType.TYPEIDX: 'type',
+    ArgType.TABLEIDX: 'table',
+}
+
+
+# Kinds of operands, as used in the opcode table:
+_REF, _U32, _INT, _TYPE, _F32, _F64, _BYTE, _BR_TABLE = range(8)
+OPERAND_KINDS = {
+    ArgType.U32: _U32,
+    ArgType.I32: _INT,
+    ArgType.I64: _INT,
+    ArgType.TYPE: _TYPE,
+    ArgType.F32: _F32,
+    ArgType.F64: _F64,
+    'byte': _BYTE,
+    'br_table': _BR_TABLE,
+}
+
+
+def _make_opcode_table():
+    """ Create a table with the mnemonic and operands of each opcode.
+
+    Each operand is described by its kind and, for references, the space
+    the reference refers to.
+    """
+    table = [None] * 256
+    for binopcode, opcode in REVERZ.items():
+        operands = tuple(
+            (_REF, REF_SPACES[operand]) if operand in REF_SPACES
+            else (OPERAND_KINDS[operand], None)
+            for operand in OPERANDS[opcode])
+        table[binopcode] = (opcode, operands)
+    return table
+
+
+OPCODE_TABLE = _make_opcode_table()
+
+
+def read_uleb(data, pos):
+    """ Decode an unsigned leb128 number at pos in data.
+
+    Returns the number and the position after it.
+    """
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def read_sleb(data, pos):
+    """ Decode a signed leb128 number at pos in data.
+
+    Returns the number and the position after it.
+    """
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        shift += 7
+        if byte < 0x80:
+            break
+    if byte & 0x40:
+        result -= 1 << shift
+    return result, pos
+
+
+class BufferReader(FileReader):
+    """ Reader which decodes wasm from a buffer in memory.
+
+    The buffer can be bytes, a memoryview or a memory mapped file. The
+    data is not copied, and numbers are decoded directly from the buffer.
+    """
+
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.pos = 0
+
+    def read(self, amount=None):
+        pos = self.pos
+        if amount is None:
+            end = len(self.data)
+        elif amount < 0:
+            raise ValueError('Cannot read {} bytes'.format(amount))
+        else:
+            end = pos + amount
+            if end > len(self.data):
+                raise EOFError('Reading beyond end of file')
+        self.pos = end
+        return self.data[pos:end].tobytes()
+
+    def sub_reader(self, amount):
+        """ Create a reader for the next amount bytes, without copying """
+        pos = self.pos
+        end = pos + amount
+        if amount < 0 or end > len(self.data):
+            raise EOFError('Reading beyond end of file')
+        self.pos = end
+        return BufferReader(self.data[pos:end])
+
+    def __next__(self):
+        return self.read_byte()
+
+    def read_byte(self):
+        """ Read the value of a single byte """
+        try:
+            byte = self.data[self.pos]
+        except IndexError:
+            raise EOFError('Reading beyond end of file')
+        self.pos += 1
+        return byte
+
+    def read_int(self):
+        """ Read variable size signed int """
+        try:
+            value, self.pos = read_sleb(self.data, self.pos)
+        except IndexError:
+            raise EOFError('Reading beyond end of file')
+        return value
+
+    def read_uint(self):
+        """ Read variable size unsigned integer """
+        try:
+            value, self.pos = read_uleb(self.data, self.pos)
+        except IndexError:
+            raise EOFError('Reading beyond end of file')
+        return value
+
+    def read_f32(self) -> float:
+        value, = struct.unpack('f', self.read(4))
+        return value
+
+    def read_f64(self) -> float:
+        value, = struct.unpack('d', self.read(8))
+        return value
+
+    def read_u32(self) -> int:
+        return struct.unpack('<I', self.read(4))[0]
+
+    def read_expression(self):
+        """ Read instructions until an end marker is found.
+
+        The instructions are decoded in a single loop over the buffer.
+        """
+        from .components import Instruction, Ref
+        new_instruction = Instruction.__new__
+        data = self.data
+        pos = self.pos
+        expr = []
+        blocks = 1
+        try:
+            while blocks:
+                binopcode = data[pos]
+                pos += 1
+                entry = OPCODE_TABLE[binopcode]
+                if entry is None:
+                    raise KeyError(binopcode)
+                opcode, operands = entry
+                if opcode == 'end':
+                    blocks -= 1
+                elif opcode in ('if', 'block', 'loop'):
+                    blocks += 1
+                args = []
+                for kind, space in operands:
+                    if kind == _REF:
+                        byte = data[pos]
+                        if byte < 0x80:
+                            pos += 1
+                            index = byte
+                        else:
+                            index, pos = read_uleb(data, pos)
+                        arg = Ref(space, index=index)
+                    elif kind == _U32:
+                        byte = data[pos]
+                        if byte < 0x80:
+                            pos += 1
+                            arg = byte
+                        else:
+                            arg, pos = read_uleb(data, pos)
+                    elif kind == _INT:
+                        arg, pos = read_sleb(data, pos)
+                    elif kind == _TYPE:
+                        arg = LANG_TYPES_REVERSE[data[pos]]
+                        pos += 1
+                    elif kind == _F32:
+                        arg, = struct.unpack_from('f', data, pos)
+                        pos += 4
+                    elif kind == _F64:
+                        arg, = struct.unpack_from('d', data, pos)
+                        pos += 8
+                    elif kind == _BYTE:
+                        arg = data[pos]
+                        pos += 1
+                    else:
+                        count, pos = read_uleb(data, pos)
+                        arg = []
+                        for _ in range(count + 1):
+                            index, pos = read_uleb(data, pos)
+                            arg.append(Ref('label', index=index))
+                    args.append(arg)
+                instruction = new_instruction(Instruction)
+                instruction.opcode = opcode
+                instruction.args = tuple(args)
+                expr.append(instruction)
+        except (IndexError, struct.error):
+            raise EOFError('Reading beyond end of file')
+        self.pos = pos
+
+        # Strip of last end opcode:
+        assert expr[-1].opcode == 'end'
+        return expr[:-1]
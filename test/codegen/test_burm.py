@@ -7,6 +7,7 @@ from ppci.utils.tree import Tree, from_string
 from ppci.codegen import burg
 from ppci.codegen.burg import BurgSystem
 from ppci.codegen.instructionselector import TreeSelector
+from ppci.codegen.instructionselector import MemoizedTreeSelector
 
 brg_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'sample4.brg')
 
@@ -71,6 +72,8 @@ class TreeTestCase(unittest.TestCase):
 
 class TreeMatchingTestCase(unittest.TestCase):
     """ Verify tree matching functions """
+    selector_class = TreeSelector
+
     def test_simple_match(self):
         """ Test if instruction selection on trees works fine """
         class Ctx:
@@ -93,7 +96,7 @@ class TreeMatchingTestCase(unittest.TestCase):
             None,
             lambda ctx, tree: tree.value)
         system.check()
-        selector = TreeSelector(system)
+        selector = self.selector_class(system)
         v = selector.gen(context, tree)
         self.assertEqual((1, '+', 2), v)
 
@@ -131,7 +134,7 @@ class TreeMatchingTestCase(unittest.TestCase):
             None,
             lambda ctx, tree: tree.value)
         system.check()
-        selector = TreeSelector(system)
+        selector = self.selector_class(system)
         v = selector.gen(context, tree)
         self.assertEqual((1, '+', 2), v)
 
@@ -176,10 +179,87 @@ class TreeMatchingTestCase(unittest.TestCase):
             lambda ctx, tree: tree.value)
         system.check()
         # print('FOOO', system.chain_rules_for_nt('val'))
-        selector = TreeSelector(system)
+        selector = self.selector_class(system)
         v = selector.gen(context, tree)
         self.assertEqual((1, '+', 2), v)
 
+    def test_nested_pattern_and_acceptance(self):
+        """ Check nested patterns and rules with an acceptance function """
+        class Ctx:
+            pass
+        context = Ctx()
+        system = BurgSystem()
+        for terminal in ['ADD', 'MUL', 'VAL']:
+            system.add_terminal(terminal)
+        system.add_rule(
+            'stm', Tree('ADD', Tree('reg'), Tree('reg')), 1, None,
+            lambda ctx, tree, c0, c1: ('add', c0, c1))
+        system.add_rule(
+            'stm', Tree('MUL', Tree('reg'), Tree('reg')), 1, None,
+            lambda ctx, tree, c0, c1: ('mul', c0, c1))
+        system.add_rule(
+            'reg', Tree('MUL', Tree('reg'), Tree('reg')), 3, None,
+            lambda ctx, tree, c0, c1: ('mul', c0, c1))
+        system.add_rule(
+            'stm', Tree('ADD', Tree('MUL', Tree('reg'), Tree('reg')),
+                        Tree('reg')), 2, None,
+            lambda ctx, tree, c0, c1, c2: ('muladd', c0, c1, c2))
+        system.add_rule(
+            'reg', Tree('VAL'), 2, None,
+            lambda ctx, tree: tree.value)
+        system.add_rule(
+            'reg', Tree('VAL'), 1, lambda tree: tree.value < 10,
+            lambda ctx, tree: ('small', tree.value))
+        system.check()
+        selector = self.selector_class(system)
+
+        def val(value):
+            return Tree('VAL', value=value)
+
+        tree = Tree('ADD', Tree('MUL', val(1), val(20)), val(3))
+        v = selector.gen(context, tree)
+        self.assertEqual(('muladd', ('small', 1), 20, ('small', 3)), v)
+        tree = Tree('ADD', val(30), Tree('MUL', val(1), val(2)))
+        v = selector.gen(context, tree)
+        self.assertEqual(
+            ('add', 30, ('mul', ('small', 1), ('small', 2))), v)
+        tree = Tree('MUL', val(30), val(4))
+        v = selector.gen(context, tree)
+        self.assertEqual(('mul', 30, ('small', 4)), v)
+
+
+class MemoizedTreeMatchingTestCase(TreeMatchingTestCase):
+    """ Verify tree matching with memoized state tables """
+    selector_class = MemoizedTreeSelector
+
+    def test_table_reuse(self):
+        """ Check that nodes with equal labels share their state """
+        class Ctx:
+            pass
+        context = Ctx()
+        system = BurgSystem()
+        for terminal in ['ADD', 'VAL']:
+            system.add_terminal(terminal)
+        system.add_rule(
+            'stm', Tree('ADD', Tree('val'), Tree('val')), 1, None,
+            lambda ctx, tree, c0, c1: (c0, '+', c1))
+        system.add_rule(
+            'val', Tree('ADD', Tree('val'), Tree('val')), 1, None,
+            lambda ctx, tree, c0, c1: (c0, '+', c1))
+        system.add_rule(
+            'val', Tree('VAL'), 1, None, lambda ctx, tree: tree.value)
+        system.check()
+        selector = self.selector_class(system)
+        inner = Tree('ADD', Tree('VAL', value=1), Tree('VAL', value=2))
+        tree, expected = inner, (1, '+', 2)
+        for value in range(3, 10):
+            tree = Tree('ADD', tree, Tree('VAL', value=value))
+            expected = (expected, '+', value)
+        v = selector.gen(context, tree)
+        self.assertEqual(expected, v)
+        self.assertIs(tree.state, inner.state)
+        self.assertEqual(3, len(selector.table))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -9,7 +9,7 @@ from ppci.codegen.irdag import SelectionGraphBuilder
 from ppci.codegen.irdag import FunctionInfo, prepare_function_info
 from ppci.arch.example import ExampleArch
 from ppci.binutils.debuginfo import DebugDb
-from ppci.api import get_arch
+from ppci.api import get_arch, c_to_ir, ir_to_object
 
 
 def print_module(m):
@@ -189,5 +189,25 @@ class IrDagTestCase(unittest.TestCase):
         # self.assertTrue(sg_value.vreg)
 
 
+class ParallelCodegenTestCase(unittest.TestCase):
+    """ Check that compiling with multiple processes gives the same code """
+    source = """
+    int g;
+    int add(int a, int b) { return a + b; }
+    int mul(int a, int b) { int i, r = 0; for (i=0;i<b;i++) r += a; return r; }
+    void set(int a) { g = add(a, mul(a, 3)); }
+    """
+
+    def compile(self, march, jobs):
+        ir_module = c_to_ir(io.StringIO(self.source), march)
+        return ir_to_object([ir_module], march, jobs=jobs)
+
+    def test_same_output(self):
+        for march in ['arm', 'riscv', 'msp430']:
+            obj1 = self.compile(march, 1)
+            obj2 = self.compile(march, 2)
+            self.assertEqual(obj1, obj2)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from ppci.codegen.instructionscheduler import InstructionScheduler
+from ppci.api import get_arch
+from ppci.arch.arch import Frame
+from ppci.arch.arch_info import SchedulingInfo
+from ppci.arch.generic_instructions import Label
+from ppci.arch.example import Def, Use, Add, Cmp, ExampleRegister
+
+
+class InstructionSchedulerTestCase(unittest.TestCase):
+    """ Check the list scheduler with the example target.
+
+    The def instruction acts as a load with a latency of two cycles.
+    """
+    def setUp(self):
+        self.arch = get_arch('example')
+        self.arch.info.scheduling = SchedulingInfo(
+            instructions=(Add, Use), memory=(Def,), prefixes=(Cmp,),
+            latencies={Def: 2})
+        self.scheduler = InstructionScheduler(self.arch)
+        self.t1, self.t2, self.t3, self.t4 = [
+            ExampleRegister('t{}'.format(i)) for i in range(1, 5)]
+
+    def schedule(self, instructions):
+        frame = Frame('tst')
+        frame.instructions.extend(instructions)
+        self.scheduler.schedule(frame)
+        return frame.instructions
+
+    def test_fill_load_delay(self):
+        """ Independent work is moved in between a load and its use """
+        t1, t2, t3, t4 = self.t1, self.t2, self.t3, self.t4
+        i1, i2 = Def(t1), Add(t2, t1, t1)
+        i3, i4 = Def(t3), Add(t4, t3, t3)
+        self.assertEqual([i1, i3, i2, i4], self.schedule([i1, i2, i3, i4]))
+
+    def test_write_after_read(self):
+        """ A register may not be overwritten before it is read """
+        t1, t2 = self.t1, self.t2
+        instructions = [Def(t1), Add(t2, t1, t1), Def(t1), Use(t1)]
+        self.assertEqual(instructions, self.schedule(instructions))
+
+    def test_memory_order(self):
+        """ Memory accesses are not reordered """
+        t2, t3, t4 = self.t2, self.t3, self.t4
+        instructions = [Def(t2), Def(t3), Add(t4, t3, t3)]
+        self.assertEqual(instructions, self.schedule(instructions))
+
+    def test_barriers(self):
+        """ Labels and instructions without information stay in place """
+        t1, t2, t3, t4 = self.t1, self.t2, self.t3, self.t4
+        label = Label('a')
+        instructions = [
+            Def(t1), label, Add(t2, t1, t1), Add(t4, t2, t2, jumps=[label]),
+            Def(t3), Use(t3)]
+        self.assertEqual(instructions, self.schedule(instructions))
+
+    def test_prefix(self):
+        """ A prefix instruction is kept in front of the next one """
+        t1, t2, t3, t4 = self.t1, self.t2, self.t3, self.t4
+        i1, i2, i3 = Add(t2, t1, t1), Cmp(t3, t3), Add(t4, t3, t3)
+        i4 = Def(t1)
+        self.assertEqual(
+            [i4, i2, i3, i1], self.schedule([i4, i1, i2, i3]))
+
+    def test_no_scheduling_info(self):
+        """ Targets without scheduling information are left alone """
+        self.arch.info.scheduling = None
+        t1, t2, t3, t4 = self.t1, self.t2, self.t3, self.t4
+        instructions = [Def(t1), Add(t2, t1, t1), Def(t3), Add(t4, t3, t3)]
+        self.assertEqual(instructions, self.schedule(instructions))
+
+
+if __name__ == '__main__':
+    unittest.main()
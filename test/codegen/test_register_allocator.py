@@ -1,7 +1,12 @@
+import io
+from collections import Counter
+from contextlib import contextmanager
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from ppci.codegen.registerallocator import GraphColoringRegisterAllocator
-from ppci.api import get_arch
+from ppci.codegen.flowgraph import FlowGraph
+from ppci.codegen.interferencegraph import InterferenceGraph
+from ppci.api import get_arch, c_to_ir, ir_to_object
 from ppci.arch.arch import Frame
 from ppci.arch.example import Def, Use, Add, Mov, R0, R1, ExampleRegister
 from ppci.arch.example import R10, R10l, DefHalf, UseHalf
@@ -151,5 +156,85 @@ class GraphColoringRegisterAllocatorTestCase(unittest.TestCase):
         # self.register_allocator.coalesc()
 
 
+class CheckedRegisterAllocator(GraphColoringRegisterAllocator):
+    """ Register allocator which verifies each incremental update """
+    updates = 0
+
+    def update_liveness(self, spilled, rewrites):
+        changed = super().update_liveness(spilled, rewrites)
+        if changed is None:
+            # The data is constructed from scratch instead:
+            return
+        CheckedRegisterAllocator.updates += 1
+
+        # Spilled registers can be left in the live sets:
+        keep = ~self.spilled_mask
+        incremental = self.live_sets(self.cfg, self.frame.instructions, keep)
+        with self.saved_sets():
+            cfg = FlowGraph(self.frame.instructions)
+            cfg.calculate_liveness()
+            expected = self.live_sets(cfg, self.frame.instructions)
+        assert incremental == expected
+        return changed
+
+    def update_data(self, spilled, rewrites):
+        super().update_data(spilled, rewrites)
+        graph = InterferenceGraph()
+        with self.saved_sets():
+            cfg = FlowGraph(self.frame.instructions)
+            cfg.calculate_liveness()
+            graph.calculate_interference(cfg)
+        assert self.edges(self.frame.ig) == self.edges(graph)
+        for node in graph.nodes:
+            tmp = node.reg or next(iter(node.temps))
+            assert Counter(graph.defs(tmp)) == Counter(self.frame.ig.defs(tmp))
+            assert Counter(graph.uses(tmp)) == Counter(self.frame.ig.uses(tmp))
+
+    @contextmanager
+    def saved_sets(self):
+        """ Restore the sets, which are numbered by the allocator flowgraph,
+        after checking them with another flowgraph """
+        instructions = self.frame.instructions
+        saved = [
+            (i.gen, i.kill, i.live_in, i.live_out) for i in instructions]
+        yield
+        for i, sets in zip(instructions, saved):
+            i.gen, i.kill, i.live_in, i.live_out = sets
+
+    @staticmethod
+    def live_sets(cfg, instructions, keep=-1):
+        return [
+            (set(cfg.registers(i.live_in & keep)),
+             set(cfg.registers(i.live_out & keep)))
+            for i in instructions]
+
+    @staticmethod
+    def edges(graph):
+        return {
+            frozenset(t for n in (n1, n2) for t in n.temps)
+            for n1 in graph.nodes for n2 in n1.adjecent}
+
+
+class IncrementalSpillTestCase(unittest.TestCase):
+    """ Check that liveness is updated properly after spilling """
+    source = """
+    int f(int x, int y) {
+      int a = x + 1, b = x + 2, c = x + 3, d = x + 4, e = y + 5, g = y + 6;
+      int h = x + y, i = x - y, j = y - x, k = x * 3, l = y * 5, m = x - 7;
+      if (x > y) { a = a + b; c = c * d; } else { e = e - g; b = a - c; }
+      return a + b + c + d + e + g + h + i + j + k + l + m + x * y;
+    }
+    """
+
+    def test_msp430(self):
+        march = get_arch('msp430')
+        ir_module = c_to_ir(io.StringIO(self.source), march)
+        CheckedRegisterAllocator.updates = 0
+        with patch('ppci.codegen.codegen.GraphColoringRegisterAllocator',
+                   CheckedRegisterAllocator):
+            ir_to_object([ir_module], march)
+        self.assertGreater(CheckedRegisterAllocator.updates, 0)
+
+
 if __name__ == '__main__':
     unittest.main()
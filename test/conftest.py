@@ -0,0 +1,18 @@
+""" Configuration of pytest for the whole test suite. """
+
+import os
+import shutil
+import tempfile
+
+
+def pytest_configure(config):
+    """ Keep the compiler caches out of the cache directory of the user.
+
+    The tests fill the object cache, so a temporary directory is used
+    for it, which is removed afterwards.
+    """
+    if 'PPCI_CACHE_DIR' in os.environ:
+        return
+    directory = tempfile.mkdtemp(prefix='ppci-test-cache-')
+    os.environ['PPCI_CACHE_DIR'] = directory
+    config.add_cleanup(lambda: shutil.rmtree(directory, ignore_errors=True))
@@ -203,30 +203,30 @@ class InterferenceGraphTestCase(unittest.TestCase):
 
         # Check block 1:
         self.assertEqual(5, len(b1.instructions))
-        self.assertEqual(set(), b1.gen)
-        self.assertEqual({a, b, d, x}, b1.kill)
+        self.assertEqual(set(), set(cfg.registers(b1.gen)))
+        self.assertEqual({a, b, d, x}, set(cfg.registers(b1.kill)))
 
         # Check block 2 gen and killl:
         self.assertEqual(2, len(b2.instructions))
-        self.assertEqual({a, b}, b2.gen)
-        self.assertEqual({c, d}, b2.kill)
+        self.assertEqual({a, b}, set(cfg.registers(b2.gen)))
+        self.assertEqual({c, d}, set(cfg.registers(b2.kill)))
 
         # Check block 3:
         self.assertEqual(2, len(b3.instructions))
-        self.assertEqual({b, d}, b3.gen)
-        self.assertEqual({c}, b3.kill)
+        self.assertEqual({b, d}, set(cfg.registers(b3.gen)))
+        self.assertEqual({c}, set(cfg.registers(b3.kill)))
 
         # Check block 1 live in and out:
-        self.assertEqual(set(), b1.live_in)
-        self.assertEqual({a, b, d}, b1.live_out)
+        self.assertEqual(set(), set(cfg.registers(b1.live_in)))
+        self.assertEqual({a, b, d}, set(cfg.registers(b1.live_out)))
 
         # Check block 2:
-        self.assertEqual({a, b}, b2.live_in)
-        self.assertEqual({b, d}, b2.live_out)
+        self.assertEqual({a, b}, set(cfg.registers(b2.live_in)))
+        self.assertEqual({b, d}, set(cfg.registers(b2.live_out)))
 
         # Check block 3:
-        self.assertEqual({b, d}, b3.live_in)
-        self.assertEqual(set(), b3.live_out)
+        self.assertEqual({b, d}, set(cfg.registers(b3.live_in)))
+        self.assertEqual(set(), set(cfg.registers(b3.live_out)))
 
         # Create interference graph:
         ig = InterferenceGraph()
@@ -272,7 +272,7 @@ class InterferenceGraphTestCase(unittest.TestCase):
         self.assertEqual(2, len(b2.predecessors))
 
         # Check that x is live at end of block 2
-        self.assertEqual({x}, b2.live_out)
+        self.assertEqual({x}, set(cfg.registers(b2.live_out)))
 
     def test_loop_variable(self):
         """
@@ -301,9 +301,9 @@ class InterferenceGraphTestCase(unittest.TestCase):
         b2 = cfg.get_node(i2)
         b3 = cfg.get_node(i5)
         self.assertEqual(3, len(cfg))
-        self.assertEqual({x}, b1.live_out)
-        self.assertEqual({x}, b2.live_out)
-        self.assertEqual({x}, b3.live_out)
+        self.assertEqual({x}, set(cfg.registers(b1.live_out)))
+        self.assertEqual({x}, set(cfg.registers(b2.live_out)))
+        self.assertEqual({x}, set(cfg.registers(b3.live_out)))
 
     def test_combine(self):
         t1 = ExampleRegister('t1')
@@ -2,10 +2,13 @@ import unittest
 from functools import reduce
 import operator
 import io
+import os
+import tempfile
 from ppci.common import CompilerError
 from ppci.lang.c import CBuilder, render_ast, CContext
 from ppci.lang.c import CSynthesizer, parse_type, print_ast
 from ppci.lang.c.options import COptions
+from ppci.lang.c.pch import create_pch, read_pch
 from ppci.lang.c.utils import replace_escape_codes
 from ppci.arch.example import ExampleArch
 from ppci.arch import get_arch
@@ -659,6 +662,77 @@ class CSynthesizerTestCase(unittest.TestCase):
         synthesizer.syn_module(ir_module)
 
 
+class PrecompiledHeaderTestCase(unittest.TestCase):
+    """ Test loading the state of a precompiled header """
+    header = """
+    #define ANSWER 42
+    struct s { char a; int b; };
+    typedef struct s s_t;
+    enum e { A = 3, B };
+    extern int x;
+    int get(s_t *s);
+    """
+    src = """
+    int x = ANSWER + B;
+    int get(s_t *s) { return s->b + sizeof(struct s); }
+    """
+
+    def make_pch(self, arch):
+        pch = create_pch(io.StringIO(self.header), arch.info, COptions())
+        f = io.BytesIO()
+        pch.save(f)
+        f.seek(0)
+        return read_pch(f)
+
+    def test_build(self):
+        arch = get_arch('arm')
+        coptions = COptions()
+        coptions.precompiled_header = self.make_pch(arch)
+        builder = CBuilder(arch.info, coptions)
+
+        # Each translation unit gets its own copy of the declarations:
+        for _ in range(2):
+            ir_module = builder.build(io.StringIO(self.src), None)
+            Verifier().verify(ir_module)
+            self.assertEqual(
+                ['get', 'x'], sorted(v.name for v in ir_module.variables +
+                                     ir_module.functions))
+
+    def test_other_target(self):
+        coptions = COptions()
+        coptions.precompiled_header = self.make_pch(get_arch('msp430'))
+        builder = CBuilder(get_arch('x86_64').info, coptions)
+        with self.assertRaisesRegex(CompilerError, 'another target'):
+            builder.build(io.StringIO(self.src), None)
+
+    def test_changed_include(self):
+        """ A precompiled header is rejected when an included file changed """
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        header = os.path.join(directory.name, 'header.h')
+        included = os.path.join(directory.name, 'included.h')
+        with open(header, 'w') as f:
+            f.write('#include "included.h"\n' + self.header)
+        with open(included, 'w') as f:
+            f.write('#define SIZE 1\n')
+
+        arch = get_arch('arm')
+        coptions = COptions()
+        with open(header) as f:
+            coptions.precompiled_header = create_pch(f, arch.info, coptions)
+        builder = CBuilder(arch.info, coptions)
+        builder.build(io.StringIO(self.src), None)
+
+        with open(included, 'w') as f:
+            f.write('#define SIZE 2\n')
+        with self.assertRaisesRegex(CompilerError, 'included.h changed'):
+            builder.build(io.StringIO(self.src), None)
+
+    def test_invalid(self):
+        with self.assertRaisesRegex(CompilerError, 'Not a precompiled'):
+            read_pch(io.BytesIO(b'int x;'))
+
+
 class CTypeInitializerTestCase(unittest.TestCase):
     """ Test if C-types are correctly initialized """
     def setUp(self):
@@ -1,10 +1,14 @@
 import unittest
 import io
+import os
+import tempfile
 from unittest import mock
 from ppci.common import CompilerError
 from ppci.lang.c import CPreProcessor
 from ppci.lang.c import COptions
 from ppci.lang.c import CTokenPrinter
+from ppci.lang.c.preprocessor import find_include_guard
+from ppci.lang.c.lexer import lex_text
 
 
 class CPreProcessorTestCase(unittest.TestCase):
@@ -473,5 +477,76 @@ class CPreProcessorTestCase(unittest.TestCase):
         self.preprocess(src, expected)
 
 
+class IncludeTestCase(unittest.TestCase):
+    """ Test the handling of included files """
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.coptions = COptions()
+        self.coptions.add_include_path(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_header(self, name, text):
+        with open(os.path.join(self.directory.name, name), 'w') as f:
+            f.write(text)
+
+    def preprocess(self, src):
+        preprocessor = CPreProcessor(self.coptions)
+        f = io.StringIO(src)
+        tokens = list(preprocessor.process_file(f, 'dummy.t'))
+        f2 = io.StringIO()
+        CTokenPrinter().dump(tokens, file=f2)
+        return f2.getvalue()
+
+    def test_include_guard(self):
+        """ A guarded header is only opened once """
+        self.write_header('a.h', """#ifndef A_H
+        #define A_H
+        int a;
+        #endif
+        """)
+        src = """#include "a.h"
+        #include <a.h>
+        int b;
+        """
+        with mock.patch('ppci.lang.c.lexer.open', create=True,
+                        side_effect=open) as mock_open:
+            output = self.preprocess(src)
+            self.assertEqual(1, mock_open.call_count)
+        self.assertEqual(1, output.count('int a;'))
+        self.assertIn('int b;', output)
+
+    def test_token_cache(self):
+        """ Headers are lexed once for several translation units """
+        self.write_header('b.h', "#define B 2\nint b = B;\n")
+        output = self.preprocess('#include "b.h"\n')
+        with mock.patch('ppci.lang.c.lexer.open', create=True) as mock_open:
+            self.assertEqual(output, self.preprocess('#include "b.h"\n'))
+            mock_open.assert_not_called()
+        self.assertIn('int b = 2;', output)
+
+    def test_unguarded(self):
+        """ A header which is not guarded is included every time """
+        self.write_header('c.h', "#ifndef C_H\n#define C_H\n#endif\nint c;")
+        output = self.preprocess('#include "c.h"\n#include "c.h"\n')
+        self.assertEqual(2, output.count('int c;'))
+
+    def test_find_include_guard(self):
+        def guard(text):
+            return find_include_guard(lex_text(text, self.coptions))
+        self.assertEqual('X', guard('#ifndef X\n#define X\nint x;\n#endif'))
+        self.assertEqual(
+            'X', guard('\n#if !defined(X)\n#define X 1\n#endif\n'))
+        self.assertIsNone(guard('#ifndef X\n#define Y\n#endif'))
+        self.assertIsNone(
+            guard('#ifndef X\n#define X\n#else\nint x;\n#endif'))
+        self.assertIsNone(
+            guard('#ifndef X\n#define X\n#endif\n#ifdef Y\n#endif'))
+        self.assertEqual(
+            'X', guard('#ifndef X\n#define X\n#if Y\n#else\n#endif\n'
+                       '#endif'))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,6 @@
 import io
 import unittest
+from unittest.mock import patch
 
 from ppci.common import CompilerError
 from ppci.lang.c import CLexer, lexer
@@ -158,5 +159,65 @@ class CLexerTestCase(unittest.TestCase):
             self.assertEqual(src, tokens[0].val)
 
 
+class FastCLexerTestCase(unittest.TestCase):
+    """ Check that the fast lexer gives the same tokens as the character
+    based lexer. """
+    def setUp(self):
+        self.coptions = COptions()
+
+    def tokenize(self, src, fast):
+        source_file = SourceFile('a.h')
+        with patch.object(CLexer, 'fast', fast):
+            lexer = CLexer(self.coptions)
+            tokens = lexer.lex(io.StringIO(src), source_file)
+            return [
+                (t.typ, t.val, t.space, t.first, t.loc.filename, t.loc.row,
+                 t.loc.col) for t in tokens]
+
+    def check(self, src):
+        tokens = self.tokenize(src, False)
+        self.assertEqual(tokens, self.tokenize(src, True))
+        return tokens
+
+    def test_same_tokens(self):
+        src = r"""
+        #include <stdio.h>
+        #define X(a, b) a ## b  /* a block
+            comment */ + 1
+        int main(void) {
+        \tchar *s = "tab\t\"" L"wide"; // comment
+            unsigned long x = 0x1fUL + 017 + 0b101 + .5e-3 + 1.f;
+            x <<= 2; x >>= 1; x = x->y... ?: '\'' + L'\x1f' + '\123';
+
+            return x;
+        }"""
+        self.check(src)
+
+    def test_continued_lines(self):
+        """ Test locations of tokens after glued lines """
+        tokens = self.check('a \\\nb c\\\\\nd \\\n\\\ne\\')
+        self.assertEqual(
+            ['a', 'b', 'c', '\\', '\\', 'd', 'e'], [t[1] for t in tokens])
+        self.assertEqual([1, 2, 2, 2, 2, 3, 5], [t[5] for t in tokens])
+
+    def test_end_of_file(self):
+        for src in ['', ' ', '\n', 'a\n', 'a\n\n  ', '/* */']:
+            self.check(src)
+
+    def test_trigraphs(self):
+        self.coptions.enable('trigraphs')
+        self.check('??=define a ??( b ??)')
+
+    def test_errors(self):
+        """ Lexical errors are reported by the character based lexer """
+        for src in ['"abc', "'ab'", 'a /* b', r'"\q"']:
+            with self.assertRaises(CompilerError):
+                self.tokenize(src, True)
+
+        self.coptions.set('std', 'c89')
+        with self.assertRaises(CompilerError):
+            self.tokenize('a // b', True)
+
+
 if __name__ == '__main__':
     unittest.main()
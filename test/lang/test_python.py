@@ -93,5 +93,106 @@ class PythonToIrCompilerTestCase(unittest.TestCase):
         python_to_ir(io.StringIO(src3))
 
 
+ir_fib = """module demo;
+function i32 fib(i32 n) {
+  fib_entry: {
+    i32 zero = 0;
+    i32 one = 1;
+    jmp fib_loop;
+  }
+  fib_loop: {
+    i32 a = phi fib_entry: zero, fib_loop: b;
+    i32 b = phi fib_entry: one, fib_loop: c;
+    i32 i = phi fib_entry: zero, fib_loop: j;
+    i32 c = a + b;
+    i32 j = i + one;
+    cjmp j < n ? fib_loop : fib_exit;
+  }
+  fib_exit: {
+    return a;
+  }
+}
+"""
+
+
+# A loop which can be entered at two blocks:
+ir_irreducible = """module demo;
+function i32 irr(i32 x) {
+  irr_entry: {
+    i32 zero = 0;
+    i32 one = 1;
+    i32 ten = 10;
+    cjmp x > zero ? irr_a : irr_b;
+  }
+  irr_a: {
+    i32 a = phi irr_entry: x, irr_b: b2;
+    i32 a2 = a + one;
+    jmp irr_b;
+  }
+  irr_b: {
+    i32 b = phi irr_entry: zero, irr_a: a2;
+    i32 b2 = b + one;
+    cjmp b2 < ten ? irr_a : irr_exit;
+  }
+  irr_exit: {
+    return b2;
+  }
+}
+"""
+
+
+class IrToPythonTestCase(unittest.TestCase):
+    """ Check the python code generated from ir code """
+    def compile(self, ir_source):
+        ir_module = irutils.read_module(io.StringIO(ir_source))
+        irutils.verify_module(ir_module)
+        f = io.StringIO()
+        api.ir_to_python([ir_module], f)
+        namespace = {}
+        exec(f.getvalue(), namespace)
+        return f.getvalue(), namespace
+
+    def test_loop(self):
+        """ The loop is generated as a while loop, and the phis are only
+        assigned when jumping to their block """
+        code, namespace = self.compile(ir_fib)
+        self.assertIn('while True:', code)
+        self.assertNotIn('current_block', code)
+
+        def fib(n):
+            a, b, i = 0, 1, 0
+            while True:
+                c = a + b
+                i += 1
+                if i < n:
+                    a, b = b, c
+                else:
+                    return a
+
+        for n in range(10):
+            self.assertEqual(fib(n), namespace['fib'](n))
+
+    def test_irreducible(self):
+        """ Control flow without structure uses the block switch """
+        code, namespace = self.compile(ir_irreducible)
+        self.assertIn('current_block', code)
+
+        def irr(x):
+            if x > 0:
+                a = x
+                b = a + 1
+            else:
+                b = 0
+            while True:
+                b2 = b + 1
+                if b2 < 10:
+                    b = b2 + 1
+                else:
+                    return b2
+
+        for x in range(-2, 12):
+            self.assertEqual(irr(x), namespace['irr'](x))
+
+
 if __name__ == '__main__':
     unittest.main()
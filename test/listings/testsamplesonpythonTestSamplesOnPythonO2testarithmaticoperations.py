@@ -0,0 +1,381 @@
+# Automatically generated on Sat Oct 17 02:32:17 2026
+# Generator /root/package/ppci/lang/python/ir2py.py
+
+import struct
+import math
+
+heap = bytearray()
+stack = bytearray()
+HEAP_START = 0x10000000
+func_pointers = list()
+externals = {}
+
+def correct(value, bits, signed):
+    base = 1 << bits
+    value %= base
+    if signed and value.bit_length() == bits:
+        return value - base
+    else:
+        return value
+
+def idiv(x, y):
+    return int(math.trunc(x/y))
+
+def irem(x, y):
+    sign = x < 0
+    v = abs(x) % abs(y)
+    if sign:
+        return -v
+    else:
+        return v
+
+def ishl(x, amount, bits):
+    amount = amount % bits
+    return x << amount
+def ishr(x, amount, bits):
+    amount = amount % bits
+    return x >> amount
+def _alloca(amount):
+    ptr = len(stack)
+    stack.extend(bytes(amount))
+    return (ptr, amount)
+
+def _free(amount):
+    for _ in range(amount):
+        stack.pop()
+
+def read_mem(address, size):
+    mem, address = get_memory(address)
+    assert address+size <= len(mem), str(hex(address))
+    return mem[address:address+size]
+
+def write_mem(address, data):
+    mem, address = get_memory(address)
+    size = len(data)
+    assert address+size <= len(mem), str(hex(address))
+    mem[address:address+size] = data
+
+def get_memory(v):
+    if v >= HEAP_START:
+        return heap, v - HEAP_START
+    else:
+        return stack, v
+
+def heap_top():
+    return len(heap) + HEAP_START
+
+def load_f64(p):
+    return struct.unpack("d", read_mem(p, 8))[0]
+
+def store_f64(v, p):
+    write_mem(p, struct.pack("d", v))
+
+def load_f32(p):
+    return struct.unpack("f", read_mem(p, 4))[0]
+
+def store_f32(v, p):
+    write_mem(p, struct.pack("f", v))
+
+def load_i64(p):
+    return struct.unpack("q", read_mem(p, 8))[0]
+
+def store_i64(v, p):
+    write_mem(p, struct.pack("q", v))
+
+def load_u64(p):
+    return struct.unpack("Q", read_mem(p, 8))[0]
+
+def store_u64(v, p):
+    write_mem(p, struct.pack("Q", v))
+
+def load_i32(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_i32(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_u32(p):
+    return struct.unpack("I", read_mem(p, 4))[0]
+
+def store_u32(v, p):
+    write_mem(p, struct.pack("I", v))
+
+def load_ptr(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_ptr(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_i16(p):
+    return struct.unpack("h", read_mem(p, 2))[0]
+
+def store_i16(v, p):
+    write_mem(p, struct.pack("h", v))
+
+def load_u16(p):
+    return struct.unpack("H", read_mem(p, 2))[0]
+
+def store_u16(v, p):
+    write_mem(p, struct.pack("H", v))
+
+def load_i8(p):
+    return struct.unpack("b", read_mem(p, 1))[0]
+
+def store_i8(v, p):
+    write_mem(p, struct.pack("b", v))
+
+def load_u8(p):
+    return struct.unpack("B", read_mem(p, 1))[0]
+
+def store_u8(v, p):
+    write_mem(p, struct.pack("B", v))
+
+
+# Module c3_code
+main_d = heap_top()
+heap.extend(bytes(4))
+main_x = heap_top()
+heap.extend(bytes(4))
+def io_print(txt):
+    cnst = 0
+    offset_5_12 = 4
+    mem_addr_6 = txt + offset_5_12
+    phi_var_i_0 = cnst
+    while True:
+        load_3 = load_i32(txt)
+        if phi_var_i_0 < load_3:
+            element_size = 1
+            element_offset_8 = int(round(phi_var_i_0))
+            element_address = mem_addr_6 + element_offset_8
+            load_9 = load_u8(element_address)
+            _fptr = bsp_putc
+            _fptr(load_9)
+            binop = phi_var_i_0 + element_size
+            binop = correct(binop, 32, True)
+            phi_var_i_0 = binop
+            continue
+        else:
+            return
+func_pointers.append(io_print)
+
+def io_print2(label,value):
+    _fptr = io_print
+    _fptr(label)
+    strval_3 = (io_print2_strval_3,6)
+    addr_4 = strval_3[0]
+    _fptr = io_print
+    _fptr(addr_4)
+    cnst_4_5 = 28
+    phi_var_b_0 = cnst_4_5
+    while True:
+        cnst_5 = 0
+        if phi_var_b_0 >= cnst_5:
+            binop = ishr(value, phi_var_b_0, 32)
+            binop = correct(binop, 32, True)
+            cnst_8 = 15
+            binop_9 = binop & cnst_8
+            binop_9 = correct(binop_9, 32, True)
+            cnst_11 = 10
+            if binop_9 < cnst_11:
+                cnst_12 = 48
+                binop_14 = cnst_12 + binop_9
+                binop_14 = correct(binop_14, 32, True)
+                cast = correct(int(round(binop_14)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast)
+            else:
+                cnst_27 = 55
+                binop_19 = cnst_27 + binop_9
+                binop_19 = correct(binop_19, 32, True)
+                cast_20 = correct(int(round(binop_19)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast_20)
+            cnst_22 = 4
+            binop_23 = phi_var_b_0 - cnst_22
+            binop_23 = correct(binop_23, 32, True)
+            phi_var_b_0 = binop_23
+            continue
+        else:
+            cnst_26 = 10
+            _fptr = bsp_putc
+            _fptr(cnst_26)
+            return
+func_pointers.append(io_print2)
+
+def io_print_int(i):
+    strval = (io_print_int_strval,6)
+    addr = strval[0]
+    _fptr = io_print
+    _fptr(addr)
+    cnst_4 = 28
+    phi_var_b_0 = cnst_4
+    while True:
+        cnst_5 = 0
+        if phi_var_b_0 >= cnst_5:
+            binop = ishr(i, phi_var_b_0, 32)
+            binop = correct(binop, 32, True)
+            cnst_8 = 15
+            binop_9 = binop & cnst_8
+            binop_9 = correct(binop_9, 32, True)
+            cnst_11 = 10
+            if binop_9 < cnst_11:
+                cnst_12 = 48
+                binop_14 = cnst_12 + binop_9
+                binop_14 = correct(binop_14, 32, True)
+                cast = correct(int(round(binop_14)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast)
+            else:
+                cnst_27 = 55
+                binop_19 = cnst_27 + binop_9
+                binop_19 = correct(binop_19, 32, True)
+                cast_20 = correct(int(round(binop_19)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast_20)
+            cnst_22 = 4
+            binop_23 = phi_var_b_0 - cnst_22
+            binop_23 = correct(binop_23, 32, True)
+            phi_var_b_0 = binop_23
+            continue
+        else:
+            cnst_26 = 10
+            _fptr = bsp_putc
+            _fptr(cnst_26)
+            return
+func_pointers.append(io_print_int)
+
+def io_print_sub(txt,start,end):
+    offset_12 = 4
+    mem_addr = txt + offset_12
+    phi_var_i_0 = start
+    while True:
+        if phi_var_i_0 < end:
+            element_size = 1
+            element_offset_8 = int(round(phi_var_i_0))
+            element_address = mem_addr + element_offset_8
+            load_9 = load_u8(element_address)
+            _fptr = bsp_putc
+            _fptr(load_9)
+            binop = phi_var_i_0 + element_size
+            binop = correct(binop, 32, True)
+            phi_var_i_0 = binop
+            continue
+        else:
+            return
+func_pointers.append(io_print_sub)
+
+def io_println(txt):
+    _fptr = io_print
+    _fptr(txt)
+    cnst_1 = 10
+    _fptr = bsp_putc
+    _fptr(cnst_1)
+    return
+func_pointers.append(io_println)
+
+def main_main():
+    cnst = 2
+    store_i32(cnst, main_d)
+    cnst_1 = 13
+    store_i32(cnst_1, main_x)
+    load_2_29_54 = load_i32(main_d)
+    binop_30_55 = idiv(cnst_1, load_2_29_54)
+    binop_30_55 = correct(binop_30_55, 32, True)
+    strval_31_56 = (main_main_strval_31_56,6)
+    addr_32_57 = strval_31_56[0]
+    _fptr = io_print2
+    _fptr(addr_32_57, binop_30_55)
+    load_4_33_58 = load_i32(main_x)
+    load_5_34_59 = load_i32(main_d)
+    binop_6_35_60 = load_4_33_58 - load_5_34_59
+    binop_6_35_60 = correct(binop_6_35_60, 32, True)
+    strval_7_36_61 = (main_main_strval_7_36_61,6)
+    addr_8_37_62 = strval_7_36_61[0]
+    _fptr = io_print2
+    _fptr(addr_8_37_62, binop_6_35_60)
+    load_10_38_63 = load_i32(main_x)
+    load_11_39_64 = load_i32(main_d)
+    binop_12_40_65 = irem(load_10_38_63, load_11_39_64)
+    binop_12_40_65 = correct(binop_12_40_65, 32, True)
+    strval_13_41_66 = (main_main_strval_13_41_66,6)
+    addr_14_42_67 = strval_13_41_66[0]
+    _fptr = io_print2
+    _fptr(addr_14_42_67, binop_12_40_65)
+    load_16_43_68 = load_i32(main_x)
+    load_17_44_69 = load_i32(main_d)
+    binop_18_45_70 = load_16_43_68 + load_17_44_69
+    binop_18_45_70 = correct(binop_18_45_70, 32, True)
+    strval_19_46_71 = (main_main_strval_19_46_71,6)
+    addr_20_47_72 = strval_19_46_71[0]
+    _fptr = io_print2
+    _fptr(addr_20_47_72, binop_18_45_70)
+    load_22_48_73 = load_i32(main_x)
+    cnst_23_49_74 = 15
+    binop_24_50_75 = load_22_48_73 ^ cnst_23_49_74
+    binop_24_50_75 = correct(binop_24_50_75, 32, True)
+    strval_25_51_76 = (main_main_strval_25_51_76,6)
+    addr_26_52_77 = strval_25_51_76[0]
+    _fptr = io_print2
+    _fptr(addr_26_52_77, binop_24_50_75)
+    return
+func_pointers.append(main_main)
+
+def main_set_x(v):
+    store_i32(v, main_x)
+    return
+func_pointers.append(main_set_x)
+
+io_print2_strval_3 = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(48)
+heap.append(120)
+io_print_int_strval = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(48)
+heap.append(120)
+main_main_strval_31_56 = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(119)
+heap.append(61)
+main_main_strval_7_36_61 = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(119)
+heap.append(61)
+main_main_strval_13_41_66 = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(119)
+heap.append(61)
+main_main_strval_19_46_71 = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(119)
+heap.append(61)
+main_main_strval_25_51_76 = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(119)
+heap.append(61)
+
+
+def bsp_putc(c):
+    print(chr(c), end="")
+main_main()
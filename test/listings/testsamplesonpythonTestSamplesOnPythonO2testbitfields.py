@@ -0,0 +1,720 @@
+# Automatically generated on Sat Oct 17 02:32:17 2026
+# Generator /root/package/ppci/lang/python/ir2py.py
+
+import struct
+import math
+
+heap = bytearray()
+stack = bytearray()
+HEAP_START = 0x10000000
+func_pointers = list()
+externals = {}
+
+def correct(value, bits, signed):
+    base = 1 << bits
+    value %= base
+    if signed and value.bit_length() == bits:
+        return value - base
+    else:
+        return value
+
+def idiv(x, y):
+    return int(math.trunc(x/y))
+
+def irem(x, y):
+    sign = x < 0
+    v = abs(x) % abs(y)
+    if sign:
+        return -v
+    else:
+        return v
+
+def ishl(x, amount, bits):
+    amount = amount % bits
+    return x << amount
+def ishr(x, amount, bits):
+    amount = amount % bits
+    return x >> amount
+def _alloca(amount):
+    ptr = len(stack)
+    stack.extend(bytes(amount))
+    return (ptr, amount)
+
+def _free(amount):
+    for _ in range(amount):
+        stack.pop()
+
+def read_mem(address, size):
+    mem, address = get_memory(address)
+    assert address+size <= len(mem), str(hex(address))
+    return mem[address:address+size]
+
+def write_mem(address, data):
+    mem, address = get_memory(address)
+    size = len(data)
+    assert address+size <= len(mem), str(hex(address))
+    mem[address:address+size] = data
+
+def get_memory(v):
+    if v >= HEAP_START:
+        return heap, v - HEAP_START
+    else:
+        return stack, v
+
+def heap_top():
+    return len(heap) + HEAP_START
+
+def load_f64(p):
+    return struct.unpack("d", read_mem(p, 8))[0]
+
+def store_f64(v, p):
+    write_mem(p, struct.pack("d", v))
+
+def load_f32(p):
+    return struct.unpack("f", read_mem(p, 4))[0]
+
+def store_f32(v, p):
+    write_mem(p, struct.pack("f", v))
+
+def load_i64(p):
+    return struct.unpack("q", read_mem(p, 8))[0]
+
+def store_i64(v, p):
+    write_mem(p, struct.pack("q", v))
+
+def load_u64(p):
+    return struct.unpack("Q", read_mem(p, 8))[0]
+
+def store_u64(v, p):
+    write_mem(p, struct.pack("Q", v))
+
+def load_i32(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_i32(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_u32(p):
+    return struct.unpack("I", read_mem(p, 4))[0]
+
+def store_u32(v, p):
+    write_mem(p, struct.pack("I", v))
+
+def load_ptr(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_ptr(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_i16(p):
+    return struct.unpack("h", read_mem(p, 2))[0]
+
+def store_i16(v, p):
+    write_mem(p, struct.pack("h", v))
+
+def load_u16(p):
+    return struct.unpack("H", read_mem(p, 2))[0]
+
+def store_u16(v, p):
+    write_mem(p, struct.pack("H", v))
+
+def load_i8(p):
+    return struct.unpack("b", read_mem(p, 1))[0]
+
+def store_i8(v, p):
+    write_mem(p, struct.pack("b", v))
+
+def load_u8(p):
+    return struct.unpack("B", read_mem(p, 1))[0]
+
+def store_u8(v, p):
+    write_mem(p, struct.pack("B", v))
+
+
+# Module main
+def reverse(str,length):
+    constant = 0
+    constant_0 = 1
+    op = length - constant_0
+    op = correct(op, 32, True)
+    phi_end_alloc_0, phi_start_alloc_0 = op, constant
+    while True:
+        if phi_start_alloc_0 < phi_end_alloc_0:
+            index = int(round(phi_start_alloc_0))
+            element_address = str + index
+            load_7 = load_i8(element_address)
+            index_17 = int(round(phi_end_alloc_0))
+            element_address_19 = str + index_17
+            load_20 = load_i8(element_address_19)
+            store_i8(load_20, element_address)
+            store_i8(load_7, element_address_19)
+            one = 1
+            inc = phi_start_alloc_0 + one
+            inc = correct(inc, 32, True)
+            inc_31 = phi_end_alloc_0 - one
+            inc_31 = correct(inc_31, 32, True)
+            phi_end_alloc_0, phi_start_alloc_0 = inc_31, inc
+            continue
+        else:
+            return
+func_pointers.append(reverse)
+
+def itoa(value,str,base):
+    current_block = 0
+    while True:
+        if current_block < 6:
+            if current_block < 3:
+                if current_block < 1:
+                    constant = 0
+                    if value == constant:
+                        current_block = 2
+                    else:
+                        current_block = 1
+                else:
+                    if current_block < 2:
+                        constant_16 = 0
+                        if value < constant_16:
+                            current_block = 4
+                        else:
+                            phi_neg_alloc_0, phi_value_alloc_0 = constant, value
+                            current_block = 3
+                    else:
+                        constant_6 = 48
+                        store_i8(constant_6, str)
+                        casted_72 = 1
+                        element_address_12 = str + casted_72
+                        constant_13 = 0
+                        store_i8(constant_13, element_address_12)
+                        return str
+            else:
+                if current_block < 4:
+                    phi_i_alloc_0, phi_value_alloc_1 = constant, phi_value_alloc_0
+                    current_block = 5
+                else:
+                    if current_block < 5:
+                        constant_17 = 1
+                        unop = -value
+                        unop = correct(unop, 32, True)
+                        phi_neg_alloc_0, phi_value_alloc_0 = constant_17, unop
+                        current_block = 3
+                    else:
+                        constant_20 = 0
+                        if phi_value_alloc_1 != constant_20:
+                            current_block = 6
+                        else:
+                            current_block = 7
+        else:
+            if current_block < 9:
+                if current_block < 7:
+                    op = irem(phi_value_alloc_1, base)
+                    op = correct(op, 32, True)
+                    one_27 = 1
+                    inc_28 = phi_i_alloc_0 + one_27
+                    inc_28 = correct(inc_28, 32, True)
+                    index_30 = int(round(phi_i_alloc_0))
+                    element_address_32 = str + index_30
+                    cnst = 48
+                    op_35 = op + cnst
+                    op_35 = correct(op_35, 32, True)
+                    typecast_36 = correct(int(round(op_35)), 8, True)
+                    store_i8(typecast_36, element_address_32)
+                    op_39 = idiv(phi_value_alloc_1, base)
+                    op_39 = correct(op_39, 32, True)
+                    phi_i_alloc_0, phi_value_alloc_1 = inc_28, op_39
+                    current_block = 5
+                else:
+                    if current_block < 8:
+                        zero = 0
+                        if phi_neg_alloc_0 == zero:
+                            phi_i_alloc_1 = phi_i_alloc_0
+                            current_block = 8
+                        else:
+                            current_block = 9
+                    else:
+                        index_53 = int(round(phi_i_alloc_1))
+                        element_address_55 = str + index_53
+                        cnst_62 = 0
+                        store_i8(cnst_62, element_address_55)
+                        constant_64_73 = 0
+                        constant_0_65_74 = 1
+                        op_66_75 = phi_i_alloc_1 - constant_0_65_74
+                        op_66_75 = correct(op_66_75, 32, True)
+                        phi_end_alloc_0, phi_start_alloc_0 = op_66_75, constant_64_73
+                        current_block = 11
+            else:
+                if current_block < 11:
+                    if current_block < 10:
+                        one_43 = 1
+                        inc_44 = phi_i_alloc_0 + one_43
+                        inc_44 = correct(inc_44, 32, True)
+                        index_46 = int(round(phi_i_alloc_0))
+                        element_address_48 = str + index_46
+                        constant_49 = 45
+                        store_i8(constant_49, element_address_48)
+                        phi_i_alloc_1 = inc_44
+                        current_block = 8
+                    else:
+                        return str
+                else:
+                    if current_block < 12:
+                        if phi_start_alloc_0 < phi_end_alloc_0:
+                            current_block = 12
+                        else:
+                            current_block = 10
+                    else:
+                        index_67 = int(round(phi_start_alloc_0))
+                        element_address_68 = str + index_67
+                        load_7_69 = load_i8(element_address_68)
+                        index_17 = int(round(phi_end_alloc_0))
+                        element_address_19 = str + index_17
+                        load_20 = load_i8(element_address_19)
+                        store_i8(load_20, element_address_68)
+                        store_i8(load_7_69, element_address_19)
+                        one_70 = 1
+                        inc_71 = phi_start_alloc_0 + one_70
+                        inc_71 = correct(inc_71, 32, True)
+                        inc_31 = phi_end_alloc_0 - one_70
+                        inc_31 = correct(inc_31, 32, True)
+                        phi_end_alloc_0, phi_start_alloc_0 = inc_31, inc_71
+                        current_block = 11
+    
+func_pointers.append(itoa)
+
+def printf(txt,varargz):
+    _stack_top = len(stack)
+    buffer_alloc = _alloca(20)
+    buffer_addr = buffer_alloc[0]
+    phi_args_alloc_2, phi_txt_alloc_2 = varargz, txt
+    while True:
+        load_0 = load_i8(phi_txt_alloc_2)
+        typecast = correct(int(round(load_0)), 32, True)
+        constant = 0
+        if typecast != constant:
+            constant_3 = 37
+            if load_0 == constant_3:
+                one_element = 1
+                inc = phi_txt_alloc_2 + one_element
+                load_6 = load_i8(inc)
+                constant_7 = 100
+                if load_6 == constant_7:
+                    new_fold = 2
+                    inc_10 = phi_txt_alloc_2 + new_fold
+                    va_arg = load_i32(phi_args_alloc_2)
+                    size = 4
+                    incptr = phi_args_alloc_2 + size
+                    constant_13 = 10
+                    _fptr = itoa
+                    result = _fptr(va_arg, buffer_addr, constant_13)
+                    varargs = 0
+                    _fptr = printf
+                    result_14 = _fptr(buffer_addr, varargs)
+                    phi_args_alloc_0, phi_txt_alloc_0 = incptr, inc_10
+                else:
+                    one_element_16 = 1
+                    inc_17 = inc - one_element_16
+                    load_19 = load_i8(inc_17)
+                    _fptr = bsp_putc
+                    _fptr(load_19)
+                    inc_22 = inc_17 + one_element_16
+                    load_24 = load_i8(inc_22)
+                    _fptr = bsp_putc
+                    _fptr(load_24)
+                    phi_args_alloc_0, phi_txt_alloc_0 = phi_args_alloc_2, inc_22
+                phi_args_alloc_1, phi_txt_alloc_1 = phi_args_alloc_0, phi_txt_alloc_0
+            else:
+                _fptr = bsp_putc
+                _fptr(load_0)
+                one_element_28 = 1
+                inc_29 = phi_txt_alloc_2 + one_element_28
+                phi_args_alloc_1, phi_txt_alloc_1 = phi_args_alloc_2, inc_29
+            phi_args_alloc_2, phi_txt_alloc_2 = phi_args_alloc_1, phi_txt_alloc_1
+            continue
+        else:
+            zero = 0
+            del stack[_stack_top:]
+            return zero
+func_pointers.append(printf)
+
+
+
+# Module main
+def main_main():
+    _stack_top = len(stack)
+    u_alloc = _alloca(2)
+    u_addr = u_alloc[0]
+    cnst_274 = 7
+    loaded = load_u8(u_addr)
+    inv_mask = 248
+    loaded_masked = loaded & inv_mask
+    loaded_masked = correct(loaded_masked, 8, False)
+    value_0 = loaded_masked | cnst_274
+    value_0 = correct(value_0, 8, False)
+    store_u8(value_0, u_addr)
+    loaded_4 = load_u16(u_addr)
+    shift = 3
+    cnst_278 = 336
+    mask_6 = 32760
+    inv_mask_8 = 32775
+    loaded_masked_9 = loaded_4 & inv_mask_8
+    loaded_masked_9 = correct(loaded_masked_9, 16, False)
+    value_10 = loaded_masked_9 | cnst_278
+    value_10 = correct(value_10, 16, False)
+    store_u16(value_10, u_addr)
+    cstr = (main_main_cstr,8)
+    dptr = cstr[0]
+    varargs = _alloca(4)
+    vaptr = varargs[0]
+    loaded_12 = load_u8(u_addr)
+    value_14 = loaded_12 & cnst_274
+    value_14 = correct(value_14, 8, False)
+    cast_15 = correct(int(round(value_14)), 32, False)
+    typecast_16 = correct(int(round(cast_15)), 32, True)
+    store_i32(typecast_16, vaptr)
+    _fptr = printf
+    result = _fptr(dptr, vaptr)
+    loaded_19 = load_u8(u_addr)
+    value_21 = loaded_19 & cnst_274
+    value_21 = correct(value_21, 8, False)
+    cast_22 = correct(int(round(value_21)), 32, False)
+    one = 1
+    inc = cast_22 + one
+    inc = correct(inc, 32, False)
+    cast_23 = correct(int(round(inc)), 8, False)
+    loaded_24 = load_u8(u_addr)
+    value_26 = cast_23 & cnst_274
+    value_26 = correct(value_26, 8, False)
+    loaded_masked_28 = loaded_24 & inv_mask
+    loaded_masked_28 = correct(loaded_masked_28, 8, False)
+    value_29 = loaded_masked_28 | value_26
+    value_29 = correct(value_29, 8, False)
+    store_u8(value_29, u_addr)
+    cstr_30 = (main_main_cstr_30,8)
+    dptr_31 = cstr_30[0]
+    varargs_32 = _alloca(4)
+    vaptr_33 = varargs_32[0]
+    value_38 = value_29 & cnst_274
+    value_38 = correct(value_38, 8, False)
+    cast_39 = correct(int(round(value_38)), 32, False)
+    typecast_40 = correct(int(round(cast_39)), 32, True)
+    store_i32(typecast_40, vaptr_33)
+    _fptr = printf
+    result_43 = _fptr(dptr_31, vaptr_33)
+    cstr_44 = (main_main_cstr_44,8)
+    dptr_45 = cstr_44[0]
+    varargs_46 = _alloca(4)
+    vaptr_47 = varargs_46[0]
+    loaded_50 = load_u16(u_addr)
+    value_52 = loaded_50 & mask_6
+    value_52 = correct(value_52, 16, False)
+    value_54 = ishr(value_52, shift, 16)
+    value_54 = correct(value_54, 16, False)
+    cast_55 = correct(int(round(value_54)), 32, False)
+    typecast_56 = correct(int(round(cast_55)), 32, True)
+    store_i32(typecast_56, vaptr_47)
+    _fptr = printf
+    result_59 = _fptr(dptr_45, vaptr_47)
+    loaded_62 = load_u16(u_addr)
+    value_64 = loaded_62 & mask_6
+    value_64 = correct(value_64, 16, False)
+    value_66 = ishr(value_64, shift, 16)
+    value_66 = correct(value_66, 16, False)
+    cast_67 = correct(int(round(value_66)), 32, False)
+    inc_69 = cast_67 + one
+    inc_69 = correct(inc_69, 32, False)
+    cast_70 = correct(int(round(inc_69)), 16, False)
+    loaded_71 = load_u16(u_addr)
+    value_73 = ishl(cast_70, shift, 16)
+    value_73 = correct(value_73, 16, False)
+    value_75 = value_73 & mask_6
+    value_75 = correct(value_75, 16, False)
+    loaded_masked_77 = loaded_71 & inv_mask_8
+    loaded_masked_77 = correct(loaded_masked_77, 16, False)
+    value_78 = loaded_masked_77 | value_75
+    value_78 = correct(value_78, 16, False)
+    store_u16(value_78, u_addr)
+    cstr_79 = (main_main_cstr_79,8)
+    dptr_80 = cstr_79[0]
+    varargs_81 = _alloca(4)
+    vaptr_82 = varargs_81[0]
+    value_87 = value_78 & mask_6
+    value_87 = correct(value_87, 16, False)
+    value_89 = ishr(value_87, shift, 16)
+    value_89 = correct(value_89, 16, False)
+    cast_90 = correct(int(round(value_89)), 32, False)
+    typecast_91 = correct(int(round(cast_90)), 32, True)
+    store_i32(typecast_91, vaptr_82)
+    _fptr = printf
+    result_94 = _fptr(dptr_80, vaptr_82)
+    s_alloc = _alloca(2)
+    s_addr = s_alloc[0]
+    cnst_280 = 3
+    loaded_97 = load_u8(s_addr)
+    loaded_masked_101 = loaded_97 & inv_mask
+    loaded_masked_101 = correct(loaded_masked_101, 8, False)
+    value_102 = loaded_masked_101 | cnst_280
+    value_102 = correct(value_102, 8, False)
+    store_u8(value_102, s_addr)
+    loaded_105 = load_u8(s_addr)
+    cnst_283 = 56
+    mask_108 = 120
+    inv_mask_110 = 135
+    loaded_masked_111 = loaded_105 & inv_mask_110
+    loaded_masked_111 = correct(loaded_masked_111, 8, False)
+    value_112 = loaded_masked_111 | cnst_283
+    value_112 = correct(value_112, 8, False)
+    store_u8(value_112, s_addr)
+    constant_113 = 1
+    loaded_115 = load_u16(s_addr)
+    shift_116 = 7
+    cnst_286 = 128
+    mask_118 = 384
+    inv_mask_120 = 65151
+    loaded_masked_121 = loaded_115 & inv_mask_120
+    loaded_masked_121 = correct(loaded_masked_121, 16, False)
+    value_122 = loaded_masked_121 | cnst_286
+    value_122 = correct(value_122, 16, False)
+    store_u16(value_122, s_addr)
+    cstr_125 = (main_main_cstr_125,8)
+    dptr_126 = cstr_125[0]
+    varargs_127 = _alloca(4)
+    vaptr_128 = varargs_127[0]
+    loaded_131 = load_i8(s_addr)
+    left_shift = 5
+    value_132 = ishl(loaded_131, left_shift, 8)
+    value_132 = correct(value_132, 8, True)
+    value_133 = ishr(value_132, left_shift, 8)
+    value_133 = correct(value_133, 8, True)
+    cast_134 = correct(int(round(value_133)), 32, True)
+    typecast_135 = correct(int(round(cast_134)), 32, True)
+    store_i32(typecast_135, vaptr_128)
+    _fptr = printf
+    result_138 = _fptr(dptr_126, vaptr_128)
+    loaded_141 = load_i8(s_addr)
+    value_143 = ishl(loaded_141, left_shift, 8)
+    value_143 = correct(value_143, 8, True)
+    value_145 = ishr(value_143, left_shift, 8)
+    value_145 = correct(value_145, 8, True)
+    cast_146 = correct(int(round(value_145)), 32, True)
+    inc_148 = cast_146 + constant_113
+    inc_148 = correct(inc_148, 32, True)
+    cast_149 = correct(int(round(inc_148)), 8, False)
+    loaded_150 = load_u8(s_addr)
+    value_152 = cast_149 & cnst_274
+    value_152 = correct(value_152, 8, False)
+    loaded_masked_154 = loaded_150 & inv_mask
+    loaded_masked_154 = correct(loaded_masked_154, 8, False)
+    value_155 = loaded_masked_154 | value_152
+    value_155 = correct(value_155, 8, False)
+    store_u8(value_155, s_addr)
+    cstr_156 = (main_main_cstr_156,8)
+    dptr_157 = cstr_156[0]
+    varargs_158 = _alloca(4)
+    vaptr_159 = varargs_158[0]
+    loaded_162 = load_i8(s_addr)
+    value_164 = ishl(loaded_162, left_shift, 8)
+    value_164 = correct(value_164, 8, True)
+    value_166 = ishr(value_164, left_shift, 8)
+    value_166 = correct(value_166, 8, True)
+    cast_167 = correct(int(round(value_166)), 32, True)
+    typecast_168 = correct(int(round(cast_167)), 32, True)
+    store_i32(typecast_168, vaptr_159)
+    _fptr = printf
+    result_171 = _fptr(dptr_157, vaptr_159)
+    cstr_172 = (main_main_cstr_172,8)
+    dptr_173 = cstr_172[0]
+    varargs_174 = _alloca(4)
+    vaptr_175 = varargs_174[0]
+    loaded_178 = load_i8(s_addr)
+    left_shift_179 = 1
+    value_180 = ishl(loaded_178, left_shift_179, 8)
+    value_180 = correct(value_180, 8, True)
+    right_shift_181 = 4
+    value_182 = ishr(value_180, right_shift_181, 8)
+    value_182 = correct(value_182, 8, True)
+    cast_183 = correct(int(round(value_182)), 32, True)
+    typecast_184 = correct(int(round(cast_183)), 32, True)
+    store_i32(typecast_184, vaptr_175)
+    _fptr = printf
+    result_187 = _fptr(dptr_173, vaptr_175)
+    loaded_190 = load_i8(s_addr)
+    value_192 = ishl(loaded_190, left_shift_179, 8)
+    value_192 = correct(value_192, 8, True)
+    value_194 = ishr(value_192, right_shift_181, 8)
+    value_194 = correct(value_194, 8, True)
+    cast_195 = correct(int(round(value_194)), 32, True)
+    inc_197 = cast_195 + constant_113
+    inc_197 = correct(inc_197, 32, True)
+    cast_198 = correct(int(round(inc_197)), 8, False)
+    loaded_199 = load_u8(s_addr)
+    value_201 = ishl(cast_198, cnst_280, 8)
+    value_201 = correct(value_201, 8, False)
+    value_203 = value_201 & mask_108
+    value_203 = correct(value_203, 8, False)
+    loaded_masked_205 = loaded_199 & inv_mask_110
+    loaded_masked_205 = correct(loaded_masked_205, 8, False)
+    value_206 = loaded_masked_205 | value_203
+    value_206 = correct(value_206, 8, False)
+    store_u8(value_206, s_addr)
+    cstr_207 = (main_main_cstr_207,8)
+    dptr_208 = cstr_207[0]
+    varargs_209 = _alloca(4)
+    vaptr_210 = varargs_209[0]
+    loaded_213 = load_i8(s_addr)
+    value_215 = ishl(loaded_213, left_shift_179, 8)
+    value_215 = correct(value_215, 8, True)
+    value_217 = ishr(value_215, right_shift_181, 8)
+    value_217 = correct(value_217, 8, True)
+    cast_218 = correct(int(round(value_217)), 32, True)
+    typecast_219 = correct(int(round(cast_218)), 32, True)
+    store_i32(typecast_219, vaptr_210)
+    _fptr = printf
+    result_222 = _fptr(dptr_208, vaptr_210)
+    cstr_223 = (main_main_cstr_223,8)
+    dptr_224 = cstr_223[0]
+    varargs_225 = _alloca(4)
+    vaptr_226 = varargs_225[0]
+    loaded_229 = load_i16(s_addr)
+    left_shift_230 = 7
+    value_231 = ishl(loaded_229, left_shift_230, 16)
+    value_231 = correct(value_231, 16, True)
+    right_shift_232 = 14
+    value_233 = ishr(value_231, right_shift_232, 16)
+    value_233 = correct(value_233, 16, True)
+    cast_234 = correct(int(round(value_233)), 32, True)
+    typecast_235 = correct(int(round(cast_234)), 32, True)
+    store_i32(typecast_235, vaptr_226)
+    _fptr = printf
+    result_238 = _fptr(dptr_224, vaptr_226)
+    loaded_241 = load_i16(s_addr)
+    value_243 = ishl(loaded_241, left_shift_230, 16)
+    value_243 = correct(value_243, 16, True)
+    value_245 = ishr(value_243, right_shift_232, 16)
+    value_245 = correct(value_245, 16, True)
+    cast_246 = correct(int(round(value_245)), 32, True)
+    inc_248 = cast_246 + constant_113
+    inc_248 = correct(inc_248, 32, True)
+    cast_249 = correct(int(round(inc_248)), 16, False)
+    loaded_250 = load_u16(s_addr)
+    value_252 = ishl(cast_249, shift_116, 16)
+    value_252 = correct(value_252, 16, False)
+    value_254 = value_252 & mask_118
+    value_254 = correct(value_254, 16, False)
+    loaded_masked_256 = loaded_250 & inv_mask_120
+    loaded_masked_256 = correct(loaded_masked_256, 16, False)
+    value_257 = loaded_masked_256 | value_254
+    value_257 = correct(value_257, 16, False)
+    store_u16(value_257, s_addr)
+    cstr_258 = (main_main_cstr_258,8)
+    dptr_259 = cstr_258[0]
+    varargs_260 = _alloca(4)
+    vaptr_261 = varargs_260[0]
+    loaded_264 = load_i16(s_addr)
+    value_266 = ishl(loaded_264, left_shift_230, 16)
+    value_266 = correct(value_266, 16, True)
+    value_268 = ishr(value_266, right_shift_232, 16)
+    value_268 = correct(value_268, 16, True)
+    cast_269 = correct(int(round(value_268)), 32, True)
+    typecast_270 = correct(int(round(cast_269)), 32, True)
+    store_i32(typecast_270, vaptr_261)
+    _fptr = printf
+    result_273 = _fptr(dptr_259, vaptr_261)
+    zero = 0
+    del stack[_stack_top:]
+    return zero
+func_pointers.append(main_main)
+
+main_main_cstr = heap_top()
+heap.append(117)
+heap.append(46)
+heap.append(98)
+heap.append(61)
+heap.append(37)
+heap.append(100)
+heap.append(10)
+heap.append(0)
+main_main_cstr_30 = heap_top()
+heap.append(117)
+heap.append(46)
+heap.append(98)
+heap.append(61)
+heap.append(37)
+heap.append(100)
+heap.append(10)
+heap.append(0)
+main_main_cstr_44 = heap_top()
+heap.append(117)
+heap.append(46)
+heap.append(99)
+heap.append(61)
+heap.append(37)
+heap.append(100)
+heap.append(10)
+heap.append(0)
+main_main_cstr_79 = heap_top()
+heap.append(117)
+heap.append(46)
+heap.append(99)
+heap.append(61)
+heap.append(37)
+heap.append(100)
+heap.append(10)
+heap.append(0)
+main_main_cstr_125 = heap_top()
+heap.append(115)
+heap.append(46)
+heap.append(98)
+heap.append(61)
+heap.append(37)
+heap.append(100)
+heap.append(10)
+heap.append(0)
+main_main_cstr_156 = heap_top()
+heap.append(115)
+heap.append(46)
+heap.append(98)
+heap.append(61)
+heap.append(37)
+heap.append(100)
+heap.append(10)
+heap.append(0)
+main_main_cstr_172 = heap_top()
+heap.append(115)
+heap.append(46)
+heap.append(99)
+heap.append(61)
+heap.append(37)
+heap.append(100)
+heap.append(10)
+heap.append(0)
+main_main_cstr_207 = heap_top()
+heap.append(115)
+heap.append(46)
+heap.append(99)
+heap.append(61)
+heap.append(37)
+heap.append(100)
+heap.append(10)
+heap.append(0)
+main_main_cstr_223 = heap_top()
+heap.append(115)
+heap.append(46)
+heap.append(100)
+heap.append(61)
+heap.append(37)
+heap.append(100)
+heap.append(10)
+heap.append(0)
+main_main_cstr_258 = heap_top()
+heap.append(115)
+heap.append(46)
+heap.append(100)
+heap.append(61)
+heap.append(37)
+heap.append(100)
+heap.append(10)
+heap.append(0)
+
+
+def bsp_putc(c):
+    print(chr(c), end="")
+main_main()
@@ -0,0 +1,362 @@
+# Automatically generated on Sat Oct 17 02:32:18 2026
+# Generator /root/package/ppci/lang/python/ir2py.py
+
+import struct
+import math
+
+heap = bytearray()
+stack = bytearray()
+HEAP_START = 0x10000000
+func_pointers = list()
+externals = {}
+
+def correct(value, bits, signed):
+    base = 1 << bits
+    value %= base
+    if signed and value.bit_length() == bits:
+        return value - base
+    else:
+        return value
+
+def idiv(x, y):
+    return int(math.trunc(x/y))
+
+def irem(x, y):
+    sign = x < 0
+    v = abs(x) % abs(y)
+    if sign:
+        return -v
+    else:
+        return v
+
+def ishl(x, amount, bits):
+    amount = amount % bits
+    return x << amount
+def ishr(x, amount, bits):
+    amount = amount % bits
+    return x >> amount
+def _alloca(amount):
+    ptr = len(stack)
+    stack.extend(bytes(amount))
+    return (ptr, amount)
+
+def _free(amount):
+    for _ in range(amount):
+        stack.pop()
+
+def read_mem(address, size):
+    mem, address = get_memory(address)
+    assert address+size <= len(mem), str(hex(address))
+    return mem[address:address+size]
+
+def write_mem(address, data):
+    mem, address = get_memory(address)
+    size = len(data)
+    assert address+size <= len(mem), str(hex(address))
+    mem[address:address+size] = data
+
+def get_memory(v):
+    if v >= HEAP_START:
+        return heap, v - HEAP_START
+    else:
+        return stack, v
+
+def heap_top():
+    return len(heap) + HEAP_START
+
+def load_f64(p):
+    return struct.unpack("d", read_mem(p, 8))[0]
+
+def store_f64(v, p):
+    write_mem(p, struct.pack("d", v))
+
+def load_f32(p):
+    return struct.unpack("f", read_mem(p, 4))[0]
+
+def store_f32(v, p):
+    write_mem(p, struct.pack("f", v))
+
+def load_i64(p):
+    return struct.unpack("q", read_mem(p, 8))[0]
+
+def store_i64(v, p):
+    write_mem(p, struct.pack("q", v))
+
+def load_u64(p):
+    return struct.unpack("Q", read_mem(p, 8))[0]
+
+def store_u64(v, p):
+    write_mem(p, struct.pack("Q", v))
+
+def load_i32(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_i32(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_u32(p):
+    return struct.unpack("I", read_mem(p, 4))[0]
+
+def store_u32(v, p):
+    write_mem(p, struct.pack("I", v))
+
+def load_ptr(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_ptr(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_i16(p):
+    return struct.unpack("h", read_mem(p, 2))[0]
+
+def store_i16(v, p):
+    write_mem(p, struct.pack("h", v))
+
+def load_u16(p):
+    return struct.unpack("H", read_mem(p, 2))[0]
+
+def store_u16(v, p):
+    write_mem(p, struct.pack("H", v))
+
+def load_i8(p):
+    return struct.unpack("b", read_mem(p, 1))[0]
+
+def store_i8(v, p):
+    write_mem(p, struct.pack("b", v))
+
+def load_u8(p):
+    return struct.unpack("B", read_mem(p, 1))[0]
+
+def store_u8(v, p):
+    write_mem(p, struct.pack("B", v))
+
+
+# Module main
+def reverse(str,length):
+    constant = 0
+    constant_0 = 1
+    op = length - constant_0
+    op = correct(op, 32, True)
+    phi_end_alloc_0, phi_start_alloc_0 = op, constant
+    while True:
+        if phi_start_alloc_0 < phi_end_alloc_0:
+            index = int(round(phi_start_alloc_0))
+            element_address = str + index
+            load_7 = load_i8(element_address)
+            index_17 = int(round(phi_end_alloc_0))
+            element_address_19 = str + index_17
+            load_20 = load_i8(element_address_19)
+            store_i8(load_20, element_address)
+            store_i8(load_7, element_address_19)
+            one = 1
+            inc = phi_start_alloc_0 + one
+            inc = correct(inc, 32, True)
+            inc_31 = phi_end_alloc_0 - one
+            inc_31 = correct(inc_31, 32, True)
+            phi_end_alloc_0, phi_start_alloc_0 = inc_31, inc
+            continue
+        else:
+            return
+func_pointers.append(reverse)
+
+def itoa(value,str,base):
+    current_block = 0
+    while True:
+        if current_block < 6:
+            if current_block < 3:
+                if current_block < 1:
+                    constant = 0
+                    if value == constant:
+                        current_block = 2
+                    else:
+                        current_block = 1
+                else:
+                    if current_block < 2:
+                        constant_16 = 0
+                        if value < constant_16:
+                            current_block = 4
+                        else:
+                            phi_neg_alloc_0, phi_value_alloc_1 = constant, value
+                            current_block = 3
+                    else:
+                        constant_6 = 48
+                        store_i8(constant_6, str)
+                        casted_72 = 1
+                        element_address_12 = str + casted_72
+                        constant_13 = 0
+                        store_i8(constant_13, element_address_12)
+                        return str
+            else:
+                if current_block < 4:
+                    phi_i_alloc_1, phi_value_alloc_0 = constant, phi_value_alloc_1
+                    current_block = 5
+                else:
+                    if current_block < 5:
+                        constant_17 = 1
+                        unop = -value
+                        unop = correct(unop, 32, True)
+                        phi_neg_alloc_0, phi_value_alloc_1 = constant_17, unop
+                        current_block = 3
+                    else:
+                        constant_20 = 0
+                        if phi_value_alloc_0 != constant_20:
+                            current_block = 6
+                        else:
+                            current_block = 7
+        else:
+            if current_block < 9:
+                if current_block < 7:
+                    op = irem(phi_value_alloc_0, base)
+                    op = correct(op, 32, True)
+                    one_27 = 1
+                    inc_28 = phi_i_alloc_1 + one_27
+                    inc_28 = correct(inc_28, 32, True)
+                    index_30 = int(round(phi_i_alloc_1))
+                    element_address_32 = str + index_30
+                    cnst = 48
+                    op_35 = op + cnst
+                    op_35 = correct(op_35, 32, True)
+                    typecast_36 = correct(int(round(op_35)), 8, True)
+                    store_i8(typecast_36, element_address_32)
+                    op_39 = idiv(phi_value_alloc_0, base)
+                    op_39 = correct(op_39, 32, True)
+                    phi_i_alloc_1, phi_value_alloc_0 = inc_28, op_39
+                    current_block = 5
+                else:
+                    if current_block < 8:
+                        zero = 0
+                        if phi_neg_alloc_0 == zero:
+                            phi_i_alloc_0 = phi_i_alloc_1
+                            current_block = 8
+                        else:
+                            current_block = 9
+                    else:
+                        index_53 = int(round(phi_i_alloc_0))
+                        element_address_55 = str + index_53
+                        cnst_62 = 0
+                        store_i8(cnst_62, element_address_55)
+                        constant_64_73 = 0
+                        constant_0_65_74 = 1
+                        op_66_75 = phi_i_alloc_0 - constant_0_65_74
+                        op_66_75 = correct(op_66_75, 32, True)
+                        phi_end_alloc_0, phi_start_alloc_0 = op_66_75, constant_64_73
+                        current_block = 11
+            else:
+                if current_block < 11:
+                    if current_block < 10:
+                        one_43 = 1
+                        inc_44 = phi_i_alloc_1 + one_43
+                        inc_44 = correct(inc_44, 32, True)
+                        index_46 = int(round(phi_i_alloc_1))
+                        element_address_48 = str + index_46
+                        constant_49 = 45
+                        store_i8(constant_49, element_address_48)
+                        phi_i_alloc_0 = inc_44
+                        current_block = 8
+                    else:
+                        return str
+                else:
+                    if current_block < 12:
+                        if phi_start_alloc_0 < phi_end_alloc_0:
+                            current_block = 12
+                        else:
+                            current_block = 10
+                    else:
+                        index_67 = int(round(phi_start_alloc_0))
+                        element_address_68 = str + index_67
+                        load_7_69 = load_i8(element_address_68)
+                        index_17 = int(round(phi_end_alloc_0))
+                        element_address_19 = str + index_17
+                        load_20 = load_i8(element_address_19)
+                        store_i8(load_20, element_address_68)
+                        store_i8(load_7_69, element_address_19)
+                        one_70 = 1
+                        inc_71 = phi_start_alloc_0 + one_70
+                        inc_71 = correct(inc_71, 32, True)
+                        inc_31 = phi_end_alloc_0 - one_70
+                        inc_31 = correct(inc_31, 32, True)
+                        phi_end_alloc_0, phi_start_alloc_0 = inc_31, inc_71
+                        current_block = 11
+    
+func_pointers.append(itoa)
+
+def printf(txt,varargz):
+    _stack_top = len(stack)
+    buffer_alloc = _alloca(20)
+    buffer_addr = buffer_alloc[0]
+    phi_args_alloc_2, phi_txt_alloc_2 = varargz, txt
+    while True:
+        load_0 = load_i8(phi_txt_alloc_2)
+        typecast = correct(int(round(load_0)), 32, True)
+        constant = 0
+        if typecast != constant:
+            constant_3 = 37
+            if load_0 == constant_3:
+                one_element = 1
+                inc = phi_txt_alloc_2 + one_element
+                load_6 = load_i8(inc)
+                constant_7 = 100
+                if load_6 == constant_7:
+                    new_fold = 2
+                    inc_10 = phi_txt_alloc_2 + new_fold
+                    va_arg = load_i32(phi_args_alloc_2)
+                    size = 4
+                    incptr = phi_args_alloc_2 + size
+                    constant_13 = 10
+                    _fptr = itoa
+                    result = _fptr(va_arg, buffer_addr, constant_13)
+                    varargs = 0
+                    _fptr = printf
+                    result_14 = _fptr(buffer_addr, varargs)
+                    phi_args_alloc_0, phi_txt_alloc_1 = incptr, inc_10
+                else:
+                    one_element_16 = 1
+                    inc_17 = inc - one_element_16
+                    load_19 = load_i8(inc_17)
+                    _fptr = bsp_putc
+                    _fptr(load_19)
+                    inc_22 = inc_17 + one_element_16
+                    load_24 = load_i8(inc_22)
+                    _fptr = bsp_putc
+                    _fptr(load_24)
+                    phi_args_alloc_0, phi_txt_alloc_1 = phi_args_alloc_2, inc_22
+                phi_args_alloc_1, phi_txt_alloc_0 = phi_args_alloc_0, phi_txt_alloc_1
+            else:
+                _fptr = bsp_putc
+                _fptr(load_0)
+                one_element_28 = 1
+                inc_29 = phi_txt_alloc_2 + one_element_28
+                phi_args_alloc_1, phi_txt_alloc_0 = phi_args_alloc_2, inc_29
+            phi_args_alloc_2, phi_txt_alloc_2 = phi_args_alloc_1, phi_txt_alloc_0
+            continue
+        else:
+            zero = 0
+            del stack[_stack_top:]
+            return zero
+func_pointers.append(printf)
+
+
+
+# Module main
+def main_main():
+    cnst = 2
+    cnst_10 = 4294967295
+    cstr_11 = (main_main_cstr_11,5)
+    dptr_12 = cstr_11[0]
+    varargs_13 = 0
+    _fptr = printf
+    result_14 = _fptr(dptr_12, varargs_13)
+    return
+func_pointers.append(main_main)
+
+main_main_cstr_11 = heap_top()
+heap.append(79)
+heap.append(75)
+heap.append(46)
+heap.append(10)
+heap.append(0)
+
+
+def bsp_putc(c):
+    print(chr(c), end="")
+main_main()
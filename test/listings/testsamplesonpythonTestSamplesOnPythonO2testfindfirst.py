@@ -0,0 +1,470 @@
+# Automatically generated on Sat Oct 17 02:32:18 2026
+# Generator /root/package/ppci/lang/python/ir2py.py
+
+import struct
+import math
+
+heap = bytearray()
+stack = bytearray()
+HEAP_START = 0x10000000
+func_pointers = list()
+externals = {}
+
+def correct(value, bits, signed):
+    base = 1 << bits
+    value %= base
+    if signed and value.bit_length() == bits:
+        return value - base
+    else:
+        return value
+
+def idiv(x, y):
+    return int(math.trunc(x/y))
+
+def irem(x, y):
+    sign = x < 0
+    v = abs(x) % abs(y)
+    if sign:
+        return -v
+    else:
+        return v
+
+def ishl(x, amount, bits):
+    amount = amount % bits
+    return x << amount
+def ishr(x, amount, bits):
+    amount = amount % bits
+    return x >> amount
+def _alloca(amount):
+    ptr = len(stack)
+    stack.extend(bytes(amount))
+    return (ptr, amount)
+
+def _free(amount):
+    for _ in range(amount):
+        stack.pop()
+
+def read_mem(address, size):
+    mem, address = get_memory(address)
+    assert address+size <= len(mem), str(hex(address))
+    return mem[address:address+size]
+
+def write_mem(address, data):
+    mem, address = get_memory(address)
+    size = len(data)
+    assert address+size <= len(mem), str(hex(address))
+    mem[address:address+size] = data
+
+def get_memory(v):
+    if v >= HEAP_START:
+        return heap, v - HEAP_START
+    else:
+        return stack, v
+
+def heap_top():
+    return len(heap) + HEAP_START
+
+def load_f64(p):
+    return struct.unpack("d", read_mem(p, 8))[0]
+
+def store_f64(v, p):
+    write_mem(p, struct.pack("d", v))
+
+def load_f32(p):
+    return struct.unpack("f", read_mem(p, 4))[0]
+
+def store_f32(v, p):
+    write_mem(p, struct.pack("f", v))
+
+def load_i64(p):
+    return struct.unpack("q", read_mem(p, 8))[0]
+
+def store_i64(v, p):
+    write_mem(p, struct.pack("q", v))
+
+def load_u64(p):
+    return struct.unpack("Q", read_mem(p, 8))[0]
+
+def store_u64(v, p):
+    write_mem(p, struct.pack("Q", v))
+
+def load_i32(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_i32(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_u32(p):
+    return struct.unpack("I", read_mem(p, 4))[0]
+
+def store_u32(v, p):
+    write_mem(p, struct.pack("I", v))
+
+def load_ptr(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_ptr(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_i16(p):
+    return struct.unpack("h", read_mem(p, 2))[0]
+
+def store_i16(v, p):
+    write_mem(p, struct.pack("h", v))
+
+def load_u16(p):
+    return struct.unpack("H", read_mem(p, 2))[0]
+
+def store_u16(v, p):
+    write_mem(p, struct.pack("H", v))
+
+def load_i8(p):
+    return struct.unpack("b", read_mem(p, 1))[0]
+
+def store_i8(v, p):
+    write_mem(p, struct.pack("b", v))
+
+def load_u8(p):
+    return struct.unpack("B", read_mem(p, 1))[0]
+
+def store_u8(v, p):
+    write_mem(p, struct.pack("B", v))
+
+
+# Module c3_code
+def io_print(txt):
+    cnst = 0
+    offset_5_12 = 4
+    mem_addr_6 = txt + offset_5_12
+    phi_var_i_0 = cnst
+    while True:
+        load_3 = load_i32(txt)
+        if phi_var_i_0 < load_3:
+            element_size = 1
+            element_offset_8 = int(round(phi_var_i_0))
+            element_address = mem_addr_6 + element_offset_8
+            load_9 = load_u8(element_address)
+            _fptr = bsp_putc
+            _fptr(load_9)
+            binop = phi_var_i_0 + element_size
+            binop = correct(binop, 32, True)
+            phi_var_i_0 = binop
+            continue
+        else:
+            return
+func_pointers.append(io_print)
+
+def io_print2(label,value):
+    _fptr = io_print
+    _fptr(label)
+    strval_3 = (io_print2_strval_3,6)
+    addr_4 = strval_3[0]
+    _fptr = io_print
+    _fptr(addr_4)
+    cnst_4_5 = 28
+    phi_var_b_0 = cnst_4_5
+    while True:
+        cnst_5 = 0
+        if phi_var_b_0 >= cnst_5:
+            binop = ishr(value, phi_var_b_0, 32)
+            binop = correct(binop, 32, True)
+            cnst_8 = 15
+            binop_9 = binop & cnst_8
+            binop_9 = correct(binop_9, 32, True)
+            cnst_11 = 10
+            if binop_9 < cnst_11:
+                cnst_12 = 48
+                binop_14 = cnst_12 + binop_9
+                binop_14 = correct(binop_14, 32, True)
+                cast = correct(int(round(binop_14)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast)
+            else:
+                cnst_27 = 55
+                binop_19 = cnst_27 + binop_9
+                binop_19 = correct(binop_19, 32, True)
+                cast_20 = correct(int(round(binop_19)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast_20)
+            cnst_22 = 4
+            binop_23 = phi_var_b_0 - cnst_22
+            binop_23 = correct(binop_23, 32, True)
+            phi_var_b_0 = binop_23
+            continue
+        else:
+            cnst_26 = 10
+            _fptr = bsp_putc
+            _fptr(cnst_26)
+            return
+func_pointers.append(io_print2)
+
+def io_print_int(i):
+    strval = (io_print_int_strval,6)
+    addr = strval[0]
+    _fptr = io_print
+    _fptr(addr)
+    cnst_4 = 28
+    phi_var_b_0 = cnst_4
+    while True:
+        cnst_5 = 0
+        if phi_var_b_0 >= cnst_5:
+            binop = ishr(i, phi_var_b_0, 32)
+            binop = correct(binop, 32, True)
+            cnst_8 = 15
+            binop_9 = binop & cnst_8
+            binop_9 = correct(binop_9, 32, True)
+            cnst_11 = 10
+            if binop_9 < cnst_11:
+                cnst_12 = 48
+                binop_14 = cnst_12 + binop_9
+                binop_14 = correct(binop_14, 32, True)
+                cast = correct(int(round(binop_14)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast)
+            else:
+                cnst_27 = 55
+                binop_19 = cnst_27 + binop_9
+                binop_19 = correct(binop_19, 32, True)
+                cast_20 = correct(int(round(binop_19)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast_20)
+            cnst_22 = 4
+            binop_23 = phi_var_b_0 - cnst_22
+            binop_23 = correct(binop_23, 32, True)
+            phi_var_b_0 = binop_23
+            continue
+        else:
+            cnst_26 = 10
+            _fptr = bsp_putc
+            _fptr(cnst_26)
+            return
+func_pointers.append(io_print_int)
+
+def io_print_sub(txt,start,end):
+    offset_12 = 4
+    mem_addr = txt + offset_12
+    phi_var_i_0 = start
+    while True:
+        if phi_var_i_0 < end:
+            element_size = 1
+            element_offset_8 = int(round(phi_var_i_0))
+            element_address = mem_addr + element_offset_8
+            load_9 = load_u8(element_address)
+            _fptr = bsp_putc
+            _fptr(load_9)
+            binop = phi_var_i_0 + element_size
+            binop = correct(binop, 32, True)
+            phi_var_i_0 = binop
+            continue
+        else:
+            return
+func_pointers.append(io_print_sub)
+
+def io_println(txt):
+    _fptr = io_print
+    _fptr(txt)
+    cnst_1 = 10
+    _fptr = bsp_putc
+    _fptr(cnst_1)
+    return
+func_pointers.append(io_println)
+
+def main_find_first(a,b,size,stride):
+    cnst = 0
+    phi_var_ptr_0, phi_var_i_0 = cnst, cnst
+    while True:
+        if phi_var_i_0 < size:
+            int2ptr = int(round(phi_var_ptr_0))
+            binop = a + int2ptr
+            load_13 = load_i32(binop)
+            if load_13 == b:
+                return phi_var_i_0
+            else:
+                binop_17 = phi_var_ptr_0 + stride
+                binop_17 = correct(binop_17, 32, True)
+                cnst_18 = 1
+                binop_20 = phi_var_i_0 + cnst_18
+                binop_20 = correct(binop_20, 32, True)
+                phi_var_ptr_0, phi_var_i_0 = binop_17, binop_20
+                continue
+        else:
+            cnst_21 = 255
+            return cnst_21
+func_pointers.append(main_find_first)
+
+def main_main():
+    _stack_top = len(stack)
+    current_block = 0
+    while True:
+        if current_block < 6:
+            if current_block < 3:
+                if current_block < 1:
+                    var_a = _alloca(40)
+                    var_a_0 = var_a[0]
+                    element_size = 4
+                    cnst_2 = 12
+                    store_i32(cnst_2, var_a_0)
+                    cnst_3 = 1
+                    casted_82 = 4
+                    element_address_7 = var_a_0 + casted_82
+                    cnst_8 = 7
+                    store_i32(cnst_8, element_address_7)
+                    cnst_65 = 8
+                    casted_83 = 8
+                    element_address_13 = var_a_0 + casted_83
+                    cnst_14 = 3
+                    store_i32(cnst_14, element_address_13)
+                    casted_84 = 12
+                    element_address_19 = var_a_0 + casted_84
+                    cnst_20 = 5
+                    store_i32(cnst_20, element_address_19)
+                    casted_85 = 16
+                    element_address_25 = var_a_0 + casted_85
+                    cnst_26 = 42
+                    store_i32(cnst_26, element_address_25)
+                    casted_86 = 20
+                    element_address_31 = var_a_0 + casted_86
+                    store_i32(cnst_65, element_address_31)
+                    casted_87 = 24
+                    element_address_37 = var_a_0 + casted_87
+                    store_i32(cnst_14, element_address_37)
+                    casted_88 = 28
+                    element_address_43 = var_a_0 + casted_88
+                    store_i32(cnst_20, element_address_43)
+                    casted_89 = 32
+                    element_address_49 = var_a_0 + casted_89
+                    store_i32(cnst_65, element_address_49)
+                    casted_90 = 36
+                    element_address_55 = var_a_0 + casted_90
+                    store_i32(cnst_3, element_address_55)
+                    strval = (main_main_strval,6)
+                    addr = strval[0]
+                    N = 10
+                    cnst_96_100 = 0
+                    phi_var_ptr_0, phi_var_i_0 = cnst_96_100, cnst_96_100
+                    current_block = 8
+                else:
+                    if current_block < 2:
+                        cnst_5 = 0
+                        if phi_var_b_0 >= cnst_5:
+                            current_block = 2
+                        else:
+                            current_block = 3
+                    else:
+                        binop = ishr(main_find_first_result, phi_var_b_0, 32)
+                        binop = correct(binop, 32, True)
+                        cnst_8_78 = 15
+                        binop_9 = binop & cnst_8_78
+                        binop_9 = correct(binop_9, 32, True)
+                        cnst_11 = 10
+                        if binop_9 < cnst_11:
+                            current_block = 4
+                        else:
+                            current_block = 5
+            else:
+                if current_block < 4:
+                    cnst_26_79 = 10
+                    _fptr = bsp_putc
+                    _fptr(cnst_26_79)
+                    del stack[_stack_top:]
+                    return
+                else:
+                    if current_block < 5:
+                        cnst_12 = 48
+                        binop_14 = cnst_12 + binop_9
+                        binop_14 = correct(binop_14, 32, True)
+                        cast = correct(int(round(binop_14)), 8, False)
+                        _fptr = bsp_putc
+                        _fptr(cast)
+                        current_block = 6
+                    else:
+                        cnst_27_81 = 55
+                        binop_19 = cnst_27_81 + binop_9
+                        binop_19 = correct(binop_19, 32, True)
+                        cast_20 = correct(int(round(binop_19)), 8, False)
+                        _fptr = bsp_putc
+                        _fptr(cast_20)
+                        current_block = 6
+        else:
+            if current_block < 9:
+                if current_block < 7:
+                    cnst_22 = 4
+                    binop_23 = phi_var_b_0 - cnst_22
+                    binop_23 = correct(binop_23, 32, True)
+                    phi_var_b_0 = binop_23
+                    current_block = 1
+                else:
+                    if current_block < 8:
+                        _fptr = io_print
+                        _fptr(addr)
+                        strval_74_92 = (main_main_strval_74_92,6)
+                        addr_75_93 = strval_74_92[0]
+                        _fptr = io_print
+                        _fptr(addr_75_93)
+                        cnst_4_94 = 28
+                        phi_var_b_0 = cnst_4_94
+                        current_block = 1
+                    else:
+                        if phi_var_i_0 < N:
+                            current_block = 9
+                        else:
+                            current_block = 10
+            else:
+                if current_block < 10:
+                    int2ptr = int(round(phi_var_ptr_0))
+                    binop_97 = var_a_0 + int2ptr
+                    load_13 = load_i32(binop_97)
+                    if load_13 == cnst_26:
+                        main_find_first_result = phi_var_i_0
+                        current_block = 7
+                    else:
+                        current_block = 11
+                else:
+                    if current_block < 11:
+                        cnst_21_98 = 255
+                        main_find_first_result = cnst_21_98
+                        current_block = 7
+                    else:
+                        binop_17_99 = phi_var_ptr_0 + element_size
+                        binop_17_99 = correct(binop_17_99, 32, True)
+                        cnst_18 = 1
+                        binop_20 = phi_var_i_0 + cnst_18
+                        binop_20 = correct(binop_20, 32, True)
+                        phi_var_ptr_0, phi_var_i_0 = binop_17_99, binop_20
+                        current_block = 8
+    
+func_pointers.append(main_main)
+
+io_print2_strval_3 = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(48)
+heap.append(120)
+io_print_int_strval = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(48)
+heap.append(120)
+main_main_strval = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(73)
+heap.append(61)
+main_main_strval_74_92 = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(48)
+heap.append(120)
+
+
+def bsp_putc(c):
+    print(chr(c), end="")
+main_main()
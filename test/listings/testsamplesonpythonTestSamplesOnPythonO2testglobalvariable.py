@@ -0,0 +1,484 @@
+# Automatically generated on Sat Oct 17 02:32:19 2026
+# Generator /root/package/ppci/lang/python/ir2py.py
+
+import struct
+import math
+
+heap = bytearray()
+stack = bytearray()
+HEAP_START = 0x10000000
+func_pointers = list()
+externals = {}
+
+def correct(value, bits, signed):
+    base = 1 << bits
+    value %= base
+    if signed and value.bit_length() == bits:
+        return value - base
+    else:
+        return value
+
+def idiv(x, y):
+    return int(math.trunc(x/y))
+
+def irem(x, y):
+    sign = x < 0
+    v = abs(x) % abs(y)
+    if sign:
+        return -v
+    else:
+        return v
+
+def ishl(x, amount, bits):
+    amount = amount % bits
+    return x << amount
+def ishr(x, amount, bits):
+    amount = amount % bits
+    return x >> amount
+def _alloca(amount):
+    ptr = len(stack)
+    stack.extend(bytes(amount))
+    return (ptr, amount)
+
+def _free(amount):
+    for _ in range(amount):
+        stack.pop()
+
+def read_mem(address, size):
+    mem, address = get_memory(address)
+    assert address+size <= len(mem), str(hex(address))
+    return mem[address:address+size]
+
+def write_mem(address, data):
+    mem, address = get_memory(address)
+    size = len(data)
+    assert address+size <= len(mem), str(hex(address))
+    mem[address:address+size] = data
+
+def get_memory(v):
+    if v >= HEAP_START:
+        return heap, v - HEAP_START
+    else:
+        return stack, v
+
+def heap_top():
+    return len(heap) + HEAP_START
+
+def load_f64(p):
+    return struct.unpack("d", read_mem(p, 8))[0]
+
+def store_f64(v, p):
+    write_mem(p, struct.pack("d", v))
+
+def load_f32(p):
+    return struct.unpack("f", read_mem(p, 4))[0]
+
+def store_f32(v, p):
+    write_mem(p, struct.pack("f", v))
+
+def load_i64(p):
+    return struct.unpack("q", read_mem(p, 8))[0]
+
+def store_i64(v, p):
+    write_mem(p, struct.pack("q", v))
+
+def load_u64(p):
+    return struct.unpack("Q", read_mem(p, 8))[0]
+
+def store_u64(v, p):
+    write_mem(p, struct.pack("Q", v))
+
+def load_i32(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_i32(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_u32(p):
+    return struct.unpack("I", read_mem(p, 4))[0]
+
+def store_u32(v, p):
+    write_mem(p, struct.pack("I", v))
+
+def load_ptr(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_ptr(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_i16(p):
+    return struct.unpack("h", read_mem(p, 2))[0]
+
+def store_i16(v, p):
+    write_mem(p, struct.pack("h", v))
+
+def load_u16(p):
+    return struct.unpack("H", read_mem(p, 2))[0]
+
+def store_u16(v, p):
+    write_mem(p, struct.pack("H", v))
+
+def load_i8(p):
+    return struct.unpack("b", read_mem(p, 1))[0]
+
+def store_i8(v, p):
+    write_mem(p, struct.pack("b", v))
+
+def load_u8(p):
+    return struct.unpack("B", read_mem(p, 1))[0]
+
+def store_u8(v, p):
+    write_mem(p, struct.pack("B", v))
+
+
+# Module c3_code
+main_MyGlob = heap_top()
+heap.extend(bytes(4))
+main_cplx1 = heap_top()
+heap.extend(bytes(80))
+main_cplx2 = heap_top()
+heap.extend(bytes(80))
+def io_print(txt):
+    cnst = 0
+    offset_5_12 = 4
+    mem_addr_6 = txt + offset_5_12
+    phi_var_i_0 = cnst
+    while True:
+        load_3 = load_i32(txt)
+        if phi_var_i_0 < load_3:
+            element_size = 1
+            element_offset_8 = int(round(phi_var_i_0))
+            element_address = mem_addr_6 + element_offset_8
+            load_9 = load_u8(element_address)
+            _fptr = bsp_putc
+            _fptr(load_9)
+            binop = phi_var_i_0 + element_size
+            binop = correct(binop, 32, True)
+            phi_var_i_0 = binop
+            continue
+        else:
+            return
+func_pointers.append(io_print)
+
+def io_print2(label,value):
+    _fptr = io_print
+    _fptr(label)
+    strval_3 = (io_print2_strval_3,6)
+    addr_4 = strval_3[0]
+    _fptr = io_print
+    _fptr(addr_4)
+    cnst_4_5 = 28
+    phi_var_b_0 = cnst_4_5
+    while True:
+        cnst_5 = 0
+        if phi_var_b_0 >= cnst_5:
+            binop = ishr(value, phi_var_b_0, 32)
+            binop = correct(binop, 32, True)
+            cnst_8 = 15
+            binop_9 = binop & cnst_8
+            binop_9 = correct(binop_9, 32, True)
+            cnst_11 = 10
+            if binop_9 < cnst_11:
+                cnst_12 = 48
+                binop_14 = cnst_12 + binop_9
+                binop_14 = correct(binop_14, 32, True)
+                cast = correct(int(round(binop_14)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast)
+            else:
+                cnst_27 = 55
+                binop_19 = cnst_27 + binop_9
+                binop_19 = correct(binop_19, 32, True)
+                cast_20 = correct(int(round(binop_19)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast_20)
+            cnst_22 = 4
+            binop_23 = phi_var_b_0 - cnst_22
+            binop_23 = correct(binop_23, 32, True)
+            phi_var_b_0 = binop_23
+            continue
+        else:
+            cnst_26 = 10
+            _fptr = bsp_putc
+            _fptr(cnst_26)
+            return
+func_pointers.append(io_print2)
+
+def io_print_int(i):
+    strval = (io_print_int_strval,6)
+    addr = strval[0]
+    _fptr = io_print
+    _fptr(addr)
+    cnst_4 = 28
+    phi_var_b_0 = cnst_4
+    while True:
+        cnst_5 = 0
+        if phi_var_b_0 >= cnst_5:
+            binop = ishr(i, phi_var_b_0, 32)
+            binop = correct(binop, 32, True)
+            cnst_8 = 15
+            binop_9 = binop & cnst_8
+            binop_9 = correct(binop_9, 32, True)
+            cnst_11 = 10
+            if binop_9 < cnst_11:
+                cnst_12 = 48
+                binop_14 = cnst_12 + binop_9
+                binop_14 = correct(binop_14, 32, True)
+                cast = correct(int(round(binop_14)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast)
+            else:
+                cnst_27 = 55
+                binop_19 = cnst_27 + binop_9
+                binop_19 = correct(binop_19, 32, True)
+                cast_20 = correct(int(round(binop_19)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast_20)
+            cnst_22 = 4
+            binop_23 = phi_var_b_0 - cnst_22
+            binop_23 = correct(binop_23, 32, True)
+            phi_var_b_0 = binop_23
+            continue
+        else:
+            cnst_26 = 10
+            _fptr = bsp_putc
+            _fptr(cnst_26)
+            return
+func_pointers.append(io_print_int)
+
+def io_print_sub(txt,start,end):
+    offset_12 = 4
+    mem_addr = txt + offset_12
+    phi_var_i_0 = start
+    while True:
+        if phi_var_i_0 < end:
+            element_size = 1
+            element_offset_8 = int(round(phi_var_i_0))
+            element_address = mem_addr + element_offset_8
+            load_9 = load_u8(element_address)
+            _fptr = bsp_putc
+            _fptr(load_9)
+            binop = phi_var_i_0 + element_size
+            binop = correct(binop, 32, True)
+            phi_var_i_0 = binop
+            continue
+        else:
+            return
+func_pointers.append(io_print_sub)
+
+def io_println(txt):
+    _fptr = io_print
+    _fptr(txt)
+    cnst_1 = 10
+    _fptr = bsp_putc
+    _fptr(cnst_1)
+    return
+func_pointers.append(io_println)
+
+def main_do1():
+    load = load_i32(main_MyGlob)
+    cnst = 1
+    binop = load + cnst
+    binop = correct(binop, 32, True)
+    store_i32(binop, main_MyGlob)
+    strval = (main_do1_strval,6)
+    addr = strval[0]
+    _fptr = io_print2
+    _fptr(addr, binop)
+    return
+func_pointers.append(main_do1)
+
+def main_do5():
+    load = load_i32(main_MyGlob)
+    cnst = 5
+    binop = load + cnst
+    binop = correct(binop, 32, True)
+    store_i32(binop, main_MyGlob)
+    strval = (main_do5_strval,6)
+    addr = strval[0]
+    _fptr = io_print2
+    _fptr(addr, binop)
+    return
+func_pointers.append(main_do5)
+
+def main_get_ptr():
+    return main_MyGlob
+func_pointers.append(main_get_ptr)
+
+def main_main():
+    cnst_38_84 = 1
+    store_i32(cnst_38_84, main_MyGlob)
+    strval_40_86 = (main_main_strval_40_86,6)
+    addr_41_87 = strval_40_86[0]
+    _fptr = io_print2
+    _fptr(addr_41_87, cnst_38_84)
+    load_43_88 = load_i32(main_MyGlob)
+    binop_45_90 = load_43_88 + cnst_38_84
+    binop_45_90 = correct(binop_45_90, 32, True)
+    store_i32(binop_45_90, main_MyGlob)
+    strval_46_91 = (main_main_strval_46_91,6)
+    addr_47_92 = strval_46_91[0]
+    _fptr = io_print2
+    _fptr(addr_47_92, binop_45_90)
+    load_49_93 = load_i32(main_MyGlob)
+    cnst_50_94 = 5
+    binop_51_95 = load_49_93 + cnst_50_94
+    binop_51_95 = correct(binop_51_95, 32, True)
+    store_i32(binop_51_95, main_MyGlob)
+    strval_52_96 = (main_main_strval_52_96,6)
+    addr_53_97 = strval_52_96[0]
+    _fptr = io_print2
+    _fptr(addr_53_97, binop_51_95)
+    load_56_98 = load_i32(main_MyGlob)
+    binop_58_100 = load_56_98 + cnst_38_84
+    binop_58_100 = correct(binop_58_100, 32, True)
+    store_i32(binop_58_100, main_MyGlob)
+    strval_59_101 = (main_main_strval_59_101,6)
+    addr_60_102 = strval_59_101[0]
+    _fptr = io_print2
+    _fptr(addr_60_102, binop_58_100)
+    load_63_103 = load_i32(main_MyGlob)
+    binop_65_105 = load_63_103 + cnst_50_94
+    binop_65_105 = correct(binop_65_105, 32, True)
+    store_i32(binop_65_105, main_MyGlob)
+    strval_66_106 = (main_main_strval_66_106,6)
+    addr_67_107 = strval_66_106[0]
+    _fptr = io_print2
+    _fptr(addr_67_107, binop_65_105)
+    cnst_0_108 = 2
+    assign_op_load_109 = load_i32(main_MyGlob)
+    new_fold_145 = 15
+    binop_73_128 = assign_op_load_109 + new_fold_145
+    binop_73_128 = correct(binop_73_128, 32, True)
+    store_i32(binop_73_128, main_MyGlob)
+    strval_74_129 = (main_main_strval_74_129,6)
+    addr_75_130 = strval_74_129[0]
+    _fptr = io_print2
+    _fptr(addr_75_130, binop_73_128)
+    casted_114_131 = 8
+    new_fold_115_132 = 12
+    mem_addr_116_133 = main_cplx1 + new_fold_115_132
+    store_i32(cnst_0_108, mem_addr_116_133)
+    element_address_12_118_135 = main_cplx2 + casted_114_131
+    cnst_15_119_136 = 22
+    store_i32(cnst_15_119_136, element_address_12_118_135)
+    strval_120_137 = (main_main_strval_120_137,15)
+    addr_121_138 = strval_120_137[0]
+    load_122_139 = load_i32(mem_addr_116_133)
+    _fptr = io_print2
+    _fptr(addr_121_138, load_122_139)
+    strval_23_123_140 = (main_main_strval_23_123_140,15)
+    addr_24_124_141 = strval_23_123_140[0]
+    load_32_125_142 = load_i32(element_address_12_118_135)
+    _fptr = io_print2
+    _fptr(addr_24_124_141, load_32_125_142)
+    return
+func_pointers.append(main_main)
+
+io_print2_strval_3 = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(48)
+heap.append(120)
+io_print_int_strval = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(48)
+heap.append(120)
+main_do1_strval = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(71)
+heap.append(61)
+main_do5_strval = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(71)
+heap.append(61)
+main_main_strval_40_86 = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(71)
+heap.append(61)
+main_main_strval_46_91 = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(71)
+heap.append(61)
+main_main_strval_52_96 = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(71)
+heap.append(61)
+main_main_strval_59_101 = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(71)
+heap.append(61)
+main_main_strval_66_106 = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(71)
+heap.append(61)
+main_main_strval_74_129 = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(71)
+heap.append(61)
+main_main_strval_120_137 = heap_top()
+heap.append(11)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(99)
+heap.append(112)
+heap.append(108)
+heap.append(120)
+heap.append(49)
+heap.append(32)
+heap.append(49)
+heap.append(32)
+heap.append(98)
+heap.append(32)
+heap.append(61)
+main_main_strval_23_123_140 = heap_top()
+heap.append(11)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(99)
+heap.append(112)
+heap.append(108)
+heap.append(120)
+heap.append(50)
+heap.append(32)
+heap.append(49)
+heap.append(32)
+heap.append(97)
+heap.append(32)
+heap.append(61)
+
+
+def bsp_putc(c):
+    print(chr(c), end="")
+main_main()
@@ -0,0 +1,455 @@
+# Automatically generated on Sat Oct 17 02:32:22 2026
+# Generator /root/package/ppci/lang/python/ir2py.py
+
+import struct
+import math
+
+heap = bytearray()
+stack = bytearray()
+HEAP_START = 0x10000000
+func_pointers = list()
+externals = {}
+
+def correct(value, bits, signed):
+    base = 1 << bits
+    value %= base
+    if signed and value.bit_length() == bits:
+        return value - base
+    else:
+        return value
+
+def idiv(x, y):
+    return int(math.trunc(x/y))
+
+def irem(x, y):
+    sign = x < 0
+    v = abs(x) % abs(y)
+    if sign:
+        return -v
+    else:
+        return v
+
+def ishl(x, amount, bits):
+    amount = amount % bits
+    return x << amount
+def ishr(x, amount, bits):
+    amount = amount % bits
+    return x >> amount
+def _alloca(amount):
+    ptr = len(stack)
+    stack.extend(bytes(amount))
+    return (ptr, amount)
+
+def _free(amount):
+    for _ in range(amount):
+        stack.pop()
+
+def read_mem(address, size):
+    mem, address = get_memory(address)
+    assert address+size <= len(mem), str(hex(address))
+    return mem[address:address+size]
+
+def write_mem(address, data):
+    mem, address = get_memory(address)
+    size = len(data)
+    assert address+size <= len(mem), str(hex(address))
+    mem[address:address+size] = data
+
+def get_memory(v):
+    if v >= HEAP_START:
+        return heap, v - HEAP_START
+    else:
+        return stack, v
+
+def heap_top():
+    return len(heap) + HEAP_START
+
+def load_f64(p):
+    return struct.unpack("d", read_mem(p, 8))[0]
+
+def store_f64(v, p):
+    write_mem(p, struct.pack("d", v))
+
+def load_f32(p):
+    return struct.unpack("f", read_mem(p, 4))[0]
+
+def store_f32(v, p):
+    write_mem(p, struct.pack("f", v))
+
+def load_i64(p):
+    return struct.unpack("q", read_mem(p, 8))[0]
+
+def store_i64(v, p):
+    write_mem(p, struct.pack("q", v))
+
+def load_u64(p):
+    return struct.unpack("Q", read_mem(p, 8))[0]
+
+def store_u64(v, p):
+    write_mem(p, struct.pack("Q", v))
+
+def load_i32(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_i32(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_u32(p):
+    return struct.unpack("I", read_mem(p, 4))[0]
+
+def store_u32(v, p):
+    write_mem(p, struct.pack("I", v))
+
+def load_ptr(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_ptr(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_i16(p):
+    return struct.unpack("h", read_mem(p, 2))[0]
+
+def store_i16(v, p):
+    write_mem(p, struct.pack("h", v))
+
+def load_u16(p):
+    return struct.unpack("H", read_mem(p, 2))[0]
+
+def store_u16(v, p):
+    write_mem(p, struct.pack("H", v))
+
+def load_i8(p):
+    return struct.unpack("b", read_mem(p, 1))[0]
+
+def store_i8(v, p):
+    write_mem(p, struct.pack("b", v))
+
+def load_u8(p):
+    return struct.unpack("B", read_mem(p, 1))[0]
+
+def store_u8(v, p):
+    write_mem(p, struct.pack("B", v))
+
+
+# Module c3_code
+main_G = heap_top()
+heap.extend(bytes(200))
+def io_print(txt):
+    cnst = 0
+    offset_5_12 = 4
+    mem_addr_6 = txt + offset_5_12
+    phi_var_i_0 = cnst
+    while True:
+        load_3 = load_i32(txt)
+        if phi_var_i_0 < load_3:
+            element_size = 1
+            element_offset_8 = int(round(phi_var_i_0))
+            element_address = mem_addr_6 + element_offset_8
+            load_9 = load_u8(element_address)
+            _fptr = bsp_putc
+            _fptr(load_9)
+            binop = phi_var_i_0 + element_size
+            binop = correct(binop, 32, True)
+            phi_var_i_0 = binop
+            continue
+        else:
+            return
+func_pointers.append(io_print)
+
+def io_print2(label,value):
+    _fptr = io_print
+    _fptr(label)
+    strval_3 = (io_print2_strval_3,6)
+    addr_4 = strval_3[0]
+    _fptr = io_print
+    _fptr(addr_4)
+    cnst_4_5 = 28
+    phi_var_b_0 = cnst_4_5
+    while True:
+        cnst_5 = 0
+        if phi_var_b_0 >= cnst_5:
+            binop = ishr(value, phi_var_b_0, 32)
+            binop = correct(binop, 32, True)
+            cnst_8 = 15
+            binop_9 = binop & cnst_8
+            binop_9 = correct(binop_9, 32, True)
+            cnst_11 = 10
+            if binop_9 < cnst_11:
+                cnst_12 = 48
+                binop_14 = cnst_12 + binop_9
+                binop_14 = correct(binop_14, 32, True)
+                cast = correct(int(round(binop_14)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast)
+            else:
+                cnst_27 = 55
+                binop_19 = cnst_27 + binop_9
+                binop_19 = correct(binop_19, 32, True)
+                cast_20 = correct(int(round(binop_19)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast_20)
+            cnst_22 = 4
+            binop_23 = phi_var_b_0 - cnst_22
+            binop_23 = correct(binop_23, 32, True)
+            phi_var_b_0 = binop_23
+            continue
+        else:
+            cnst_26 = 10
+            _fptr = bsp_putc
+            _fptr(cnst_26)
+            return
+func_pointers.append(io_print2)
+
+def io_print_int(i):
+    strval = (io_print_int_strval,6)
+    addr = strval[0]
+    _fptr = io_print
+    _fptr(addr)
+    cnst_4 = 28
+    phi_var_b_0 = cnst_4
+    while True:
+        cnst_5 = 0
+        if phi_var_b_0 >= cnst_5:
+            binop = ishr(i, phi_var_b_0, 32)
+            binop = correct(binop, 32, True)
+            cnst_8 = 15
+            binop_9 = binop & cnst_8
+            binop_9 = correct(binop_9, 32, True)
+            cnst_11 = 10
+            if binop_9 < cnst_11:
+                cnst_12 = 48
+                binop_14 = cnst_12 + binop_9
+                binop_14 = correct(binop_14, 32, True)
+                cast = correct(int(round(binop_14)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast)
+            else:
+                cnst_27 = 55
+                binop_19 = cnst_27 + binop_9
+                binop_19 = correct(binop_19, 32, True)
+                cast_20 = correct(int(round(binop_19)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast_20)
+            cnst_22 = 4
+            binop_23 = phi_var_b_0 - cnst_22
+            binop_23 = correct(binop_23, 32, True)
+            phi_var_b_0 = binop_23
+            continue
+        else:
+            cnst_26 = 10
+            _fptr = bsp_putc
+            _fptr(cnst_26)
+            return
+func_pointers.append(io_print_int)
+
+def io_print_sub(txt,start,end):
+    offset_12 = 4
+    mem_addr = txt + offset_12
+    phi_var_i_0 = start
+    while True:
+        if phi_var_i_0 < end:
+            element_size = 1
+            element_offset_8 = int(round(phi_var_i_0))
+            element_address = mem_addr + element_offset_8
+            load_9 = load_u8(element_address)
+            _fptr = bsp_putc
+            _fptr(load_9)
+            binop = phi_var_i_0 + element_size
+            binop = correct(binop, 32, True)
+            phi_var_i_0 = binop
+            continue
+        else:
+            return
+func_pointers.append(io_print_sub)
+
+def io_println(txt):
+    _fptr = io_print
+    _fptr(txt)
+    cnst_1 = 10
+    _fptr = bsp_putc
+    _fptr(cnst_1)
+    return
+func_pointers.append(io_println)
+
+def main_do1():
+    cnst = 0
+    element_offset_iv, phi_var_i_0 = cnst, cnst
+    while True:
+        cnst_1 = 50
+        if phi_var_i_0 < cnst_1:
+            element_offset_3 = int(round(element_offset_iv))
+            element_address = main_G + element_offset_3
+            store_i32(phi_var_i_0, element_address)
+            cnst_6 = 1
+            binop = phi_var_i_0 + cnst_6
+            binop = correct(binop, 32, True)
+            step = 4
+            next = element_offset_iv + step
+            next = correct(next, 32, True)
+            element_offset_iv, phi_var_i_0 = next, binop
+            continue
+        else:
+            return
+func_pointers.append(main_do1)
+
+def main_do5():
+    load = load_i32(main_G)
+    casted_124 = 4
+    element_address_22 = main_G + casted_124
+    load_23 = load_i32(element_address_22)
+    casted_125 = 8
+    element_address_28 = main_G + casted_125
+    load_29 = load_i32(element_address_28)
+    casted_126 = 12
+    element_address_34 = main_G + casted_126
+    load_35 = load_i32(element_address_34)
+    casted_127 = 16
+    element_address_40 = main_G + casted_127
+    load_41 = load_i32(element_address_40)
+    casted_128 = 20
+    element_address_46 = main_G + casted_128
+    load_47 = load_i32(element_address_46)
+    casted_129 = 24
+    element_address_52 = main_G + casted_129
+    load_53 = load_i32(element_address_52)
+    casted_130 = 28
+    element_address_58 = main_G + casted_130
+    load_59 = load_i32(element_address_58)
+    casted_131 = 32
+    element_address_64 = main_G + casted_131
+    load_65 = load_i32(element_address_64)
+    casted_132 = 36
+    element_address_70 = main_G + casted_132
+    load_71 = load_i32(element_address_70)
+    casted_133 = 40
+    element_address_76 = main_G + casted_133
+    load_77 = load_i32(element_address_76)
+    casted_134 = 44
+    element_address_82 = main_G + casted_134
+    load_83 = load_i32(element_address_82)
+    binop = load + load_23
+    binop = correct(binop, 32, True)
+    binop_87 = binop + load_29
+    binop_87 = correct(binop_87, 32, True)
+    binop_89 = binop_87 + load_35
+    binop_89 = correct(binop_89, 32, True)
+    binop_91 = binop_89 + load_41
+    binop_91 = correct(binop_91, 32, True)
+    binop_93 = binop_91 + load_47
+    binop_93 = correct(binop_93, 32, True)
+    binop_95 = binop_93 + load_53
+    binop_95 = correct(binop_95, 32, True)
+    binop_97 = binop_95 + load_59
+    binop_97 = correct(binop_97, 32, True)
+    binop_99 = binop_97 + load_65
+    binop_99 = correct(binop_99, 32, True)
+    binop_101 = binop_99 + load_71
+    binop_101 = correct(binop_101, 32, True)
+    binop_103 = binop_101 + load_77
+    binop_103 = correct(binop_103, 32, True)
+    binop_105 = binop_103 + load_83
+    binop_105 = correct(binop_105, 32, True)
+    strval = (main_do5_strval,9)
+    addr = strval[0]
+    _fptr = io_print
+    _fptr(addr)
+    strval_119_135 = (main_do5_strval_119_135,6)
+    addr_120_136 = strval_119_135[0]
+    _fptr = io_print
+    _fptr(addr_120_136)
+    cnst_4_137 = 28
+    phi_var_b_0 = cnst_4_137
+    while True:
+        cnst_5 = 0
+        if phi_var_b_0 >= cnst_5:
+            binop_122 = ishr(binop_105, phi_var_b_0, 32)
+            binop_122 = correct(binop_122, 32, True)
+            cnst_8 = 15
+            binop_9 = binop_122 & cnst_8
+            binop_9 = correct(binop_9, 32, True)
+            cnst_11 = 10
+            if binop_9 < cnst_11:
+                cnst_12 = 48
+                binop_14 = cnst_12 + binop_9
+                binop_14 = correct(binop_14, 32, True)
+                cast = correct(int(round(binop_14)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast)
+            else:
+                cnst_27 = 55
+                binop_19 = cnst_27 + binop_9
+                binop_19 = correct(binop_19, 32, True)
+                cast_20 = correct(int(round(binop_19)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast_20)
+            cnst_22 = 4
+            binop_23 = phi_var_b_0 - cnst_22
+            binop_23 = correct(binop_23, 32, True)
+            phi_var_b_0 = binop_23
+            continue
+        else:
+            cnst_26 = 10
+            _fptr = bsp_putc
+            _fptr(cnst_26)
+            return
+func_pointers.append(main_do5)
+
+def main_main():
+    cnst_2 = 0
+    element_offset_iv, phi_var_i_0 = cnst_2, cnst_2
+    while True:
+        cnst_1 = 50
+        if phi_var_i_0 < cnst_1:
+            element_offset_3 = int(round(element_offset_iv))
+            element_address = main_G + element_offset_3
+            store_i32(phi_var_i_0, element_address)
+            cnst_6 = 1
+            binop = phi_var_i_0 + cnst_6
+            binop = correct(binop, 32, True)
+            step = 4
+            next = element_offset_iv + step
+            next = correct(next, 32, True)
+            element_offset_iv, phi_var_i_0 = next, binop
+            continue
+        else:
+            _fptr = main_do5
+            _fptr()
+            return
+func_pointers.append(main_main)
+
+io_print2_strval_3 = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(48)
+heap.append(120)
+io_print_int_strval = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(48)
+heap.append(120)
+main_do5_strval = heap_top()
+heap.append(5)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(119)
+heap.append(48)
+heap.append(48)
+heap.append(116)
+heap.append(61)
+main_do5_strval_119_135 = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(48)
+heap.append(120)
+
+
+def bsp_putc(c):
+    print(chr(c), end="")
+main_main()
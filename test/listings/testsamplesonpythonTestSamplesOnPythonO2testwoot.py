@@ -0,0 +1,493 @@
+# Automatically generated on Sat Oct 17 02:32:22 2026
+# Generator /root/package/ppci/lang/python/ir2py.py
+
+import struct
+import math
+
+heap = bytearray()
+stack = bytearray()
+HEAP_START = 0x10000000
+func_pointers = list()
+externals = {}
+
+def correct(value, bits, signed):
+    base = 1 << bits
+    value %= base
+    if signed and value.bit_length() == bits:
+        return value - base
+    else:
+        return value
+
+def idiv(x, y):
+    return int(math.trunc(x/y))
+
+def irem(x, y):
+    sign = x < 0
+    v = abs(x) % abs(y)
+    if sign:
+        return -v
+    else:
+        return v
+
+def ishl(x, amount, bits):
+    amount = amount % bits
+    return x << amount
+def ishr(x, amount, bits):
+    amount = amount % bits
+    return x >> amount
+def _alloca(amount):
+    ptr = len(stack)
+    stack.extend(bytes(amount))
+    return (ptr, amount)
+
+def _free(amount):
+    for _ in range(amount):
+        stack.pop()
+
+def read_mem(address, size):
+    mem, address = get_memory(address)
+    assert address+size <= len(mem), str(hex(address))
+    return mem[address:address+size]
+
+def write_mem(address, data):
+    mem, address = get_memory(address)
+    size = len(data)
+    assert address+size <= len(mem), str(hex(address))
+    mem[address:address+size] = data
+
+def get_memory(v):
+    if v >= HEAP_START:
+        return heap, v - HEAP_START
+    else:
+        return stack, v
+
+def heap_top():
+    return len(heap) + HEAP_START
+
+def load_f64(p):
+    return struct.unpack("d", read_mem(p, 8))[0]
+
+def store_f64(v, p):
+    write_mem(p, struct.pack("d", v))
+
+def load_f32(p):
+    return struct.unpack("f", read_mem(p, 4))[0]
+
+def store_f32(v, p):
+    write_mem(p, struct.pack("f", v))
+
+def load_i64(p):
+    return struct.unpack("q", read_mem(p, 8))[0]
+
+def store_i64(v, p):
+    write_mem(p, struct.pack("q", v))
+
+def load_u64(p):
+    return struct.unpack("Q", read_mem(p, 8))[0]
+
+def store_u64(v, p):
+    write_mem(p, struct.pack("Q", v))
+
+def load_i32(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_i32(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_u32(p):
+    return struct.unpack("I", read_mem(p, 4))[0]
+
+def store_u32(v, p):
+    write_mem(p, struct.pack("I", v))
+
+def load_ptr(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_ptr(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_i16(p):
+    return struct.unpack("h", read_mem(p, 2))[0]
+
+def store_i16(v, p):
+    write_mem(p, struct.pack("h", v))
+
+def load_u16(p):
+    return struct.unpack("H", read_mem(p, 2))[0]
+
+def store_u16(v, p):
+    write_mem(p, struct.pack("H", v))
+
+def load_i8(p):
+    return struct.unpack("b", read_mem(p, 1))[0]
+
+def store_i8(v, p):
+    write_mem(p, struct.pack("b", v))
+
+def load_u8(p):
+    return struct.unpack("B", read_mem(p, 1))[0]
+
+def store_u8(v, p):
+    write_mem(p, struct.pack("B", v))
+
+
+# Module c3_code
+def io_print(txt):
+    cnst = 0
+    offset_5_12 = 4
+    mem_addr_6 = txt + offset_5_12
+    phi_var_i_0 = cnst
+    while True:
+        load_3 = load_i32(txt)
+        if phi_var_i_0 < load_3:
+            element_size = 1
+            element_offset_8 = int(round(phi_var_i_0))
+            element_address = mem_addr_6 + element_offset_8
+            load_9 = load_u8(element_address)
+            _fptr = bsp_putc
+            _fptr(load_9)
+            binop = phi_var_i_0 + element_size
+            binop = correct(binop, 32, True)
+            phi_var_i_0 = binop
+            continue
+        else:
+            return
+func_pointers.append(io_print)
+
+def io_print2(label,value):
+    _fptr = io_print
+    _fptr(label)
+    strval_3 = (io_print2_strval_3,6)
+    addr_4 = strval_3[0]
+    _fptr = io_print
+    _fptr(addr_4)
+    cnst_4_5 = 28
+    phi_var_b_0 = cnst_4_5
+    while True:
+        cnst_5 = 0
+        if phi_var_b_0 >= cnst_5:
+            binop = ishr(value, phi_var_b_0, 32)
+            binop = correct(binop, 32, True)
+            cnst_8 = 15
+            binop_9 = binop & cnst_8
+            binop_9 = correct(binop_9, 32, True)
+            cnst_11 = 10
+            if binop_9 < cnst_11:
+                cnst_12 = 48
+                binop_14 = cnst_12 + binop_9
+                binop_14 = correct(binop_14, 32, True)
+                cast = correct(int(round(binop_14)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast)
+            else:
+                cnst_27 = 55
+                binop_19 = cnst_27 + binop_9
+                binop_19 = correct(binop_19, 32, True)
+                cast_20 = correct(int(round(binop_19)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast_20)
+            cnst_22 = 4
+            binop_23 = phi_var_b_0 - cnst_22
+            binop_23 = correct(binop_23, 32, True)
+            phi_var_b_0 = binop_23
+            continue
+        else:
+            cnst_26 = 10
+            _fptr = bsp_putc
+            _fptr(cnst_26)
+            return
+func_pointers.append(io_print2)
+
+def io_print_int(i):
+    strval = (io_print_int_strval,6)
+    addr = strval[0]
+    _fptr = io_print
+    _fptr(addr)
+    cnst_4 = 28
+    phi_var_b_0 = cnst_4
+    while True:
+        cnst_5 = 0
+        if phi_var_b_0 >= cnst_5:
+            binop = ishr(i, phi_var_b_0, 32)
+            binop = correct(binop, 32, True)
+            cnst_8 = 15
+            binop_9 = binop & cnst_8
+            binop_9 = correct(binop_9, 32, True)
+            cnst_11 = 10
+            if binop_9 < cnst_11:
+                cnst_12 = 48
+                binop_14 = cnst_12 + binop_9
+                binop_14 = correct(binop_14, 32, True)
+                cast = correct(int(round(binop_14)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast)
+            else:
+                cnst_27 = 55
+                binop_19 = cnst_27 + binop_9
+                binop_19 = correct(binop_19, 32, True)
+                cast_20 = correct(int(round(binop_19)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast_20)
+            cnst_22 = 4
+            binop_23 = phi_var_b_0 - cnst_22
+            binop_23 = correct(binop_23, 32, True)
+            phi_var_b_0 = binop_23
+            continue
+        else:
+            cnst_26 = 10
+            _fptr = bsp_putc
+            _fptr(cnst_26)
+            return
+func_pointers.append(io_print_int)
+
+def io_print_sub(txt,start,end):
+    offset_12 = 4
+    mem_addr = txt + offset_12
+    phi_var_i_0 = start
+    while True:
+        if phi_var_i_0 < end:
+            element_size = 1
+            element_offset_8 = int(round(phi_var_i_0))
+            element_address = mem_addr + element_offset_8
+            load_9 = load_u8(element_address)
+            _fptr = bsp_putc
+            _fptr(load_9)
+            binop = phi_var_i_0 + element_size
+            binop = correct(binop, 32, True)
+            phi_var_i_0 = binop
+            continue
+        else:
+            return
+func_pointers.append(io_print_sub)
+
+def io_println(txt):
+    _fptr = io_print
+    _fptr(txt)
+    cnst_1 = 10
+    _fptr = bsp_putc
+    _fptr(cnst_1)
+    return
+func_pointers.append(io_println)
+
+def main_area(radius):
+    binop = radius * radius
+    pi = 3.14159
+    binop_2 = binop * pi
+    return binop_2
+func_pointers.append(main_area)
+
+def main_main():
+    _stack_top = len(stack)
+    var_buffer = _alloca(32)
+    var_buffer_0 = var_buffer[0]
+    casted_137 = 0
+    store_f32(casted_137, var_buffer_0)
+    casted_138 = 4
+    element_address_7 = var_buffer_0 + casted_138
+    casted_139 = 22
+    store_f32(casted_139, element_address_7)
+    casted_140 = 8
+    element_address_14 = var_buffer_0 + casted_140
+    casted_141 = 3.1415926
+    store_f32(casted_141, element_address_14)
+    casted_142 = 12
+    element_address_21 = var_buffer_0 + casted_142
+    casted_143 = 2.7
+    store_f32(casted_143, element_address_21)
+    casted_144 = 16
+    element_address_28 = var_buffer_0 + casted_144
+    load = load_f32(element_address_7)
+    load_39 = load_f32(element_address_14)
+    casted_154_167 = 66
+    binop_168 = load * casted_154_167
+    casted_155_169 = 33
+    binop_5_170 = load_39 * casted_155_169
+    casted_156_171 = 11
+    binop_8_172 = binop_5_170 + casted_156_171
+    binop_9_173 = binop_168 + binop_8_172
+    store_f32(binop_9_173, element_address_28)
+    load_45_163_176 = load_f32(element_address_7)
+    load_51_166_179 = load_f32(var_buffer_0)
+    if load_45_163_176 > load_51_166_179:
+        strval = (main_main_strval,12)
+        addr = strval[0]
+        _fptr = io_print
+        _fptr(addr)
+    casted_147 = 4
+    element_address_56 = var_buffer_0 + casted_147
+    load_57 = load_f32(element_address_56)
+    casted_148 = 8
+    element_address_62 = var_buffer_0 + casted_148
+    load_63 = load_f32(element_address_62)
+    casted_149 = 12
+    element_address_68 = var_buffer_0 + casted_149
+    load_69 = load_f32(element_address_68)
+    casted_157_180 = 66
+    binop_113_181 = load_63 * casted_157_180
+    casted_158_182 = 33
+    binop_5_116_183 = load_69 * casted_158_182
+    casted_159_184 = 11
+    binop_8_119_185 = binop_5_116_183 + casted_159_184
+    binop_9_120_186 = binop_113_181 + binop_8_119_185
+    if load_57 > binop_9_120_186:
+        strval_71 = (main_main_strval_71,13)
+        addr_72 = strval_71[0]
+        _fptr = io_print
+        _fptr(addr_72)
+    casted_150 = 4
+    element_address_77 = var_buffer_0 + casted_150
+    load_78 = load_f32(element_address_77)
+    binop_121_190 = load_78 * load_78
+    pi_191 = 3.14159
+    binop_2_192 = binop_121_190 * pi_191
+    casted_160_187_193 = 8
+    element_address_83_188_194 = var_buffer_0 + casted_160_187_193
+    load_84_189_195 = load_f32(element_address_83_188_194)
+    if binop_2_192 < load_84_189_195:
+        strval_85 = (main_main_strval_85,13)
+        addr_86 = strval_85[0]
+        _fptr = io_print
+        _fptr(addr_86)
+    strval_87 = (main_main_strval_87,13)
+    addr_88 = strval_87[0]
+    casted_151 = 22
+    binop_123_197 = casted_151 * casted_151
+    pi_124_198 = 3.14159
+    binop_2_125_199 = binop_123_197 * pi_124_198
+    cast_92_196_200 = correct(int(round(binop_2_125_199)), 32, True)
+    _fptr = io_print
+    _fptr(addr_88)
+    strval_126_201 = (main_main_strval_126_201,6)
+    addr_127_202 = strval_126_201[0]
+    _fptr = io_print
+    _fptr(addr_127_202)
+    cnst_4_203 = 28
+    phi_var_b_0 = cnst_4_203
+    while True:
+        cnst_5 = 0
+        if phi_var_b_0 >= cnst_5:
+            binop_130 = ishr(cast_92_196_200, phi_var_b_0, 32)
+            binop_130 = correct(binop_130, 32, True)
+            cnst_8_131 = 15
+            binop_9_132 = binop_130 & cnst_8_131
+            binop_9_132 = correct(binop_9_132, 32, True)
+            cnst_11 = 10
+            if binop_9_132 < cnst_11:
+                cnst_12 = 48
+                binop_14 = cnst_12 + binop_9_132
+                binop_14 = correct(binop_14, 32, True)
+                cast_134 = correct(int(round(binop_14)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast_134)
+            else:
+                cnst_27 = 55
+                binop_19 = cnst_27 + binop_9_132
+                binop_19 = correct(binop_19, 32, True)
+                cast_20 = correct(int(round(binop_19)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast_20)
+            cnst_22_136 = 4
+            binop_23 = phi_var_b_0 - cnst_22_136
+            binop_23 = correct(binop_23, 32, True)
+            phi_var_b_0 = binop_23
+            continue
+        else:
+            cnst_26 = 10
+            _fptr = bsp_putc
+            _fptr(cnst_26)
+            del stack[_stack_top:]
+            return
+func_pointers.append(main_main)
+
+def main_wfun(a,b):
+    casted = 66
+    binop = a * casted
+    casted_10 = 33
+    binop_5 = b * casted_10
+    casted_11 = 11
+    binop_8 = binop_5 + casted_11
+    binop_9 = binop + binop_8
+    return binop_9
+func_pointers.append(main_wfun)
+
+io_print2_strval_3 = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(48)
+heap.append(120)
+io_print_int_strval = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(48)
+heap.append(120)
+main_main_strval = heap_top()
+heap.append(8)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(102)
+heap.append(111)
+heap.append(114)
+heap.append(32)
+heap.append(115)
+heap.append(117)
+heap.append(114)
+heap.append(101)
+main_main_strval_71 = heap_top()
+heap.append(9)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(119)
+heap.append(111)
+heap.append(111)
+heap.append(116)
+heap.append(32)
+heap.append(109)
+heap.append(111)
+heap.append(114)
+heap.append(101)
+main_main_strval_85 = heap_top()
+heap.append(9)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(119)
+heap.append(111)
+heap.append(111)
+heap.append(116)
+heap.append(32)
+heap.append(108)
+heap.append(101)
+heap.append(115)
+heap.append(115)
+main_main_strval_87 = heap_top()
+heap.append(9)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(97)
+heap.append(114)
+heap.append(101)
+heap.append(97)
+heap.append(40)
+heap.append(50)
+heap.append(50)
+heap.append(41)
+heap.append(61)
+main_main_strval_126_201 = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(48)
+heap.append(120)
+
+
+def bsp_putc(c):
+    print(chr(c), end="")
+main_main()
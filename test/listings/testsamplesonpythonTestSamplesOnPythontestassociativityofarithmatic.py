@@ -0,0 +1,386 @@
+# Automatically generated on Sat Oct 17 02:32:13 2026
+# Generator /root/package/ppci/lang/python/ir2py.py
+
+import struct
+import math
+
+heap = bytearray()
+stack = bytearray()
+HEAP_START = 0x10000000
+func_pointers = list()
+externals = {}
+
+def correct(value, bits, signed):
+    base = 1 << bits
+    value %= base
+    if signed and value.bit_length() == bits:
+        return value - base
+    else:
+        return value
+
+def idiv(x, y):
+    return int(math.trunc(x/y))
+
+def irem(x, y):
+    sign = x < 0
+    v = abs(x) % abs(y)
+    if sign:
+        return -v
+    else:
+        return v
+
+def ishl(x, amount, bits):
+    amount = amount % bits
+    return x << amount
+def ishr(x, amount, bits):
+    amount = amount % bits
+    return x >> amount
+def _alloca(amount):
+    ptr = len(stack)
+    stack.extend(bytes(amount))
+    return (ptr, amount)
+
+def _free(amount):
+    for _ in range(amount):
+        stack.pop()
+
+def read_mem(address, size):
+    mem, address = get_memory(address)
+    assert address+size <= len(mem), str(hex(address))
+    return mem[address:address+size]
+
+def write_mem(address, data):
+    mem, address = get_memory(address)
+    size = len(data)
+    assert address+size <= len(mem), str(hex(address))
+    mem[address:address+size] = data
+
+def get_memory(v):
+    if v >= HEAP_START:
+        return heap, v - HEAP_START
+    else:
+        return stack, v
+
+def heap_top():
+    return len(heap) + HEAP_START
+
+def load_f64(p):
+    return struct.unpack("d", read_mem(p, 8))[0]
+
+def store_f64(v, p):
+    write_mem(p, struct.pack("d", v))
+
+def load_f32(p):
+    return struct.unpack("f", read_mem(p, 4))[0]
+
+def store_f32(v, p):
+    write_mem(p, struct.pack("f", v))
+
+def load_i64(p):
+    return struct.unpack("q", read_mem(p, 8))[0]
+
+def store_i64(v, p):
+    write_mem(p, struct.pack("q", v))
+
+def load_u64(p):
+    return struct.unpack("Q", read_mem(p, 8))[0]
+
+def store_u64(v, p):
+    write_mem(p, struct.pack("Q", v))
+
+def load_i32(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_i32(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_u32(p):
+    return struct.unpack("I", read_mem(p, 4))[0]
+
+def store_u32(v, p):
+    write_mem(p, struct.pack("I", v))
+
+def load_ptr(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_ptr(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_i16(p):
+    return struct.unpack("h", read_mem(p, 2))[0]
+
+def store_i16(v, p):
+    write_mem(p, struct.pack("h", v))
+
+def load_u16(p):
+    return struct.unpack("H", read_mem(p, 2))[0]
+
+def store_u16(v, p):
+    write_mem(p, struct.pack("H", v))
+
+def load_i8(p):
+    return struct.unpack("b", read_mem(p, 1))[0]
+
+def store_i8(v, p):
+    write_mem(p, struct.pack("b", v))
+
+def load_u8(p):
+    return struct.unpack("B", read_mem(p, 1))[0]
+
+def store_u8(v, p):
+    write_mem(p, struct.pack("B", v))
+
+
+# Module c3_code
+def io_print(txt):
+    _stack_top = len(stack)
+    var_i = _alloca(4)
+    var_i_0 = var_i[0]
+    var_txt = _alloca(4)
+    var_txt_1 = var_txt[0]
+    store_ptr(txt, var_txt_1)
+    cnst = 0
+    store_i32(cnst, var_i_0)
+    while True:
+        load = load_i32(var_i_0)
+        load_2 = load_ptr(var_txt_1)
+        offset = 0
+        mem_addr = load_2 + offset
+        load_3 = load_i32(mem_addr)
+        if load < load_3:
+            load_4 = load_ptr(var_txt_1)
+            offset_5 = 4
+            mem_addr_6 = load_4 + offset_5
+            load_7 = load_i32(var_i_0)
+            element_size = 1
+            element_offset = load_7 * element_size
+            element_offset = correct(element_offset, 32, True)
+            element_offset_8 = int(round(element_offset))
+            element_address = mem_addr_6 + element_offset_8
+            load_9 = load_u8(element_address)
+            _fptr = bsp_putc
+            _fptr(load_9)
+            load_10 = load_i32(var_i_0)
+            cnst_11 = 1
+            binop = load_10 + cnst_11
+            binop = correct(binop, 32, True)
+            store_i32(binop, var_i_0)
+            continue
+        else:
+            del stack[_stack_top:]
+            return
+func_pointers.append(io_print)
+
+def io_print2(label,value):
+    _stack_top = len(stack)
+    var_label = _alloca(4)
+    var_label_0 = var_label[0]
+    store_ptr(label, var_label_0)
+    var_value = _alloca(4)
+    var_value_1 = var_value[0]
+    store_i32(value, var_value_1)
+    load = load_ptr(var_label_0)
+    _fptr = io_print
+    _fptr(load)
+    load_2 = load_i32(var_value_1)
+    _fptr = io_print_int
+    _fptr(load_2)
+    del stack[_stack_top:]
+    return
+func_pointers.append(io_print2)
+
+def io_print_int(i):
+    _stack_top = len(stack)
+    var_b = _alloca(4)
+    var_b_0 = var_b[0]
+    var_c = _alloca(4)
+    var_c_1 = var_c[0]
+    var_i = _alloca(4)
+    var_i_2 = var_i[0]
+    store_i32(i, var_i_2)
+    strval = (io_print_int_strval,6)
+    addr = strval[0]
+    _fptr = io_print
+    _fptr(addr)
+    cnst = 0
+    store_i32(cnst, var_c_1)
+    cnst_3 = 0
+    store_i32(cnst_3, var_b_0)
+    cnst_4 = 28
+    store_i32(cnst_4, var_b_0)
+    while True:
+        load = load_i32(var_b_0)
+        cnst_5 = 0
+        if load >= cnst_5:
+            load_6 = load_i32(var_i_2)
+            load_7 = load_i32(var_b_0)
+            binop = ishr(load_6, load_7, 32)
+            binop = correct(binop, 32, True)
+            cnst_8 = 15
+            binop_9 = binop & cnst_8
+            binop_9 = correct(binop_9, 32, True)
+            store_i32(binop_9, var_c_1)
+            load_10 = load_i32(var_c_1)
+            cnst_11 = 10
+            if load_10 < cnst_11:
+                cnst_12 = 48
+                load_13 = load_i32(var_c_1)
+                binop_14 = cnst_12 + load_13
+                binop_14 = correct(binop_14, 32, True)
+                cast = correct(int(round(binop_14)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast)
+            else:
+                cnst_15 = 65
+                cnst_16 = 10
+                binop_17 = cnst_15 - cnst_16
+                binop_17 = correct(binop_17, 32, True)
+                load_18 = load_i32(var_c_1)
+                binop_19 = binop_17 + load_18
+                binop_19 = correct(binop_19, 32, True)
+                cast_20 = correct(int(round(binop_19)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast_20)
+            load_21 = load_i32(var_b_0)
+            cnst_22 = 4
+            binop_23 = load_21 - cnst_22
+            binop_23 = correct(binop_23, 32, True)
+            store_i32(binop_23, var_b_0)
+            continue
+        else:
+            cnst_24 = 10
+            cast_25 = correct(int(round(cnst_24)), 8, False)
+            _fptr = bsp_putc
+            _fptr(cast_25)
+            del stack[_stack_top:]
+            return
+func_pointers.append(io_print_int)
+
+def io_print_sub(txt,start,end):
+    _stack_top = len(stack)
+    var_end = _alloca(4)
+    var_end_0 = var_end[0]
+    store_i32(end, var_end_0)
+    var_i = _alloca(4)
+    var_i_1 = var_i[0]
+    var_start = _alloca(4)
+    var_start_2 = var_start[0]
+    store_i32(start, var_start_2)
+    var_txt = _alloca(4)
+    var_txt_3 = var_txt[0]
+    store_ptr(txt, var_txt_3)
+    cnst = 0
+    store_i32(cnst, var_i_1)
+    load = load_i32(var_start_2)
+    store_i32(load, var_i_1)
+    while True:
+        load_4 = load_i32(var_i_1)
+        load_5 = load_i32(var_end_0)
+        if load_4 < load_5:
+            load_6 = load_ptr(var_txt_3)
+            offset = 4
+            mem_addr = load_6 + offset
+            load_7 = load_i32(var_i_1)
+            element_size = 1
+            element_offset = load_7 * element_size
+            element_offset = correct(element_offset, 32, True)
+            element_offset_8 = int(round(element_offset))
+            element_address = mem_addr + element_offset_8
+            load_9 = load_u8(element_address)
+            _fptr = bsp_putc
+            _fptr(load_9)
+            load_10 = load_i32(var_i_1)
+            cnst_11 = 1
+            binop = load_10 + cnst_11
+            binop = correct(binop, 32, True)
+            store_i32(binop, var_i_1)
+            continue
+        else:
+            del stack[_stack_top:]
+            return
+func_pointers.append(io_print_sub)
+
+def io_println(txt):
+    _stack_top = len(stack)
+    var_txt = _alloca(4)
+    var_txt_0 = var_txt[0]
+    store_ptr(txt, var_txt_0)
+    load = load_ptr(var_txt_0)
+    _fptr = io_print
+    _fptr(load)
+    cnst = 10
+    cast = correct(int(round(cnst)), 8, False)
+    _fptr = bsp_putc
+    _fptr(cast)
+    del stack[_stack_top:]
+    return
+func_pointers.append(io_println)
+
+def main_main():
+    _stack_top = len(stack)
+    var_d = _alloca(4)
+    var_d_0 = var_d[0]
+    var_w = _alloca(4)
+    var_w_1 = var_w[0]
+    var_x = _alloca(4)
+    var_x_2 = var_x[0]
+    cnst = 2
+    store_i32(cnst, var_d_0)
+    cnst_3 = 10
+    store_i32(cnst_3, var_x_2)
+    cnst_4 = 100
+    load = load_i32(var_x_2)
+    binop = idiv(cnst_4, load)
+    binop = correct(binop, 32, True)
+    load_5 = load_i32(var_d_0)
+    binop_6 = idiv(binop, load_5)
+    binop_6 = correct(binop_6, 32, True)
+    store_i32(binop_6, var_w_1)
+    strval = (main_main_strval,6)
+    addr = strval[0]
+    load_7 = load_i32(var_w_1)
+    _fptr = io_print2
+    _fptr(addr, load_7)
+    cnst_8 = 100
+    load_9 = load_i32(var_x_2)
+    binop_10 = cnst_8 - load_9
+    binop_10 = correct(binop_10, 32, True)
+    load_11 = load_i32(var_d_0)
+    binop_12 = binop_10 - load_11
+    binop_12 = correct(binop_12, 32, True)
+    store_i32(binop_12, var_w_1)
+    strval_13 = (main_main_strval_13,6)
+    addr_14 = strval_13[0]
+    load_15 = load_i32(var_w_1)
+    _fptr = io_print2
+    _fptr(addr_14, load_15)
+    del stack[_stack_top:]
+    return
+func_pointers.append(main_main)
+
+io_print_int_strval = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(48)
+heap.append(120)
+main_main_strval = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(119)
+heap.append(61)
+main_main_strval_13 = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(119)
+heap.append(61)
+
+
+def bsp_putc(c):
+    print(chr(c), end="")
+main_main()
@@ -0,0 +1,941 @@
+# Automatically generated on Sat Oct 17 02:32:14 2026
+# Generator /root/package/ppci/lang/python/ir2py.py
+
+import struct
+import math
+
+heap = bytearray()
+stack = bytearray()
+HEAP_START = 0x10000000
+func_pointers = list()
+externals = {}
+
+def correct(value, bits, signed):
+    base = 1 << bits
+    value %= base
+    if signed and value.bit_length() == bits:
+        return value - base
+    else:
+        return value
+
+def idiv(x, y):
+    return int(math.trunc(x/y))
+
+def irem(x, y):
+    sign = x < 0
+    v = abs(x) % abs(y)
+    if sign:
+        return -v
+    else:
+        return v
+
+def ishl(x, amount, bits):
+    amount = amount % bits
+    return x << amount
+def ishr(x, amount, bits):
+    amount = amount % bits
+    return x >> amount
+def _alloca(amount):
+    ptr = len(stack)
+    stack.extend(bytes(amount))
+    return (ptr, amount)
+
+def _free(amount):
+    for _ in range(amount):
+        stack.pop()
+
+def read_mem(address, size):
+    mem, address = get_memory(address)
+    assert address+size <= len(mem), str(hex(address))
+    return mem[address:address+size]
+
+def write_mem(address, data):
+    mem, address = get_memory(address)
+    size = len(data)
+    assert address+size <= len(mem), str(hex(address))
+    mem[address:address+size] = data
+
+def get_memory(v):
+    if v >= HEAP_START:
+        return heap, v - HEAP_START
+    else:
+        return stack, v
+
+def heap_top():
+    return len(heap) + HEAP_START
+
+def load_f64(p):
+    return struct.unpack("d", read_mem(p, 8))[0]
+
+def store_f64(v, p):
+    write_mem(p, struct.pack("d", v))
+
+def load_f32(p):
+    return struct.unpack("f", read_mem(p, 4))[0]
+
+def store_f32(v, p):
+    write_mem(p, struct.pack("f", v))
+
+def load_i64(p):
+    return struct.unpack("q", read_mem(p, 8))[0]
+
+def store_i64(v, p):
+    write_mem(p, struct.pack("q", v))
+
+def load_u64(p):
+    return struct.unpack("Q", read_mem(p, 8))[0]
+
+def store_u64(v, p):
+    write_mem(p, struct.pack("Q", v))
+
+def load_i32(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_i32(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_u32(p):
+    return struct.unpack("I", read_mem(p, 4))[0]
+
+def store_u32(v, p):
+    write_mem(p, struct.pack("I", v))
+
+def load_ptr(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_ptr(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_i16(p):
+    return struct.unpack("h", read_mem(p, 2))[0]
+
+def store_i16(v, p):
+    write_mem(p, struct.pack("h", v))
+
+def load_u16(p):
+    return struct.unpack("H", read_mem(p, 2))[0]
+
+def store_u16(v, p):
+    write_mem(p, struct.pack("H", v))
+
+def load_i8(p):
+    return struct.unpack("b", read_mem(p, 1))[0]
+
+def store_i8(v, p):
+    write_mem(p, struct.pack("b", v))
+
+def load_u8(p):
+    return struct.unpack("B", read_mem(p, 1))[0]
+
+def store_u8(v, p):
+    write_mem(p, struct.pack("B", v))
+
+
+# Module main
+def reverse(str,length):
+    _stack_top = len(stack)
+    str_alloc = _alloca(4)
+    str_addr = str_alloc[0]
+    store_ptr(str, str_addr)
+    length_alloc = _alloca(4)
+    length_addr = length_alloc[0]
+    store_i32(length, length_addr)
+    start_alloc = _alloca(4)
+    start_addr = start_alloc[0]
+    constant = 0
+    store_i32(constant, start_addr)
+    size = 4
+    iptr = start_addr + size
+    end_alloc = _alloca(4)
+    end_addr = end_alloc[0]
+    load = load_i32(length_addr)
+    constant_0 = 1
+    op = load - constant_0
+    op = correct(op, 32, True)
+    store_i32(op, end_addr)
+    size_1 = 4
+    iptr_2 = end_addr + size_1
+    tmp_alloc = _alloca(1)
+    tmp_addr = tmp_alloc[0]
+    while True:
+        load_3 = load_i32(start_addr)
+        load_4 = load_i32(end_addr)
+        if load_3 < load_4:
+            load_5 = load_ptr(str_addr)
+            load_6 = load_i32(start_addr)
+            element_size = 1
+            index = int(round(load_6))
+            element_offset = index * element_size
+            element_address = load_5 + element_offset
+            load_7 = load_i8(element_address)
+            store_i8(load_7, tmp_addr)
+            load_8 = load_ptr(str_addr)
+            load_9 = load_i32(start_addr)
+            element_size_10 = 1
+            index_11 = int(round(load_9))
+            element_offset_12 = index_11 * element_size_10
+            element_address_13 = load_8 + element_offset_12
+            load_14 = load_ptr(str_addr)
+            load_15 = load_i32(end_addr)
+            element_size_16 = 1
+            index_17 = int(round(load_15))
+            element_offset_18 = index_17 * element_size_16
+            element_address_19 = load_14 + element_offset_18
+            load_20 = load_i8(element_address_19)
+            store_i8(load_20, element_address_13)
+            load_21 = load_ptr(str_addr)
+            load_22 = load_i32(end_addr)
+            element_size_23 = 1
+            index_24 = int(round(load_22))
+            element_offset_25 = index_24 * element_size_23
+            element_address_26 = load_21 + element_offset_25
+            load_27 = load_i8(tmp_addr)
+            store_i8(load_27, element_address_26)
+            load_28 = load_i32(start_addr)
+            one = 1
+            inc = load_28 + one
+            inc = correct(inc, 32, True)
+            store_i32(inc, start_addr)
+            load_29 = load_i32(end_addr)
+            one_30 = 1
+            inc_31 = load_29 - one_30
+            inc_31 = correct(inc_31, 32, True)
+            store_i32(inc_31, end_addr)
+            continue
+        else:
+            del stack[_stack_top:]
+            return
+func_pointers.append(reverse)
+
+def itoa(value,str,base):
+    _stack_top = len(stack)
+    value_alloc = _alloca(4)
+    value_addr = value_alloc[0]
+    store_i32(value, value_addr)
+    str_alloc = _alloca(4)
+    str_addr = str_alloc[0]
+    store_ptr(str, str_addr)
+    base_alloc = _alloca(4)
+    base_addr = base_alloc[0]
+    store_i32(base, base_addr)
+    i_alloc = _alloca(4)
+    i_addr = i_alloc[0]
+    constant = 0
+    store_i32(constant, i_addr)
+    size = 4
+    iptr = i_addr + size
+    neg_alloc = _alloca(4)
+    neg_addr = neg_alloc[0]
+    constant_0 = 0
+    store_i32(constant_0, neg_addr)
+    size_1 = 4
+    iptr_2 = neg_addr + size_1
+    load = load_i32(value_addr)
+    constant_3 = 0
+    if load == constant_3:
+        load_4 = load_ptr(str_addr)
+        load_5 = load_i32(i_addr)
+        one = 1
+        inc = load_5 + one
+        inc = correct(inc, 32, True)
+        store_i32(inc, i_addr)
+        element_size = 1
+        index = int(round(load_5))
+        element_offset = index * element_size
+        element_address = load_4 + element_offset
+        constant_6 = 48
+        store_i8(constant_6, element_address)
+        load_7 = load_ptr(str_addr)
+        load_8 = load_i32(i_addr)
+        element_size_9 = 1
+        index_10 = int(round(load_8))
+        element_offset_11 = index_10 * element_size_9
+        element_address_12 = load_7 + element_offset_11
+        constant_13 = 0
+        store_i8(constant_13, element_address_12)
+        load_14 = load_ptr(str_addr)
+        del stack[_stack_top:]
+        return load_14
+    else:
+        load_15 = load_i32(value_addr)
+        constant_16 = 0
+        if load_15 < constant_16:
+            constant_17 = 1
+            store_i32(constant_17, neg_addr)
+            load_18 = load_i32(value_addr)
+            unop = -load_18
+            unop = correct(unop, 32, True)
+            store_i32(unop, value_addr)
+        while True:
+            load_19 = load_i32(value_addr)
+            constant_20 = 0
+            if load_19 != constant_20:
+                rem_alloc = _alloca(4)
+                rem_addr = rem_alloc[0]
+                load_21 = load_i32(value_addr)
+                load_22 = load_i32(base_addr)
+                op = irem(load_21, load_22)
+                op = correct(op, 32, True)
+                store_i32(op, rem_addr)
+                size_23 = 4
+                iptr_24 = rem_addr + size_23
+                load_25 = load_ptr(str_addr)
+                load_26 = load_i32(i_addr)
+                one_27 = 1
+                inc_28 = load_26 + one_27
+                inc_28 = correct(inc_28, 32, True)
+                store_i32(inc_28, i_addr)
+                element_size_29 = 1
+                index_30 = int(round(load_26))
+                element_offset_31 = index_30 * element_size_29
+                element_address_32 = load_25 + element_offset_31
+                load_33 = load_i32(rem_addr)
+                constant_34 = 48
+                typecast = correct(int(round(constant_34)), 32, True)
+                op_35 = load_33 + typecast
+                op_35 = correct(op_35, 32, True)
+                typecast_36 = correct(int(round(op_35)), 8, True)
+                store_i8(typecast_36, element_address_32)
+                load_37 = load_i32(value_addr)
+                load_38 = load_i32(base_addr)
+                op_39 = idiv(load_37, load_38)
+                op_39 = correct(op_39, 32, True)
+                store_i32(op_39, value_addr)
+                continue
+            else:
+                load_40 = load_i32(neg_addr)
+                zero = 0
+                if load_40 == zero:
+                    load_50 = load_ptr(str_addr)
+                    load_51 = load_i32(i_addr)
+                    element_size_52 = 1
+                    index_53 = int(round(load_51))
+                    element_offset_54 = index_53 * element_size_52
+                    element_address_55 = load_50 + element_offset_54
+                    constant_56 = 0
+                    typecast_57 = correct(int(round(constant_56)), 8, True)
+                    store_i8(typecast_57, element_address_55)
+                    load_58 = load_ptr(str_addr)
+                    load_59 = load_i32(i_addr)
+                    _fptr = reverse
+                    _fptr(load_58, load_59)
+                    load_60 = load_ptr(str_addr)
+                    del stack[_stack_top:]
+                    return load_60
+                else:
+                    load_41 = load_ptr(str_addr)
+                    load_42 = load_i32(i_addr)
+                    one_43 = 1
+                    inc_44 = load_42 + one_43
+                    inc_44 = correct(inc_44, 32, True)
+                    store_i32(inc_44, i_addr)
+                    element_size_45 = 1
+                    index_46 = int(round(load_42))
+                    element_offset_47 = index_46 * element_size_45
+                    element_address_48 = load_41 + element_offset_47
+                    constant_49 = 45
+                    store_i8(constant_49, element_address_48)
+                    load_50 = load_ptr(str_addr)
+                    load_51 = load_i32(i_addr)
+                    element_size_52 = 1
+                    index_53 = int(round(load_51))
+                    element_offset_54 = index_53 * element_size_52
+                    element_address_55 = load_50 + element_offset_54
+                    constant_56 = 0
+                    typecast_57 = correct(int(round(constant_56)), 8, True)
+                    store_i8(typecast_57, element_address_55)
+                    load_58 = load_ptr(str_addr)
+                    load_59 = load_i32(i_addr)
+                    _fptr = reverse
+                    _fptr(load_58, load_59)
+                    load_60 = load_ptr(str_addr)
+                    del stack[_stack_top:]
+                    return load_60
+func_pointers.append(itoa)
+
+def printf(txt,varargz):
+    _stack_top = len(stack)
+    txt_alloc = _alloca(4)
+    txt_addr = txt_alloc[0]
+    store_ptr(txt, txt_addr)
+    args_alloc = _alloca(4)
+    args_addr = args_alloc[0]
+    store_ptr(varargz, args_addr)
+    buffer_alloc = _alloca(20)
+    buffer_addr = buffer_alloc[0]
+    while True:
+        load = load_ptr(txt_addr)
+        load_0 = load_i8(load)
+        typecast = correct(int(round(load_0)), 32, True)
+        constant = 0
+        if typecast != constant:
+            load_1 = load_ptr(txt_addr)
+            load_2 = load_i8(load_1)
+            constant_3 = 37
+            if load_2 == constant_3:
+                load_4 = load_ptr(txt_addr)
+                one_element = 1
+                inc = load_4 + one_element
+                store_ptr(inc, txt_addr)
+                load_5 = load_ptr(txt_addr)
+                load_6 = load_i8(load_5)
+                constant_7 = 100
+                if load_6 == constant_7:
+                    load_8 = load_ptr(txt_addr)
+                    one_element_9 = 1
+                    inc_10 = load_8 + one_element_9
+                    store_ptr(inc_10, txt_addr)
+                    v_alloc = _alloca(4)
+                    v_addr = v_alloc[0]
+                    va_ptr = load_ptr(args_addr)
+                    va_arg = load_i32(va_ptr)
+                    size = 4
+                    incptr = va_ptr + size
+                    store_ptr(incptr, args_addr)
+                    store_i32(va_arg, v_addr)
+                    size_11 = 4
+                    iptr = v_addr + size_11
+                    load_12 = load_i32(v_addr)
+                    constant_13 = 10
+                    _fptr = itoa
+                    result = _fptr(load_12, buffer_addr, constant_13)
+                    varargs = 0
+                    _fptr = printf
+                    result_14 = _fptr(buffer_addr, varargs)
+                else:
+                    load_15 = load_ptr(txt_addr)
+                    one_element_16 = 1
+                    inc_17 = load_15 - one_element_16
+                    store_ptr(inc_17, txt_addr)
+                    load_18 = load_ptr(txt_addr)
+                    load_19 = load_i8(load_18)
+                    _fptr = bsp_putc
+                    _fptr(load_19)
+                    load_20 = load_ptr(txt_addr)
+                    one_element_21 = 1
+                    inc_22 = load_20 + one_element_21
+                    store_ptr(inc_22, txt_addr)
+                    load_23 = load_ptr(txt_addr)
+                    load_24 = load_i8(load_23)
+                    _fptr = bsp_putc
+                    _fptr(load_24)
+            else:
+                load_25 = load_ptr(txt_addr)
+                load_26 = load_i8(load_25)
+                _fptr = bsp_putc
+                _fptr(load_26)
+                load_27 = load_ptr(txt_addr)
+                one_element_28 = 1
+                inc_29 = load_27 + one_element_28
+                store_ptr(inc_29, txt_addr)
+            continue
+        else:
+            zero = 0
+            del stack[_stack_top:]
+            return zero
+func_pointers.append(printf)
+
+
+
+# Module main
+def main_main():
+    _stack_top = len(stack)
+    u_alloc = _alloca(2)
+    u_addr = u_alloc[0]
+    constant = 7
+    typecast = correct(int(round(constant)), 32, False)
+    cast = correct(int(round(typecast)), 8, False)
+    loaded = load_u8(u_addr)
+    mask = 7
+    value = cast & mask
+    value = correct(value, 8, False)
+    inv_mask = 248
+    loaded_masked = loaded & inv_mask
+    loaded_masked = correct(loaded_masked, 8, False)
+    value_0 = loaded_masked | value
+    value_0 = correct(value_0, 8, False)
+    store_u8(value_0, u_addr)
+    constant_1 = 42
+    typecast_2 = correct(int(round(constant_1)), 32, False)
+    cast_3 = correct(int(round(typecast_2)), 16, False)
+    loaded_4 = load_u16(u_addr)
+    shift = 3
+    value_5 = ishl(cast_3, shift, 16)
+    value_5 = correct(value_5, 16, False)
+    mask_6 = 32760
+    value_7 = value_5 & mask_6
+    value_7 = correct(value_7, 16, False)
+    inv_mask_8 = 32775
+    loaded_masked_9 = loaded_4 & inv_mask_8
+    loaded_masked_9 = correct(loaded_masked_9, 16, False)
+    value_10 = loaded_masked_9 | value_7
+    value_10 = correct(value_10, 16, False)
+    store_u16(value_10, u_addr)
+    padding = 2
+    iptr = u_addr + padding
+    cstr = (main_main_cstr,8)
+    dptr = cstr[0]
+    varargs = _alloca(4)
+    vaptr = varargs[0]
+    offset = 0
+    offset_11 = u_addr + offset
+    loaded_12 = load_u8(offset_11)
+    mask_13 = 7
+    value_14 = loaded_12 & mask_13
+    value_14 = correct(value_14, 8, False)
+    cast_15 = correct(int(round(value_14)), 32, False)
+    typecast_16 = correct(int(round(cast_15)), 32, True)
+    store_i32(typecast_16, vaptr)
+    size = 4
+    va2 = vaptr + size
+    _fptr = printf
+    result = _fptr(dptr, vaptr)
+    offset_17 = 0
+    offset_18 = u_addr + offset_17
+    loaded_19 = load_u8(offset_18)
+    mask_20 = 7
+    value_21 = loaded_19 & mask_20
+    value_21 = correct(value_21, 8, False)
+    cast_22 = correct(int(round(value_21)), 32, False)
+    one = 1
+    inc = cast_22 + one
+    inc = correct(inc, 32, False)
+    cast_23 = correct(int(round(inc)), 8, False)
+    loaded_24 = load_u8(offset_18)
+    mask_25 = 7
+    value_26 = cast_23 & mask_25
+    value_26 = correct(value_26, 8, False)
+    inv_mask_27 = 248
+    loaded_masked_28 = loaded_24 & inv_mask_27
+    loaded_masked_28 = correct(loaded_masked_28, 8, False)
+    value_29 = loaded_masked_28 | value_26
+    value_29 = correct(value_29, 8, False)
+    store_u8(value_29, offset_18)
+    cstr_30 = (main_main_cstr_30,8)
+    dptr_31 = cstr_30[0]
+    varargs_32 = _alloca(4)
+    vaptr_33 = varargs_32[0]
+    offset_34 = 0
+    offset_35 = u_addr + offset_34
+    loaded_36 = load_u8(offset_35)
+    mask_37 = 7
+    value_38 = loaded_36 & mask_37
+    value_38 = correct(value_38, 8, False)
+    cast_39 = correct(int(round(value_38)), 32, False)
+    typecast_40 = correct(int(round(cast_39)), 32, True)
+    store_i32(typecast_40, vaptr_33)
+    size_41 = 4
+    va2_42 = vaptr_33 + size_41
+    _fptr = printf
+    result_43 = _fptr(dptr_31, vaptr_33)
+    cstr_44 = (main_main_cstr_44,8)
+    dptr_45 = cstr_44[0]
+    varargs_46 = _alloca(4)
+    vaptr_47 = varargs_46[0]
+    offset_48 = 0
+    offset_49 = u_addr + offset_48
+    loaded_50 = load_u16(offset_49)
+    mask_51 = 32760
+    value_52 = loaded_50 & mask_51
+    value_52 = correct(value_52, 16, False)
+    shift_53 = 3
+    value_54 = ishr(value_52, shift_53, 16)
+    value_54 = correct(value_54, 16, False)
+    cast_55 = correct(int(round(value_54)), 32, False)
+    typecast_56 = correct(int(round(cast_55)), 32, True)
+    store_i32(typecast_56, vaptr_47)
+    size_57 = 4
+    va2_58 = vaptr_47 + size_57
+    _fptr = printf
+    result_59 = _fptr(dptr_45, vaptr_47)
+    offset_60 = 0
+    offset_61 = u_addr + offset_60
+    loaded_62 = load_u16(offset_61)
+    mask_63 = 32760
+    value_64 = loaded_62 & mask_63
+    value_64 = correct(value_64, 16, False)
+    shift_65 = 3
+    value_66 = ishr(value_64, shift_65, 16)
+    value_66 = correct(value_66, 16, False)
+    cast_67 = correct(int(round(value_66)), 32, False)
+    one_68 = 1
+    inc_69 = cast_67 + one_68
+    inc_69 = correct(inc_69, 32, False)
+    cast_70 = correct(int(round(inc_69)), 16, False)
+    loaded_71 = load_u16(offset_61)
+    shift_72 = 3
+    value_73 = ishl(cast_70, shift_72, 16)
+    value_73 = correct(value_73, 16, False)
+    mask_74 = 32760
+    value_75 = value_73 & mask_74
+    value_75 = correct(value_75, 16, False)
+    inv_mask_76 = 32775
+    loaded_masked_77 = loaded_71 & inv_mask_76
+    loaded_masked_77 = correct(loaded_masked_77, 16, False)
+    value_78 = loaded_masked_77 | value_75
+    value_78 = correct(value_78, 16, False)
+    store_u16(value_78, offset_61)
+    cstr_79 = (main_main_cstr_79,8)
+    dptr_80 = cstr_79[0]
+    varargs_81 = _alloca(4)
+    vaptr_82 = varargs_81[0]
+    offset_83 = 0
+    offset_84 = u_addr + offset_83
+    loaded_85 = load_u16(offset_84)
+    mask_86 = 32760
+    value_87 = loaded_85 & mask_86
+    value_87 = correct(value_87, 16, False)
+    shift_88 = 3
+    value_89 = ishr(value_87, shift_88, 16)
+    value_89 = correct(value_89, 16, False)
+    cast_90 = correct(int(round(value_89)), 32, False)
+    typecast_91 = correct(int(round(cast_90)), 32, True)
+    store_i32(typecast_91, vaptr_82)
+    size_92 = 4
+    va2_93 = vaptr_82 + size_92
+    _fptr = printf
+    result_94 = _fptr(dptr_80, vaptr_82)
+    s_alloc = _alloca(2)
+    s_addr = s_alloc[0]
+    constant_95 = 3
+    cast_96 = correct(int(round(constant_95)), 8, False)
+    loaded_97 = load_u8(s_addr)
+    mask_98 = 7
+    value_99 = cast_96 & mask_98
+    value_99 = correct(value_99, 8, False)
+    inv_mask_100 = 248
+    loaded_masked_101 = loaded_97 & inv_mask_100
+    loaded_masked_101 = correct(loaded_masked_101, 8, False)
+    value_102 = loaded_masked_101 | value_99
+    value_102 = correct(value_102, 8, False)
+    store_u8(value_102, s_addr)
+    constant_103 = 7
+    cast_104 = correct(int(round(constant_103)), 8, False)
+    loaded_105 = load_u8(s_addr)
+    shift_106 = 3
+    value_107 = ishl(cast_104, shift_106, 8)
+    value_107 = correct(value_107, 8, False)
+    mask_108 = 120
+    value_109 = value_107 & mask_108
+    value_109 = correct(value_109, 8, False)
+    inv_mask_110 = 135
+    loaded_masked_111 = loaded_105 & inv_mask_110
+    loaded_masked_111 = correct(loaded_masked_111, 8, False)
+    value_112 = loaded_masked_111 | value_109
+    value_112 = correct(value_112, 8, False)
+    store_u8(value_112, s_addr)
+    constant_113 = 1
+    cast_114 = correct(int(round(constant_113)), 16, False)
+    loaded_115 = load_u16(s_addr)
+    shift_116 = 7
+    value_117 = ishl(cast_114, shift_116, 16)
+    value_117 = correct(value_117, 16, False)
+    mask_118 = 384
+    value_119 = value_117 & mask_118
+    value_119 = correct(value_119, 16, False)
+    inv_mask_120 = 65151
+    loaded_masked_121 = loaded_115 & inv_mask_120
+    loaded_masked_121 = correct(loaded_masked_121, 16, False)
+    value_122 = loaded_masked_121 | value_119
+    value_122 = correct(value_122, 16, False)
+    store_u16(value_122, s_addr)
+    padding_123 = 2
+    iptr_124 = s_addr + padding_123
+    cstr_125 = (main_main_cstr_125,8)
+    dptr_126 = cstr_125[0]
+    varargs_127 = _alloca(4)
+    vaptr_128 = varargs_127[0]
+    offset_129 = 0
+    offset_130 = s_addr + offset_129
+    loaded_131 = load_i8(offset_130)
+    left_shift = 5
+    value_132 = ishl(loaded_131, left_shift, 8)
+    value_132 = correct(value_132, 8, True)
+    right_shift = 5
+    value_133 = ishr(value_132, right_shift, 8)
+    value_133 = correct(value_133, 8, True)
+    cast_134 = correct(int(round(value_133)), 32, True)
+    typecast_135 = correct(int(round(cast_134)), 32, True)
+    store_i32(typecast_135, vaptr_128)
+    size_136 = 4
+    va2_137 = vaptr_128 + size_136
+    _fptr = printf
+    result_138 = _fptr(dptr_126, vaptr_128)
+    offset_139 = 0
+    offset_140 = s_addr + offset_139
+    loaded_141 = load_i8(offset_140)
+    left_shift_142 = 5
+    value_143 = ishl(loaded_141, left_shift_142, 8)
+    value_143 = correct(value_143, 8, True)
+    right_shift_144 = 5
+    value_145 = ishr(value_143, right_shift_144, 8)
+    value_145 = correct(value_145, 8, True)
+    cast_146 = correct(int(round(value_145)), 32, True)
+    one_147 = 1
+    inc_148 = cast_146 + one_147
+    inc_148 = correct(inc_148, 32, True)
+    cast_149 = correct(int(round(inc_148)), 8, False)
+    loaded_150 = load_u8(offset_140)
+    mask_151 = 7
+    value_152 = cast_149 & mask_151
+    value_152 = correct(value_152, 8, False)
+    inv_mask_153 = 248
+    loaded_masked_154 = loaded_150 & inv_mask_153
+    loaded_masked_154 = correct(loaded_masked_154, 8, False)
+    value_155 = loaded_masked_154 | value_152
+    value_155 = correct(value_155, 8, False)
+    store_u8(value_155, offset_140)
+    cstr_156 = (main_main_cstr_156,8)
+    dptr_157 = cstr_156[0]
+    varargs_158 = _alloca(4)
+    vaptr_159 = varargs_158[0]
+    offset_160 = 0
+    offset_161 = s_addr + offset_160
+    loaded_162 = load_i8(offset_161)
+    left_shift_163 = 5
+    value_164 = ishl(loaded_162, left_shift_163, 8)
+    value_164 = correct(value_164, 8, True)
+    right_shift_165 = 5
+    value_166 = ishr(value_164, right_shift_165, 8)
+    value_166 = correct(value_166, 8, True)
+    cast_167 = correct(int(round(value_166)), 32, True)
+    typecast_168 = correct(int(round(cast_167)), 32, True)
+    store_i32(typecast_168, vaptr_159)
+    size_169 = 4
+    va2_170 = vaptr_159 + size_169
+    _fptr = printf
+    result_171 = _fptr(dptr_157, vaptr_159)
+    cstr_172 = (main_main_cstr_172,8)
+    dptr_173 = cstr_172[0]
+    varargs_174 = _alloca(4)
+    vaptr_175 = varargs_174[0]
+    offset_176 = 0
+    offset_177 = s_addr + offset_176
+    loaded_178 = load_i8(offset_177)
+    left_shift_179 = 1
+    value_180 = ishl(loaded_178, left_shift_179, 8)
+    value_180 = correct(value_180, 8, True)
+    right_shift_181 = 4
+    value_182 = ishr(value_180, right_shift_181, 8)
+    value_182 = correct(value_182, 8, True)
+    cast_183 = correct(int(round(value_182)), 32, True)
+    typecast_184 = correct(int(round(cast_183)), 32, True)
+    store_i32(typecast_184, vaptr_175)
+    size_185 = 4
+    va2_186 = vaptr_175 + size_185
+    _fptr = printf
+    result_187 = _fptr(dptr_173, vaptr_175)
+    offset_188 = 0
+    offset_189 = s_addr + offset_188
+    loaded_190 = load_i8(offset_189)
+    left_shift_191 = 1
+    value_192 = ishl(loaded_190, left_shift_191, 8)
+    value_192 = correct(value_192, 8, True)
+    right_shift_193 = 4
+    value_194 = ishr(value_192, right_shift_193, 8)
+    value_194 = correct(value_194, 8, True)
+    cast_195 = correct(int(round(value_194)), 32, True)
+    one_196 = 1
+    inc_197 = cast_195 + one_196
+    inc_197 = correct(inc_197, 32, True)
+    cast_198 = correct(int(round(inc_197)), 8, False)
+    loaded_199 = load_u8(offset_189)
+    shift_200 = 3
+    value_201 = ishl(cast_198, shift_200, 8)
+    value_201 = correct(value_201, 8, False)
+    mask_202 = 120
+    value_203 = value_201 & mask_202
+    value_203 = correct(value_203, 8, False)
+    inv_mask_204 = 135
+    loaded_masked_205 = loaded_199 & inv_mask_204
+    loaded_masked_205 = correct(loaded_masked_205, 8, False)
+    value_206 = loaded_masked_205 | value_203
+    value_206 = correct(value_206, 8, False)
+    store_u8(value_206, offset_189)
+    cstr_207 = (main_main_cstr_207,8)
+    dptr_208 = cstr_207[0]
+    varargs_209 = _alloca(4)
+    vaptr_210 = varargs_209[0]
+    offset_211 = 0
+    offset_212 = s_addr + offset_211
+    loaded_213 = load_i8(offset_212)
+    left_shift_214 = 1
+    value_215 = ishl(loaded_213, left_shift_214, 8)
+    value_215 = correct(value_215, 8, True)
+    right_shift_216 = 4
+    value_217 = ishr(value_215, right_shift_216, 8)
+    value_217 = correct(value_217, 8, True)
+    cast_218 = correct(int(round(value_217)), 32, True)
+    typecast_219 = correct(int(round(cast_218)), 32, True)
+    store_i32(typecast_219, vaptr_210)
+    size_220 = 4
+    va2_221 = vaptr_210 + size_220
+    _fptr = printf
+    result_222 = _fptr(dptr_208, vaptr_210)
+    cstr_223 = (main_main_cstr_223,8)
+    dptr_224 = cstr_223[0]
+    varargs_225 = _alloca(4)
+    vaptr_226 = varargs_225[0]
+    offset_227 = 0
+    offset_228 = s_addr + offset_227
+    loaded_229 = load_i16(offset_228)
+    left_shift_230 = 7
+    value_231 = ishl(loaded_229, left_shift_230, 16)
+    value_231 = correct(value_231, 16, True)
+    right_shift_232 = 14
+    value_233 = ishr(value_231, right_shift_232, 16)
+    value_233 = correct(value_233, 16, True)
+    cast_234 = correct(int(round(value_233)), 32, True)
+    typecast_235 = correct(int(round(cast_234)), 32, True)
+    store_i32(typecast_235, vaptr_226)
+    size_236 = 4
+    va2_237 = vaptr_226 + size_236
+    _fptr = printf
+    result_238 = _fptr(dptr_224, vaptr_226)
+    offset_239 = 0
+    offset_240 = s_addr + offset_239
+    loaded_241 = load_i16(offset_240)
+    left_shift_242 = 7
+    value_243 = ishl(loaded_241, left_shift_242, 16)
+    value_243 = correct(value_243, 16, True)
+    right_shift_244 = 14
+    value_245 = ishr(value_243, right_shift_244, 16)
+    value_245 = correct(value_245, 16, True)
+    cast_246 = correct(int(round(value_245)), 32, True)
+    one_247 = 1
+    inc_248 = cast_246 + one_247
+    inc_248 = correct(inc_248, 32, True)
+    cast_249 = correct(int(round(inc_248)), 16, False)
+    loaded_250 = load_u16(offset_240)
+    shift_251 = 7
+    value_252 = ishl(cast_249, shift_251, 16)
+    value_252 = correct(value_252, 16, False)
+    mask_253 = 384
+    value_254 = value_252 & mask_253
+    value_254 = correct(value_254, 16, False)
+    inv_mask_255 = 65151
+    loaded_masked_256 = loaded_250 & inv_mask_255
+    loaded_masked_256 = correct(loaded_masked_256, 16, False)
+    value_257 = loaded_masked_256 | value_254
+    value_257 = correct(value_257, 16, False)
+    store_u16(value_257, offset_240)
+    cstr_258 = (main_main_cstr_258,8)
+    dptr_259 = cstr_258[0]
+    varargs_260 = _alloca(4)
+    vaptr_261 = varargs_260[0]
+    offset_262 = 0
+    offset_263 = s_addr + offset_262
+    loaded_264 = load_i16(offset_263)
+    left_shift_265 = 7
+    value_266 = ishl(loaded_264, left_shift_265, 16)
+    value_266 = correct(value_266, 16, True)
+    right_shift_267 = 14
+    value_268 = ishr(value_266, right_shift_267, 16)
+    value_268 = correct(value_268, 16, True)
+    cast_269 = correct(int(round(value_268)), 32, True)
+    typecast_270 = correct(int(round(cast_269)), 32, True)
+    store_i32(typecast_270, vaptr_261)
+    size_271 = 4
+    va2_272 = vaptr_261 + size_271
+    _fptr = printf
+    result_273 = _fptr(dptr_259, vaptr_261)
+    zero = 0
+    del stack[_stack_top:]
+    return zero
+func_pointers.append(main_main)
+
+main_main_cstr = heap_top()
+heap.append(117)
+heap.append(46)
+heap.append(98)
+heap.append(61)
+heap.append(37)
+heap.append(100)
+heap.append(10)
+heap.append(0)
+main_main_cstr_30 = heap_top()
+heap.append(117)
+heap.append(46)
+heap.append(98)
+heap.append(61)
+heap.append(37)
+heap.append(100)
+heap.append(10)
+heap.append(0)
+main_main_cstr_44 = heap_top()
+heap.append(117)
+heap.append(46)
+heap.append(99)
+heap.append(61)
+heap.append(37)
+heap.append(100)
+heap.append(10)
+heap.append(0)
+main_main_cstr_79 = heap_top()
+heap.append(117)
+heap.append(46)
+heap.append(99)
+heap.append(61)
+heap.append(37)
+heap.append(100)
+heap.append(10)
+heap.append(0)
+main_main_cstr_125 = heap_top()
+heap.append(115)
+heap.append(46)
+heap.append(98)
+heap.append(61)
+heap.append(37)
+heap.append(100)
+heap.append(10)
+heap.append(0)
+main_main_cstr_156 = heap_top()
+heap.append(115)
+heap.append(46)
+heap.append(98)
+heap.append(61)
+heap.append(37)
+heap.append(100)
+heap.append(10)
+heap.append(0)
+main_main_cstr_172 = heap_top()
+heap.append(115)
+heap.append(46)
+heap.append(99)
+heap.append(61)
+heap.append(37)
+heap.append(100)
+heap.append(10)
+heap.append(0)
+main_main_cstr_207 = heap_top()
+heap.append(115)
+heap.append(46)
+heap.append(99)
+heap.append(61)
+heap.append(37)
+heap.append(100)
+heap.append(10)
+heap.append(0)
+main_main_cstr_223 = heap_top()
+heap.append(115)
+heap.append(46)
+heap.append(100)
+heap.append(61)
+heap.append(37)
+heap.append(100)
+heap.append(10)
+heap.append(0)
+main_main_cstr_258 = heap_top()
+heap.append(115)
+heap.append(46)
+heap.append(100)
+heap.append(61)
+heap.append(37)
+heap.append(100)
+heap.append(10)
+heap.append(0)
+
+
+def bsp_putc(c):
+    print(chr(c), end="")
+main_main()
@@ -0,0 +1,495 @@
+# Automatically generated on Sat Oct 17 02:32:14 2026
+# Generator /root/package/ppci/lang/python/ir2py.py
+
+import struct
+import math
+
+heap = bytearray()
+stack = bytearray()
+HEAP_START = 0x10000000
+func_pointers = list()
+externals = {}
+
+def correct(value, bits, signed):
+    base = 1 << bits
+    value %= base
+    if signed and value.bit_length() == bits:
+        return value - base
+    else:
+        return value
+
+def idiv(x, y):
+    return int(math.trunc(x/y))
+
+def irem(x, y):
+    sign = x < 0
+    v = abs(x) % abs(y)
+    if sign:
+        return -v
+    else:
+        return v
+
+def ishl(x, amount, bits):
+    amount = amount % bits
+    return x << amount
+def ishr(x, amount, bits):
+    amount = amount % bits
+    return x >> amount
+def _alloca(amount):
+    ptr = len(stack)
+    stack.extend(bytes(amount))
+    return (ptr, amount)
+
+def _free(amount):
+    for _ in range(amount):
+        stack.pop()
+
+def read_mem(address, size):
+    mem, address = get_memory(address)
+    assert address+size <= len(mem), str(hex(address))
+    return mem[address:address+size]
+
+def write_mem(address, data):
+    mem, address = get_memory(address)
+    size = len(data)
+    assert address+size <= len(mem), str(hex(address))
+    mem[address:address+size] = data
+
+def get_memory(v):
+    if v >= HEAP_START:
+        return heap, v - HEAP_START
+    else:
+        return stack, v
+
+def heap_top():
+    return len(heap) + HEAP_START
+
+def load_f64(p):
+    return struct.unpack("d", read_mem(p, 8))[0]
+
+def store_f64(v, p):
+    write_mem(p, struct.pack("d", v))
+
+def load_f32(p):
+    return struct.unpack("f", read_mem(p, 4))[0]
+
+def store_f32(v, p):
+    write_mem(p, struct.pack("f", v))
+
+def load_i64(p):
+    return struct.unpack("q", read_mem(p, 8))[0]
+
+def store_i64(v, p):
+    write_mem(p, struct.pack("q", v))
+
+def load_u64(p):
+    return struct.unpack("Q", read_mem(p, 8))[0]
+
+def store_u64(v, p):
+    write_mem(p, struct.pack("Q", v))
+
+def load_i32(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_i32(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_u32(p):
+    return struct.unpack("I", read_mem(p, 4))[0]
+
+def store_u32(v, p):
+    write_mem(p, struct.pack("I", v))
+
+def load_ptr(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_ptr(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_i16(p):
+    return struct.unpack("h", read_mem(p, 2))[0]
+
+def store_i16(v, p):
+    write_mem(p, struct.pack("h", v))
+
+def load_u16(p):
+    return struct.unpack("H", read_mem(p, 2))[0]
+
+def store_u16(v, p):
+    write_mem(p, struct.pack("H", v))
+
+def load_i8(p):
+    return struct.unpack("b", read_mem(p, 1))[0]
+
+def store_i8(v, p):
+    write_mem(p, struct.pack("b", v))
+
+def load_u8(p):
+    return struct.unpack("B", read_mem(p, 1))[0]
+
+def store_u8(v, p):
+    write_mem(p, struct.pack("B", v))
+
+
+# Module main
+def reverse(str,length):
+    _stack_top = len(stack)
+    str_alloc = _alloca(4)
+    str_addr = str_alloc[0]
+    store_ptr(str, str_addr)
+    length_alloc = _alloca(4)
+    length_addr = length_alloc[0]
+    store_i32(length, length_addr)
+    start_alloc = _alloca(4)
+    start_addr = start_alloc[0]
+    constant = 0
+    store_i32(constant, start_addr)
+    size = 4
+    iptr = start_addr + size
+    end_alloc = _alloca(4)
+    end_addr = end_alloc[0]
+    load = load_i32(length_addr)
+    constant_0 = 1
+    op = load - constant_0
+    op = correct(op, 32, True)
+    store_i32(op, end_addr)
+    size_1 = 4
+    iptr_2 = end_addr + size_1
+    tmp_alloc = _alloca(1)
+    tmp_addr = tmp_alloc[0]
+    while True:
+        load_3 = load_i32(start_addr)
+        load_4 = load_i32(end_addr)
+        if load_3 < load_4:
+            load_5 = load_ptr(str_addr)
+            load_6 = load_i32(start_addr)
+            element_size = 1
+            index = int(round(load_6))
+            element_offset = index * element_size
+            element_address = load_5 + element_offset
+            load_7 = load_i8(element_address)
+            store_i8(load_7, tmp_addr)
+            load_8 = load_ptr(str_addr)
+            load_9 = load_i32(start_addr)
+            element_size_10 = 1
+            index_11 = int(round(load_9))
+            element_offset_12 = index_11 * element_size_10
+            element_address_13 = load_8 + element_offset_12
+            load_14 = load_ptr(str_addr)
+            load_15 = load_i32(end_addr)
+            element_size_16 = 1
+            index_17 = int(round(load_15))
+            element_offset_18 = index_17 * element_size_16
+            element_address_19 = load_14 + element_offset_18
+            load_20 = load_i8(element_address_19)
+            store_i8(load_20, element_address_13)
+            load_21 = load_ptr(str_addr)
+            load_22 = load_i32(end_addr)
+            element_size_23 = 1
+            index_24 = int(round(load_22))
+            element_offset_25 = index_24 * element_size_23
+            element_address_26 = load_21 + element_offset_25
+            load_27 = load_i8(tmp_addr)
+            store_i8(load_27, element_address_26)
+            load_28 = load_i32(start_addr)
+            one = 1
+            inc = load_28 + one
+            inc = correct(inc, 32, True)
+            store_i32(inc, start_addr)
+            load_29 = load_i32(end_addr)
+            one_30 = 1
+            inc_31 = load_29 - one_30
+            inc_31 = correct(inc_31, 32, True)
+            store_i32(inc_31, end_addr)
+            continue
+        else:
+            del stack[_stack_top:]
+            return
+func_pointers.append(reverse)
+
+def itoa(value,str,base):
+    _stack_top = len(stack)
+    value_alloc = _alloca(4)
+    value_addr = value_alloc[0]
+    store_i32(value, value_addr)
+    str_alloc = _alloca(4)
+    str_addr = str_alloc[0]
+    store_ptr(str, str_addr)
+    base_alloc = _alloca(4)
+    base_addr = base_alloc[0]
+    store_i32(base, base_addr)
+    i_alloc = _alloca(4)
+    i_addr = i_alloc[0]
+    constant = 0
+    store_i32(constant, i_addr)
+    size = 4
+    iptr = i_addr + size
+    neg_alloc = _alloca(4)
+    neg_addr = neg_alloc[0]
+    constant_0 = 0
+    store_i32(constant_0, neg_addr)
+    size_1 = 4
+    iptr_2 = neg_addr + size_1
+    load = load_i32(value_addr)
+    constant_3 = 0
+    if load == constant_3:
+        load_4 = load_ptr(str_addr)
+        load_5 = load_i32(i_addr)
+        one = 1
+        inc = load_5 + one
+        inc = correct(inc, 32, True)
+        store_i32(inc, i_addr)
+        element_size = 1
+        index = int(round(load_5))
+        element_offset = index * element_size
+        element_address = load_4 + element_offset
+        constant_6 = 48
+        store_i8(constant_6, element_address)
+        load_7 = load_ptr(str_addr)
+        load_8 = load_i32(i_addr)
+        element_size_9 = 1
+        index_10 = int(round(load_8))
+        element_offset_11 = index_10 * element_size_9
+        element_address_12 = load_7 + element_offset_11
+        constant_13 = 0
+        store_i8(constant_13, element_address_12)
+        load_14 = load_ptr(str_addr)
+        del stack[_stack_top:]
+        return load_14
+    else:
+        load_15 = load_i32(value_addr)
+        constant_16 = 0
+        if load_15 < constant_16:
+            constant_17 = 1
+            store_i32(constant_17, neg_addr)
+            load_18 = load_i32(value_addr)
+            unop = -load_18
+            unop = correct(unop, 32, True)
+            store_i32(unop, value_addr)
+        while True:
+            load_19 = load_i32(value_addr)
+            constant_20 = 0
+            if load_19 != constant_20:
+                rem_alloc = _alloca(4)
+                rem_addr = rem_alloc[0]
+                load_21 = load_i32(value_addr)
+                load_22 = load_i32(base_addr)
+                op = irem(load_21, load_22)
+                op = correct(op, 32, True)
+                store_i32(op, rem_addr)
+                size_23 = 4
+                iptr_24 = rem_addr + size_23
+                load_25 = load_ptr(str_addr)
+                load_26 = load_i32(i_addr)
+                one_27 = 1
+                inc_28 = load_26 + one_27
+                inc_28 = correct(inc_28, 32, True)
+                store_i32(inc_28, i_addr)
+                element_size_29 = 1
+                index_30 = int(round(load_26))
+                element_offset_31 = index_30 * element_size_29
+                element_address_32 = load_25 + element_offset_31
+                load_33 = load_i32(rem_addr)
+                constant_34 = 48
+                typecast = correct(int(round(constant_34)), 32, True)
+                op_35 = load_33 + typecast
+                op_35 = correct(op_35, 32, True)
+                typecast_36 = correct(int(round(op_35)), 8, True)
+                store_i8(typecast_36, element_address_32)
+                load_37 = load_i32(value_addr)
+                load_38 = load_i32(base_addr)
+                op_39 = idiv(load_37, load_38)
+                op_39 = correct(op_39, 32, True)
+                store_i32(op_39, value_addr)
+                continue
+            else:
+                load_40 = load_i32(neg_addr)
+                zero = 0
+                if load_40 == zero:
+                    load_50 = load_ptr(str_addr)
+                    load_51 = load_i32(i_addr)
+                    element_size_52 = 1
+                    index_53 = int(round(load_51))
+                    element_offset_54 = index_53 * element_size_52
+                    element_address_55 = load_50 + element_offset_54
+                    constant_56 = 0
+                    typecast_57 = correct(int(round(constant_56)), 8, True)
+                    store_i8(typecast_57, element_address_55)
+                    load_58 = load_ptr(str_addr)
+                    load_59 = load_i32(i_addr)
+                    _fptr = reverse
+                    _fptr(load_58, load_59)
+                    load_60 = load_ptr(str_addr)
+                    del stack[_stack_top:]
+                    return load_60
+                else:
+                    load_41 = load_ptr(str_addr)
+                    load_42 = load_i32(i_addr)
+                    one_43 = 1
+                    inc_44 = load_42 + one_43
+                    inc_44 = correct(inc_44, 32, True)
+                    store_i32(inc_44, i_addr)
+                    element_size_45 = 1
+                    index_46 = int(round(load_42))
+                    element_offset_47 = index_46 * element_size_45
+                    element_address_48 = load_41 + element_offset_47
+                    constant_49 = 45
+                    store_i8(constant_49, element_address_48)
+                    load_50 = load_ptr(str_addr)
+                    load_51 = load_i32(i_addr)
+                    element_size_52 = 1
+                    index_53 = int(round(load_51))
+                    element_offset_54 = index_53 * element_size_52
+                    element_address_55 = load_50 + element_offset_54
+                    constant_56 = 0
+                    typecast_57 = correct(int(round(constant_56)), 8, True)
+                    store_i8(typecast_57, element_address_55)
+                    load_58 = load_ptr(str_addr)
+                    load_59 = load_i32(i_addr)
+                    _fptr = reverse
+                    _fptr(load_58, load_59)
+                    load_60 = load_ptr(str_addr)
+                    del stack[_stack_top:]
+                    return load_60
+func_pointers.append(itoa)
+
+def printf(txt,varargz):
+    _stack_top = len(stack)
+    txt_alloc = _alloca(4)
+    txt_addr = txt_alloc[0]
+    store_ptr(txt, txt_addr)
+    args_alloc = _alloca(4)
+    args_addr = args_alloc[0]
+    store_ptr(varargz, args_addr)
+    buffer_alloc = _alloca(20)
+    buffer_addr = buffer_alloc[0]
+    while True:
+        load = load_ptr(txt_addr)
+        load_0 = load_i8(load)
+        typecast = correct(int(round(load_0)), 32, True)
+        constant = 0
+        if typecast != constant:
+            load_1 = load_ptr(txt_addr)
+            load_2 = load_i8(load_1)
+            constant_3 = 37
+            if load_2 == constant_3:
+                load_4 = load_ptr(txt_addr)
+                one_element = 1
+                inc = load_4 + one_element
+                store_ptr(inc, txt_addr)
+                load_5 = load_ptr(txt_addr)
+                load_6 = load_i8(load_5)
+                constant_7 = 100
+                if load_6 == constant_7:
+                    load_8 = load_ptr(txt_addr)
+                    one_element_9 = 1
+                    inc_10 = load_8 + one_element_9
+                    store_ptr(inc_10, txt_addr)
+                    v_alloc = _alloca(4)
+                    v_addr = v_alloc[0]
+                    va_ptr = load_ptr(args_addr)
+                    va_arg = load_i32(va_ptr)
+                    size = 4
+                    incptr = va_ptr + size
+                    store_ptr(incptr, args_addr)
+                    store_i32(va_arg, v_addr)
+                    size_11 = 4
+                    iptr = v_addr + size_11
+                    load_12 = load_i32(v_addr)
+                    constant_13 = 10
+                    _fptr = itoa
+                    result = _fptr(load_12, buffer_addr, constant_13)
+                    varargs = 0
+                    _fptr = printf
+                    result_14 = _fptr(buffer_addr, varargs)
+                else:
+                    load_15 = load_ptr(txt_addr)
+                    one_element_16 = 1
+                    inc_17 = load_15 - one_element_16
+                    store_ptr(inc_17, txt_addr)
+                    load_18 = load_ptr(txt_addr)
+                    load_19 = load_i8(load_18)
+                    _fptr = bsp_putc
+                    _fptr(load_19)
+                    load_20 = load_ptr(txt_addr)
+                    one_element_21 = 1
+                    inc_22 = load_20 + one_element_21
+                    store_ptr(inc_22, txt_addr)
+                    load_23 = load_ptr(txt_addr)
+                    load_24 = load_i8(load_23)
+                    _fptr = bsp_putc
+                    _fptr(load_24)
+            else:
+                load_25 = load_ptr(txt_addr)
+                load_26 = load_i8(load_25)
+                _fptr = bsp_putc
+                _fptr(load_26)
+                load_27 = load_ptr(txt_addr)
+                one_element_28 = 1
+                inc_29 = load_27 + one_element_28
+                store_ptr(inc_29, txt_addr)
+            continue
+        else:
+            zero = 0
+            del stack[_stack_top:]
+            return zero
+func_pointers.append(printf)
+
+
+
+# Module main
+def main_main():
+    _stack_top = len(stack)
+    a_alloc = _alloca(4)
+    a_addr = a_alloc[0]
+    constant = 2
+    typecast = correct(int(round(constant)), 32, False)
+    store_u32(typecast, a_addr)
+    size = 4
+    iptr = a_addr + size
+    b_alloc = _alloca(4)
+    b_addr = b_alloc[0]
+    constant_0 = 1
+    unop = -constant_0
+    unop = correct(unop, 32, True)
+    store_i32(unop, b_addr)
+    size_1 = 4
+    iptr_2 = b_addr + size_1
+    load = load_i32(b_addr)
+    typecast_3 = correct(int(round(load)), 32, False)
+    load_4 = load_u32(a_addr)
+    if typecast_3 > load_4:
+        cstr = (main_main_cstr,5)
+        dptr = cstr[0]
+        varargs = 0
+        _fptr = printf
+        result = _fptr(dptr, varargs)
+    else:
+        cstr_5 = (main_main_cstr_5,7)
+        dptr_6 = cstr_5[0]
+        varargs_7 = 0
+        _fptr = printf
+        result_8 = _fptr(dptr_6, varargs_7)
+    del stack[_stack_top:]
+    return
+func_pointers.append(main_main)
+
+main_main_cstr = heap_top()
+heap.append(79)
+heap.append(75)
+heap.append(46)
+heap.append(10)
+heap.append(0)
+main_main_cstr_5 = heap_top()
+heap.append(70)
+heap.append(97)
+heap.append(105)
+heap.append(108)
+heap.append(46)
+heap.append(10)
+heap.append(0)
+
+
+def bsp_putc(c):
+    print(chr(c), end="")
+main_main()
@@ -0,0 +1,500 @@
+# Automatically generated on Sat Oct 17 02:32:14 2026
+# Generator /root/package/ppci/lang/python/ir2py.py
+
+import struct
+import math
+
+heap = bytearray()
+stack = bytearray()
+HEAP_START = 0x10000000
+func_pointers = list()
+externals = {}
+
+def correct(value, bits, signed):
+    base = 1 << bits
+    value %= base
+    if signed and value.bit_length() == bits:
+        return value - base
+    else:
+        return value
+
+def idiv(x, y):
+    return int(math.trunc(x/y))
+
+def irem(x, y):
+    sign = x < 0
+    v = abs(x) % abs(y)
+    if sign:
+        return -v
+    else:
+        return v
+
+def ishl(x, amount, bits):
+    amount = amount % bits
+    return x << amount
+def ishr(x, amount, bits):
+    amount = amount % bits
+    return x >> amount
+def _alloca(amount):
+    ptr = len(stack)
+    stack.extend(bytes(amount))
+    return (ptr, amount)
+
+def _free(amount):
+    for _ in range(amount):
+        stack.pop()
+
+def read_mem(address, size):
+    mem, address = get_memory(address)
+    assert address+size <= len(mem), str(hex(address))
+    return mem[address:address+size]
+
+def write_mem(address, data):
+    mem, address = get_memory(address)
+    size = len(data)
+    assert address+size <= len(mem), str(hex(address))
+    mem[address:address+size] = data
+
+def get_memory(v):
+    if v >= HEAP_START:
+        return heap, v - HEAP_START
+    else:
+        return stack, v
+
+def heap_top():
+    return len(heap) + HEAP_START
+
+def load_f64(p):
+    return struct.unpack("d", read_mem(p, 8))[0]
+
+def store_f64(v, p):
+    write_mem(p, struct.pack("d", v))
+
+def load_f32(p):
+    return struct.unpack("f", read_mem(p, 4))[0]
+
+def store_f32(v, p):
+    write_mem(p, struct.pack("f", v))
+
+def load_i64(p):
+    return struct.unpack("q", read_mem(p, 8))[0]
+
+def store_i64(v, p):
+    write_mem(p, struct.pack("q", v))
+
+def load_u64(p):
+    return struct.unpack("Q", read_mem(p, 8))[0]
+
+def store_u64(v, p):
+    write_mem(p, struct.pack("Q", v))
+
+def load_i32(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_i32(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_u32(p):
+    return struct.unpack("I", read_mem(p, 4))[0]
+
+def store_u32(v, p):
+    write_mem(p, struct.pack("I", v))
+
+def load_ptr(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_ptr(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_i16(p):
+    return struct.unpack("h", read_mem(p, 2))[0]
+
+def store_i16(v, p):
+    write_mem(p, struct.pack("h", v))
+
+def load_u16(p):
+    return struct.unpack("H", read_mem(p, 2))[0]
+
+def store_u16(v, p):
+    write_mem(p, struct.pack("H", v))
+
+def load_i8(p):
+    return struct.unpack("b", read_mem(p, 1))[0]
+
+def store_i8(v, p):
+    write_mem(p, struct.pack("b", v))
+
+def load_u8(p):
+    return struct.unpack("B", read_mem(p, 1))[0]
+
+def store_u8(v, p):
+    write_mem(p, struct.pack("B", v))
+
+
+# Module c3_code
+def io_print(txt):
+    _stack_top = len(stack)
+    var_i = _alloca(4)
+    var_i_0 = var_i[0]
+    var_txt = _alloca(4)
+    var_txt_1 = var_txt[0]
+    store_ptr(txt, var_txt_1)
+    cnst = 0
+    store_i32(cnst, var_i_0)
+    while True:
+        load = load_i32(var_i_0)
+        load_2 = load_ptr(var_txt_1)
+        offset = 0
+        mem_addr = load_2 + offset
+        load_3 = load_i32(mem_addr)
+        if load < load_3:
+            load_4 = load_ptr(var_txt_1)
+            offset_5 = 4
+            mem_addr_6 = load_4 + offset_5
+            load_7 = load_i32(var_i_0)
+            element_size = 1
+            element_offset = load_7 * element_size
+            element_offset = correct(element_offset, 32, True)
+            element_offset_8 = int(round(element_offset))
+            element_address = mem_addr_6 + element_offset_8
+            load_9 = load_u8(element_address)
+            _fptr = bsp_putc
+            _fptr(load_9)
+            load_10 = load_i32(var_i_0)
+            cnst_11 = 1
+            binop = load_10 + cnst_11
+            binop = correct(binop, 32, True)
+            store_i32(binop, var_i_0)
+            continue
+        else:
+            del stack[_stack_top:]
+            return
+func_pointers.append(io_print)
+
+def io_print2(label,value):
+    _stack_top = len(stack)
+    var_label = _alloca(4)
+    var_label_0 = var_label[0]
+    store_ptr(label, var_label_0)
+    var_value = _alloca(4)
+    var_value_1 = var_value[0]
+    store_i32(value, var_value_1)
+    load = load_ptr(var_label_0)
+    _fptr = io_print
+    _fptr(load)
+    load_2 = load_i32(var_value_1)
+    _fptr = io_print_int
+    _fptr(load_2)
+    del stack[_stack_top:]
+    return
+func_pointers.append(io_print2)
+
+def io_print_int(i):
+    _stack_top = len(stack)
+    var_b = _alloca(4)
+    var_b_0 = var_b[0]
+    var_c = _alloca(4)
+    var_c_1 = var_c[0]
+    var_i = _alloca(4)
+    var_i_2 = var_i[0]
+    store_i32(i, var_i_2)
+    strval = (io_print_int_strval,6)
+    addr = strval[0]
+    _fptr = io_print
+    _fptr(addr)
+    cnst = 0
+    store_i32(cnst, var_c_1)
+    cnst_3 = 0
+    store_i32(cnst_3, var_b_0)
+    cnst_4 = 28
+    store_i32(cnst_4, var_b_0)
+    while True:
+        load = load_i32(var_b_0)
+        cnst_5 = 0
+        if load >= cnst_5:
+            load_6 = load_i32(var_i_2)
+            load_7 = load_i32(var_b_0)
+            binop = ishr(load_6, load_7, 32)
+            binop = correct(binop, 32, True)
+            cnst_8 = 15
+            binop_9 = binop & cnst_8
+            binop_9 = correct(binop_9, 32, True)
+            store_i32(binop_9, var_c_1)
+            load_10 = load_i32(var_c_1)
+            cnst_11 = 10
+            if load_10 < cnst_11:
+                cnst_12 = 48
+                load_13 = load_i32(var_c_1)
+                binop_14 = cnst_12 + load_13
+                binop_14 = correct(binop_14, 32, True)
+                cast = correct(int(round(binop_14)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast)
+            else:
+                cnst_15 = 65
+                cnst_16 = 10
+                binop_17 = cnst_15 - cnst_16
+                binop_17 = correct(binop_17, 32, True)
+                load_18 = load_i32(var_c_1)
+                binop_19 = binop_17 + load_18
+                binop_19 = correct(binop_19, 32, True)
+                cast_20 = correct(int(round(binop_19)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast_20)
+            load_21 = load_i32(var_b_0)
+            cnst_22 = 4
+            binop_23 = load_21 - cnst_22
+            binop_23 = correct(binop_23, 32, True)
+            store_i32(binop_23, var_b_0)
+            continue
+        else:
+            cnst_24 = 10
+            cast_25 = correct(int(round(cnst_24)), 8, False)
+            _fptr = bsp_putc
+            _fptr(cast_25)
+            del stack[_stack_top:]
+            return
+func_pointers.append(io_print_int)
+
+def io_print_sub(txt,start,end):
+    _stack_top = len(stack)
+    var_end = _alloca(4)
+    var_end_0 = var_end[0]
+    store_i32(end, var_end_0)
+    var_i = _alloca(4)
+    var_i_1 = var_i[0]
+    var_start = _alloca(4)
+    var_start_2 = var_start[0]
+    store_i32(start, var_start_2)
+    var_txt = _alloca(4)
+    var_txt_3 = var_txt[0]
+    store_ptr(txt, var_txt_3)
+    cnst = 0
+    store_i32(cnst, var_i_1)
+    load = load_i32(var_start_2)
+    store_i32(load, var_i_1)
+    while True:
+        load_4 = load_i32(var_i_1)
+        load_5 = load_i32(var_end_0)
+        if load_4 < load_5:
+            load_6 = load_ptr(var_txt_3)
+            offset = 4
+            mem_addr = load_6 + offset
+            load_7 = load_i32(var_i_1)
+            element_size = 1
+            element_offset = load_7 * element_size
+            element_offset = correct(element_offset, 32, True)
+            element_offset_8 = int(round(element_offset))
+            element_address = mem_addr + element_offset_8
+            load_9 = load_u8(element_address)
+            _fptr = bsp_putc
+            _fptr(load_9)
+            load_10 = load_i32(var_i_1)
+            cnst_11 = 1
+            binop = load_10 + cnst_11
+            binop = correct(binop, 32, True)
+            store_i32(binop, var_i_1)
+            continue
+        else:
+            del stack[_stack_top:]
+            return
+func_pointers.append(io_print_sub)
+
+def io_println(txt):
+    _stack_top = len(stack)
+    var_txt = _alloca(4)
+    var_txt_0 = var_txt[0]
+    store_ptr(txt, var_txt_0)
+    load = load_ptr(var_txt_0)
+    _fptr = io_print
+    _fptr(load)
+    cnst = 10
+    cast = correct(int(round(cnst)), 8, False)
+    _fptr = bsp_putc
+    _fptr(cast)
+    del stack[_stack_top:]
+    return
+func_pointers.append(io_println)
+
+def main_find_first(a,b,size,stride):
+    _stack_top = len(stack)
+    var_a = _alloca(4)
+    var_a_0 = var_a[0]
+    store_ptr(a, var_a_0)
+    var_b = _alloca(4)
+    var_b_1 = var_b[0]
+    store_i32(b, var_b_1)
+    var_i = _alloca(4)
+    var_i_2 = var_i[0]
+    var_ptr = _alloca(4)
+    var_ptr_3 = var_ptr[0]
+    var_size = _alloca(4)
+    var_size_4 = var_size[0]
+    store_i32(size, var_size_4)
+    var_stride = _alloca(4)
+    var_stride_5 = var_stride[0]
+    store_i32(stride, var_stride_5)
+    cnst = 0
+    store_i32(cnst, var_i_2)
+    inc = 4
+    add = var_i_2 + inc
+    cnst_6 = 0
+    store_i32(cnst_6, var_ptr_3)
+    inc_7 = 4
+    add_8 = var_ptr_3 + inc_7
+    cnst_9 = 0
+    store_i32(cnst_9, var_i_2)
+    while True:
+        load = load_i32(var_i_2)
+        load_10 = load_i32(var_size_4)
+        if load < load_10:
+            load_11 = load_ptr(var_a_0)
+            load_12 = load_i32(var_ptr_3)
+            int2ptr = int(round(load_12))
+            binop = load_11 + int2ptr
+            load_13 = load_i32(binop)
+            load_14 = load_i32(var_b_1)
+            if load_13 == load_14:
+                load_15 = load_i32(var_i_2)
+                del stack[_stack_top:]
+                return load_15
+            else:
+                load_16 = load_i32(var_stride_5)
+                assign_op_load = load_i32(var_ptr_3)
+                binop_17 = assign_op_load + load_16
+                binop_17 = correct(binop_17, 32, True)
+                store_i32(binop_17, var_ptr_3)
+                cnst_18 = 1
+                assign_op_load_19 = load_i32(var_i_2)
+                binop_20 = assign_op_load_19 + cnst_18
+                binop_20 = correct(binop_20, 32, True)
+                store_i32(binop_20, var_i_2)
+                continue
+        else:
+            cnst_21 = 255
+            del stack[_stack_top:]
+            return cnst_21
+func_pointers.append(main_find_first)
+
+def main_main():
+    _stack_top = len(stack)
+    var_a = _alloca(40)
+    var_a_0 = var_a[0]
+    cnst = 0
+    element_size = 4
+    element_offset = cnst * element_size
+    element_offset = correct(element_offset, 32, True)
+    element_offset_1 = int(round(element_offset))
+    element_address = var_a_0 + element_offset_1
+    cnst_2 = 12
+    store_i32(cnst_2, element_address)
+    cnst_3 = 1
+    element_size_4 = 4
+    element_offset_5 = cnst_3 * element_size_4
+    element_offset_5 = correct(element_offset_5, 32, True)
+    element_offset_6 = int(round(element_offset_5))
+    element_address_7 = var_a_0 + element_offset_6
+    cnst_8 = 7
+    store_i32(cnst_8, element_address_7)
+    cnst_9 = 2
+    element_size_10 = 4
+    element_offset_11 = cnst_9 * element_size_10
+    element_offset_11 = correct(element_offset_11, 32, True)
+    element_offset_12 = int(round(element_offset_11))
+    element_address_13 = var_a_0 + element_offset_12
+    cnst_14 = 3
+    store_i32(cnst_14, element_address_13)
+    cnst_15 = 3
+    element_size_16 = 4
+    element_offset_17 = cnst_15 * element_size_16
+    element_offset_17 = correct(element_offset_17, 32, True)
+    element_offset_18 = int(round(element_offset_17))
+    element_address_19 = var_a_0 + element_offset_18
+    cnst_20 = 5
+    store_i32(cnst_20, element_address_19)
+    cnst_21 = 4
+    element_size_22 = 4
+    element_offset_23 = cnst_21 * element_size_22
+    element_offset_23 = correct(element_offset_23, 32, True)
+    element_offset_24 = int(round(element_offset_23))
+    element_address_25 = var_a_0 + element_offset_24
+    cnst_26 = 42
+    store_i32(cnst_26, element_address_25)
+    cnst_27 = 5
+    element_size_28 = 4
+    element_offset_29 = cnst_27 * element_size_28
+    element_offset_29 = correct(element_offset_29, 32, True)
+    element_offset_30 = int(round(element_offset_29))
+    element_address_31 = var_a_0 + element_offset_30
+    cnst_32 = 8
+    store_i32(cnst_32, element_address_31)
+    cnst_33 = 6
+    element_size_34 = 4
+    element_offset_35 = cnst_33 * element_size_34
+    element_offset_35 = correct(element_offset_35, 32, True)
+    element_offset_36 = int(round(element_offset_35))
+    element_address_37 = var_a_0 + element_offset_36
+    cnst_38 = 3
+    store_i32(cnst_38, element_address_37)
+    cnst_39 = 7
+    element_size_40 = 4
+    element_offset_41 = cnst_39 * element_size_40
+    element_offset_41 = correct(element_offset_41, 32, True)
+    element_offset_42 = int(round(element_offset_41))
+    element_address_43 = var_a_0 + element_offset_42
+    cnst_44 = 5
+    store_i32(cnst_44, element_address_43)
+    cnst_45 = 8
+    element_size_46 = 4
+    element_offset_47 = cnst_45 * element_size_46
+    element_offset_47 = correct(element_offset_47, 32, True)
+    element_offset_48 = int(round(element_offset_47))
+    element_address_49 = var_a_0 + element_offset_48
+    cnst_50 = 8
+    store_i32(cnst_50, element_address_49)
+    cnst_51 = 9
+    element_size_52 = 4
+    element_offset_53 = cnst_51 * element_size_52
+    element_offset_53 = correct(element_offset_53, 32, True)
+    element_offset_54 = int(round(element_offset_53))
+    element_address_55 = var_a_0 + element_offset_54
+    cnst_56 = 1
+    store_i32(cnst_56, element_address_55)
+    strval = (main_main_strval,6)
+    addr = strval[0]
+    cnst_57 = 0
+    element_size_58 = 4
+    element_offset_59 = cnst_57 * element_size_58
+    element_offset_59 = correct(element_offset_59, 32, True)
+    element_offset_60 = int(round(element_offset_59))
+    element_address_61 = var_a_0 + element_offset_60
+    cnst_62 = 42
+    N = 10
+    sizeof = 4
+    _fptr = main_find_first
+    find_first_rv = _fptr(element_address_61, cnst_62, N, sizeof)
+    _fptr = io_print2
+    _fptr(addr, find_first_rv)
+    del stack[_stack_top:]
+    return
+func_pointers.append(main_main)
+
+io_print_int_strval = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(48)
+heap.append(120)
+main_main_strval = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(73)
+heap.append(61)
+
+
+def bsp_putc(c):
+    print(chr(c), end="")
+main_main()
@@ -0,0 +1,555 @@
+# Automatically generated on Sat Oct 17 02:32:17 2026
+# Generator /root/package/ppci/lang/python/ir2py.py
+
+import struct
+import math
+
+heap = bytearray()
+stack = bytearray()
+HEAP_START = 0x10000000
+func_pointers = list()
+externals = {}
+
+def correct(value, bits, signed):
+    base = 1 << bits
+    value %= base
+    if signed and value.bit_length() == bits:
+        return value - base
+    else:
+        return value
+
+def idiv(x, y):
+    return int(math.trunc(x/y))
+
+def irem(x, y):
+    sign = x < 0
+    v = abs(x) % abs(y)
+    if sign:
+        return -v
+    else:
+        return v
+
+def ishl(x, amount, bits):
+    amount = amount % bits
+    return x << amount
+def ishr(x, amount, bits):
+    amount = amount % bits
+    return x >> amount
+def _alloca(amount):
+    ptr = len(stack)
+    stack.extend(bytes(amount))
+    return (ptr, amount)
+
+def _free(amount):
+    for _ in range(amount):
+        stack.pop()
+
+def read_mem(address, size):
+    mem, address = get_memory(address)
+    assert address+size <= len(mem), str(hex(address))
+    return mem[address:address+size]
+
+def write_mem(address, data):
+    mem, address = get_memory(address)
+    size = len(data)
+    assert address+size <= len(mem), str(hex(address))
+    mem[address:address+size] = data
+
+def get_memory(v):
+    if v >= HEAP_START:
+        return heap, v - HEAP_START
+    else:
+        return stack, v
+
+def heap_top():
+    return len(heap) + HEAP_START
+
+def load_f64(p):
+    return struct.unpack("d", read_mem(p, 8))[0]
+
+def store_f64(v, p):
+    write_mem(p, struct.pack("d", v))
+
+def load_f32(p):
+    return struct.unpack("f", read_mem(p, 4))[0]
+
+def store_f32(v, p):
+    write_mem(p, struct.pack("f", v))
+
+def load_i64(p):
+    return struct.unpack("q", read_mem(p, 8))[0]
+
+def store_i64(v, p):
+    write_mem(p, struct.pack("q", v))
+
+def load_u64(p):
+    return struct.unpack("Q", read_mem(p, 8))[0]
+
+def store_u64(v, p):
+    write_mem(p, struct.pack("Q", v))
+
+def load_i32(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_i32(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_u32(p):
+    return struct.unpack("I", read_mem(p, 4))[0]
+
+def store_u32(v, p):
+    write_mem(p, struct.pack("I", v))
+
+def load_ptr(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_ptr(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_i16(p):
+    return struct.unpack("h", read_mem(p, 2))[0]
+
+def store_i16(v, p):
+    write_mem(p, struct.pack("h", v))
+
+def load_u16(p):
+    return struct.unpack("H", read_mem(p, 2))[0]
+
+def store_u16(v, p):
+    write_mem(p, struct.pack("H", v))
+
+def load_i8(p):
+    return struct.unpack("b", read_mem(p, 1))[0]
+
+def store_i8(v, p):
+    write_mem(p, struct.pack("b", v))
+
+def load_u8(p):
+    return struct.unpack("B", read_mem(p, 1))[0]
+
+def store_u8(v, p):
+    write_mem(p, struct.pack("B", v))
+
+
+# Module c3_code
+main_G = heap_top()
+heap.extend(bytes(200))
+def io_print(txt):
+    _stack_top = len(stack)
+    var_i = _alloca(4)
+    var_i_0 = var_i[0]
+    var_txt = _alloca(4)
+    var_txt_1 = var_txt[0]
+    store_ptr(txt, var_txt_1)
+    cnst = 0
+    store_i32(cnst, var_i_0)
+    while True:
+        load = load_i32(var_i_0)
+        load_2 = load_ptr(var_txt_1)
+        offset = 0
+        mem_addr = load_2 + offset
+        load_3 = load_i32(mem_addr)
+        if load < load_3:
+            load_4 = load_ptr(var_txt_1)
+            offset_5 = 4
+            mem_addr_6 = load_4 + offset_5
+            load_7 = load_i32(var_i_0)
+            element_size = 1
+            element_offset = load_7 * element_size
+            element_offset = correct(element_offset, 32, True)
+            element_offset_8 = int(round(element_offset))
+            element_address = mem_addr_6 + element_offset_8
+            load_9 = load_u8(element_address)
+            _fptr = bsp_putc
+            _fptr(load_9)
+            load_10 = load_i32(var_i_0)
+            cnst_11 = 1
+            binop = load_10 + cnst_11
+            binop = correct(binop, 32, True)
+            store_i32(binop, var_i_0)
+            continue
+        else:
+            del stack[_stack_top:]
+            return
+func_pointers.append(io_print)
+
+def io_print2(label,value):
+    _stack_top = len(stack)
+    var_label = _alloca(4)
+    var_label_0 = var_label[0]
+    store_ptr(label, var_label_0)
+    var_value = _alloca(4)
+    var_value_1 = var_value[0]
+    store_i32(value, var_value_1)
+    load = load_ptr(var_label_0)
+    _fptr = io_print
+    _fptr(load)
+    load_2 = load_i32(var_value_1)
+    _fptr = io_print_int
+    _fptr(load_2)
+    del stack[_stack_top:]
+    return
+func_pointers.append(io_print2)
+
+def io_print_int(i):
+    _stack_top = len(stack)
+    var_b = _alloca(4)
+    var_b_0 = var_b[0]
+    var_c = _alloca(4)
+    var_c_1 = var_c[0]
+    var_i = _alloca(4)
+    var_i_2 = var_i[0]
+    store_i32(i, var_i_2)
+    strval = (io_print_int_strval,6)
+    addr = strval[0]
+    _fptr = io_print
+    _fptr(addr)
+    cnst = 0
+    store_i32(cnst, var_c_1)
+    cnst_3 = 0
+    store_i32(cnst_3, var_b_0)
+    cnst_4 = 28
+    store_i32(cnst_4, var_b_0)
+    while True:
+        load = load_i32(var_b_0)
+        cnst_5 = 0
+        if load >= cnst_5:
+            load_6 = load_i32(var_i_2)
+            load_7 = load_i32(var_b_0)
+            binop = ishr(load_6, load_7, 32)
+            binop = correct(binop, 32, True)
+            cnst_8 = 15
+            binop_9 = binop & cnst_8
+            binop_9 = correct(binop_9, 32, True)
+            store_i32(binop_9, var_c_1)
+            load_10 = load_i32(var_c_1)
+            cnst_11 = 10
+            if load_10 < cnst_11:
+                cnst_12 = 48
+                load_13 = load_i32(var_c_1)
+                binop_14 = cnst_12 + load_13
+                binop_14 = correct(binop_14, 32, True)
+                cast = correct(int(round(binop_14)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast)
+            else:
+                cnst_15 = 65
+                cnst_16 = 10
+                binop_17 = cnst_15 - cnst_16
+                binop_17 = correct(binop_17, 32, True)
+                load_18 = load_i32(var_c_1)
+                binop_19 = binop_17 + load_18
+                binop_19 = correct(binop_19, 32, True)
+                cast_20 = correct(int(round(binop_19)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast_20)
+            load_21 = load_i32(var_b_0)
+            cnst_22 = 4
+            binop_23 = load_21 - cnst_22
+            binop_23 = correct(binop_23, 32, True)
+            store_i32(binop_23, var_b_0)
+            continue
+        else:
+            cnst_24 = 10
+            cast_25 = correct(int(round(cnst_24)), 8, False)
+            _fptr = bsp_putc
+            _fptr(cast_25)
+            del stack[_stack_top:]
+            return
+func_pointers.append(io_print_int)
+
+def io_print_sub(txt,start,end):
+    _stack_top = len(stack)
+    var_end = _alloca(4)
+    var_end_0 = var_end[0]
+    store_i32(end, var_end_0)
+    var_i = _alloca(4)
+    var_i_1 = var_i[0]
+    var_start = _alloca(4)
+    var_start_2 = var_start[0]
+    store_i32(start, var_start_2)
+    var_txt = _alloca(4)
+    var_txt_3 = var_txt[0]
+    store_ptr(txt, var_txt_3)
+    cnst = 0
+    store_i32(cnst, var_i_1)
+    load = load_i32(var_start_2)
+    store_i32(load, var_i_1)
+    while True:
+        load_4 = load_i32(var_i_1)
+        load_5 = load_i32(var_end_0)
+        if load_4 < load_5:
+            load_6 = load_ptr(var_txt_3)
+            offset = 4
+            mem_addr = load_6 + offset
+            load_7 = load_i32(var_i_1)
+            element_size = 1
+            element_offset = load_7 * element_size
+            element_offset = correct(element_offset, 32, True)
+            element_offset_8 = int(round(element_offset))
+            element_address = mem_addr + element_offset_8
+            load_9 = load_u8(element_address)
+            _fptr = bsp_putc
+            _fptr(load_9)
+            load_10 = load_i32(var_i_1)
+            cnst_11 = 1
+            binop = load_10 + cnst_11
+            binop = correct(binop, 32, True)
+            store_i32(binop, var_i_1)
+            continue
+        else:
+            del stack[_stack_top:]
+            return
+func_pointers.append(io_print_sub)
+
+def io_println(txt):
+    _stack_top = len(stack)
+    var_txt = _alloca(4)
+    var_txt_0 = var_txt[0]
+    store_ptr(txt, var_txt_0)
+    load = load_ptr(var_txt_0)
+    _fptr = io_print
+    _fptr(load)
+    cnst = 10
+    cast = correct(int(round(cnst)), 8, False)
+    _fptr = bsp_putc
+    _fptr(cast)
+    del stack[_stack_top:]
+    return
+func_pointers.append(io_println)
+
+def main_do1():
+    _stack_top = len(stack)
+    var_i = _alloca(4)
+    var_i_0 = var_i[0]
+    cnst = 0
+    store_i32(cnst, var_i_0)
+    while True:
+        load = load_i32(var_i_0)
+        cnst_1 = 50
+        if load < cnst_1:
+            load_2 = load_i32(var_i_0)
+            element_size = 4
+            element_offset = load_2 * element_size
+            element_offset = correct(element_offset, 32, True)
+            element_offset_3 = int(round(element_offset))
+            element_address = main_G + element_offset_3
+            load_4 = load_i32(var_i_0)
+            store_i32(load_4, element_address)
+            load_5 = load_i32(var_i_0)
+            cnst_6 = 1
+            binop = load_5 + cnst_6
+            binop = correct(binop, 32, True)
+            store_i32(binop, var_i_0)
+            continue
+        else:
+            del stack[_stack_top:]
+            return
+func_pointers.append(main_do1)
+
+def main_do5():
+    _stack_top = len(stack)
+    var_a = _alloca(4)
+    var_a_0 = var_a[0]
+    var_b = _alloca(4)
+    var_b_1 = var_b[0]
+    var_c = _alloca(4)
+    var_c_2 = var_c[0]
+    var_d = _alloca(4)
+    var_d_3 = var_d[0]
+    var_e = _alloca(4)
+    var_e_4 = var_e[0]
+    var_f = _alloca(4)
+    var_f_5 = var_f[0]
+    var_g = _alloca(4)
+    var_g_6 = var_g[0]
+    var_h = _alloca(4)
+    var_h_7 = var_h[0]
+    var_i = _alloca(4)
+    var_i_8 = var_i[0]
+    var_j = _alloca(4)
+    var_j_9 = var_j[0]
+    var_k = _alloca(4)
+    var_k_10 = var_k[0]
+    var_l = _alloca(4)
+    var_l_11 = var_l[0]
+    var_m = _alloca(4)
+    var_m_12 = var_m[0]
+    var_n = _alloca(4)
+    var_n_13 = var_n[0]
+    var_o = _alloca(4)
+    var_o_14 = var_o[0]
+    var_p = _alloca(4)
+    var_p_15 = var_p[0]
+    var_sum = _alloca(4)
+    var_sum_16 = var_sum[0]
+    cnst = 0
+    element_size = 4
+    element_offset = cnst * element_size
+    element_offset = correct(element_offset, 32, True)
+    element_offset_17 = int(round(element_offset))
+    element_address = main_G + element_offset_17
+    load = load_i32(element_address)
+    store_i32(load, var_a_0)
+    cnst_18 = 1
+    element_size_19 = 4
+    element_offset_20 = cnst_18 * element_size_19
+    element_offset_20 = correct(element_offset_20, 32, True)
+    element_offset_21 = int(round(element_offset_20))
+    element_address_22 = main_G + element_offset_21
+    load_23 = load_i32(element_address_22)
+    store_i32(load_23, var_b_1)
+    cnst_24 = 2
+    element_size_25 = 4
+    element_offset_26 = cnst_24 * element_size_25
+    element_offset_26 = correct(element_offset_26, 32, True)
+    element_offset_27 = int(round(element_offset_26))
+    element_address_28 = main_G + element_offset_27
+    load_29 = load_i32(element_address_28)
+    store_i32(load_29, var_c_2)
+    cnst_30 = 3
+    element_size_31 = 4
+    element_offset_32 = cnst_30 * element_size_31
+    element_offset_32 = correct(element_offset_32, 32, True)
+    element_offset_33 = int(round(element_offset_32))
+    element_address_34 = main_G + element_offset_33
+    load_35 = load_i32(element_address_34)
+    store_i32(load_35, var_d_3)
+    cnst_36 = 4
+    element_size_37 = 4
+    element_offset_38 = cnst_36 * element_size_37
+    element_offset_38 = correct(element_offset_38, 32, True)
+    element_offset_39 = int(round(element_offset_38))
+    element_address_40 = main_G + element_offset_39
+    load_41 = load_i32(element_address_40)
+    store_i32(load_41, var_e_4)
+    cnst_42 = 5
+    element_size_43 = 4
+    element_offset_44 = cnst_42 * element_size_43
+    element_offset_44 = correct(element_offset_44, 32, True)
+    element_offset_45 = int(round(element_offset_44))
+    element_address_46 = main_G + element_offset_45
+    load_47 = load_i32(element_address_46)
+    store_i32(load_47, var_f_5)
+    cnst_48 = 6
+    element_size_49 = 4
+    element_offset_50 = cnst_48 * element_size_49
+    element_offset_50 = correct(element_offset_50, 32, True)
+    element_offset_51 = int(round(element_offset_50))
+    element_address_52 = main_G + element_offset_51
+    load_53 = load_i32(element_address_52)
+    store_i32(load_53, var_g_6)
+    cnst_54 = 7
+    element_size_55 = 4
+    element_offset_56 = cnst_54 * element_size_55
+    element_offset_56 = correct(element_offset_56, 32, True)
+    element_offset_57 = int(round(element_offset_56))
+    element_address_58 = main_G + element_offset_57
+    load_59 = load_i32(element_address_58)
+    store_i32(load_59, var_h_7)
+    cnst_60 = 8
+    element_size_61 = 4
+    element_offset_62 = cnst_60 * element_size_61
+    element_offset_62 = correct(element_offset_62, 32, True)
+    element_offset_63 = int(round(element_offset_62))
+    element_address_64 = main_G + element_offset_63
+    load_65 = load_i32(element_address_64)
+    store_i32(load_65, var_i_8)
+    cnst_66 = 9
+    element_size_67 = 4
+    element_offset_68 = cnst_66 * element_size_67
+    element_offset_68 = correct(element_offset_68, 32, True)
+    element_offset_69 = int(round(element_offset_68))
+    element_address_70 = main_G + element_offset_69
+    load_71 = load_i32(element_address_70)
+    store_i32(load_71, var_j_9)
+    cnst_72 = 10
+    element_size_73 = 4
+    element_offset_74 = cnst_72 * element_size_73
+    element_offset_74 = correct(element_offset_74, 32, True)
+    element_offset_75 = int(round(element_offset_74))
+    element_address_76 = main_G + element_offset_75
+    load_77 = load_i32(element_address_76)
+    store_i32(load_77, var_k_10)
+    cnst_78 = 11
+    element_size_79 = 4
+    element_offset_80 = cnst_78 * element_size_79
+    element_offset_80 = correct(element_offset_80, 32, True)
+    element_offset_81 = int(round(element_offset_80))
+    element_address_82 = main_G + element_offset_81
+    load_83 = load_i32(element_address_82)
+    store_i32(load_83, var_l_11)
+    load_84 = load_i32(var_a_0)
+    load_85 = load_i32(var_b_1)
+    binop = load_84 + load_85
+    binop = correct(binop, 32, True)
+    load_86 = load_i32(var_c_2)
+    binop_87 = binop + load_86
+    binop_87 = correct(binop_87, 32, True)
+    load_88 = load_i32(var_d_3)
+    binop_89 = binop_87 + load_88
+    binop_89 = correct(binop_89, 32, True)
+    load_90 = load_i32(var_e_4)
+    binop_91 = binop_89 + load_90
+    binop_91 = correct(binop_91, 32, True)
+    load_92 = load_i32(var_f_5)
+    binop_93 = binop_91 + load_92
+    binop_93 = correct(binop_93, 32, True)
+    load_94 = load_i32(var_g_6)
+    binop_95 = binop_93 + load_94
+    binop_95 = correct(binop_95, 32, True)
+    load_96 = load_i32(var_h_7)
+    binop_97 = binop_95 + load_96
+    binop_97 = correct(binop_97, 32, True)
+    load_98 = load_i32(var_i_8)
+    binop_99 = binop_97 + load_98
+    binop_99 = correct(binop_99, 32, True)
+    load_100 = load_i32(var_j_9)
+    binop_101 = binop_99 + load_100
+    binop_101 = correct(binop_101, 32, True)
+    load_102 = load_i32(var_k_10)
+    binop_103 = binop_101 + load_102
+    binop_103 = correct(binop_103, 32, True)
+    load_104 = load_i32(var_l_11)
+    binop_105 = binop_103 + load_104
+    binop_105 = correct(binop_105, 32, True)
+    store_i32(binop_105, var_sum_16)
+    strval = (main_do5_strval,9)
+    addr = strval[0]
+    load_106 = load_i32(var_sum_16)
+    _fptr = io_print2
+    _fptr(addr, load_106)
+    del stack[_stack_top:]
+    return
+func_pointers.append(main_do5)
+
+def main_main():
+    _fptr = main_do1
+    _fptr()
+    _fptr = main_do5
+    _fptr()
+    return
+func_pointers.append(main_main)
+
+io_print_int_strval = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(48)
+heap.append(120)
+main_do5_strval = heap_top()
+heap.append(5)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(119)
+heap.append(48)
+heap.append(48)
+heap.append(116)
+heap.append(61)
+
+
+def bsp_putc(c):
+    print(chr(c), end="")
+main_main()
@@ -0,0 +1,573 @@
+# Automatically generated on Sat Oct 17 02:32:17 2026
+# Generator /root/package/ppci/lang/python/ir2py.py
+
+import struct
+import math
+
+heap = bytearray()
+stack = bytearray()
+HEAP_START = 0x10000000
+func_pointers = list()
+externals = {}
+
+def correct(value, bits, signed):
+    base = 1 << bits
+    value %= base
+    if signed and value.bit_length() == bits:
+        return value - base
+    else:
+        return value
+
+def idiv(x, y):
+    return int(math.trunc(x/y))
+
+def irem(x, y):
+    sign = x < 0
+    v = abs(x) % abs(y)
+    if sign:
+        return -v
+    else:
+        return v
+
+def ishl(x, amount, bits):
+    amount = amount % bits
+    return x << amount
+def ishr(x, amount, bits):
+    amount = amount % bits
+    return x >> amount
+def _alloca(amount):
+    ptr = len(stack)
+    stack.extend(bytes(amount))
+    return (ptr, amount)
+
+def _free(amount):
+    for _ in range(amount):
+        stack.pop()
+
+def read_mem(address, size):
+    mem, address = get_memory(address)
+    assert address+size <= len(mem), str(hex(address))
+    return mem[address:address+size]
+
+def write_mem(address, data):
+    mem, address = get_memory(address)
+    size = len(data)
+    assert address+size <= len(mem), str(hex(address))
+    mem[address:address+size] = data
+
+def get_memory(v):
+    if v >= HEAP_START:
+        return heap, v - HEAP_START
+    else:
+        return stack, v
+
+def heap_top():
+    return len(heap) + HEAP_START
+
+def load_f64(p):
+    return struct.unpack("d", read_mem(p, 8))[0]
+
+def store_f64(v, p):
+    write_mem(p, struct.pack("d", v))
+
+def load_f32(p):
+    return struct.unpack("f", read_mem(p, 4))[0]
+
+def store_f32(v, p):
+    write_mem(p, struct.pack("f", v))
+
+def load_i64(p):
+    return struct.unpack("q", read_mem(p, 8))[0]
+
+def store_i64(v, p):
+    write_mem(p, struct.pack("q", v))
+
+def load_u64(p):
+    return struct.unpack("Q", read_mem(p, 8))[0]
+
+def store_u64(v, p):
+    write_mem(p, struct.pack("Q", v))
+
+def load_i32(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_i32(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_u32(p):
+    return struct.unpack("I", read_mem(p, 4))[0]
+
+def store_u32(v, p):
+    write_mem(p, struct.pack("I", v))
+
+def load_ptr(p):
+    return struct.unpack("i", read_mem(p, 4))[0]
+
+def store_ptr(v, p):
+    write_mem(p, struct.pack("i", v))
+
+def load_i16(p):
+    return struct.unpack("h", read_mem(p, 2))[0]
+
+def store_i16(v, p):
+    write_mem(p, struct.pack("h", v))
+
+def load_u16(p):
+    return struct.unpack("H", read_mem(p, 2))[0]
+
+def store_u16(v, p):
+    write_mem(p, struct.pack("H", v))
+
+def load_i8(p):
+    return struct.unpack("b", read_mem(p, 1))[0]
+
+def store_i8(v, p):
+    write_mem(p, struct.pack("b", v))
+
+def load_u8(p):
+    return struct.unpack("B", read_mem(p, 1))[0]
+
+def store_u8(v, p):
+    write_mem(p, struct.pack("B", v))
+
+
+# Module c3_code
+def io_print(txt):
+    _stack_top = len(stack)
+    var_i = _alloca(4)
+    var_i_0 = var_i[0]
+    var_txt = _alloca(4)
+    var_txt_1 = var_txt[0]
+    store_ptr(txt, var_txt_1)
+    cnst = 0
+    store_i32(cnst, var_i_0)
+    while True:
+        load = load_i32(var_i_0)
+        load_2 = load_ptr(var_txt_1)
+        offset = 0
+        mem_addr = load_2 + offset
+        load_3 = load_i32(mem_addr)
+        if load < load_3:
+            load_4 = load_ptr(var_txt_1)
+            offset_5 = 4
+            mem_addr_6 = load_4 + offset_5
+            load_7 = load_i32(var_i_0)
+            element_size = 1
+            element_offset = load_7 * element_size
+            element_offset = correct(element_offset, 32, True)
+            element_offset_8 = int(round(element_offset))
+            element_address = mem_addr_6 + element_offset_8
+            load_9 = load_u8(element_address)
+            _fptr = bsp_putc
+            _fptr(load_9)
+            load_10 = load_i32(var_i_0)
+            cnst_11 = 1
+            binop = load_10 + cnst_11
+            binop = correct(binop, 32, True)
+            store_i32(binop, var_i_0)
+            continue
+        else:
+            del stack[_stack_top:]
+            return
+func_pointers.append(io_print)
+
+def io_print2(label,value):
+    _stack_top = len(stack)
+    var_label = _alloca(4)
+    var_label_0 = var_label[0]
+    store_ptr(label, var_label_0)
+    var_value = _alloca(4)
+    var_value_1 = var_value[0]
+    store_i32(value, var_value_1)
+    load = load_ptr(var_label_0)
+    _fptr = io_print
+    _fptr(load)
+    load_2 = load_i32(var_value_1)
+    _fptr = io_print_int
+    _fptr(load_2)
+    del stack[_stack_top:]
+    return
+func_pointers.append(io_print2)
+
+def io_print_int(i):
+    _stack_top = len(stack)
+    var_b = _alloca(4)
+    var_b_0 = var_b[0]
+    var_c = _alloca(4)
+    var_c_1 = var_c[0]
+    var_i = _alloca(4)
+    var_i_2 = var_i[0]
+    store_i32(i, var_i_2)
+    strval = (io_print_int_strval,6)
+    addr = strval[0]
+    _fptr = io_print
+    _fptr(addr)
+    cnst = 0
+    store_i32(cnst, var_c_1)
+    cnst_3 = 0
+    store_i32(cnst_3, var_b_0)
+    cnst_4 = 28
+    store_i32(cnst_4, var_b_0)
+    while True:
+        load = load_i32(var_b_0)
+        cnst_5 = 0
+        if load >= cnst_5:
+            load_6 = load_i32(var_i_2)
+            load_7 = load_i32(var_b_0)
+            binop = ishr(load_6, load_7, 32)
+            binop = correct(binop, 32, True)
+            cnst_8 = 15
+            binop_9 = binop & cnst_8
+            binop_9 = correct(binop_9, 32, True)
+            store_i32(binop_9, var_c_1)
+            load_10 = load_i32(var_c_1)
+            cnst_11 = 10
+            if load_10 < cnst_11:
+                cnst_12 = 48
+                load_13 = load_i32(var_c_1)
+                binop_14 = cnst_12 + load_13
+                binop_14 = correct(binop_14, 32, True)
+                cast = correct(int(round(binop_14)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast)
+            else:
+                cnst_15 = 65
+                cnst_16 = 10
+                binop_17 = cnst_15 - cnst_16
+                binop_17 = correct(binop_17, 32, True)
+                load_18 = load_i32(var_c_1)
+                binop_19 = binop_17 + load_18
+                binop_19 = correct(binop_19, 32, True)
+                cast_20 = correct(int(round(binop_19)), 8, False)
+                _fptr = bsp_putc
+                _fptr(cast_20)
+            load_21 = load_i32(var_b_0)
+            cnst_22 = 4
+            binop_23 = load_21 - cnst_22
+            binop_23 = correct(binop_23, 32, True)
+            store_i32(binop_23, var_b_0)
+            continue
+        else:
+            cnst_24 = 10
+            cast_25 = correct(int(round(cnst_24)), 8, False)
+            _fptr = bsp_putc
+            _fptr(cast_25)
+            del stack[_stack_top:]
+            return
+func_pointers.append(io_print_int)
+
+def io_print_sub(txt,start,end):
+    _stack_top = len(stack)
+    var_end = _alloca(4)
+    var_end_0 = var_end[0]
+    store_i32(end, var_end_0)
+    var_i = _alloca(4)
+    var_i_1 = var_i[0]
+    var_start = _alloca(4)
+    var_start_2 = var_start[0]
+    store_i32(start, var_start_2)
+    var_txt = _alloca(4)
+    var_txt_3 = var_txt[0]
+    store_ptr(txt, var_txt_3)
+    cnst = 0
+    store_i32(cnst, var_i_1)
+    load = load_i32(var_start_2)
+    store_i32(load, var_i_1)
+    while True:
+        load_4 = load_i32(var_i_1)
+        load_5 = load_i32(var_end_0)
+        if load_4 < load_5:
+            load_6 = load_ptr(var_txt_3)
+            offset = 4
+            mem_addr = load_6 + offset
+            load_7 = load_i32(var_i_1)
+            element_size = 1
+            element_offset = load_7 * element_size
+            element_offset = correct(element_offset, 32, True)
+            element_offset_8 = int(round(element_offset))
+            element_address = mem_addr + element_offset_8
+            load_9 = load_u8(element_address)
+            _fptr = bsp_putc
+            _fptr(load_9)
+            load_10 = load_i32(var_i_1)
+            cnst_11 = 1
+            binop = load_10 + cnst_11
+            binop = correct(binop, 32, True)
+            store_i32(binop, var_i_1)
+            continue
+        else:
+            del stack[_stack_top:]
+            return
+func_pointers.append(io_print_sub)
+
+def io_println(txt):
+    _stack_top = len(stack)
+    var_txt = _alloca(4)
+    var_txt_0 = var_txt[0]
+    store_ptr(txt, var_txt_0)
+    load = load_ptr(var_txt_0)
+    _fptr = io_print
+    _fptr(load)
+    cnst = 10
+    cast = correct(int(round(cnst)), 8, False)
+    _fptr = bsp_putc
+    _fptr(cast)
+    del stack[_stack_top:]
+    return
+func_pointers.append(io_println)
+
+def main_area(radius):
+    _stack_top = len(stack)
+    var_radius = _alloca(4)
+    var_radius_0 = var_radius[0]
+    store_f32(radius, var_radius_0)
+    load = load_f32(var_radius_0)
+    load_1 = load_f32(var_radius_0)
+    binop = load * load_1
+    pi = 3.14159
+    binop_2 = binop * pi
+    del stack[_stack_top:]
+    return binop_2
+func_pointers.append(main_area)
+
+def main_main():
+    _stack_top = len(stack)
+    var_buffer = _alloca(32)
+    var_buffer_0 = var_buffer[0]
+    cnst = 0
+    element_size = 4
+    element_offset = cnst * element_size
+    element_offset = correct(element_offset, 32, True)
+    element_offset_1 = int(round(element_offset))
+    element_address = var_buffer_0 + element_offset_1
+    cnst_2 = 0
+    cast = float(cnst_2)
+    store_f32(cast, element_address)
+    cnst_3 = 1
+    element_size_4 = 4
+    element_offset_5 = cnst_3 * element_size_4
+    element_offset_5 = correct(element_offset_5, 32, True)
+    element_offset_6 = int(round(element_offset_5))
+    element_address_7 = var_buffer_0 + element_offset_6
+    cnst_8 = 22
+    cast_9 = float(cnst_8)
+    store_f32(cast_9, element_address_7)
+    cnst_10 = 2
+    element_size_11 = 4
+    element_offset_12 = cnst_10 * element_size_11
+    element_offset_12 = correct(element_offset_12, 32, True)
+    element_offset_13 = int(round(element_offset_12))
+    element_address_14 = var_buffer_0 + element_offset_13
+    cnst_15 = 3.1415926
+    cast_16 = float(cnst_15)
+    store_f32(cast_16, element_address_14)
+    cnst_17 = 3
+    element_size_18 = 4
+    element_offset_19 = cnst_17 * element_size_18
+    element_offset_19 = correct(element_offset_19, 32, True)
+    element_offset_20 = int(round(element_offset_19))
+    element_address_21 = var_buffer_0 + element_offset_20
+    cnst_22 = 2.7
+    cast_23 = float(cnst_22)
+    store_f32(cast_23, element_address_21)
+    cnst_24 = 4
+    element_size_25 = 4
+    element_offset_26 = cnst_24 * element_size_25
+    element_offset_26 = correct(element_offset_26, 32, True)
+    element_offset_27 = int(round(element_offset_26))
+    element_address_28 = var_buffer_0 + element_offset_27
+    cnst_29 = 1
+    element_size_30 = 4
+    element_offset_31 = cnst_29 * element_size_30
+    element_offset_31 = correct(element_offset_31, 32, True)
+    element_offset_32 = int(round(element_offset_31))
+    element_address_33 = var_buffer_0 + element_offset_32
+    load = load_f32(element_address_33)
+    cnst_34 = 2
+    element_size_35 = 4
+    element_offset_36 = cnst_34 * element_size_35
+    element_offset_36 = correct(element_offset_36, 32, True)
+    element_offset_37 = int(round(element_offset_36))
+    element_address_38 = var_buffer_0 + element_offset_37
+    load_39 = load_f32(element_address_38)
+    _fptr = main_wfun
+    wfun_rv = _fptr(load, load_39)
+    store_f32(wfun_rv, element_address_28)
+    cnst_40 = 1
+    element_size_41 = 4
+    element_offset_42 = cnst_40 * element_size_41
+    element_offset_42 = correct(element_offset_42, 32, True)
+    element_offset_43 = int(round(element_offset_42))
+    element_address_44 = var_buffer_0 + element_offset_43
+    load_45 = load_f32(element_address_44)
+    cnst_46 = 0
+    element_size_47 = 4
+    element_offset_48 = cnst_46 * element_size_47
+    element_offset_48 = correct(element_offset_48, 32, True)
+    element_offset_49 = int(round(element_offset_48))
+    element_address_50 = var_buffer_0 + element_offset_49
+    load_51 = load_f32(element_address_50)
+    if load_45 > load_51:
+        strval = (main_main_strval,12)
+        addr = strval[0]
+        _fptr = io_print
+        _fptr(addr)
+    else:
+        pass
+    cnst_52 = 1
+    element_size_53 = 4
+    element_offset_54 = cnst_52 * element_size_53
+    element_offset_54 = correct(element_offset_54, 32, True)
+    element_offset_55 = int(round(element_offset_54))
+    element_address_56 = var_buffer_0 + element_offset_55
+    load_57 = load_f32(element_address_56)
+    cnst_58 = 2
+    element_size_59 = 4
+    element_offset_60 = cnst_58 * element_size_59
+    element_offset_60 = correct(element_offset_60, 32, True)
+    element_offset_61 = int(round(element_offset_60))
+    element_address_62 = var_buffer_0 + element_offset_61
+    load_63 = load_f32(element_address_62)
+    cnst_64 = 3
+    element_size_65 = 4
+    element_offset_66 = cnst_64 * element_size_65
+    element_offset_66 = correct(element_offset_66, 32, True)
+    element_offset_67 = int(round(element_offset_66))
+    element_address_68 = var_buffer_0 + element_offset_67
+    load_69 = load_f32(element_address_68)
+    _fptr = main_wfun
+    wfun_rv_70 = _fptr(load_63, load_69)
+    if load_57 > wfun_rv_70:
+        strval_71 = (main_main_strval_71,13)
+        addr_72 = strval_71[0]
+        _fptr = io_print
+        _fptr(addr_72)
+    else:
+        pass
+    cnst_73 = 1
+    element_size_74 = 4
+    element_offset_75 = cnst_73 * element_size_74
+    element_offset_75 = correct(element_offset_75, 32, True)
+    element_offset_76 = int(round(element_offset_75))
+    element_address_77 = var_buffer_0 + element_offset_76
+    load_78 = load_f32(element_address_77)
+    _fptr = main_area
+    area_rv = _fptr(load_78)
+    cnst_79 = 2
+    element_size_80 = 4
+    element_offset_81 = cnst_79 * element_size_80
+    element_offset_81 = correct(element_offset_81, 32, True)
+    element_offset_82 = int(round(element_offset_81))
+    element_address_83 = var_buffer_0 + element_offset_82
+    load_84 = load_f32(element_address_83)
+    if area_rv < load_84:
+        strval_85 = (main_main_strval_85,13)
+        addr_86 = strval_85[0]
+        _fptr = io_print
+        _fptr(addr_86)
+    else:
+        pass
+    strval_87 = (main_main_strval_87,13)
+    addr_88 = strval_87[0]
+    cnst_89 = 22
+    cast_90 = float(cnst_89)
+    _fptr = main_area
+    area_rv_91 = _fptr(cast_90)
+    cast_92 = correct(int(round(area_rv_91)), 32, True)
+    _fptr = io_print2
+    _fptr(addr_88, cast_92)
+    del stack[_stack_top:]
+    return
+func_pointers.append(main_main)
+
+def main_wfun(a,b):
+    _stack_top = len(stack)
+    var_a = _alloca(4)
+    var_a_0 = var_a[0]
+    store_f32(a, var_a_0)
+    var_b = _alloca(4)
+    var_b_1 = var_b[0]
+    store_f32(b, var_b_1)
+    load = load_f32(var_a_0)
+    cnst = 66
+    cast = float(cnst)
+    binop = load * cast
+    load_2 = load_f32(var_b_1)
+    cnst_3 = 33
+    cast_4 = float(cnst_3)
+    binop_5 = load_2 * cast_4
+    cnst_6 = 11
+    cast_7 = float(cnst_6)
+    binop_8 = binop_5 + cast_7
+    binop_9 = binop + binop_8
+    del stack[_stack_top:]
+    return binop_9
+func_pointers.append(main_wfun)
+
+io_print_int_strval = heap_top()
+heap.append(2)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(48)
+heap.append(120)
+main_main_strval = heap_top()
+heap.append(8)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(102)
+heap.append(111)
+heap.append(114)
+heap.append(32)
+heap.append(115)
+heap.append(117)
+heap.append(114)
+heap.append(101)
+main_main_strval_71 = heap_top()
+heap.append(9)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(119)
+heap.append(111)
+heap.append(111)
+heap.append(116)
+heap.append(32)
+heap.append(109)
+heap.append(111)
+heap.append(114)
+heap.append(101)
+main_main_strval_85 = heap_top()
+heap.append(9)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(119)
+heap.append(111)
+heap.append(111)
+heap.append(116)
+heap.append(32)
+heap.append(108)
+heap.append(101)
+heap.append(115)
+heap.append(115)
+main_main_strval_87 = heap_top()
+heap.append(9)
+heap.append(0)
+heap.append(0)
+heap.append(0)
+heap.append(97)
+heap.append(114)
+heap.append(101)
+heap.append(97)
+heap.append(40)
+heap.append(50)
+heap.append(50)
+heap.append(41)
+heap.append(61)
+
+
+def bsp_putc(c):
+    print(chr(c), end="")
+main_main()
@@ -1,8 +1,13 @@
 import io
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
 
-from ppci.api import construct, objcopy, disasm, link
+from ppci.api import construct, objcopy, disasm, link, cc, c3c
+from ppci.build.cache import ObjectCache
+from ppci.build.parallel import compile_c_sources
+from ppci.common import CompilerError
 from ppci.build.tasks import TaskError
 import ppci.build.buildtasks
 
@@ -18,6 +23,92 @@ class ApiTestCase(unittest.TestCase):
             link([])
 
 
+class ObjectCacheTestCase(unittest.TestCase):
+    """ Test the persistent object file cache """
+    c_src = "int add(int a, int b) { return a + b; }\n"
+    c3_src = "module main; function int add(int a, int b) { return a + b; }"
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ObjectCache(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_miss(self):
+        key = self.cache.make_key('a', 'b')
+        self.assertIsNone(self.cache.load(key))
+
+    def test_key(self):
+        self.assertEqual(
+            self.cache.make_key('a', 'b'), self.cache.make_key('a', 'b'))
+        self.assertNotEqual(
+            self.cache.make_key('ab', 'c'), self.cache.make_key('a', 'bc'))
+
+    def test_cc(self):
+        obj1 = cc(io.StringIO(self.c_src), 'arm', cache=self.cache)
+        self.assertEqual(1, len(self.cache.entries()))
+        with patch('ppci.api.c_to_ir') as mock_c_to_ir:
+            obj2 = cc(io.StringIO(self.c_src), 'arm', cache=self.cache)
+            mock_c_to_ir.assert_not_called()
+        self.assertEqual(obj1, obj2)
+
+        # Different settings must not hit the cache:
+        cc(io.StringIO(self.c_src), 'arm', opt_level=2, cache=self.cache)
+        cc(io.StringIO(self.c_src), 'riscv', cache=self.cache)
+        self.assertEqual(3, len(self.cache.entries()))
+
+    def test_c3c(self):
+        obj1 = c3c([io.StringIO(self.c3_src)], [], 'arm', cache=self.cache)
+        obj2 = c3c([io.StringIO(self.c3_src)], [], 'arm', cache=self.cache)
+        self.assertEqual(obj1, obj2)
+        self.assertEqual(1, len(self.cache.entries()))
+
+    def test_eviction(self):
+        obj = cc(io.StringIO(self.c_src), 'arm', cache=self.cache)
+        first_key = self.cache.make_key('first')
+        self.cache.store(first_key, obj)
+        os.utime(self.cache._filename(first_key), (0, 0))
+        self.cache.max_size = self.cache.size - 1
+        self.cache.store(self.cache.make_key('second'), obj)
+        self.assertIsNone(self.cache.load(first_key))
+        self.assertLessEqual(self.cache.size, self.cache.max_size)
+
+    def test_clear(self):
+        cc(io.StringIO(self.c_src), 'arm', cache=self.cache)
+        self.cache.clear()
+        self.assertEqual(0, self.cache.size)
+
+
+class ParallelCompileTestCase(unittest.TestCase):
+    """ Check compilation of several C sources in worker processes """
+    sources = [
+        'int a; int f(int x) { return x + a; }',
+        'int g(int x) { return x * 2; }',
+        'char b = 7; int h(void) { return b; }',
+    ]
+
+    def compile(self, sources, jobs):
+        return compile_c_sources(
+            [io.StringIO(source) for source in sources], 'arm', jobs=jobs)
+
+    def test_same_objects(self):
+        """ The objects are returned in the order of the sources """
+        objs1 = self.compile(self.sources, 1)
+        objs2 = self.compile(self.sources, 3)
+        self.assertEqual(objs1, objs2)
+        self.assertEqual(
+            [['a', 'f'], ['g'], ['b', 'h']],
+            [[s.name for s in obj.symbols if s.name in 'abfgh']
+             for obj in objs2])
+
+    def test_error(self):
+        """ Errors are passed from the worker to the caller """
+        with self.assertRaises(CompilerError) as cm:
+            self.compile(self.sources + ['int i(void) { return c; }'], 2)
+        self.assertEqual(1, cm.exception.loc.row)
+
+
 class RecipeTestCase(unittest.TestCase):
     def test_bad_xml(self):
         recipe = """<project>"""
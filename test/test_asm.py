@@ -2,12 +2,15 @@
 
 import io
 import unittest
+from unittest.mock import patch
 from ppci.common import CompilerError, DiagnosticsManager
-from ppci.binutils.assembler import AsmLexer, BaseAssembler
+from ppci.binutils.assembler import AsmLexer, BaseAssembler, AsmParser
+from ppci.binutils.assembler import ShapeMatcher
 from ppci.binutils.objectfile import ObjectFile
-from ppci.binutils.outstream import BinaryOutputStream
+from ppci.binutils.outstream import BinaryOutputStream, TextOutputStream
 from ppci.arch.generic_instructions import Label
-from ppci.api import link, get_arch
+from ppci.lang.tools.grammar import Grammar
+from ppci.api import link, get_arch, c3c
 from ppci.binutils.layout import Layout
 from util import gnu_assemble
 
@@ -78,6 +81,90 @@ class AssemblerTestCase(unittest.TestCase):
         with self.assertRaises(CompilerError):
             assembler.assemble('abc def', ostream, diag)
 
+    def assemble(self, source, march):
+        obj = ObjectFile(march)
+        ostream = BinaryOutputStream(obj)
+        ostream.select_section('code')
+        march.assembler.prepare()
+        march.assembler.assemble(source, ostream, DiagnosticsManager())
+        march.assembler.flush()
+        return obj
+
+    def test_fast_path(self):
+        """ Check that the fast path gives the same result as earley """
+        source = """
+        section code
+        start: push {r4, r5, lr}
+        mov r4, r0
+        bl start
+        add r4, r4, 1
+        align 4
+        pop {r4, r5, pc}
+        """
+        objects = []
+        for fast_path in (False, True):
+            with patch.object(AsmParser, 'fast_path', fast_path):
+                objects.append(self.assemble(source, get_arch('arm')))
+        self.assertEqual(objects[0], objects[1])
+
+    def test_assembly_output(self):
+        """ Check that assembly language output can be assembled again """
+        source = io.StringIO("""module main;
+        function int f(int a) { return a + 1; }
+        function int g(int a) { return f(a) * 2; }
+        """)
+        march = get_arch('arm')
+        output = io.StringIO()
+        stream = TextOutputStream(printer=march.asm_printer, f=output)
+        c3c([source], [], march, outstream=stream)
+        self.assemble(output.getvalue(), march)
+
+
+class ShapeMatcherTestCase(unittest.TestCase):
+    """ Check matching of token types against a grammar """
+    def setUp(self):
+        self.grammar = Grammar()
+        self.grammar.add_terminals(['mov', 'reg', 'ID', ','])
+        self.grammar.start_symbol = 'instruction'
+
+    def test_mnemonic(self):
+        """ Only the productions of the mnemonic are tried """
+        g = self.grammar
+        g.add_terminal('add')
+        g.add_production('instruction', ['mov', 'operand', ',', 'operand'])
+        g.add_production('instruction', ['add', 'operand', ',', 'operand'])
+        g.add_production('operand', ['reg'])
+        g.add_production('operand', [])
+        matcher = ShapeMatcher(g)
+        self.assertEqual(2, len(matcher.index['instruction']))
+        production, children = matcher.match(('mov', 'reg', ','))
+        self.assertIs(g.productions[0], production)
+        self.assertEqual(0, children[0])
+        self.assertEqual(2, children[2])
+        self.assertEqual((), children[3][1])
+        self.assertIsNone(matcher.match(('mov', 'reg')))
+
+    def test_ambiguous(self):
+        """ Ambiguous token types are not matched """
+        g = self.grammar
+        g.add_production('instruction', ['mov', 'operand'])
+        g.add_production('instruction', ['mov', 'label'])
+        g.add_production('operand', ['reg'])
+        g.add_production('label', ['reg'])
+        g.add_production('label', ['ID'])
+        matcher = ShapeMatcher(g)
+        self.assertIsNone(matcher.match(('mov', 'reg')))
+        self.assertIsNotNone(matcher.match(('mov', 'ID')))
+
+    def test_left_recursion(self):
+        """ Left recursive rules are left to the earley parser """
+        g = self.grammar
+        g.add_production('instruction', ['mov', 'list'])
+        g.add_production('list', ['list', ',', 'reg'])
+        g.add_production('list', ['reg'])
+        matcher = ShapeMatcher(g)
+        self.assertIsNone(matcher.match(('mov', 'reg', ',', 'reg')))
+
 
 class AsmTestCaseBase(unittest.TestCase):
     """ Base testcase for assembly """
@@ -1,14 +1,23 @@
 import unittest
 import io
+import os
+import tempfile
 from unittest.mock import patch
 
 from ppci.binutils.objectfile import ObjectFile, serialize, deserialize, Image
+from ppci.binutils.objectfile import get_object, save_object
 from ppci.binutils.outstream import DummyOutputStream, TextOutputStream
 from ppci.binutils.outstream import binary_and_logging_stream
+from ppci.binutils.outstream import FunctionOutputStream
+from ppci.binutils.disasm import Disassembler
 from ppci.common import CompilerError
-from ppci.api import link, get_arch
+from ppci.binutils.archive import save_archive, load_archive
+from ppci.api import link, get_arch, asm, c3c, archive
+from ppci.api import c3_to_ir, ir_to_object
 from ppci.binutils import layout
 from ppci.arch.example import Mov, R0, R1, ExampleArch
+from ppci.arch.msp430 import instructions as msp430_instructions
+from ppci.arch.msp430.registers import r4, r5
 
 
 class OutstreamTestCase(unittest.TestCase):
@@ -34,6 +43,119 @@ class OutstreamTestCase(unittest.TestCase):
         stream.emit(Mov(R1, R0))
 
 
+class DisassemblerTestCase(unittest.TestCase):
+    """ Test the table driven disassembler """
+    def assemble(self, source, march):
+        obj = asm(io.StringIO(source), march)
+        return obj.get_section('code').data
+
+    def decode(self, data, march):
+        instructions = []
+        disassembler = Disassembler(get_arch(march))
+        disassembler.disasm(data, FunctionOutputStream(instructions.append))
+        return instructions
+
+    def disassemble(self, source, march):
+        return self.decode(self.assemble(source, march), march)
+
+    def round_trip(self, source, march):
+        """ Check that the disassembly assembles into the same code """
+        instructions = self.disassemble(source, march)
+        text = '\n'.join(str(i) for i in instructions)
+        self.assertEqual(
+            self.assemble(source, march), self.assemble(text, march))
+        return instructions
+
+    def test_riscv(self):
+        source = 'add x1, x2, x3\nnop\nmv x5, x6\nsub x4, x5, x6\n'
+        instructions = self.disassemble(source, 'riscv')
+        self.assertEqual(
+            ['add x1, x2, x3', 'nop', 'mv x5, x6', 'sub x4, x5, x6'],
+            [str(i) for i in instructions])
+        self.assertEqual([0, 4, 8, 12], [i.address for i in instructions])
+
+    def test_mixed_sizes(self):
+        """ Check an isa with instructions of multiple sizes """
+        source = 'add a1, a2, a3\nnop\nadd a4, a5, a6\n'
+        instructions = self.disassemble(source, 'xtensa')
+        self.assertEqual(
+            ['add a1, a2, a3', 'nop', 'add a4, a5, a6'],
+            [str(i) for i in instructions])
+        self.assertEqual([0, 3, 6], [i.address for i in instructions])
+
+    def test_riscv_round_trip(self):
+        source = (
+            'addi x1, x2, -5\nandi x5, x6, 255\nlw x1, -8(x2)\n'
+            'sw x3, 12(x4)\nrdcycle x5\n')
+        instructions = self.round_trip(source, 'riscv')
+        self.assertEqual(
+            ['addi x1, x2, -5', 'andi x5, x6, 255', 'lw x1, -8(x2)',
+             'sw x3, 12(x4)', 'rdcycle x5'],
+            [str(i) for i in instructions])
+
+    def test_msp430_round_trip(self):
+        """ Check the addressing modes, which have extension words """
+        source = (
+            'mov.w r4, r5\nmov.w #1, r5\nmov.w #1234, r6\n'
+            'add.w 4(r4), r5\nadd.w #8, r7\nmov.w @r6, 2(r7)\n'
+            'mov.w @r6+, r8\npush r5\nreti\n')
+        instructions = self.round_trip(source, 'msp430')
+        self.assertEqual(
+            ['mov.w R4, R5', 'mov.w #1, R5', 'mov.w #1234, R6',
+             'add.w 4(R4), R5', 'add.w #8, R7', 'mov.w @R6, 2(R7)',
+             'mov.w @R6+, R8', 'push R5', 'reti'],
+            [str(i) for i in instructions])
+        self.assertEqual(
+            [0, 2, 6, 10, 14, 18, 22, 24, 26],
+            [i.address for i in instructions])
+
+    def test_msp430_constant_generator(self):
+        """ Small constants are encoded without an extension word """
+        ins = msp430_instructions
+        data = b''.join(
+            ins.Mov(src, ins.RegDst(r5)).encode()
+            for src in [
+                ins.small_const_src(1), ins.small_const_src(4),
+                ins.small_const_src(-1), ins.RegSrc(r4)])
+        instructions = self.decode(data, 'msp430')
+        self.assertEqual(
+            ['mov.w #1, R5', 'mov.w #4, R5', 'mov.w #-1, R5',
+             'mov.w R4, R5'],
+            [str(i) for i in instructions])
+        self.assertEqual([0, 2, 4, 6], [i.address for i in instructions])
+
+    def test_x86_64_round_trip(self):
+        source = (
+            'mov rax, rbx\nmov r8, r15\nadd rax, rcx\nadd r12, rdx\n'
+            'mov [rax], rbx\nmov rbx, [rcx]\nmov eax, ebx\n'
+            'add ecx, edx\npush rbp\npop r12\nint 0x80\n')
+        instructions = self.round_trip(source, 'x86_64')
+        self.assertEqual(
+            ['mov rax, rbx', 'mov r8, r15', 'add rax, rcx', 'add r12, rdx',
+             'mov [rax], rbx', 'mov rbx, [rcx]', 'mov eax, ebx',
+             'add ecx, edx', 'push rbp', 'pop r12', 'int 128'],
+            [str(i) for i in instructions])
+
+    def test_arm_round_trip(self):
+        source = (
+            'mov r1, r2\nadd r1, r2, r3\nadd r1, r2, 5\n'
+            'sub r4, r5, 1024\nmul r1, r2, r3\ncmp r1, r2\n')
+        instructions = self.round_trip(source, 'arm')
+        self.assertEqual(
+            ['mov R1, R2', 'add R1, R2, R3', 'add R1, R2, 5',
+             'sub R4, R5, 1024', 'mul R1, R2, R3', 'cmp R1, R2'],
+            [str(i) for i in instructions])
+
+    def test_undecodable_data(self):
+        """ Data which cannot be decoded is emitted as bytes """
+        instructions = []
+        disassembler = Disassembler(get_arch('riscv'))
+        disassembler.disasm(
+            bytes([0xff] * 4), FunctionOutputStream(instructions.append))
+        self.assertEqual(4, len(instructions))
+        self.assertEqual('.byte 255', str(instructions[0]))
+
+
 class LinkerTestCase(unittest.TestCase):
     """ Test the behavior of the linker """
     def test_undefined_reference(self):
@@ -134,6 +256,131 @@ class LinkerTestCase(unittest.TestCase):
         with self.assertRaisesRegex(CompilerError, 'exceeds'):
             link([object1], layout2)
 
+    def make_library(self, arch):
+        """ Create an archive with two members, one refering to the other """
+        object1 = ObjectFile(arch)
+        object1.get_section('code', create=True).add_data(bytes([0]*8))
+        object1.add_symbol('a', 0, 'code')
+        object1.gen_relocation('rel8', 'b', offset=0, section='code')
+        object2 = ObjectFile(arch)
+        object2.get_section('code', create=True).add_data(bytes([0]*12))
+        object2.add_symbol('b', 4, 'code')
+        object3 = ObjectFile(arch)
+        object3.get_section('code', create=True).add_data(bytes([0]*16))
+        object3.add_symbol('c', 0, 'code')
+        return archive([object1, object2, object3])
+
+    def test_archive_extraction(self):
+        """ Only the archive members that are needed are linked in """
+        arch = get_arch('arm')
+        library = self.make_library(arch)
+        object1 = ObjectFile(arch)
+        object1.get_section('code', create=True).add_data(bytes([0]*4))
+        object1.gen_relocation('rel8', 'a', offset=0, section='code')
+        obj = link([object1], libraries=[library])
+        self.assertEqual(24, obj.get_section('code').size)
+        self.assertEqual(4, obj.get_symbol_value('a'))
+        self.assertEqual(16, obj.get_symbol_value('b'))
+        self.assertFalse(obj.has_symbol('c'))
+
+    def test_archive_file(self):
+        """ Save an archive and link against the loaded archive """
+        arch = get_arch('arm')
+        library = self.make_library(arch)
+        object1 = ObjectFile(arch)
+        object1.get_section('code', create=True).add_data(bytes([0]*4))
+        object1.gen_relocation('rel8', 'b', offset=0, section='code')
+        handle, filename = tempfile.mkstemp(suffix='.pa')
+        os.close(handle)
+        try:
+            save_archive(library, filename)
+            library2 = load_archive(filename)
+            self.assertEqual(
+                ['member0', 'member1', 'member2'],
+                [member.name for member in library2.members])
+            self.assertIs(library2.members[1], library2.find_member('b'))
+            obj = link([object1], libraries=[filename])
+        finally:
+            os.remove(filename)
+        self.assertEqual(16, obj.get_section('code').size)
+        self.assertEqual(8, obj.get_symbol_value('b'))
+
+    def test_gc_sections(self):
+        """ Unused function sections are removed """
+        arch = get_arch('arm')
+        object1 = ObjectFile(arch)
+        object1.get_section('code', create=True).add_data(bytes([0]*4))
+        object1.gen_relocation('rel8', 'f', offset=0, section='code')
+        object1.get_section('code.f', create=True).add_data(bytes([0]*8))
+        object1.add_symbol('f', 0, 'code.f')
+        object1.gen_relocation('rel8', 'g', offset=4, section='code.f')
+        object1.get_section('code.g', create=True).add_data(bytes([0]*8))
+        object1.add_symbol('g', 0, 'code.g')
+        object1.get_section('code.h', create=True).add_data(bytes([0]*8))
+        object1.add_symbol('h', 0, 'code.h')
+        object1.get_section('code.i', create=True).add_data(bytes([0]*8))
+        object1.add_symbol('i', 0, 'code.i')
+        obj = link([object1])
+        self.assertEqual(['code'], [s.name for s in obj.sections])
+        self.assertEqual(36, obj.get_section('code').size)
+        obj = link([object1], gc_sections=True, entry=['i'])
+        self.assertEqual(28, obj.get_section('code').size)
+        self.assertEqual(4, obj.get_symbol_value('f'))
+        self.assertEqual(12, obj.get_symbol_value('g'))
+        self.assertFalse(obj.has_symbol('h'))
+        self.assertEqual(20, obj.get_symbol_value('i'))
+
+    def test_gc_sections_default_entry(self):
+        """ Without entry symbols, main is kept when removing sections """
+        arch = get_arch('arm')
+        object1 = ObjectFile(arch)
+        object1.get_section('code.main', create=True).add_data(bytes([0]*8))
+        object1.add_symbol('main', 0, 'code.main')
+        object1.gen_relocation('rel8', 'f', offset=4, section='code.main')
+        object1.get_section('code.f', create=True).add_data(bytes([0]*8))
+        object1.add_symbol('f', 0, 'code.f')
+        object1.get_section('code.g', create=True).add_data(bytes([0]*8))
+        object1.add_symbol('g', 0, 'code.g')
+        obj = link([object1], gc_sections=True)
+        self.assertEqual(16, obj.get_section('code').size)
+        self.assertEqual(0, obj.get_symbol_value('main'))
+        self.assertEqual(8, obj.get_symbol_value('f'))
+        self.assertFalse(obj.has_symbol('g'))
+
+    def test_function_section_names(self):
+        """ Only function sections are merged, and not in a partial link """
+        arch = get_arch('arm')
+        object1 = ObjectFile(arch)
+        object1.get_section('code.f', create=True).add_data(bytes([0]*8))
+        object1.add_symbol('f', 0, 'code.f')
+        object1.get_section('rodata.str', create=True).add_data(bytes(4))
+        object1.get_section('.text', create=True).add_data(bytes(4))
+        obj = link([object1], partial_link=True)
+        self.assertEqual(
+            ['code.f', 'rodata.str', '.text'],
+            [s.name for s in obj.sections])
+        self.assertEqual('code.f', obj.get_symbol('f').section)
+        obj = link([obj])
+        self.assertEqual(
+            ['code', 'rodata.str', '.text'], [s.name for s in obj.sections])
+
+    def test_gc_sections_debug_info(self):
+        """ Debug information of removed functions is removed """
+        source = """module main;
+        function int f() { return 1; }
+        function int g() { return 2; }
+        """
+        ir_module = c3_to_ir([io.StringIO(source)], [], 'arm')
+        object1 = ir_to_object(
+            [ir_module], 'arm', debug=True, function_sections=True)
+        self.assertTrue(object1.has_section('code.main_f'))
+        obj = link([object1], debug=True, gc_sections=True, entry=['main_g'])
+        self.assertFalse(obj.has_symbol('main_f'))
+        self.assertEqual(
+            ['g'], [f.name for f in obj.debug_info.functions])
+        for location in obj.debug_info.locations:
+            self.assertEqual('code', location.address.section)
+
 
 class ObjectFileTestCase(unittest.TestCase):
     def make_twins(self):
@@ -172,6 +419,69 @@ class ObjectFileTestCase(unittest.TestCase):
         object3 = deserialize(serialize(object1))
         self.assertEqual(object3, object1)
 
+    def test_binary_save_and_load(self):
+        object1, object2 = self.make_twins()
+        object1.gen_relocation('rel8', 'A2', offset=0x4, section='code',
+                               addend=3)
+        f1 = io.BytesIO()
+        object1.save(f1, binary=True)
+        f2 = io.BytesIO(f1.getvalue())
+        object3 = ObjectFile.load(f2)
+        self.assertEqual(object3, object1)
+        self.assertEqual(3, object3.relocations[1].addend)
+
+    def test_binary_debug_info(self):
+        """ Check that debug information survives the binary format """
+        source = io.StringIO("""
+        module main;
+        function int add(int a, int b) { return a + b; }
+        """)
+        object1 = c3c([source], [], 'arm', debug=True)
+        f1 = io.BytesIO()
+        object1.save(f1, binary=True)
+        object2 = ObjectFile.load(io.BytesIO(f1.getvalue()))
+        self.assertEqual(object1, object2)
+        self.assertIsNotNone(object2.debug_info)
+        self.assertEqual(serialize(object1), serialize(object2))
+
+    def test_binary_file(self):
+        """ Binary files are chosen by extension """
+        object1, object2 = self.make_twins()
+        handle, filename = tempfile.mkstemp(suffix='.ojb')
+        os.close(handle)
+        self.addCleanup(os.remove, filename)
+        save_object(object1, filename)
+        object3 = get_object(filename)
+        self.assertEqual(object3, object2)
+        self.assertIsInstance(object3.get_section('code').data, bytearray)
+
+        # The loaded section data can be changed in place:
+        object3.get_section('code').data[0] = 1
+        object3.get_section('code').add_data(bytes([1]))
+        self.assertEqual(56, object3.get_section('code').size)
+
+    def test_save_over_mapped_file(self):
+        """ A loaded object can be saved to the file it came from """
+        object1, object2 = self.make_twins()
+        handle, filename = tempfile.mkstemp(suffix='.ojb')
+        os.close(handle)
+        self.addCleanup(os.remove, filename)
+        save_object(object1, filename)
+        object3 = get_object(filename)
+        object3.get_section('extra', create=True).add_data(bytes(100))
+        save_object(object3, filename)
+        self.assertEqual(object3, get_object(filename))
+
+        save_object(object3, filename, binary=False)
+        self.assertEqual(object3, get_object(filename))
+
+    def test_corrupt_binary(self):
+        object1, object2 = self.make_twins()
+        f1 = io.BytesIO()
+        object1.save(f1, binary=True)
+        with self.assertRaises(ValueError):
+            ObjectFile.load(io.BytesIO(f1.getvalue()[:50]))
+
     def test_overlapping_sections(self):
         """ Check that overlapping sections are detected """
         obj = ObjectFile(get_arch('msp430'))
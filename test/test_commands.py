@@ -12,6 +12,7 @@ from ppci.cli.objdump import objdump
 from ppci.cli.objcopy import objcopy
 from ppci.cli.pascal import pascal
 from ppci.cli.link import link
+from ppci.cli.archive import archive
 from ppci.cli.opt import opt
 from ppci.cli.cc import cc
 from ppci import api
@@ -95,6 +96,137 @@ class CcTestCase(unittest.TestCase):
         oj_file = new_temp_file('.oj')
         cc(['-m', 'arm', self.c_file, '-o', oj_file])
 
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('sys.stderr', new_callable=io.StringIO)
+    def test_cc_command_jobs(self, mock_stdout, mock_stderr):
+        """ Check that parallel code generation gives the same output """
+        c_file = new_temp_file('.c')
+        with open(c_file, 'w') as f:
+            for i in range(4):
+                f.write(
+                    'int f{0}(int a) {{ return a * {0} + 1; }}\n'.format(i))
+        oj_file1 = new_temp_file('.oj')
+        oj_file2 = new_temp_file('.oj')
+        cc(['-m', 'arm', '--no-cache', c_file, '-o', oj_file1])
+        cc(['-m', 'arm', '--no-cache', '-j', '2', c_file, '-o', oj_file2])
+        with open(oj_file1) as f1, open(oj_file2) as f2:
+            self.assertEqual(f1.read(), f2.read())
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('sys.stderr', new_callable=io.StringIO)
+    def test_cc_command_sources_jobs(self, mock_stdout, mock_stderr):
+        """ Check that sources compiled in parallel give the same output """
+        c_files = []
+        for i in range(3):
+            c_file = new_temp_file('.c')
+            with open(c_file, 'w') as f:
+                f.write('int f{0}(int a) {{ return a * {0}; }}\n'.format(i))
+            c_files.append(c_file)
+        oj_file1 = new_temp_file('.oj')
+        oj_file2 = new_temp_file('.oj')
+        cc(['-m', 'arm', '--no-cache', '-j', '2'] + c_files +
+           ['-o', oj_file1])
+        cc(['-m', 'arm', '--no-cache', '-j', '3'] + c_files +
+           ['-o', oj_file2])
+        with open(oj_file1) as f1, open(oj_file2) as f2:
+            self.assertEqual(f1.read(), f2.read())
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('sys.stderr', new_callable=io.StringIO)
+    def test_cc_command_sources_jobs_function_sections(
+            self, mock_stdout, mock_stderr):
+        """ Sources compiled in parallel keep their function sections """
+        c_files = []
+        for i in range(3):
+            c_file = new_temp_file('.c')
+            with open(c_file, 'w') as f:
+                f.write('int f{0}(int a) {{ return a * {0}; }}\n'.format(i))
+            c_files.append(c_file)
+        oj_file1 = new_temp_file('.oj')
+        oj_file2 = new_temp_file('.oj')
+        options = ['-m', 'arm', '--no-cache', '--function-sections', '-c']
+        cc(options + ['-j', '1'] + c_files + ['-o', oj_file1])
+        cc(options + ['-j', '3'] + c_files + ['-o', oj_file2])
+        with open(oj_file1) as f1, open(oj_file2) as f2:
+            self.assertEqual(f1.read(), f2.read())
+        with open(oj_file2) as f:
+            obj = ObjectFile.load(f)
+        for i in range(3):
+            self.assertTrue(obj.has_section('code.f{}'.format(i)))
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('sys.stderr', new_callable=io.StringIO)
+    def test_cc_command_cache(self, mock_stdout, mock_stderr):
+        """ Check that a second compilation is served from the cache """
+        with tempfile.TemporaryDirectory() as cache_dir:
+            oj_file1 = new_temp_file('.oj')
+            oj_file2 = new_temp_file('.oj')
+            cc(['-m', 'arm', '--cache-dir', cache_dir, self.c_file,
+                '-o', oj_file1])
+            with patch('ppci.api.c_to_ir') as mock_c_to_ir:
+                cc(['-m', 'arm', '--cache-dir', cache_dir, self.c_file,
+                    '-o', oj_file2])
+                mock_c_to_ir.assert_not_called()
+        with open(oj_file1) as f1, open(oj_file2) as f2:
+            self.assertEqual(f1.read(), f2.read())
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('sys.stderr', new_callable=io.StringIO)
+    def test_cc_command_pch(self, mock_stdout, mock_stderr):
+        """ Check that a precompiled header gives the same output """
+        with tempfile.TemporaryDirectory() as directory:
+            h_file = os.path.join(directory, 'common.h')
+            with open(h_file, 'w') as f:
+                f.write(
+                    '#ifndef COMMON_H\n#define COMMON_H\n'
+                    '#define SQUARE(x) ((x) * (x))\n'
+                    'typedef struct point { int x; char y; int z; } pt;\n'
+                    'enum color { RED = 2, GREEN };\n'
+                    'int add(int a, int b);\n#endif\n')
+            c_file = os.path.join(directory, 'main.c')
+            with open(c_file, 'w') as f:
+                f.write(
+                    '#include "common.h"\n'
+                    'int f(pt *p) { return SQUARE(p->z) + GREEN; }\n'
+                    'int g(void) { return add(RED, sizeof(pt)); }\n')
+            pch_file = os.path.join(directory, 'common.pch')
+            oj_file1 = os.path.join(directory, 'main1.oj')
+            oj_file2 = os.path.join(directory, 'main2.oj')
+            cc(['-m', 'arm', '--emit-pch', h_file, '-o', pch_file])
+            cc(['-m', 'arm', '--no-cache', '-c', c_file, '-o', oj_file1])
+            with patch('ppci.lang.c.lexer.open', create=True) as mock_open:
+                cc(['-m', 'arm', '--no-cache', '-c', '--include-pch',
+                    pch_file, c_file, '-o', oj_file2])
+                mock_open.assert_not_called()
+            with open(oj_file1) as f1, open(oj_file2) as f2:
+                self.assertEqual(f1.read(), f2.read())
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('sys.stderr', new_callable=io.StringIO)
+    def test_cc_command_pch_cache(self, mock_stdout, mock_stderr):
+        """ A cached object is not used when its precompiled header is
+        out of date """
+        with tempfile.TemporaryDirectory() as directory:
+            h_file = os.path.join(directory, 'common.h')
+            with open(h_file, 'w') as f:
+                f.write('#define VALUE 1\n')
+            c_file = os.path.join(directory, 'main.c')
+            with open(c_file, 'w') as f:
+                f.write('int f(void) { return VALUE; }\n')
+            pch_file = os.path.join(directory, 'common.pch')
+            oj_file = os.path.join(directory, 'main.oj')
+            cache_dir = os.path.join(directory, 'cache')
+            cc(['-m', 'arm', '--emit-pch', h_file, '-o', pch_file])
+            args = [
+                '-m', 'arm', '--cache-dir', cache_dir, '-c', '--include-pch',
+                pch_file, c_file, '-o', oj_file]
+            cc(args)
+            with open(h_file, 'w') as f:
+                f.write('#define VALUE 2\n')
+            with self.assertRaises(SystemExit):
+                cc(args)
+            self.assertIn('out of date', mock_stdout.getvalue())
+
     @patch('sys.stdout', new_callable=io.StringIO)
     @patch('sys.stderr', new_callable=io.StringIO)
     def test_cc_command_s(self, mock_stdout, mock_stderr):
@@ -175,6 +307,18 @@ class ObjdumpTestCase(unittest.TestCase):
             objdump([obj_file])
             self.assertIn('SECTION', mock_stdout.getvalue())
 
+    @patch('sys.stderr', new_callable=io.StringIO)
+    def test_binary_object(self, mock_stderr):
+        """ Check that binary object files are written and read """
+        obj_file = new_temp_file('.ojb')
+        src = relpath('..', 'examples', 'avr', 'arduino-blinky', 'boot.asm')
+        asm(['-m', 'avr', '-o', obj_file, src])
+        with open(obj_file, 'rb') as f:
+            self.assertTrue(f.read().startswith(b'PPCIOBJ'))
+        with patch('sys.stdout', new_callable=io.StringIO) as mock_stdout:
+            objdump([obj_file])
+            self.assertIn('SECTION', mock_stdout.getvalue())
+
 
 @unittest.skipUnless(do_long_tests('any'), 'skipping slow tests')
 class ObjcopyTestCase(unittest.TestCase):
@@ -250,6 +394,37 @@ class LinkCommandTestCase(unittest.TestCase):
         link(
             ['-o', obj3, '-L', mmap, obj1, obj2])
 
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('sys.stderr', new_callable=io.StringIO)
+    def test_library_and_gc_sections(self, mock_stdout, mock_stderr):
+        """ Link against an archive and remove unused functions """
+        obj1 = new_temp_file('.obj')
+        obj2 = new_temp_file('.obj')
+        obj3 = new_temp_file('.obj')
+        obj4 = new_temp_file('.obj')
+        obj5 = new_temp_file('.obj')
+        lib = new_temp_file('.pa')
+        asm_src = relpath('..', 'examples', 'lm3s6965evb', 'startup.asm')
+        mmap = relpath('..', 'examples', 'lm3s6965evb', 'memlayout.mmap')
+        c3_srcs = [
+            relpath('..', 'examples', 'src', 'snake', 'main.c3'),
+            relpath('..', 'examples', 'src', 'snake', 'game.c3'),
+            relpath('..', 'examples', 'lm3s6965evb', 'bsp.c3'),
+            ]
+        c3_lib_src = relpath('..', 'librt', 'io.c3')
+        c3_options = ['-m', 'arm', '--mtune', 'thumb', '--function-sections']
+        asm(['-m', 'arm', '--mtune', 'thumb', '-o', obj1, asm_src])
+        c3c(c3_options + ['-o', obj2, '-i', c3_lib_src] + c3_srcs)
+        includes = [arg for src in c3_srcs for arg in ('-i', src)]
+        c3c(c3_options + ['-o', obj3] + includes + [c3_lib_src])
+        archive([lib, obj3])
+        link(['-o', obj4, '-L', mmap, obj1, obj2, '-l', lib])
+        link(
+            ['-o', obj5, '-L', mmap, obj1, obj2, '-l', lib, '--gc-sections'])
+        size = api.get_object(obj4).get_image('flash').size
+        gc_size = api.get_object(obj5).get_image('flash').size
+        self.assertLess(gc_size, size)
+
 
 class YaccTestCase(unittest.TestCase):
     @patch('sys.stdout', new_callable=io.StringIO)
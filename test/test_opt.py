@@ -8,9 +8,18 @@ from ppci import ir
 from ppci import irutils
 from ppci.binutils.debuginfo import DebugDb
 from ppci.irutils import verify_module
+from ppci.api import ir_to_python, c_to_ir, optimize
 from ppci.opt import Mem2RegPromotor
-from ppci.opt import CleanPass
-from ppci.opt.constantfolding import correct
+from ppci.opt import CleanPass, PassManager
+from ppci.opt import ConstantFolder, DeleteUnusedInstructionsPass
+from ppci.opt import GlobalValueNumberingPass, InlinePass
+from ppci.opt import LoopInvariantCodeMotionPass, StrengthReductionPass
+from ppci.opt import SparseConditionalConstantPropagationPass
+from ppci.opt.loops import find_loops
+from ppci.graph.domtree import CfgInfo
+from ppci.opt.transform import FunctionPass
+from ppci.utils.reporting import DummyReportGenerator
+from ppci.opt.constantfolding import correct, c_div, c_mod
 from ppci.opt.tailcall import TailCallOptimization
 
 
@@ -76,6 +85,29 @@ class CleanTestCase(OptTestCase):
         self.clean_pass.run(self.module)
         self.assertNotIn(block4, self.function)
 
+    def test_empty_blocks_to_phi(self):
+        """ Empty blocks which give different values to a phi remain """
+        p = ir.Parameter('p', ir.ptr)
+        self.function.add_parameter(p)
+        yes = self.builder.new_block()
+        no = self.builder.new_block()
+        join = self.builder.new_block()
+        one = self.builder.emit(ir.Const(1, 'one', ir.i32))
+        two = self.builder.emit(ir.Const(2, 'two', ir.i32))
+        self.builder.emit(ir.CJump(one, '<', two, yes, no))
+        for block in (yes, no):
+            self.builder.set_block(block)
+            self.builder.emit(ir.Jump(join))
+        self.builder.set_block(join)
+        phi = self.builder.emit(ir.Phi('phi', ir.i32))
+        phi.set_incoming(yes, one)
+        phi.set_incoming(no, two)
+        self.builder.emit(ir.Store(phi, p))
+        self.builder.emit(ir.Exit())
+        self.clean_pass.run(self.module)
+        self.assertEqual(2, len(phi.inputs))
+        self.assertEqual({1, 2}, {v.value for v in phi.inputs.values()})
+
 
 class Mem2RegTestCase(OptTestCase):
     """ Test the memory to register lifter """
@@ -137,6 +169,421 @@ class Mem2RegTestCase(OptTestCase):
         self.assertIn(alloc, self.function.entry.instructions)
 
 
+class GlobalValueNumberingTestCase(OptTestCase):
+    """ Test the removal of values computed twice """
+    def setUp(self):
+        super().setUp()
+        self.gvn = GlobalValueNumberingPass()
+        self.a = ir.Parameter('a', ir.i32)
+        self.b = ir.Parameter('b', ir.i32)
+        self.p = ir.Parameter('p', ir.ptr)
+        for parameter in (self.a, self.b, self.p):
+            self.function.add_parameter(parameter)
+
+    def jump_to_new_block(self):
+        block = self.builder.new_block()
+        self.builder.emit(ir.Jump(block))
+        self.builder.set_block(block)
+        return block
+
+    def test_dominated_block(self):
+        """ Values of a dominating block are reused, with the operands of
+        commutative operations in any order """
+        x = self.builder.emit(ir.add(self.a, self.b, 'x', ir.i32))
+        self.jump_to_new_block()
+        y = self.builder.emit(ir.add(self.b, self.a, 'y', ir.i32))
+        z = self.builder.emit(ir.sub(self.b, self.a, 'z', ir.i32))
+        store = self.builder.emit(ir.Store(y, self.p))
+        self.builder.emit(ir.Store(z, self.p))
+        self.builder.emit(ir.Exit())
+        self.assertTrue(self.gvn.run(self.module))
+        self.assertIs(x, store.value)
+        self.assertIsNone(y.block)
+        self.assertIsNotNone(z.block)
+        self.assertFalse(self.gvn.run(self.module))
+
+    def test_sibling_blocks(self):
+        """ Values of a block which does not dominate are not reused """
+        yes = self.builder.new_block()
+        no = self.builder.new_block()
+        self.builder.emit(ir.CJump(self.a, '<', self.b, yes, no))
+        values = []
+        for block in (yes, no):
+            self.builder.set_block(block)
+            value = self.builder.emit(ir.Cast(self.a, 'c', ir.i8))
+            self.builder.emit(ir.Store(value, self.p))
+            self.builder.emit(ir.Exit())
+            values.append(value)
+        self.assertFalse(self.gvn.run(self.module))
+        self.assertTrue(all(value.block for value in values))
+
+    def test_loads(self):
+        """ Loads are reused until memory is changed """
+        x = self.builder.emit(ir.Load(self.p, 'x', ir.i32))
+        self.jump_to_new_block()
+        y = self.builder.emit(ir.Load(self.p, 'y', ir.i32))
+        self.builder.emit(ir.Store(y, self.p))
+        z = self.builder.emit(ir.Load(self.p, 'z', ir.i32))
+        self.builder.emit(ir.Store(z, self.p))
+        self.builder.emit(ir.Exit())
+        self.gvn.run(self.module)
+        self.assertIsNone(y.block)
+        self.assertIsNotNone(x.block)
+        self.assertIsNotNone(z.block)
+
+    def test_load_after_join(self):
+        """ A store in one branch changes memory for the join block """
+        self.builder.emit(ir.Load(self.p, 'x', ir.i32))
+        yes = self.builder.new_block()
+        join = self.builder.new_block()
+        self.builder.emit(ir.CJump(self.a, '<', self.b, yes, join))
+        self.builder.set_block(yes)
+        self.builder.emit(ir.Store(self.a, self.p))
+        self.builder.emit(ir.Jump(join))
+        self.builder.set_block(join)
+        y = self.builder.emit(ir.Load(self.p, 'y', ir.i32))
+        self.builder.emit(ir.Store(y, self.p))
+        self.builder.emit(ir.Exit())
+        self.assertFalse(self.gvn.run(self.module))
+        self.assertIsNotNone(y.block)
+
+
+class ConstantPropagationTestCase(OptTestCase):
+    """ Test the propagation of constants over blocks """
+    def setUp(self):
+        super().setUp()
+        self.sccp = SparseConditionalConstantPropagationPass()
+        self.p = ir.Parameter('p', ir.ptr)
+        self.function.add_parameter(self.p)
+
+    def test_dead_branch(self):
+        """ A constant condition removes the branch not taken, and the phi
+        of the join block becomes constant """
+        yes = self.builder.new_block()
+        no = self.builder.new_block()
+        join = self.builder.new_block()
+        one = self.builder.emit(ir.Const(1, 'one', ir.i32))
+        two = self.builder.emit(ir.Const(2, 'two', ir.i32))
+        flag = self.builder.emit(ir.add(one, one, 'flag', ir.i32))
+        self.builder.emit(ir.CJump(flag, '==', one, yes, no))
+        self.builder.set_block(yes)
+        self.builder.emit(ir.Jump(join))
+        self.builder.set_block(no)
+        self.builder.emit(ir.Jump(join))
+        self.builder.set_block(join)
+        phi = self.builder.emit(ir.Phi('phi', ir.i32))
+        phi.set_incoming(yes, two)
+        phi.set_incoming(no, one)
+        store = self.builder.emit(ir.Store(phi, self.p))
+        self.builder.emit(ir.Exit())
+
+        self.assertTrue(self.sccp.run(self.module))
+        self.assertNotIn(yes, self.function.blocks)
+        self.assertIsInstance(store.value, ir.Const)
+        self.assertEqual(1, store.value.value)
+        self.assertFalse(self.sccp.run(self.module))
+
+    def test_loop(self):
+        """ A phi changed in a loop is not constant """
+        loop = self.builder.new_block()
+        done = self.builder.new_block()
+        zero = self.builder.emit(ir.Const(0, 'zero', ir.i8))
+        one = self.builder.emit(ir.Const(1, 'one', ir.i8))
+        self.builder.emit(ir.Jump(loop))
+        self.builder.set_block(loop)
+        phi = self.builder.emit(ir.Phi('i', ir.i8))
+        i2 = self.builder.emit(ir.add(phi, one, 'i2', ir.i8))
+        phi.set_incoming(self.function.entry, zero)
+        phi.set_incoming(loop, i2)
+        self.builder.emit(ir.CJump(i2, '>', zero, loop, done))
+        self.builder.set_block(done)
+        self.builder.emit(ir.Store(phi, self.p))
+        self.builder.emit(ir.Exit())
+
+        self.assertFalse(self.sccp.run(self.module))
+        self.assertEqual(3, len(self.function.blocks))
+
+    def test_same_targets(self):
+        """ A constant jump with twice the same target keeps the phi """
+        join = self.builder.new_block()
+        one = self.builder.emit(ir.Const(1, 'one', ir.i32))
+        self.builder.emit(ir.CJump(one, '==', one, join, join))
+        self.builder.set_block(join)
+        phi = self.builder.emit(ir.Phi('phi', ir.i32))
+        phi.set_incoming(self.function.entry, one)
+        self.builder.emit(ir.Store(phi, self.p))
+        self.builder.emit(ir.Exit())
+
+        self.assertTrue(self.sccp.run(self.module))
+        self.assertIsInstance(self.function.entry.last_instruction, ir.Jump)
+        self.assertEqual([self.function.entry], join.predecessors)
+
+
+class InlineTestCase(unittest.TestCase):
+    """ Test the inlining of calls """
+    def setUp(self):
+        self.builder = irutils.Builder()
+        self.module = ir.Module('test')
+        self.builder.set_module(self.module)
+
+    def new_function(self, name):
+        function = self.builder.new_function(name, ir.i32)
+        self.builder.set_function(function)
+        function.entry = self.builder.new_block()
+        self.builder.set_block(function.entry)
+        parameter = ir.Parameter('x', ir.i32)
+        function.add_parameter(parameter)
+        return function, parameter
+
+    def make_abs(self):
+        """ A function which returns from two places """
+        function, x = self.new_function('abs')
+        negative = self.builder.new_block()
+        positive = self.builder.new_block()
+        zero = self.builder.emit(ir.Const(0, 'zero', ir.i32))
+        self.builder.emit(ir.CJump(x, '<', zero, negative, positive))
+        self.builder.set_block(negative)
+        minus_x = self.builder.emit(ir.sub(zero, x, 'minus_x', ir.i32))
+        self.builder.emit(ir.Return(minus_x))
+        self.builder.set_block(positive)
+        self.builder.emit(ir.Return(x))
+        return function
+
+    def call_twice(self, callee):
+        """ A function which calls the callee twice """
+        function, x = self.new_function('caller')
+        a = self.builder.emit(ir.FunctionCall(callee, [x], 'a', ir.i32))
+        b = self.builder.emit(ir.FunctionCall(callee, [a], 'b', ir.i32))
+        self.builder.emit(ir.Return(b))
+        return function
+
+    def test_inline(self):
+        caller = self.call_twice(self.make_abs())
+        verify_module(self.module)
+        self.assertTrue(InlinePass().run(self.module))
+        verify_module(self.module)
+        self.assertTrue(caller.is_leaf())
+        phis = [i for i in caller.get_instructions() if isinstance(i, ir.Phi)]
+        self.assertEqual(2, len(phis))
+
+        # The inlined code computes the same:
+        f = io.StringIO()
+        ir_to_python([self.module], f)
+        namespace = {}
+        exec(f.getvalue(), namespace)
+        self.assertEqual(7, namespace['caller'](-7))
+        self.assertEqual(7, namespace['caller'](7))
+
+    def test_recursive(self):
+        function, x = self.new_function('f')
+        result = self.builder.emit(
+            ir.FunctionCall(function, [x], 'result', ir.i32))
+        self.builder.emit(ir.Return(result))
+        caller = self.call_twice(function)
+        self.assertFalse(InlinePass().run(self.module))
+        self.assertEqual(2, len(caller.get_out_calls()))
+
+
+class LoopTestCase(OptTestCase):
+    """ Test the moving of values out of loops and strength reduction """
+    def setUp(self):
+        super().setUp()
+        self.a = ir.Parameter('a', ir.i32)
+        self.p = ir.Parameter('p', ir.ptr)
+        for parameter in (self.a, self.p):
+            self.function.add_parameter(parameter)
+        self.header = self.builder.new_block()
+        self.body = self.builder.new_block()
+        self.done = self.builder.new_block()
+
+    def make_loop(self, entry_values):
+        """ Create a loop over i, which is entered from the given blocks
+        with the given start values, and continue in the loop body """
+        self.builder.set_block(self.header)
+        i = self.builder.emit(ir.Phi('i', ir.i32))
+        for block, value in entry_values:
+            i.set_incoming(block, value)
+        self.builder.emit(ir.CJump(i, '<', self.a, self.body, self.done))
+        self.builder.set_block(self.done)
+        self.builder.emit(ir.Exit())
+        self.builder.set_block(self.body)
+        return i
+
+    def close_loop(self, i):
+        one = self.builder.emit(ir.Const(1, 'one', ir.i32))
+        i2 = self.builder.emit(ir.add(i, one, 'i2', ir.i32))
+        i.set_incoming(self.body, i2)
+        self.builder.emit(ir.Jump(self.header))
+
+    def test_invariant_moved_to_preheader(self):
+        """ The loop is entered from two blocks, so a preheader is made """
+        other = self.builder.new_block()
+        zero = self.builder.emit(ir.Const(0, 'zero', ir.i32))
+        self.builder.emit(ir.CJump(self.a, '<', zero, self.header, other))
+        self.builder.set_block(other)
+        one = self.builder.emit(ir.Const(1, 'one', ir.i32))
+        self.builder.emit(ir.Jump(self.header))
+        i = self.make_loop([(self.function.entry, zero), (other, one)])
+        three = self.builder.emit(ir.Const(3, 'three', ir.i32))
+        x = self.builder.emit(ir.mul(self.a, three, 'x', ir.i32))
+        y = self.builder.emit(ir.add(x, i, 'y', ir.i32))
+        self.builder.emit(ir.Store(y, self.p))
+        self.close_loop(i)
+
+        self.assertTrue(LoopInvariantCodeMotionPass().run(self.module))
+        preheader = x.block
+        self.assertEqual(
+            {preheader, self.body}, set(self.header.predecessors))
+        self.assertIsInstance(i.get_value(preheader), ir.Phi)
+        self.assertIs(self.body, y.block)
+        self.assertIs(self.body, three.block)
+        self.assertFalse(LoopInvariantCodeMotionPass().run(self.module))
+
+    def test_load_with_store(self):
+        """ A load is not moved out of a loop which stores """
+        zero = self.builder.emit(ir.Const(0, 'zero', ir.i32))
+        self.builder.emit(ir.Jump(self.header))
+        i = self.make_loop([(self.function.entry, zero)])
+        x = self.builder.emit(ir.Load(self.p, 'x', ir.i32))
+        self.builder.emit(ir.Store(i, self.p))
+        self.close_loop(i)
+        self.assertFalse(LoopInvariantCodeMotionPass().run(self.module))
+        self.assertIs(self.body, x.block)
+
+    def test_load_from_variable(self):
+        """ A load from a variable can always be done """
+        variable = ir.Variable('v', 8, 4)
+        self.module.add_variable(variable)
+        zero = self.builder.emit(ir.Const(0, 'zero', ir.i32))
+        self.builder.emit(ir.Jump(self.header))
+        i = self.make_loop([(self.function.entry, zero)])
+        four = self.builder.emit(ir.Const(4, 'four', ir.ptr))
+        address = self.builder.emit(ir.add(variable, four, 'addr', ir.ptr))
+        x = self.builder.emit(ir.Load(address, 'x', ir.i32))
+        y = self.builder.emit(ir.add(x, i, 'y', ir.i32))
+        self.builder.emit(ir.Cast(y, 'z', ir.i8))
+        self.close_loop(i)
+        self.assertTrue(LoopInvariantCodeMotionPass().run(self.module))
+        self.assertIs(self.function.entry, x.block)
+
+    def test_loop_with_two_latches(self):
+        """ The back edges to a header form a single loop """
+        zero = self.builder.emit(ir.Const(0, 'zero', ir.i32))
+        self.builder.emit(ir.Jump(self.header))
+        i = self.make_loop([(self.function.entry, zero)])
+        latch = self.builder.new_block()
+        self.builder.emit(ir.CJump(i, '==', zero, self.header, latch))
+        i.set_incoming(self.body, i)
+        self.builder.set_block(latch)
+        one = self.builder.emit(ir.Const(1, 'one', ir.i32))
+        i.set_incoming(latch, self.builder.emit(ir.add(i, one, 'i2', ir.i32)))
+        self.builder.emit(ir.Jump(self.header))
+        loops = find_loops(CfgInfo(self.function))
+        self.assertEqual(1, len(loops))
+        self.assertIs(self.header, loops[0].header)
+        self.assertEqual({self.header, self.body, latch}, loops[0].blocks)
+        self.assertEqual({self.body, latch}, set(loops[0].latches))
+
+    def test_no_loops(self):
+        """ A function without back edges has no loops """
+        for block, target in [
+                (self.function.entry, self.header), (self.header, self.body),
+                (self.body, self.done)]:
+            self.builder.set_block(block)
+            self.builder.emit(ir.Jump(target))
+        self.builder.set_block(self.done)
+        self.builder.emit(ir.Exit())
+        self.assertEqual([], find_loops(CfgInfo(self.function)))
+        self.assertFalse(LoopInvariantCodeMotionPass().run(self.module))
+
+    def test_cfg_info_kept(self):
+        """ The control flow information is only thrown away when a
+        preheader is inserted """
+        variable = ir.Variable('v', 4, 4)
+        self.module.add_variable(variable)
+        zero = self.builder.emit(ir.Const(0, 'zero', ir.i32))
+        self.builder.emit(ir.Jump(self.header))
+        i = self.make_loop([(self.function.entry, zero)])
+        x = self.builder.emit(ir.Load(variable, 'x', ir.i32))
+        self.builder.emit(ir.add(x, i, 'y', ir.i32))
+        self.close_loop(i)
+
+        before, after = CfgInfoPass(), CfgInfoPass()
+        passes = [before, LoopInvariantCodeMotionPass(), after]
+        pass_manager = PassManager(passes)
+        pass_manager.run(self.module)
+        self.assertIs(self.function.entry, x.block)
+        self.assertEqual(1, pass_manager.statistics[1].changes)
+        self.assertIs(before.cfg_infos[0], after.cfg_infos[0])
+
+    def test_array_index(self):
+        """ The address p + i * 4 becomes a pointer increment """
+        zero = self.builder.emit(ir.Const(0, 'zero', ir.i32))
+        self.builder.emit(ir.Jump(self.header))
+        i = self.make_loop([(self.function.entry, zero)])
+        index = self.builder.emit(ir.Cast(i, 'index', ir.ptr))
+        four = self.builder.emit(ir.Const(4, 'four', ir.ptr))
+        offset = self.builder.emit(ir.mul(index, four, 'offset', ir.ptr))
+        address = self.builder.emit(ir.add(self.p, offset, 'addr', ir.ptr))
+        store = self.builder.emit(ir.Store(i, address))
+        self.close_loop(i)
+
+        self.assertTrue(StrengthReductionPass().run(self.module))
+        pointer = store.address
+        self.assertIsInstance(pointer, ir.Phi)
+        self.assertIs(self.header, pointer.block)
+        increment = pointer.get_value(self.body)
+        self.assertEqual('+', increment.operation)
+        self.assertEqual(4, increment.b.value)
+        self.assertFalse(address.is_used)
+
+
+class StrengthReductionTestCase(unittest.TestCase):
+    """ Test that reduced code computes the same """
+    def test_reduced_multiplication(self):
+        """ A multiplication turned into an addition computes the same """
+        builder = irutils.Builder()
+        module = ir.Module('test')
+        builder.set_module(module)
+        function = builder.new_function('sum3', ir.i32)
+        builder.set_function(function)
+        n = ir.Parameter('n', ir.i32)
+        function.add_parameter(n)
+        entry = builder.new_block()
+        function.entry = entry
+        header = builder.new_block()
+        body = builder.new_block()
+        done = builder.new_block()
+        builder.set_block(entry)
+        zero = builder.emit(ir.Const(0, 'zero', ir.i32))
+        builder.emit(ir.Jump(header))
+        builder.set_block(header)
+        i = builder.emit(ir.Phi('i', ir.i32))
+        s = builder.emit(ir.Phi('s', ir.i32))
+        builder.emit(ir.CJump(i, '<', n, body, done))
+        builder.set_block(body)
+        three = builder.emit(ir.Const(3, 'three', ir.i32))
+        x = builder.emit(ir.mul(three, i, 'x', ir.i32))
+        s2 = builder.emit(ir.add(s, x, 's2', ir.i32))
+        two = builder.emit(ir.Const(2, 'two', ir.i32))
+        i2 = builder.emit(ir.add(i, two, 'i2', ir.i32))
+        builder.emit(ir.Jump(header))
+        builder.set_block(done)
+        builder.emit(ir.Return(s))
+        for phi, value in ((i, i2), (s, s2)):
+            phi.set_incoming(entry, zero)
+            phi.set_incoming(body, value)
+
+        self.assertTrue(StrengthReductionPass().run(module))
+        self.assertFalse(x.is_used)
+        verify_module(module)
+        f = io.StringIO()
+        ir_to_python([module], f)
+        namespace = {}
+        exec(f.getvalue(), namespace)
+        self.assertEqual(3 * (0 + 2 + 4 + 6), namespace['sum3'](7))
+
+
 class TypedEvalTestCase(unittest.TestCase):
     """ Test various integer values wrapped at bitsizes and signedness """
     def test_char_overflow(self):
@@ -158,6 +605,90 @@ class TypedEvalTestCase(unittest.TestCase):
         self.assertEqual(-32767, correct(2+32767, ir.i16))
         self.assertEqual(32766, correct(-32767-3, ir.i16))
 
+    def test_division_rounds_to_zero(self):
+        self.assertEqual(-4, c_mod(-4, 7))
+        self.assertEqual(4, c_mod(4, -7))
+        self.assertEqual(-2, c_div(-7, 3))
+        self.assertEqual(-2, c_div(7, -3))
+        self.assertEqual(2, c_div(-7, -3))
+
+
+class OptimizedProgramTestCase(unittest.TestCase):
+    """ Test that C programs compute the same at each optimization level """
+    def compile(self, source, level, passes=None):
+        ir_module = c_to_ir(io.StringIO(source), 'x86_64')
+        if passes is None:
+            optimize(ir_module, level)
+        else:
+            PassManager(passes).run(ir_module)
+        verify_module(ir_module)
+        f = io.StringIO()
+        ir_to_python([ir_module], f)
+        namespace = {}
+        exec(f.getvalue(), namespace)
+        return namespace
+
+    def check(self, source, function, arguments):
+        for level in ('0', '1', '2', 's'):
+            namespace = self.compile(source, level)
+            results = [namespace[function](*args) for args in arguments]
+            if level == '0':
+                expected = results
+            else:
+                self.assertEqual(expected, results, level)
+
+    def test_negative_modulo(self):
+        """ The remainder has the sign of the dividend, as in C """
+        source = """
+        int f(int a) {
+            int c = -4;
+            if (a > 0) { c = -4; }
+            return c % 7;
+        }
+        """
+        self.check(source, 'f', [(1,), (-1,)])
+        self.assertEqual(-4, self.compile(source, 2)['f'](1))
+
+    def test_jump_with_same_targets(self):
+        """ Empty branches become a conditional jump to one block """
+        source = """
+        int f(int a) {
+            int x = 0;
+            if (x == 0) {} else {}
+            if (a < 3) {} else {}
+            return a;
+        }
+        """
+        self.check(source, 'f', [(1,), (5,)])
+
+    def test_inlined_dead_result(self):
+        """ The empty return blocks of an inlined function, which result is
+        not used, are removed """
+        source = """
+        int arr[16];
+        int h1(int p, int q) {
+            if (p < q) return p - q;
+            return q + 5;
+        }
+        int f(int a, int b) {
+            int c = 5, x = 0, i0;
+            for (i0 = 0; i0 < 6; i0++) {
+                if (c >= b) { a = arr[c & 15]; x = i0 >> 5; }
+                else { b = h1(c, b >> 5); }
+                b = x << 4;
+                c = a + i0;
+            }
+            return x + a * 1000 + b + c;
+        }
+        """
+        arguments = [(a, b) for a in (-3, 7) for b in (-9, 40)]
+        self.check(source, 'f', arguments)
+        passes = [
+            Mem2RegPromotor(), InlinePass(), DeleteUnusedInstructionsPass(),
+            CleanPass()]
+        namespace = self.compile(source, None, passes=passes)
+        self.assertEqual(5, namespace['f'](7, 40))
+
 
 class TailCallTestCase(unittest.TestCase):
     """ Test the tail call optimization """
@@ -199,6 +730,86 @@ class TailCallTestCase(unittest.TestCase):
         self.assertTrue(function.is_leaf())
 
 
+class CfgInfoPass(FunctionPass):
+    """ Record the control flow information a pass gets """
+    preserves_cfg = True
+
+    def __init__(self):
+        super().__init__()
+        self.cfg_infos = []
+
+    def on_function(self, function):
+        self.cfg_infos.append(self.get_cfg_info(function))
+        return False
+
+
+class MessageReporter(DummyReportGenerator):
+    def __init__(self):
+        self.messages = []
+
+    def message(self, msg):
+        self.messages.append(msg)
+
+
+class PassManagerTestCase(OptTestCase):
+    """ Test running passes until nothing changes """
+    def setUp(self):
+        super().setUp()
+        alloc = self.builder.emit(ir.Alloc('A', 4, 4))
+        addr = self.builder.emit(ir.AddressOf(alloc, 'addr'))
+        one = self.builder.emit(ir.Const(1, 'one', ir.i32))
+        two = self.builder.emit(ir.Const(2, 'two', ir.i32))
+        three = self.builder.emit(ir.add(one, two, 'three', ir.i32))
+        self.builder.emit(ir.Store(three, addr))
+        value = self.builder.emit(ir.Load(addr, 'value', ir.i32))
+        self.builder.emit(ir.Store(value, addr))
+        self.builder.emit(ir.Exit())
+
+    def test_fixed_point(self):
+        passes = [
+            Mem2RegPromotor(), ConstantFolder(),
+            DeleteUnusedInstructionsPass(), CleanPass()]
+        reporter = MessageReporter()
+        pass_manager = PassManager(passes, reporter=reporter)
+        pass_manager.run(self.module)
+        self.assertEqual(1, len(self.function.entry))
+
+        mem2reg, folder, delete, clean = pass_manager.statistics
+        self.assertEqual(1, mem2reg.changes)
+        self.assertGreater(mem2reg.runs, 1)
+        self.assertEqual(0, clean.changes)
+        self.assertIn(str(folder), reporter.messages)
+
+        # Running once more does not change the function:
+        pass_manager = PassManager(passes)
+        pass_manager.run(self.module)
+        self.assertTrue(all(
+            stats.runs == 1 and stats.changes == 0
+            for stats in pass_manager.statistics))
+
+    def test_analysis_cache(self):
+        """ The control flow information is shared between passes """
+        before, after = CfgInfoPass(), CfgInfoPass()
+        passes = [before, Mem2RegPromotor(), after]
+        PassManager(passes).run(self.module)
+        self.assertIs(before.cfg_infos[0], after.cfg_infos[0])
+
+    def test_analysis_invalidated(self):
+        """ A change of the control flow invalidates the information """
+        block = self.builder.new_block()
+        exit_instruction = self.function.entry.last_instruction
+        exit_instruction.remove_from_block()
+        self.builder.emit(ir.Jump(block))
+        self.builder.set_block(block)
+        self.builder.emit(exit_instruction)
+
+        before, after = CfgInfoPass(), CfgInfoPass()
+        passes = [before, CleanPass(), after]
+        PassManager(passes).run(self.module)
+        self.assertEqual(1, len(self.function.blocks))
+        self.assertIsNot(before.cfg_infos[0], after.cfg_infos[0])
+
+
 if __name__ == '__main__':
     unittest.main()
     sys.exit()
@@ -1,8 +1,29 @@
 import os
 import unittest
 import tempfile
+from unittest.mock import patch
 
 from ppci.build.tasks import TaskRunner, TaskError, Project, Target, Task
+from ppci.build.tasks import register_task, order_targets
+from ppci.build.state import BuildState
+from ppci.build.buildtasks import CCompileTask
+
+
+@register_task
+class CopyTextTask(Task):
+    """ Copy a text file and record each run in a log file """
+    input_arguments = ('source',)
+    output_arguments = ('output',)
+
+    def run(self):
+        with open(self.relpath(self.arguments['source'])) as f:
+            text = f.read()
+        if text == 'fail':
+            raise TaskError('Cannot copy {}'.format(self.arguments['source']))
+        with open(self.relpath(self.arguments['output']), 'w') as f:
+            f.write(text)
+        with open(self.relpath('runs.log'), 'a') as f:
+            f.write(self.arguments['source'] + '\n')
 
 
 class TaskTestCase(unittest.TestCase):
@@ -68,5 +89,161 @@ class TaskTestCase(unittest.TestCase):
             task.open_file_set('*.asm')
 
 
+class IncrementalBuildTestCase(unittest.TestCase):
+    """ Test that tasks which are up to date are skipped """
+    def setUp(self):
+        self.basedir = tempfile.mkdtemp()
+        for name in ['a', 'b']:
+            self.write(name + '.txt', name)
+
+    def write(self, filename, text):
+        with open(os.path.join(self.basedir, filename), 'w') as f:
+            f.write(text)
+
+    def runs(self):
+        filename = os.path.join(self.basedir, 'runs.log')
+        if not os.path.exists(filename):
+            return []
+        with open(filename) as f:
+            runs = f.read().split()
+        os.remove(filename)
+        return sorted(runs)
+
+    def make_project(self):
+        project = Project('testproject')
+        project.set_property('basedir', self.basedir)
+        for name in ['a', 'b']:
+            target = Target(name, project)
+            target.add_task((
+                'copytext', {'source': name + '.txt', 'output': name + '.out'}
+            ))
+            project.add_target(target)
+        return project
+
+    def build(self, targets=('a', 'b'), jobs=1):
+        project = self.make_project()
+        state = BuildState.for_project(project)
+        TaskRunner(jobs=jobs, state=state).run(project, list(targets))
+        return project
+
+    def test_skip_up_to_date(self):
+        self.build()
+        self.assertEqual(['a.txt', 'b.txt'], self.runs())
+        self.build()
+        self.assertEqual([], self.runs())
+
+    def test_changed_input(self):
+        self.build()
+        self.runs()
+        self.write('b.txt', 'bb')
+        self.build()
+        self.assertEqual(['b.txt'], self.runs())
+
+    def test_removed_output(self):
+        self.build()
+        self.runs()
+        os.remove(os.path.join(self.basedir, 'a.out'))
+        self.build()
+        self.assertEqual(['a.txt'], self.runs())
+
+    def test_not_incremental(self):
+        """ Without a build state, all tasks run """
+        self.build()
+        self.runs()
+        project = self.make_project()
+        TaskRunner().run(project, ['a', 'b'])
+        self.assertEqual(['a.txt', 'b.txt'], self.runs())
+
+    def test_c_headers(self):
+        """ The headers included by C sources are inputs as well """
+        self.write('main.c', '#include "defs.h"\nint f() { return X; }\n')
+        self.write('defs.h', '#define X 1\n')
+        project = self.make_project()
+        task = CCompileTask(project.get_target('a'), {
+            'arch': 'arm', 'sources': 'main.c', 'output': 'main.oj'})
+        self.assertIn(
+            os.path.join(self.basedir, 'defs.h'), task.input_files())
+        signature = task.get_signature()
+        self.write('defs.h', '#define X 42\n')
+        self.assertNotEqual(signature, task.get_signature())
+
+    def test_c_headers_recorded(self):
+        """ The headers of unchanged sources are taken from the state """
+        self.write('main.c', '#include "defs.h"\nint f() { return X; }\n')
+        self.write('defs.h', '#define X 1\n')
+        self.write('more.h', '#define Y 2\n')
+        project = self.make_project()
+        target = Target('c', project)
+        target.add_task(('ccompile', {
+            'arch': 'arm', 'sources': 'main.c', 'output': 'main.oj'}))
+        project.add_target(target)
+        state = BuildState()
+        TaskRunner(state=state).run(project, ['c'])
+        headers = state.get_dependencies('c:0:ccompile')[
+            os.path.join(self.basedir, 'main.c')]['headers']
+        self.assertEqual(
+            [os.path.join(self.basedir, 'defs.h')], list(headers))
+
+        # A no-op build does not pre-process the sources:
+        with patch('ppci.build.buildtasks.get_included_files') as mock:
+            TaskRunner(state=state).run(project, ['c'])
+            mock.assert_not_called()
+
+        # A changed header is pre-processed again, to find new headers:
+        self.write('defs.h', '#include "more.h"\n#define X Y\n')
+        TaskRunner(state=state).run(project, ['c'])
+        headers = state.get_dependencies('c:0:ccompile')[
+            os.path.join(self.basedir, 'main.c')]['headers']
+        self.assertEqual(2, len(headers))
+
+    def test_failed_task(self):
+        """ A failed task runs again on the next build """
+        self.build()
+        self.runs()
+        self.write('a.txt', 'fail')
+        with self.assertRaisesRegex(TaskError, 'Cannot copy'):
+            self.build()
+        self.write('a.txt', 'aa')
+        self.build()
+        self.assertEqual(['a.txt'], self.runs())
+
+    def test_parallel(self):
+        self.build(jobs=2)
+        self.assertEqual(['a.txt', 'b.txt'], self.runs())
+        with open(os.path.join(self.basedir, 'b.out')) as f:
+            self.assertEqual('b', f.read())
+
+        # The state of the worker processes is saved:
+        self.build(jobs=2)
+        self.assertEqual([], self.runs())
+
+    def test_parallel_properties(self):
+        """ Properties set by a target are seen by the targets after it """
+        project = self.make_project()
+        target = Target('init', project)
+        target.add_task(('property', {'name': 'extension', 'value': 'bin'}))
+        project.add_target(target)
+        target = Target('c', project)
+        target.add_dependency('init')
+        target.add_task((
+            'copytext', {'source': 'a.txt', 'output': 'c.${extension}'}))
+        project.add_target(target)
+        TaskRunner(jobs=2).run(project, ['b', 'c'])
+        self.assertEqual('bin', project.get_property('extension'))
+        self.assertTrue(os.path.exists(os.path.join(self.basedir, 'c.bin')))
+
+    def test_parallel_error(self):
+        self.write('b.txt', 'fail')
+        with self.assertRaisesRegex(TaskError, 'Cannot copy b.txt'):
+            self.build(jobs=2)
+
+    def test_order_targets(self):
+        project = self.make_project()
+        project.get_target('a').add_dependency('b')
+        targets = order_targets([project.get_target('a'),
+                                 project.get_target('b')])
+        self.assertEqual(['b', 'a'], [t.name for t in targets])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,147 @@
+"""
+Test reading binary wasm from a file and from a buffer.
+"""
+
+import io
+import os
+import tempfile
+
+import pytest
+
+from ppci.wasm import Module, Func, Instruction
+from ppci.wasm.io import FileReader, BufferReader
+from ppci.utils.leb128 import signed_leb128_encode, unsigned_leb128_encode
+
+
+CODE = """
+(module
+    (type $0 (func (param i32 i64 f32 f64) (result i32)))
+    (import "js" "print" (func $print (type $0)))
+    (memory 1 2)
+    (global $g (mut i32) (i32.const -12345678))
+    (func $f (type $0)
+        (local i32 f64)
+        (block
+            (loop
+                (i32.const 3)
+                (br_table 0 1 0)
+            )
+        )
+        (i64.const -9223372036854775808)
+        (drop)
+        (f32.const 1.5)
+        (drop)
+        (f64.const -2.25)
+        (drop)
+        (i32.const 0)
+        (i32.const 624485)
+        (i32.store offset=1000)
+        (i32.const 1)
+        (memory.grow 0)
+        (drop)
+        (get_local 0)
+        (get_local 1)
+        (get_local 2)
+        (get_local 3)
+        (i32.const 0)
+        (call_indirect (type $0))
+    )
+    (table 1 anyfunc)
+    (elem (i32.const 0) $f)
+    (data (i32.const 16) "hello")
+    (export "f" (func $f))
+)
+"""
+
+
+def strings(module):
+    return [d.to_string() for d in module]
+
+
+def test_buffer_reader_same_module():
+    data = Module(CODE).to_bytes()
+    m1 = Module(FileReader(io.BytesIO(data)))
+    m2 = Module(data)
+    m3 = Module(memoryview(data))
+    assert strings(m1) == strings(m2) == strings(m3)
+    assert m2.to_bytes() == data
+
+
+def test_lazy_function_bodies(capsys):
+    data = Module(CODE).to_bytes()
+    m = Module(data)
+    func, = m['func']
+    assert not func.is_decoded
+    m.show_interface()
+    assert 'f:' in capsys.readouterr().out
+    assert not func.is_decoded
+    assert m.to_bytes() == data
+    assert not func.is_decoded
+
+    # The body is decoded on first use:
+    assert [typ for _, typ in func.locals] == ['i32', 'f64']
+    assert func.is_decoded
+    assert func.instructions[0].opcode == 'block'
+    assert m.to_bytes() == data
+
+
+def test_lazy_function_replace_instructions():
+    m = Module(Module(CODE).to_bytes())
+    func, = m['func']
+    func.instructions = [Instruction('i32.const', 7)]
+    assert [typ for _, typ in func.locals] == ['i32', 'f64']
+    func2, = Module(m.to_bytes())['func']
+    assert func2.to_string() == func.to_string()
+
+
+def test_eager_function_bodies(monkeypatch):
+    data = Module(CODE).to_bytes()
+    lazy = Module(data)
+    monkeypatch.setattr(Func, 'lazy', False)
+    m = Module(data)
+    func, = m['func']
+    assert func.is_decoded
+    assert strings(m) == strings(lazy)
+
+
+def test_module_from_file():
+    data = Module(CODE).to_bytes()
+    fd, filename = tempfile.mkstemp(suffix='.wasm')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        with open(filename, 'rb') as f:
+            m = Module(f)
+    finally:
+        os.remove(filename)
+    assert m.to_bytes() == data
+
+
+@pytest.mark.parametrize('value', [
+    0, 1, 63, 64, 127, 128, 624485, 2**32 - 1, 2**63, -1, -64, -65,
+    -624485, -2**63])
+def test_buffer_reader_leb128(value):
+    if value >= 0:
+        reader = BufferReader(unsigned_leb128_encode(value))
+        assert reader.read_uint() == value
+    reader = BufferReader(signed_leb128_encode(value))
+    assert reader.read_int() == value
+
+
+def test_buffer_reader_eof():
+    reader = BufferReader(bytes([0x81, 0x80]))
+    with pytest.raises(EOFError):
+        reader.read_uint()
+    reader = BufferReader(bytes([1, 2, 3]))
+    assert reader.read_byte() == 1
+    with pytest.raises(EOFError):
+        reader.read(3)
+    assert reader.read() == bytes([2, 3])
+    with pytest.raises(EOFError):
+        reader.read_byte()
+
+
+def test_truncated_module():
+    data = Module(CODE).to_bytes()
+    with pytest.raises(EOFError):
+        Module(data[:-3])
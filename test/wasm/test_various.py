@@ -1,10 +1,12 @@
 import io
 import os
+import tempfile
 import unittest
+from unittest.mock import patch
 
 from ppci.arch.arch_info import TypeInfo
 from ppci import api, ir
-from ppci.wasm import wasm_to_ir, ir_to_wasm, read_wasm
+from ppci.wasm import wasm_to_ir, ir_to_wasm, read_wasm, Module, instantiate
 from ppci.lang.python import python_to_wasm
 
 
@@ -52,5 +54,27 @@ class WasmLoadAndSaveTestCase(unittest.TestCase):
         self.assertEqual(content1, content2)
 
 
+@unittest.skipUnless(api.is_platform_supported(), 'native code not supported')
+class WasmInstantiateCacheTestCase(unittest.TestCase):
+    source = """
+    (module
+      (func $add (export "add") (param i32 i32) (result i32)
+        (i32.add (get_local 0) (get_local 1))))
+    """
+
+    def test_cache_file(self):
+        """ Instantiate twice, the second time should not compile """
+        module = Module(self.source)
+        with tempfile.TemporaryDirectory() as directory:
+            cache_file = os.path.join(directory, 'wasm_cache')
+            instance = instantiate(module, {}, cache_file=cache_file)
+            self.assertEqual(5, instance.exports.add(2, 3))
+
+            with patch('ppci.wasm._instantiate.native_compile') as compile:
+                instance = instantiate(module, {}, cache_file=cache_file)
+                compile.assert_not_called()
+            self.assertEqual(7, instance.exports.add(3, 4))
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=1)
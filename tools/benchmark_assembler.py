@@ -0,0 +1,87 @@
+""" Benchmark the assembler on a large generated assembly file.
+
+A C source with many functions is generated, and compiled into assembly
+language for each target. This assembly is then assembled with and
+without the fast path of the assembler parser. The fast path caches the
+derivation of each line shape, and matches new shapes by mnemonic
+before falling back to the earley parser.
+
+Usage:
+
+    $ python benchmark_assembler.py -m arm -m riscv --functions 200
+
+"""
+
+import argparse
+import io
+import time
+from ppci.api import c_to_ir, optimize, ir_to_stream, asm, get_arch
+from ppci.binutils.assembler import AsmParser
+from ppci.binutils.outstream import TextOutputStream
+
+
+def generate_source(n_functions):
+    """ Generate a C source with many small functions """
+    f = io.StringIO()
+    print('int data[100];', file=f)
+    for i in range(n_functions):
+        print('int f{}(int a, int b) {{'.format(i), file=f)
+        print('  int c = a * {} + b;'.format(i + 1), file=f)
+        print('  for (int i = 0; i < b; i++) {', file=f)
+        print('    c = c + data[i] - (a >> 2);', file=f)
+        print('    data[i] = c ^ {};'.format(i), file=f)
+        print('  }', file=f)
+        if i > 0:
+            print('  return c + f{}(c, b - 1);'.format(i - 1), file=f)
+        else:
+            print('  return c;', file=f)
+        print('}', file=f)
+    return f.getvalue()
+
+
+def generate_assembly(source, march):
+    """ Compile the C source into assembly text """
+    ir_module = c_to_ir(io.StringIO(source), march)
+    optimize(ir_module, level=1)
+    f = io.StringIO()
+    stream = TextOutputStream(printer=march.asm_printer, f=f)
+    ir_to_stream(ir_module, march, stream)
+    return f.getvalue()
+
+
+def assemble(source, march):
+    """ Assemble the source and return the object and elapsed time """
+    t1 = time.perf_counter()
+    obj = asm(io.StringIO(source), march)
+    return obj, time.perf_counter() - t1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '-m', '--machine', action='append', dest='machines',
+        help='target architecture to benchmark')
+    parser.add_argument('--functions', type=int, default=200)
+    args = parser.parse_args()
+    machines = args.machines or ['arm', 'riscv', 'x86_64']
+
+    source = generate_source(args.functions)
+    for machine in machines:
+        march = get_arch(machine)
+        assembly = generate_assembly(source, march)
+        objects = {}
+        timings = {}
+        for fast_path in (False, True):
+            AsmParser.fast_path = fast_path
+            objects[fast_path], timings[fast_path] = assemble(
+                assembly, march)
+        AsmParser.fast_path = True
+        assert objects[False] == objects[True]
+        print('{:10} {:6} lines, earley: {:7.2f} s, fast path: {:7.2f} s,'
+              ' speedup {:.2f}x'.format(
+                  machine, assembly.count('\n'), timings[False],
+                  timings[True], timings[False] / timings[True]))
+
+
+if __name__ == '__main__':
+    main()
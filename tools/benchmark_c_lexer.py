@@ -0,0 +1,78 @@
+""" Benchmark the throughput of the C lexer.
+
+A large C file is lexed with the character based lexer and with the fast
+lexer, which matches tokens with regular expressions on the whole text.
+The throughput is reported in megabytes per second. A large amalgamated
+source, such as sqlite3.c, makes a good input. Without a file, the C
+sources of the test suite are glued together.
+
+Usage:
+
+    $ python benchmark_c_lexer.py sqlite3.c
+
+"""
+
+import argparse
+import glob
+import io
+import os
+import time
+from ppci.lang.c import CLexer
+from ppci.lang.c.lexer import SourceFile
+from ppci.lang.c.options import COptions
+
+
+def default_source():
+    """ Glue the C sources of the test suite together """
+    this_dir = os.path.dirname(os.path.abspath(__file__))
+    pattern = os.path.join(this_dir, '..', 'test', '**', '*.c')
+    parts = []
+    for filename in sorted(glob.glob(pattern, recursive=True)):
+        with open(filename, 'r') as f:
+            parts.append(f.read())
+    return '\n'.join(parts) * 25
+
+
+def lex(source, fast):
+    """ Lex the source and return the tokens and elapsed time """
+    CLexer.fast = fast
+    lexer = CLexer(COptions())
+    t1 = time.perf_counter()
+    tokens = list(lexer.lex(io.StringIO(source), SourceFile('bench.c')))
+    return tokens, time.perf_counter() - t1
+
+
+def describe(tokens):
+    return [
+        (t.typ, t.val, t.space, t.first, t.loc.row, t.loc.col)
+        for t in tokens]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('source', nargs='?', help='C source file to lex')
+    args = parser.parse_args()
+
+    if args.source:
+        with open(args.source, 'r') as f:
+            source = f.read()
+    else:
+        source = default_source()
+    megabytes = len(source.encode('utf8')) / 1e6
+
+    tokens = {}
+    timings = {}
+    for fast in (False, True):
+        tokens[fast], timings[fast] = lex(source, fast)
+    CLexer.fast = True
+    assert describe(tokens[False]) == describe(tokens[True])
+    print('{:.2f} MB, {} tokens'.format(megabytes, len(tokens[True])))
+    print('characters: {:7.2f} s, {:6.2f} MB/s'.format(
+        timings[False], megabytes / timings[False]))
+    print('fast:       {:7.2f} s, {:6.2f} MB/s, speedup {:.1f}x'.format(
+        timings[True], megabytes / timings[True],
+        timings[False] / timings[True]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+""" Benchmark the register allocator on functions with a lot of spilling.
+
+Large switch statements with many live variables are generated, and
+compiled for register poor targets. The register allocator is run with
+and without incremental updates of liveness and interference after
+spilling.
+
+The incremental update only avoids the rebuild of liveness and the
+interference graph. Coalescing runs over the whole frame in each spill
+round in both modes, and takes most of the time. So the speedup is
+small, between none and about 1.3x, and does not grow with the size of
+the function.
+
+Usage:
+
+    $ python benchmark_regalloc.py -m msp430 -m riscv --cases 4 --vars 10
+
+"""
+
+import argparse
+import io
+import time
+from ppci.api import c_to_ir, optimize, ir_to_object, get_arch
+from ppci.codegen.registerallocator import GraphColoringRegisterAllocator
+
+
+def generate_source(n_cases, n_vars):
+    """ Generate a C function with a big switch and many live values """
+    f = io.StringIO()
+    print('int spill_heavy(int x, int y) {', file=f)
+    for i in range(n_vars):
+        print('  int v{0} = x + y + {1};'.format(i, i + 1), file=f)
+    print('  switch (x) {', file=f)
+    for case in range(n_cases):
+        print('    case {}:'.format(case), file=f)
+        for i in range(n_vars):
+            print('      v{0} = v{0} + v{1} - {2};'.format(
+                i, (i + case) % n_vars, case + 1), file=f)
+        print('      break;', file=f)
+    print('  }', file=f)
+    print('  return {};'.format(
+        ' + '.join('v{}'.format(i) for i in range(n_vars))), file=f)
+    print('}', file=f)
+    return f.getvalue()
+
+
+def compile_source(source, march):
+    """ Compile the source and return the elapsed time """
+    ir_module = c_to_ir(io.StringIO(source), march)
+    optimize(ir_module, level=1)
+    t1 = time.perf_counter()
+    ir_to_object([ir_module], march)
+    return time.perf_counter() - t1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '-m', '--machine', action='append', dest='machines',
+        help='target architecture to benchmark')
+    parser.add_argument('--cases', type=int, default=4)
+    parser.add_argument('--vars', type=int, default=10)
+    args = parser.parse_args()
+    machines = args.machines or ['msp430', 'riscv']
+
+    source = generate_source(args.cases, args.vars)
+    print('Generated {} lines of C code'.format(source.count('\n')))
+    for machine in machines:
+        march = get_arch(machine)
+        timings = {}
+        for incremental in (False, True):
+            GraphColoringRegisterAllocator.incremental = incremental
+            timings[incremental] = compile_source(source, march)
+        GraphColoringRegisterAllocator.incremental = True
+        print('{:10} full rebuild: {:7.2f} s, incremental: {:7.2f} s,'
+              ' speedup {:.2f}x'.format(
+                  machine, timings[False], timings[True],
+                  timings[False] / timings[True]))
+
+
+if __name__ == '__main__':
+    main()
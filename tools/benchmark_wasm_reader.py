@@ -0,0 +1,79 @@
+""" Benchmark the loading of binary wasm modules.
+
+A wasm module is loaded with the file reader, which reads the module one
+byte at a time, and with the buffer reader, which decodes the module from
+memory. The function bodies are decoded eagerly, to measure the decoding
+of the instructions. The time to load the modules while leaving the
+function bodies undecoded is shown as well. The throughput is reported in
+megabytes per second. Without a file, the wasm examples are loaded.
+
+Usage:
+
+    $ python benchmark_wasm_reader.py program.wasm
+
+"""
+
+import argparse
+import glob
+import io
+import os
+import time
+from ppci.wasm import Module, Func
+from ppci.wasm.io import FileReader
+
+
+def default_sources():
+    """ Find the wasm files of the examples """
+    this_dir = os.path.dirname(os.path.abspath(__file__))
+    pattern = os.path.join(this_dir, '..', 'examples', '**', '*.wasm')
+    return sorted(glob.glob(pattern, recursive=True))
+
+
+def load(data, buffered, lazy=False):
+    """ Load a module and return it with the elapsed time """
+    Func.lazy = lazy
+    t1 = time.perf_counter()
+    if buffered:
+        module = Module(data)
+    else:
+        module = Module(FileReader(io.BytesIO(data)))
+    return module, time.perf_counter() - t1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('sources', nargs='*', help='wasm files to load')
+    parser.add_argument(
+        '--repeat', type=int, default=10,
+        help='how many times to load each module')
+    args = parser.parse_args()
+
+    total = 0
+    timings = {False: 0, True: 0}
+    lazy_timing = 0
+    for filename in args.sources or default_sources():
+        with open(filename, 'rb') as f:
+            data = f.read()
+        modules = {}
+        for _ in range(args.repeat):
+            for buffered in (False, True):
+                modules[buffered], elapsed = load(data, buffered)
+                timings[buffered] += elapsed
+            _, elapsed = load(data, True, lazy=True)
+            lazy_timing += elapsed
+        assert modules[False].to_bytes() == modules[True].to_bytes()
+        total += len(data) * args.repeat
+
+    megabytes = total / 1e6
+    print('{:.2f} MB'.format(megabytes))
+    print('file:   {:7.2f} s, {:6.2f} MB/s'.format(
+        timings[False], megabytes / timings[False]))
+    print('buffer: {:7.2f} s, {:6.2f} MB/s, speedup {:.1f}x'.format(
+        timings[True], megabytes / timings[True],
+        timings[False] / timings[True]))
+    print('lazy:   {:7.2f} s, {:6.2f} MB/s, speedup {:.1f}x'.format(
+        lazy_timing, megabytes / lazy_timing, timings[False] / lazy_timing))
+
+
+if __name__ == '__main__':
+    main()